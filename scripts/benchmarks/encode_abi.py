@@ -0,0 +1,51 @@
+"""
+Measure the per-call CPU cost of encoding the mintTo calls of an ERC721
+mint_batch_to through ContractWrapper.get_contract_interface(), with the cached ABI
+and contract interface, compared to parsing the ABI and building the contract on
+every call. No node is needed, encoding happens entirely locally.
+
+    python3 scripts/benchmarks/encode_abi.py [batch_size] [num_batches]
+"""
+
+import sys
+import time
+from typing import Callable
+
+from eth_typing import Address
+from thirdweb.abi import TokenERC721
+from thirdweb.constants.currency import ZERO_ADDRESS
+from thirdweb.core.classes.contract_wrapper import ContractWrapper
+from web3 import Web3
+from web3.contract import Contract
+
+TO_ADDRESS = "0x0000000000000000000000000000000000000001"
+
+
+def measure(label: str, get_interface: Callable[[], Contract], batch_size: int, num_batches: int):
+    start = time.process_time()
+    for _ in range(num_batches):
+        for i in range(batch_size):
+            get_interface().encodeABI("mintTo", [TO_ADDRESS, f"ipfs://QmHash/{i}"])
+    elapsed = time.process_time() - start
+
+    calls = batch_size * num_batches
+    print(f"{label}: {calls} calls, {elapsed * 1e6 / calls:.1f}us CPU per call")
+
+
+if __name__ == "__main__":
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    num_batches = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    provider = Web3(Web3.HTTPProvider("http://localhost:8545"))
+    token = ContractWrapper(TokenERC721(provider, ZERO_ADDRESS), provider)
+
+    measure(
+        "uncached",
+        lambda: provider.eth.contract(
+            address=Address(ZERO_ADDRESS),
+            abi=TokenERC721.abi.__wrapped__(),  # type: ignore
+        ),
+        batch_size,
+        num_batches,
+    )
+    measure("cached", token.get_contract_interface, batch_size, num_batches)
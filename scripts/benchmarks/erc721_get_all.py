@@ -0,0 +1,63 @@
+"""
+Compare the number of JSON-RPC round trips made to read the owners and token URIs
+of an ERC721 collection with and without Multicall3 batching.
+
+Run against a local hardhat node with Multicall3 deployed at its canonical address
+(for example a forked network), and an existing NFT collection:
+
+    python3 scripts/benchmarks/erc721_get_all.py <collection_address> [rpc_url]
+"""
+
+import sys
+import time
+from collections import Counter
+from typing import Any, Callable
+
+from thirdweb.constants.currency import ZERO_ADDRESS
+from thirdweb.contracts import NFTCollection
+from thirdweb.core.classes.ipfs_storage import IpfsStorage
+from thirdweb.types.sdk import MulticallSettings, SDKOptions
+from web3 import Web3
+
+requests: Counter = Counter()
+
+
+def counting_middleware(make_request: Callable, w3: Web3) -> Callable:
+    def middleware(method: str, params: Any) -> Any:
+        requests[method] += 1
+        return make_request(method, params)
+
+    return middleware
+
+
+def run(address: str, rpc_url: str, settings: MulticallSettings, label: str):
+    provider = Web3(Web3.HTTPProvider(rpc_url))
+    provider.middleware_onion.add(counting_middleware)
+
+    collection = NFTCollection(
+        provider,
+        address,
+        IpfsStorage(None),
+        options=SDKOptions(multicall_settings=settings),
+    )
+    erc721 = collection._erc721
+    token_ids = list(range(erc721.get_total_count()))
+
+    requests.clear()
+    start = time.perf_counter()
+    erc721._get_owners_and_token_uris(token_ids)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{label}: {len(token_ids)} tokens, {sum(requests.values())} requests "
+        f"({dict(requests)}), {elapsed:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    address = sys.argv[1]
+    rpc_url = sys.argv[2] if len(sys.argv) > 2 else "http://localhost:8545"
+
+    # Pointing the reader at an address without code forces one eth_call per read
+    run(address, rpc_url, MulticallSettings(address=ZERO_ADDRESS), "serial")
+    run(address, rpc_url, MulticallSettings(), "multicall3")
@@ -0,0 +1,81 @@
+"""
+Measure the cold import time of the SDK with python -X importtime, and fail if it
+regresses past a budget or if imports start pulling in unused generated ABI bindings.
+
+Bindings are imported through importlib by the lazy thirdweb.abi package, which
+-X importtime does not list, so they are counted from sys.modules instead.
+
+    python3 scripts/benchmarks/import_time.py [runs] [max_ms] [max_bindings]
+"""
+
+import re
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+MODULE = "thirdweb"
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)$")
+
+
+def measure_import() -> Tuple[float, List[str]]:
+    """
+    Import the SDK in a fresh interpreter and return its cumulative import time in
+    milliseconds along with the generated bindings it loaded.
+    """
+
+    code = (
+        f"import {MODULE}, sys; "
+        "print('\\n'.join(m for m in sys.modules if m.startswith('thirdweb.abi.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is not None and match.group(4) == MODULE and len(match.group(3)) == 1:
+            total_us = int(match.group(2))
+
+    bindings = sorted(
+        module
+        for module in result.stdout.split()
+        if re.match(r"^thirdweb\.abi\.[a-z0-9_]+$", module)
+    )
+    return total_us / 1000, bindings
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    max_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    max_bindings = int(sys.argv[3]) if len(sys.argv) > 3 else 25
+
+    timings = []
+    bindings: List[str] = []
+    for _ in range(runs):
+        elapsed, bindings = measure_import()
+        timings.append(elapsed)
+
+    median = statistics.median(timings)
+    print(
+        f"import {MODULE}: median {median:.1f}ms over {runs} runs "
+        f"(min {min(timings):.1f}ms, max {max(timings):.1f}ms), "
+        f"{len(bindings)} generated bindings loaded"
+    )
+
+    failures = []
+    if median > max_ms:
+        failures.append(f"median import time {median:.1f}ms exceeds {max_ms:.1f}ms")
+    if len(bindings) > max_bindings:
+        failures.append(
+            f"{len(bindings)} generated bindings loaded, expected at most {max_bindings}"
+        )
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if len(failures) > 0 else 0)
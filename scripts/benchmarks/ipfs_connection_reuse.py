@@ -0,0 +1,72 @@
+"""
+Measure TCP connection reuse of IpfsStorage reads against a local HTTP stand-in
+for an IPFS gateway, compared to one-off requests without a pooled session.
+
+    python3 scripts/benchmarks/ipfs_connection_reuse.py [num_requests]
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from thirdweb.core.classes.ipfs_storage import IpfsStorage
+
+connections = 0
+connections_lock = threading.Lock()
+
+
+class GatewayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        global connections
+        super().setup()
+        with connections_lock:
+            connections += 1
+
+    def do_GET(self):
+        body = json.dumps({"name": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def measure(label: str, fetch, num_requests: int):
+    global connections
+    connections = 0
+
+    start = time.perf_counter()
+    for i in range(num_requests):
+        fetch(i)
+    elapsed = time.perf_counter() - start
+
+    print(f"{label}: {num_requests} requests, {connections} connections, {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    num_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GatewayHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    gateway_url = f"http://127.0.0.1:{server.server_address[1]}/ipfs/"
+
+    storage = IpfsStorage(None, gateway_url)
+
+    measure(
+        "requests.get",
+        lambda i: requests.get(f"{gateway_url}QmHash/{i}").json(),
+        num_requests,
+    )
+    measure("IpfsStorage.get", lambda i: storage.get(f"ipfs://QmHash/{i}"), num_requests)
+
+    server.shutdown()
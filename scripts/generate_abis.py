@@ -26,7 +26,60 @@ for filename in os.listdir(output_path):
     if os.path.isdir(path):
         os.system(f"rm -rf {path}")
 
+# Parse each ABI once per process instead of on every abi() call, frozen so that the
+# list every caller shares cannot be modified by any of them
+def memoize_abi(source: str) -> str:
+    source = source.replace("\nimport json\n", "\nfrom functools import lru_cache\n", 1)
+    source = source.replace(
+        "\nfrom zero_ex.contract_wrappers.tx_params import TxParams\n",
+        "\nfrom zero_ex.contract_wrappers.tx_params import TxParams\n\nfrom thirdweb.common.frozen import freeze_json\n",
+        1,
+    )
+    source = source.replace("    @staticmethod\n    def abi():", "    @staticmethod\n    @lru_cache(maxsize=None)\n    def abi():", 1)
+    return source.replace("        return json.loads(", "        return freeze_json(", 1)
 
-for abi, binding in generated_abis.items():
-    with open('thirdweb/abi/__init__.py', 'a') as file:
-        file.write(f"\nfrom .{binding} import {abi} # pylint: disable=unused-import")
\ No newline at end of file
+
+for filename in os.listdir(output_path):
+    path = os.path.join(output_path, filename)
+    with open(path) as file:
+        source = file.read()
+    if "    def abi():" not in source:
+        continue
+    with open(path, "w") as file:
+        file.write(memoize_abi(source))
+
+
+# Bindings are imported on first access, see the module __getattr__ below
+with open('thirdweb/abi/__init__.py', 'w') as file:
+    file.write('''"""Generated wrappers for the thirdweb contracts, each imported on first access."""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+''')
+    for abi, binding in generated_abis.items():
+        file.write(f"    from .{binding} import {abi} # pylint: disable=unused-import\n")
+    file.write("\n_BINDINGS: Dict[str, str] = {\n")
+    for abi, binding in generated_abis.items():
+        file.write(f'    "{abi}": "{binding}",\n')
+    file.write('''}
+
+__all__ = list(_BINDINGS)
+
+
+# Type checkers see the bindings through the imports above, resolving every other name
+# through __getattr__ would type the missing names the bindings probe for as Any
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> Any:
+        if name not in _BINDINGS:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+        binding = getattr(importlib.import_module(f".{_BINDINGS[name]}", __name__), name)
+        globals()[name] = binding
+        return binding
+
+    def __dir__() -> List[str]:
+        return sorted(set(globals()) | set(__all__))
+''')
\ No newline at end of file
@@ -1,2 +1,4 @@
 from fixtures.sdk import sdk
 from fixtures.accounts import primary_account, secondary_account
+from fixtures.storage_server import storage_server
+from fixtures.rpc_server import rpc_server
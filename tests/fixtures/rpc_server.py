@@ -0,0 +1,97 @@
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+
+class RpcServer:
+    """
+    Local stand-in for a JSON-RPC node. Every method answers with the result of its
+    handler, "0x1" by default, and the methods of every HTTP request are recorded.
+    Requests are answered after the delay, with the HTTP status code of the server, or
+    the batch status code for batches when it is set.
+    """
+
+    url: str
+    handlers: Dict[str, Callable[[List[Any]], Any]]
+    requests: List[List[str]]
+    delay: float
+    status: int
+    batch_status: Optional[int]
+    batch_support: bool
+
+    def __init__(self):
+        self.handlers = {}
+        self.requests = []
+        self.delay = 0
+        self.status = 200
+        self.batch_status = None
+        self.batch_support = True
+        self._lock = Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self):
+        Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _answer(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        handler = self.handlers.get(request["method"], lambda params: "0x1")
+        try:
+            result = handler(request.get("params", []))
+        except Exception as e:
+            return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32000, "message": str(e)}}
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    def _handle(self, payload: Any) -> Any:
+        is_batch = isinstance(payload, list)
+        requests = payload if is_batch else [payload]
+        with self._lock:
+            self.requests.append([request["method"] for request in requests])
+
+        if self.delay > 0:
+            time.sleep(self.delay)
+
+        if is_batch and not self.batch_support:
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Batch requests are not supported"}}
+        if is_batch:
+            return [self._answer(request) for request in requests]
+        return self._answer(payload)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                payload = json.loads(body)
+                response = json.dumps(server._handle(payload)).encode("utf-8")
+
+                status = server.status
+                if isinstance(payload, list) and server.batch_status is not None:
+                    status = server.batch_status
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture()
+def rpc_server():
+    server = RpcServer()
+    server.start()
+    yield server
+    server.stop()
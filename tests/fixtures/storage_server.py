@@ -0,0 +1,115 @@
+import hashlib
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Dict, List
+
+import pytest
+
+
+class StorageServer:
+    """
+    Local stand-in for the /ipfs/upload endpoint of the storage server. Uploaded files
+    are kept in memory under a fake directory CID derived from their names and content,
+    and served back as an IPFS gateway would under /ipfs/.
+    """
+
+    url: str
+    files: Dict[str, Dict[str, bytes]]
+    requests: List[List[str]]
+    failures: int
+
+    def __init__(self):
+        self.files = {}
+        self.requests = []
+        self.failures = 0
+        self._lock = Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self):
+        Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def fail_next(self, count: int):
+        """
+        Answer the next requests with a 503, as an overloaded server would.
+        """
+
+        with self._lock:
+            self.failures = count
+
+    def _upload(self, content_type: str, body: bytes) -> str:
+        message = BytesParser().parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + body
+        )
+
+        files: Dict[str, bytes] = {}
+        for part in message.get_payload():  # type: ignore
+            name = part.get_filename().replace("files/", "", 1)
+            files[name] = part.get_payload(decode=True)
+
+        digest = hashlib.sha256()
+        for name in sorted(files):
+            digest.update(name.encode("utf-8") + hashlib.sha256(files[name]).digest())
+        cid = f"Qm{digest.hexdigest()}"
+
+        with self._lock:
+            self.files[cid] = files
+            self.requests.append(sorted(files))
+        return cid
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                cid, _, name = self.path.replace("/ipfs/", "", 1).partition("/")
+                with server._lock:
+                    content = server.files.get(cid, {}).get(name)
+
+                if content is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+
+                with server._lock:
+                    fail = server.failures > 0
+                    server.failures -= 1 if fail else 0
+
+                if fail or self.path != "/ipfs/upload":
+                    self.send_response(503 if fail else 404)
+                    self.end_headers()
+                    return
+
+                cid = server._upload(self.headers["Content-Type"], body)
+                response = f'{{"IpfsHash": "{cid}"}}'.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture()
+def storage_server():
+    server = StorageServer()
+    server.start()
+    yield server
+    server.stop()
@@ -0,0 +1,411 @@
+import asyncio
+import gc
+import json
+import weakref
+from typing import List, Optional
+
+import pytest
+import rlp
+from eth_abi import encode_abi
+from eth_account import Account
+from web3 import Web3
+
+from fixtures.rpc_server import RpcServer
+from fixtures.storage_server import StorageServer
+from thirdweb import AsyncThirdwebSDK
+from thirdweb.constants.currency import ZERO_ADDRESS
+from thirdweb.core.classes.async_ipfs_storage import AsyncIpfsStorage
+from thirdweb.types.sdk import RpcBatchSettings, SDKOptions, StorageSettings
+
+TOKEN_ADDRESS = "0x0000000000000000000000000000000000000001"
+
+
+def erc20_call(params):
+    selectors = {
+        Web3.keccak(text="name()")[:4].hex(): (["string"], ["Token"]),
+        Web3.keccak(text="symbol()")[:4].hex(): (["string"], ["TKN"]),
+        Web3.keccak(text="decimals()")[:4].hex(): (["uint8"], [18]),
+        Web3.keccak(text="balanceOf(address)")[:4].hex(): (["uint256"], [10**18]),
+    }
+    types, values = selectors[params[0]["data"][:10]]
+    return Web3.toHex(encode_abi(types, values))
+
+
+def test_gathered_reads_batched(rpc_server: RpcServer):
+    rpc_server.handlers["eth_call"] = erc20_call
+
+    async def read():
+        async with AsyncThirdwebSDK(rpc_server.url) as sdk:
+            token = sdk.get_token(TOKEN_ADDRESS)
+            return await asyncio.gather(
+                *[token.balance_of(f"0x{i:040x}") for i in range(10)]
+            )
+
+    balances = asyncio.run(read())
+
+    assert [balance.display_value for balance in balances] == [1] * 10
+    assert [balance.symbol for balance in balances] == ["TKN"] * 10
+    # The token metadata and every balance share a single round trip
+    assert len(rpc_server.requests) == 1
+    assert len(rpc_server.requests[0]) == 13
+
+
+def test_gathered_reads_batch_rejected(rpc_server: RpcServer):
+    rpc_server.batch_status = 400
+    rpc_server.handlers["eth_call"] = erc20_call
+
+    async def read():
+        async with AsyncThirdwebSDK(rpc_server.url) as sdk:
+            token = sdk.get_token(TOKEN_ADDRESS)
+            return await asyncio.gather(
+                *[token.balance_of(f"0x{i:040x}") for i in range(3)]
+            )
+
+    balances = asyncio.run(read())
+
+    assert [balance.display_value for balance in balances] == [1] * 3
+    # The rejected batch is sent again one request at a time
+    assert rpc_server.requests[0] == ["eth_call"] * 6
+    assert all(len(methods) == 1 for methods in rpc_server.requests[1:])
+
+
+def test_gathered_reads_batch_rate_limited(rpc_server: RpcServer):
+    rpc_server.batch_status = 429
+    rpc_server.handlers["eth_call"] = erc20_call
+
+    async def read(sdk: AsyncThirdwebSDK):
+        token = sdk.get_token(TOKEN_ADDRESS)
+        return await asyncio.gather(
+            *[token.balance_of(f"0x{i:040x}") for i in range(3)],
+            return_exceptions=True,
+        )
+
+    async def read_twice():
+        settings = SDKOptions(
+            rpc_batch_settings=RpcBatchSettings(max_retries=1, retry_backoff=0.01)
+        )
+        async with AsyncThirdwebSDK(rpc_server.url, options=settings) as sdk:
+            rate_limited = await read(sdk)
+            rpc_server.batch_status = None
+            del rpc_server.requests[:]
+            return rate_limited, await read(sdk)
+
+    rate_limited, balances = asyncio.run(read_twice())
+
+    assert all(isinstance(balance, Exception) for balance in rate_limited)
+    assert [balance.display_value for balance in balances] == [1] * 3
+    # Batching is still used once the node stops rate limiting
+    assert all(len(methods) > 1 for methods in rpc_server.requests)
+
+
+def transfer_handlers(sent, receipt_block: int = 2):
+    return {
+        "eth_call": erc20_call,
+        "eth_feeHistory": lambda params: {
+            "oldestBlock": "0x1",
+            "baseFeePerGas": ["0x3b9aca00", "0x3b9aca00"],
+            "gasUsedRatio": [0.5],
+            "reward": [["0x3b9aca00"]],
+        },
+        "eth_estimateGas": lambda params: "0x5208",
+        "eth_getTransactionCount": lambda params: "0x7",
+        "eth_sendRawTransaction": lambda params: sent.append(params[0])
+        or "0x" + "ab" * 32,
+        "eth_getTransactionReceipt": lambda params: {
+            "transactionHash": params[0],
+            "blockNumber": hex(receipt_block),
+            "status": "0x1",
+            "logs": [],
+        },
+    }
+
+
+def get_nonce(raw: str) -> int:
+    return Web3.toInt(rlp.decode(Web3.toBytes(hexstr=raw)[1:])[1])
+
+
+def test_transfer(rpc_server: RpcServer):
+    signer = Account.create()
+    sent = []
+    rpc_server.handlers.update(transfer_handlers(sent))
+
+    async def transfer():
+        async with AsyncThirdwebSDK(rpc_server.url, signer) as sdk:
+            token = sdk.get_token(TOKEN_ADDRESS)
+            return await asyncio.gather(
+                token.transfer(f"0x{2:040x}", 1), token.transfer(f"0x{3:040x}", 2)
+            )
+
+    receipts = asyncio.run(transfer())
+
+    assert [receipt["status"] for receipt in receipts] == [1, 1]
+    # Concurrent transfers of the same signer take consecutive nonces
+    assert sorted(get_nonce(raw) for raw in sent) == [7, 8]
+
+
+def test_transfer_fees_cached(rpc_server: RpcServer):
+    signer = Account.create()
+    sent = []
+    rpc_server.handlers.update(transfer_handlers(sent, receipt_block=1))
+
+    async def transfer():
+        async with AsyncThirdwebSDK(rpc_server.url, signer) as sdk:
+            token = sdk.get_token(TOKEN_ADDRESS)
+            for i in range(3):
+                await token.transfer(f"0x{i + 2:040x}", 1)
+
+    asyncio.run(transfer())
+
+    # Transactions mined in the block the fees were read at reuse them
+    methods = [method for methods in rpc_server.requests for method in methods]
+    assert methods.count("eth_feeHistory") == 1
+    assert len(sent) == 3
+
+
+def test_transfer_nonce_errors(rpc_server: RpcServer):
+    signer = Account.create()
+    sent = []
+    errors = ["nonce too low", "insufficient funds for gas * price + value"]
+    chain_nonces = iter(["0x7", "0x8"])
+    rpc_server.handlers.update(transfer_handlers(sent))
+
+    def send_raw_transaction(params):
+        if len(errors) > 0:
+            raise Exception(errors.pop(0))
+        sent.append(params[0])
+        return "0x" + "ab" * 32
+
+    rpc_server.handlers["eth_sendRawTransaction"] = send_raw_transaction
+    rpc_server.handlers["eth_getTransactionCount"] = lambda params: next(chain_nonces)
+
+    async def transfer():
+        async with AsyncThirdwebSDK(rpc_server.url, signer) as sdk:
+            token = sdk.get_token(TOKEN_ADDRESS)
+            # The nonce error is retried with the nonce read from the chain again
+            with pytest.raises(ValueError, match="insufficient funds"):
+                await token.transfer(f"0x{2:040x}", 1)
+            await token.transfer(f"0x{3:040x}", 1)
+
+    asyncio.run(transfer())
+
+    # The nonce of the failed transaction is released and used by the next one
+    assert [get_nonce(raw) for raw in sent] == [8]
+
+
+def selector(signature: str) -> str:
+    return Web3.keccak(text=signature)[:4].hex()
+
+
+def create_storage(server: StorageServer) -> AsyncIpfsStorage:
+    return AsyncIpfsStorage(
+        None,
+        f"{server.url}/ipfs/",
+        StorageSettings(retry_backoff_factor=0),
+        server_url=server.url,
+    )
+
+
+def nft_call(token_uris: List[Optional[str]], owners: List[Optional[str]]):
+    # Reads of a missing owner or token URI revert, as they do on chain
+    def call(params):
+        data = params[0]["data"]
+        if data[:10] == selector("nextTokenIdToMint()"):
+            return Web3.toHex(encode_abi(["uint256"], [len(token_uris)]))
+
+        token_id = int(data[10:], 16)
+        value: Optional[str]
+        if data[:10] == selector("ownerOf(uint256)"):
+            types, value = ["address"], owners[token_id]
+        elif data[:10] == selector("totalSupply(uint256)"):
+            return Web3.toHex(encode_abi(["uint256"], [token_id + 10]))
+        else:
+            types, value = ["string"], token_uris[token_id]
+
+        if value is None:
+            raise Exception("execution reverted")
+        return Web3.toHex(encode_abi(types, [value]))
+
+    return call
+
+
+def get_calldata(raw: str) -> str:
+    return Web3.toHex(rlp.decode(Web3.toBytes(hexstr=raw)[1:])[7])
+
+
+def test_nft_collection_get_all(
+    rpc_server: RpcServer, storage_server: StorageServer
+):
+    owner = f"0x{5:040x}"
+
+    async def get_all():
+        storage = create_storage(storage_server)
+        uris = await storage.upload_metadata_batch(
+            [{"name": f"NFT {i}"} for i in range(3)]
+        )
+        token_uris = uris.metadata_uris + [None]
+        rpc_server.handlers["eth_call"] = nft_call(
+            token_uris, [owner, None, owner, owner]
+        )
+
+        async with AsyncThirdwebSDK(rpc_server.url, storage=storage) as sdk:
+            return await sdk.get_nft_collection(TOKEN_ADDRESS).get_all()
+
+    nfts = asyncio.run(get_all())
+
+    # The token whose URI could not be read is skipped
+    assert [nft.metadata.name for nft in nfts] == ["NFT 0", "NFT 1", "NFT 2"]
+    assert [nft.owner for nft in nfts] == [
+        Web3.toChecksumAddress(owner),
+        ZERO_ADDRESS,
+        Web3.toChecksumAddress(owner),
+    ]
+    # The owners and URIs of every token share a single round trip
+    assert ["eth_call"] * 8 in rpc_server.requests
+
+
+def test_nft_collection_transfer(rpc_server: RpcServer):
+    signer = Account.create()
+    sent = []
+    rpc_server.handlers.update(transfer_handlers(sent))
+
+    async def transfer():
+        async with AsyncThirdwebSDK(rpc_server.url, signer) as sdk:
+            return await sdk.get_nft_collection(TOKEN_ADDRESS).transfer(
+                f"0x{2:040x}", 3
+            )
+
+    receipt = asyncio.run(transfer())
+
+    assert receipt["status"] == 1
+    assert get_calldata(sent[0]) == selector(
+        "safeTransferFrom(address,address,uint256)"
+    ) + encode_abi(
+        ["address", "address", "uint256"], [signer.address, f"0x{2:040x}", 3]
+    ).hex()
+
+
+def test_edition_get_all(rpc_server: RpcServer, storage_server: StorageServer):
+    async def get_all():
+        storage = create_storage(storage_server)
+        uris = await storage.upload_metadata_batch(
+            [{"name": f"Edition {i}"} for i in range(3)]
+        )
+        rpc_server.handlers["eth_call"] = nft_call(uris.metadata_uris, [])
+
+        async with AsyncThirdwebSDK(rpc_server.url, storage=storage) as sdk:
+            return await sdk.get_edition(TOKEN_ADDRESS).get_all()
+
+    editions = asyncio.run(get_all())
+
+    assert [edition.metadata.name for edition in editions] == [
+        "Edition 0",
+        "Edition 1",
+        "Edition 2",
+    ]
+    assert [edition.supply for edition in editions] == [10, 11, 12]
+    # The supplies and URIs of every token share a single round trip
+    assert ["eth_call"] * 6 in rpc_server.requests
+
+
+def test_edition_transfer(rpc_server: RpcServer):
+    signer = Account.create()
+    sent = []
+    rpc_server.handlers.update(transfer_handlers(sent))
+
+    async def transfer():
+        async with AsyncThirdwebSDK(rpc_server.url, signer) as sdk:
+            return await sdk.get_edition(TOKEN_ADDRESS).transfer(
+                f"0x{2:040x}", 3, 4
+            )
+
+    receipt = asyncio.run(transfer())
+
+    assert receipt["status"] == 1
+    assert get_calldata(sent[0]) == selector(
+        "safeTransferFrom(address,address,uint256,uint256,bytes)"
+    ) + encode_abi(
+        ["address", "address", "uint256", "uint256", "bytes"],
+        [signer.address, f"0x{2:040x}", 3, 4, b"0"],
+    ).hex()
+
+
+def test_storage_upload_metadata(storage_server: StorageServer):
+    async def upload():
+        storage = AsyncIpfsStorage(
+            None,
+            settings=StorageSettings(retry_backoff_factor=0),
+            server_url=storage_server.url,
+        )
+        storage_server.fail_next(1)
+        with open("tests/files/0.jpg", "rb") as jpg:
+            uri = await storage.upload_metadata({"name": "NFT", "image": jpg})
+        await storage.close()
+        return uri
+
+    uri = asyncio.run(upload())
+
+    cid, name = uri.replace("ipfs://", "").split("/")
+    metadata = json.loads(storage_server.files[cid][name])
+    image_cid, image_name = metadata["image"].replace("ipfs://", "").split("/")
+    with open("tests/files/0.jpg", "rb") as jpg:
+        assert storage_server.files[image_cid][image_name] == jpg.read()
+
+
+def test_storage_upload_metadata_in_parts(storage_server: StorageServer, tmp_path):
+    images = []
+    for i in range(3):
+        path = tmp_path / f"{i}.png"
+        path.write_bytes(f"image {i}".encode("utf-8"))
+        images.append(path)
+
+    async def upload():
+        storage = AsyncIpfsStorage(
+            None,
+            settings=StorageSettings(
+                retry_backoff_factor=0,
+                upload_part_max_files=2,
+                pin_index_path=str(tmp_path / "pins.db"),
+            ),
+            server_url=storage_server.url,
+        )
+        uris = await storage.upload_metadata_batch(
+            [{"name": f"{i}", "image": open(images[i % 3], "rb")} for i in range(6)]
+        )
+        # Images pinned by the first upload are not uploaded again
+        await storage.upload_metadata({"name": "copy", "image": open(images[0], "rb")})
+        await storage.close()
+        return uris
+
+    uris = asyncio.run(upload())
+
+    # Identical images are uploaded once, in parts bounded by the upload settings
+    assert sorted(storage_server.requests[:3]) == [
+        ["0", "1", "2", "3", "4", "5"],
+        ["0.png", "1.png"],
+        ["2.png"],
+    ]
+    assert storage_server.requests[3:] == [["0"]]
+
+    metadata_files = storage_server.files[uris.base_uri[len("ipfs://") : -1]]
+    for i in range(6):
+        image = json.loads(metadata_files[str(i)])["image"]
+        image_cid, image_name = image.replace("ipfs://", "").split("/")
+        assert storage_server.files[image_cid][image_name] == f"image {i % 3}".encode(
+            "utf-8"
+        )
+
+
+def test_transfer_state_freed_with_sdk(rpc_server: RpcServer):
+    signer = Account.create()
+    rpc_server.handlers.update(transfer_handlers([]))
+
+    async def transfer():
+        async with AsyncThirdwebSDK(rpc_server.url, signer) as sdk:
+            await sdk.get_token(TOKEN_ADDRESS).transfer(f"0x{2:040x}", 1)
+            return weakref.ref(sdk.get_provider())
+
+    provider = asyncio.run(transfer())
+    gc.collect()
+
+    # The nonce managers and fee oracles of the SDK do not keep its provider alive
+    assert provider() is None
@@ -0,0 +1,168 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+from eth_abi import encode_abi
+from web3 import Web3
+
+from fixtures.rpc_server import RpcServer
+from thirdweb.common.currency import fetch_currency_metadata
+from thirdweb.core.classes.batch_provider import BatchHTTPProvider, RequestBatch
+from thirdweb.types.sdk import RpcBatchSettings
+
+
+def test_concurrent_requests_batched(rpc_server: RpcServer):
+    rpc_server.delay = 0.05
+    provider = Web3(
+        BatchHTTPProvider(rpc_server.url, RpcBatchSettings(max_concurrent_batches=1))
+    )
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        balances = list(
+            executor.map(
+                lambda i: provider.eth.get_balance(f"0x{i:040x}"), range(10)
+            )
+        )
+
+    assert balances == [1] * 10
+    assert len(rpc_server.requests) < 10
+    assert sum(len(methods) for methods in rpc_server.requests) == 10
+
+
+def test_identical_requests_coalesced(rpc_server: RpcServer):
+    provider = Web3(
+        BatchHTTPProvider(rpc_server.url, RpcBatchSettings(scope_window=0.1))
+    )
+
+    with RequestBatch(provider) as batch:
+        futures = [batch.submit(lambda: provider.eth.block_number) for _ in range(5)]
+        futures.append(batch.submit(lambda: provider.eth.gas_price))
+
+    assert [future.result() for future in futures] == [1] * 6
+    assert rpc_server.requests == [["eth_blockNumber", "eth_gasPrice"]]
+
+
+def test_sender_stops_once_answered(rpc_server: RpcServer):
+    rpc_server.delay = 0.02
+    provider = Web3(
+        BatchHTTPProvider(
+            rpc_server.url, RpcBatchSettings(window=0.01, max_concurrent_batches=1)
+        )
+    )
+    stop = Event()
+
+    def keep_reading(i: int) -> float:
+        longest = 0.0
+        while not stop.is_set():
+            start = time.monotonic()
+            provider.eth.get_balance(f"0x{i:040x}")
+            longest = max(longest, time.monotonic() - start)
+        return longest
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(keep_reading, i) for i in range(4)]
+        time.sleep(0.5)
+        stop.set()
+
+    # Callers keep queueing requests, which must not keep any of them sending
+    assert max(future.result() for future in futures) < 0.25
+
+
+def test_batch_unsupported(rpc_server: RpcServer):
+    rpc_server.batch_support = False
+    provider = Web3(BatchHTTPProvider(rpc_server.url))
+
+    with RequestBatch(provider) as batch:
+        block_number = batch.submit(lambda: provider.eth.block_number)
+        gas_price = batch.submit(lambda: provider.eth.gas_price)
+
+    assert block_number.result() == 1
+    assert gas_price.result() == 1
+    assert sorted(rpc_server.requests[-2:]) == [["eth_blockNumber"], ["eth_gasPrice"]]
+
+
+def test_batch_rejected(rpc_server: RpcServer):
+    rpc_server.batch_status = 400
+    provider = Web3(BatchHTTPProvider(rpc_server.url))
+
+    with RequestBatch(provider) as batch:
+        block_number = batch.submit(lambda: provider.eth.block_number)
+        gas_price = batch.submit(lambda: provider.eth.gas_price)
+
+    assert block_number.result() == 1
+    assert gas_price.result() == 1
+    assert sorted(rpc_server.requests[-2:]) == [["eth_blockNumber"], ["eth_gasPrice"]]
+
+    # Later batches are sent one request at a time without being rejected first
+    del rpc_server.requests[:]
+    with RequestBatch(provider) as batch:
+        block_number = batch.submit(lambda: provider.eth.block_number)
+        gas_price = batch.submit(lambda: provider.eth.gas_price)
+
+    assert block_number.result() == 1
+    assert gas_price.result() == 1
+    assert sorted(rpc_server.requests) == [["eth_blockNumber"], ["eth_gasPrice"]]
+
+
+def test_request_batch_after_batch_rejected(rpc_server: RpcServer):
+    rpc_server.batch_status = 400
+    provider = Web3(BatchHTTPProvider(rpc_server.url))
+    provider.provider.request_batch(  # type: ignore
+        [("eth_blockNumber", []), ("eth_gasPrice", [])]
+    )
+
+    # Requests sent at once are not queued, and no longer sent as a batch either
+    del rpc_server.requests[:]
+    responses = provider.provider.request_batch(  # type: ignore
+        [("eth_blockNumber", []), ("eth_gasPrice", [])]
+    )
+    assert [response["result"] for response in responses] == ["0x1", "0x1"]
+    assert rpc_server.requests == [["eth_blockNumber"], ["eth_gasPrice"]]
+
+
+def test_batch_rate_limited(rpc_server: RpcServer):
+    rpc_server.batch_status = 429
+    transport = BatchHTTPProvider(
+        rpc_server.url, RpcBatchSettings(max_retries=1, retry_backoff=0.01)
+    )
+    # Without the request retries of web3, so that every batch sent is the provider's
+    transport.middlewares = []
+    provider = Web3(transport)
+
+    with RequestBatch(provider) as batch:
+        block_number = batch.submit(lambda: provider.eth.block_number)
+        gas_price = batch.submit(lambda: provider.eth.gas_price)
+
+    # Rate limited batches are sent again rather than one request at a time
+    assert block_number.exception() is not None
+    assert gas_price.exception() is not None
+    assert rpc_server.requests == [["eth_blockNumber", "eth_gasPrice"]] * 2
+
+    # Batching is still used once the node stops rate limiting
+    rpc_server.batch_status = None
+    del rpc_server.requests[:]
+    with RequestBatch(provider) as batch:
+        block_number = batch.submit(lambda: provider.eth.block_number)
+        gas_price = batch.submit(lambda: provider.eth.gas_price)
+
+    assert block_number.result() == 1
+    assert gas_price.result() == 1
+    assert rpc_server.requests == [["eth_blockNumber", "eth_gasPrice"]]
+
+
+def test_currency_metadata_without_batch_support(rpc_server: RpcServer):
+    rpc_server.batch_support = False
+    rpc_server.handlers["eth_chainId"] = lambda params: "0x7a69"
+    outputs = {
+        Web3.keccak(text="name()")[:4].hex(): (["string"], ["Token"]),
+        Web3.keccak(text="symbol()")[:4].hex(): (["string"], ["TKN"]),
+        Web3.keccak(text="decimals()")[:4].hex(): (["uint8"], [6]),
+    }
+    rpc_server.handlers["eth_call"] = lambda params: Web3.toHex(
+        encode_abi(*outputs[params[0]["data"][:10]])
+    )
+    provider = Web3(Web3.HTTPProvider(rpc_server.url))
+
+    currency = fetch_currency_metadata(provider, "0x" + "12" * 20)
+
+    assert (currency.name, currency.symbol, currency.decimals) == ("Token", "TKN", 6)
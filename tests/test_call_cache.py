@@ -0,0 +1,111 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from typing import List, Optional
+
+from web3 import Web3
+
+from fixtures.rpc_server import RpcServer
+from thirdweb.core.classes.batch_provider import BatchHTTPProvider
+from thirdweb.core.classes.call_cache import CallCache
+from thirdweb.types.sdk import CallCacheSettings
+
+CALL = {"to": "0x" + "11" * 20, "data": "0x18160ddd"}
+
+
+def create_cache(server: RpcServer, **settings) -> CallCache:
+    provider = Web3(BatchHTTPProvider(server.url))
+    cache = CallCache(provider, CallCacheSettings(enabled=True, **settings))
+    cache.install(provider)
+    return cache
+
+
+def eth_calls(server: RpcServer):
+    return [methods for methods in server.requests if methods == ["eth_call"]]
+
+
+def test_calls_cached_per_block(rpc_server: RpcServer):
+    block = {"number": 1}
+    rpc_server.handlers["eth_blockNumber"] = lambda params: hex(block["number"])
+    cache = create_cache(rpc_server, block_poll_interval=60)
+    provider = cache._provider
+
+    assert [provider.eth.call(CALL) for _ in range(3)] == [b"\x01"] * 3
+    assert provider.eth.call({**CALL, "data": "0x06fdde03"}) == b"\x01"
+    assert len(eth_calls(rpc_server)) == 2
+
+    # A newer block invalidates the results of older ones
+    block["number"] = 2
+    cache.observe_block(2)
+    provider.eth.call(CALL)
+    assert len(eth_calls(rpc_server)) == 3
+
+
+def test_latest_calls_cached_at_polled_block(rpc_server: RpcServer):
+    rpc_server.handlers["eth_blockNumber"] = lambda params: "0x5"
+    # The node answers latest reads with the state of its head, which moved past 5
+    rpc_server.handlers["eth_call"] = lambda params: (
+        "0xbbbb" if params[1] == "0x5" else "0xaaaa"
+    )
+    cache = create_cache(rpc_server, block_poll_interval=60)
+    provider = cache._provider
+
+    assert provider.eth.call(CALL) == b"\xbb\xbb"
+    with cache.pin(5):
+        assert provider.eth.call(CALL) == b"\xbb\xbb"
+    assert provider.eth.call(CALL, 5) == b"\xbb\xbb"
+    assert len(eth_calls(rpc_server)) == 1
+
+
+def test_calls_bounded(rpc_server: RpcServer):
+    cache = create_cache(rpc_server, block_poll_interval=60, max_entries=2)
+    provider = cache._provider
+
+    for data in ["0x01", "0x02", "0x03", "0x01"]:
+        provider.eth.call({**CALL, "data": data})
+
+    assert len(cache._results) == 2
+    assert len(eth_calls(rpc_server)) == 4
+
+
+def test_calls_pinned_to_block(rpc_server: RpcServer):
+    blocks = []
+    rpc_server.handlers["eth_blockNumber"] = lambda params: "0x10"
+    rpc_server.handlers["eth_call"] = lambda params: blocks.append(params[1]) or "0x01"
+    cache = create_cache(rpc_server)
+    provider = cache._provider
+
+    with cache.pin() as block_number:
+        provider.eth.call(CALL)
+        provider.eth.call(CALL)
+
+    assert block_number == 16
+    assert blocks == ["0x10"]
+
+
+def test_pins_scoped_to_thread(rpc_server: RpcServer):
+    rpc_server.handlers["eth_blockNumber"] = lambda params: "0x200"
+    # Each call answers with the block it was made at
+    rpc_server.handlers["eth_call"] = lambda params: (
+        params[1] if params[1] != "latest" else "0x200"
+    )
+    cache = create_cache(rpc_server, block_poll_interval=60)
+    provider = cache._provider
+    pinned = Barrier(3)
+
+    def read(block_number: Optional[int]) -> List[bytes]:
+        if block_number is None:
+            pinned.wait()
+            return [provider.eth.call(CALL)]
+
+        with cache.pin(block_number):
+            pinned.wait()
+            return [provider.eth.call(CALL), provider.eth.call(CALL)]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(read, [100, 105, None]))
+
+    assert results == [
+        [Web3.toBytes(hexstr="0x64")] * 2,
+        [Web3.toBytes(hexstr="0x69")] * 2,
+        [Web3.toBytes(hexstr="0x0200")],
+    ]
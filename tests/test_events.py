@@ -1,5 +1,6 @@
+from threading import Event
 from time import time
-from typing import Optional
+from typing import Any, Dict, Optional
 from brownie import accounts
 import pytest
 from thirdweb.constants.currency import NATIVE_TOKEN_ADDRESS, ZERO_ADDRESS
@@ -7,7 +8,12 @@ from thirdweb.constants.events import EventStatus, EventType
 from thirdweb.contracts.nft_collection import NFTCollection
 from thirdweb.core.sdk import ThirdwebSDK
 from thirdweb.types.contracts.signature import PayloadToSign721
-from thirdweb.types.events import EventQueryOptions, SignatureEvent, TxEvent
+from thirdweb.types.events import (
+    EventBackfillSettings,
+    EventQueryOptions,
+    SignatureEvent,
+    TxEvent,
+)
 from thirdweb.types.nft import NFTMetadataInput
 from thirdweb.types.settings.metadata import NFTCollectionContractMetadata
 
@@ -79,6 +85,43 @@ def test_signature_events(nft_collection: NFTCollection):
     assert event_status is not None
 
 
+def test_event_listener(nft_collection: NFTCollection):
+    minted = Event()
+
+    def listener(event: Dict[str, Any]):
+        if event["uri"] != "":
+            minted.set()
+
+    nft_collection.events.add_event_listener("TokensMinted", listener)
+    nft_collection.mint(NFTMetadataInput(name="Watched"))
+
+    assert minted.wait(timeout=30)
+    nft_collection.events.remove_event_listener("TokensMinted", listener)
+
+
+def test_stream_events(nft_collection: NFTCollection, tmp_path):
+    start = nft_collection._contract_wrapper.get_provider().eth.block_number
+    for i in range(3):
+        nft_collection.mint(NFTMetadataInput(name=f"Minted {i}"))
+
+    settings = EventBackfillSettings(
+        block_range=1, max_workers=2, checkpoint_path=str(tmp_path / "events.db")
+    )
+    events = list(
+        nft_collection.events.stream_events(
+            "TokensMinted", EventQueryOptions(from_block=start), settings
+        )
+    )
+    assert [event.args.tokenIdMinted for event in events] == [0, 1, 2]
+
+    # The checkpoint resumes after the last block that was backfilled
+    nft_collection.mint(NFTMetadataInput(name="Minted 3"))
+    events = nft_collection.events.get_events(
+        "TokensMinted", EventQueryOptions(from_block=start), settings
+    )
+    assert [event.args.tokenIdMinted for event in events] == [3]
+
+
 # @pytest.mark.usefixtures("primary_account")
 # def test_collection_events(nft_collection: NFTCollection, primary_account, secondary_account):
 #     nft_collection.mint(NFTMetadataInput(name="Minted"))
@@ -0,0 +1,79 @@
+import time
+
+import pytest
+from web3 import Web3
+
+from fixtures.rpc_server import RpcServer
+from thirdweb.core.classes.failover_provider import FailoverHTTPProvider
+from thirdweb.types.sdk import RpcFailoverSettings
+
+
+@pytest.fixture()
+def backup_rpc_server():
+    server = RpcServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_routes_to_fastest_endpoint(rpc_server: RpcServer, backup_rpc_server: RpcServer):
+    rpc_server.delay = 0.05
+    provider = Web3(
+        FailoverHTTPProvider([rpc_server.url, backup_rpc_server.url])
+    )
+
+    for _ in range(10):
+        assert provider.eth.block_number == 1
+
+    # Each endpoint is measured once, then the fastest one takes every request
+    assert len(rpc_server.requests) == 1
+    assert len(backup_rpc_server.requests) == 9
+
+
+def test_failover_and_reprobe(rpc_server: RpcServer, backup_rpc_server: RpcServer):
+    rpc_server.status = 503
+    provider = FailoverHTTPProvider(
+        [rpc_server.url, backup_rpc_server.url],
+        RpcFailoverSettings(max_consecutive_failures=1, cooldown=0.1),
+    )
+    web3 = Web3(provider)
+
+    # Failed requests are sent again to the other endpoint
+    for _ in range(5):
+        assert web3.eth.block_number == 1
+
+    assert len(rpc_server.requests) == 1
+    assert len(backup_rpc_server.requests) == 5
+    assert provider.get_endpoints()[-1].ejected_at is not None
+
+    # The ejected endpoint is probed after its cooldown, and reinstated once it answers
+    time.sleep(0.15)
+    assert len(rpc_server.requests) == 2
+    rpc_server.status = 200
+    time.sleep(0.3)
+
+    assert rpc_server.requests[-1] == ["eth_blockNumber"]
+    assert all(endpoint.ejected_at is None for endpoint in provider.get_endpoints())
+
+
+def test_batch_support_per_endpoint(
+    rpc_server: RpcServer, backup_rpc_server: RpcServer
+):
+    rpc_server.batch_support = False
+    provider = FailoverHTTPProvider(
+        [rpc_server.url, backup_rpc_server.url],
+        RpcFailoverSettings(round_robin=True),
+    )
+    calls = [("eth_blockNumber", []), ("eth_gasPrice", [])]
+
+    for _ in range(2):
+        responses = provider.request_batch(calls)
+        assert [response["result"] for response in responses] == ["0x1", "0x1"]
+
+    assert rpc_server.requests == [
+        ["eth_blockNumber", "eth_gasPrice"],
+        ["eth_blockNumber"],
+        ["eth_gasPrice"],
+    ]
+    # The endpoint without batch support does not stop the others from batching
+    assert backup_rpc_server.requests == [["eth_blockNumber", "eth_gasPrice"]]
@@ -0,0 +1,107 @@
+import time
+
+from web3 import Web3
+
+from fixtures.rpc_server import RpcServer
+from thirdweb.core.classes.fee_oracle import FeeOracle, get_fee_oracle
+from thirdweb.types.sdk import GasSettings
+
+
+def test_max_price_per_settings(rpc_server: RpcServer):
+    gwei = Web3.toWei(1, "gwei")
+    rpc_server.handlers["eth_feeHistory"] = lambda params: {
+        "oldestBlock": "0x1",
+        "baseFeePerGas": [hex(100 * gwei), hex(100 * gwei)],
+        "gasUsedRatio": [0.5],
+        "reward": [[hex(2 * gwei)]],
+    }
+    provider = Web3(Web3.HTTPProvider(rpc_server.url))
+
+    capped = get_fee_oracle(provider, GasSettings(max_price_in_gwei=50)).get_fees()
+    uncapped = get_fee_oracle(provider, GasSettings(max_price_in_gwei=300)).get_fees()
+
+    assert capped.max_fee_per_gas == 50 * gwei
+    assert uncapped.max_fee_per_gas == 202 * gwei
+
+
+def fee_history(params):
+    return {
+        "oldestBlock": "0x1",
+        "baseFeePerGas": [hex(Web3.toWei(1, "gwei"))] * 2,
+        "gasUsedRatio": [0.5],
+        "reward": [[hex(Web3.toWei(1, "gwei"))]],
+    }
+
+
+def count_requests(server: RpcServer, method: str) -> int:
+    return sum(methods.count(method) for methods in server.requests)
+
+
+def test_fees_cached_until_newer_block(rpc_server: RpcServer):
+    rpc_server.handlers["eth_feeHistory"] = fee_history
+    provider = Web3(Web3.HTTPProvider(rpc_server.url))
+    oracle = FeeOracle(provider, GasSettings(fee_cache_seconds=60))
+
+    fees = oracle.get_fees()
+    assert oracle.get_fees() == fees
+    # The fees were read at block 1, so seeing it again keeps them
+    oracle.observe_block(1)
+    assert oracle.get_fees() == fees
+    assert count_requests(rpc_server, "eth_feeHistory") == 1
+
+    # A transaction mined in a newer block means the fees are read again
+    oracle.observe_block(2)
+    oracle.get_fees()
+    assert count_requests(rpc_server, "eth_feeHistory") == 2
+
+
+def test_fees_expire(rpc_server: RpcServer):
+    rpc_server.handlers["eth_feeHistory"] = fee_history
+    provider = Web3(Web3.HTTPProvider(rpc_server.url))
+    oracle = FeeOracle(provider, GasSettings(fee_cache_seconds=0.05))
+
+    oracle.get_fees()
+    time.sleep(0.1)
+    oracle.get_fees()
+
+    assert count_requests(rpc_server, "eth_feeHistory") == 2
+
+
+def test_legacy_gas_price_without_fee_history(rpc_server: RpcServer):
+    gwei = Web3.toWei(1, "gwei")
+
+    def failing_fee_history(params):
+        raise Exception("the method eth_feeHistory does not exist")
+
+    rpc_server.handlers["eth_feeHistory"] = failing_fee_history
+    rpc_server.handlers["eth_gasPrice"] = lambda params: hex(400 * gwei)
+    provider = Web3(Web3.HTTPProvider(rpc_server.url))
+    oracle = FeeOracle(provider, GasSettings(max_price_in_gwei=300))
+
+    fees = oracle.get_fees()
+    assert fees.gas_price == 300 * gwei
+    assert fees.max_fee_per_gas is None
+    assert oracle.get_tx_params() == {"gasPrice": 300 * gwei}
+
+    # The chain is remembered not to support EIP-1559 once the fees expire
+    oracle.observe_block(1)
+    oracle.get_fees()
+    assert count_requests(rpc_server, "eth_feeHistory") == 1
+    assert count_requests(rpc_server, "eth_gasPrice") == 2
+
+
+def test_legacy_gas_price_with_zero_base_fees(rpc_server: RpcServer):
+    gwei = Web3.toWei(1, "gwei")
+    rpc_server.handlers["eth_feeHistory"] = lambda params: {
+        "oldestBlock": "0x1",
+        "baseFeePerGas": ["0x0", "0x0"],
+        "gasUsedRatio": [0.5],
+        "reward": [["0x0"]],
+    }
+    rpc_server.handlers["eth_gasPrice"] = lambda params: hex(5 * gwei)
+    provider = Web3(Web3.HTTPProvider(rpc_server.url))
+
+    fees = FeeOracle(provider).get_fees()
+
+    assert fees.gas_price == 5 * gwei
+    assert fees.max_fee_per_gas is None
@@ -121,3 +121,32 @@ def test_replace_gateway_urls(storage: IpfsStorage):
     downloaded = other_storage.get(upload)
 
     assert downloaded["svg"].startswith("https://ipfs.io/ipfs/")
+
+
+def test_get_batch(storage: IpfsStorage):
+    uri_with_metadata = storage.upload_metadata_batch(
+        [{"name": f"test {i}"} for i in range(5)]
+    )
+
+    metadatas = storage.get_batch(
+        uri_with_metadata.metadata_uris + ["ipfs://not-a-hash"], allow_failure=True
+    )
+
+    assert [metadata["name"] for metadata in metadatas[:5]] == [
+        f"test {i}" for i in range(5)
+    ]
+    assert metadatas[5] is None
+
+
+def test_get_cached(storage: IpfsStorage):
+    upload = storage.upload_metadata({"name": "cached"})
+
+    before = storage.cache_stats()
+    first = storage.get(upload)
+    second = storage.get(upload)
+    after = storage.cache_stats()
+
+    assert first == second
+    assert first is not second
+    assert after.misses == before.misses + 1
+    assert after.memory_hits == before.memory_hits + 1
@@ -0,0 +1,137 @@
+import json
+from io import BytesIO
+
+from fixtures.storage_server import StorageServer
+from thirdweb.common.cid import compute_cid
+from thirdweb.core.classes.ipfs_storage import IpfsStorage
+from thirdweb.types.sdk import StorageSettings
+
+
+def create_storage(server: StorageServer, **settings) -> IpfsStorage:
+    return IpfsStorage(
+        None,
+        settings=StorageSettings(retry_backoff_factor=0, **settings),
+        server_url=server.url,
+    )
+
+
+def test_upload_batch(storage_server: StorageServer):
+    storage = create_storage(storage_server)
+
+    with open("tests/files/0.jpg", "rb") as jpg:
+        uri = storage.upload_batch([{"name": "test.jpeg", "data": jpg}, {"a": 1}])
+        jpg.seek(0)
+        content = jpg.read()
+
+    files = storage_server.files[uri.replace("ipfs://", "")]
+    assert files["test.jpeg"] == content
+    assert json.loads(files["1"]) == {"a": 1}
+
+
+def test_upload_files_in_parts(storage_server: StorageServer, tmp_path):
+    paths = []
+    for i in range(10):
+        path = tmp_path / f"{i}.txt"
+        path.write_text(f"file {i}")
+        paths.append(path)
+
+    storage = create_storage(storage_server, upload_part_max_files=3)
+    storage_server.fail_next(2)
+    uris = storage.upload_files(paths)
+
+    assert len(storage_server.requests) == 4
+    for i, uri in enumerate(uris):
+        cid, name = uri.replace("ipfs://", "").split("/")
+        assert name == f"{i}.txt"
+        assert storage_server.files[cid][name] == f"file {i}".encode("utf-8")
+
+
+def test_upload_files_resume(storage_server: StorageServer, tmp_path):
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"{i}.txt"
+        path.write_text(f"file {i}")
+        paths.append(path)
+
+    manifest = str(tmp_path / "manifest.json")
+    storage = create_storage(
+        storage_server, upload_part_max_files=2, max_concurrent_uploads=1
+    )
+    uris = storage.upload_files(paths, manifest_path=manifest)
+    assert len(storage_server.requests) == 3
+
+    # Only the part whose file changed is uploaded again
+    paths[5].write_text("changed")
+    storage = create_storage(
+        storage_server, upload_part_max_files=2, max_concurrent_uploads=1
+    )
+    resumed = storage.upload_files(paths, manifest_path=manifest)
+
+    assert len(storage_server.requests) == 4
+    assert resumed[:4] == uris[:4]
+    assert resumed[4:] != uris[4:]
+
+
+def test_compute_cid():
+    assert compute_cid(BytesIO(b"")) == "QmbFMke1KXqnYyBBWxB74N4c5SBnJMVAiMNRcGu6x1AwQH"
+    assert (
+        compute_cid(BytesIO(b"hello world\n"))
+        == "QmT78zSuBmuS4z925WZfrqQ1qHaJ56DQaTfyMUF7F8ff5o"
+    )
+    assert (
+        compute_cid(BytesIO(b"hello world\n"), version=1)
+        == "bafybeicg2rebjoofv4kbyovkw7af3rpiitvnl6i7ckcywaq6xjcxnc2mby"
+    )
+
+
+def test_upload_deduplicated(storage_server: StorageServer, tmp_path):
+    placeholder = tmp_path / "placeholder.png"
+    placeholder.write_bytes(b"placeholder")
+    copy = tmp_path / "copy.png"
+    copy.write_bytes(b"placeholder")
+
+    storage = create_storage(storage_server, pin_index_path=str(tmp_path / "pins.db"))
+    images = [open(placeholder, "rb") for _ in range(5)] + [open(copy, "rb")]
+    try:
+        metadatas = storage.upload_metadata_batch(
+            [{"name": f"{i}", "image": image} for i, image in enumerate(images)]
+        )
+    finally:
+        for image in images:
+            image.close()
+
+    # The placeholder is shared by every token, so it is only uploaded once
+    assert storage_server.requests[0] == ["0.png"]
+    image_cid = list(storage_server.files)[0]
+    metadata_files = storage_server.files[metadatas.base_uri[len("ipfs://") : -1]]
+    assert {json.loads(f)["image"] for f in metadata_files.values()} == {
+        f"ipfs://{image_cid}/0.png"
+    }
+
+    # Content pinned by an earlier upload is not uploaded again
+    other_storage = create_storage(
+        storage_server, pin_index_path=str(tmp_path / "pins.db")
+    )
+    uris = other_storage.upload_files([copy, "text"])
+
+    assert storage_server.requests[-1] == ["1"]
+    assert uris[0] == f"ipfs://{image_cid}/0.png"
+
+
+def test_upload_shared_stream(storage_server: StorageServer):
+    image = BytesIO(b"placeholder image")
+    image.name = "placeholder.png"
+
+    storage = create_storage(storage_server)
+    metadatas = storage.upload_metadata_batch(
+        [{"name": f"{i}", "image": image} for i in range(3)]
+    )
+
+    # The stream is read once, and every entry gets its content
+    assert storage_server.requests[0] == ["0.png"]
+    image_cid = list(storage_server.files)[0]
+    assert storage_server.files[image_cid]["0.png"] == b"placeholder image"
+    metadata_files = storage_server.files[metadatas.base_uri[len("ipfs://") : -1]]
+    assert {json.loads(f)["image"] for f in metadata_files.values()} == {
+        f"ipfs://{image_cid}/0.png"
+    }
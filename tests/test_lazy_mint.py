@@ -0,0 +1,86 @@
+import json
+import os
+
+import pytest
+from thirdweb.contracts.nft_drop import NFTDrop
+
+from fixtures.nft_drop import nft_drop
+from thirdweb.types.nft import LazyMintSettings, NFTMetadataInput
+
+
+def test_create_batch_stream(nft_drop: NFTDrop, tmp_path):
+    metadatas = (NFTMetadataInput(name=f"NFT {i}") for i in range(25))
+    settings = LazyMintSettings(
+        chunk_size=10, checkpoint_path=str(tmp_path / "lazy_mint.json")
+    )
+    progress = []
+
+    txs = list(nft_drop.create_batch_stream(metadatas, settings, progress.append))
+
+    assert [tx.id for tx in txs] == list(range(25))
+    assert len({tx.receipt["transactionHash"] for tx in txs}) == 3
+    assert txs[24].data().name == "NFT 24"
+    assert progress[-1].minted == 25
+    assert nft_drop.get_total_count() == 25
+    assert not os.path.exists(settings.checkpoint_path)
+
+
+def test_create_batch_stream_resume(nft_drop: NFTDrop, tmp_path):
+    settings = LazyMintSettings(
+        chunk_size=10,
+        max_concurrent_uploads=1,
+        checkpoint_path=str(tmp_path / "lazy_mint.json"),
+    )
+
+    def interrupted_metadatas():
+        for i in range(25):
+            # Reached once the first chunk was sent, while reading the second one
+            if i == 15:
+                raise KeyboardInterrupt()
+            yield NFTMetadataInput(name=f"NFT {i}")
+
+    with pytest.raises(KeyboardInterrupt):
+        list(nft_drop.create_batch_stream(interrupted_metadatas(), settings))
+    assert os.path.exists(settings.checkpoint_path)
+
+    # Another NFT lazy minted by the signer outside the batch is not counted
+    nft_drop.create_batch([NFTMetadataInput(name="Other NFT")])
+
+    metadatas = (NFTMetadataInput(name=f"NFT {i}") for i in range(25))
+    txs = list(nft_drop.create_batch_stream(metadatas, settings))
+
+    names = [nft.metadata.name for nft in nft_drop.get_all()]
+    assert names == [f"NFT {i}" for i in range(10)] + ["Other NFT"] + [
+        f"NFT {i}" for i in range(10, 25)
+    ]
+    assert [tx.id for tx in txs] == list(range(11, 26))
+    assert not os.path.exists(settings.checkpoint_path)
+
+
+def test_create_batch_stream_resume_dropped(nft_drop: NFTDrop, tmp_path):
+    settings = LazyMintSettings(
+        chunk_size=10, checkpoint_path=str(tmp_path / "lazy_mint.json")
+    )
+
+    # The only chunk sent before the interruption never reached the node
+    with open(settings.checkpoint_path, "w") as f:
+        json.dump(
+            {
+                "contract": nft_drop._contract_wrapper._contract_abi.contract_address,
+                "minted": 0,
+                "pending": [
+                    {
+                        "transaction_hash": "0x" + "ab" * 32,
+                        "start_token_id": 0,
+                        "count": 10,
+                    }
+                ],
+            },
+            f,
+        )
+
+    metadatas = (NFTMetadataInput(name=f"NFT {i}") for i in range(10))
+    txs = list(nft_drop.create_batch_stream(metadatas, settings))
+
+    assert [tx.id for tx in txs] == list(range(10))
+    assert not os.path.exists(settings.checkpoint_path)
@@ -0,0 +1,108 @@
+import time
+from threading import Event
+from typing import Any, Dict, List
+
+import pytest
+from web3 import Web3
+from web3.contract import ContractEvent
+
+from fixtures.rpc_server import RpcServer
+from thirdweb.abi.token_erc721 import TokenERC721
+from thirdweb.core.classes.log_watcher import LogWatcher
+from thirdweb.types.sdk import EventSettings
+
+CONTRACT_ADDRESS = "0x0000000000000000000000000000000000000001"
+
+
+def transfer_log(block_number: int):
+    topic = Web3.keccak(text="Transfer(address,address,uint256)").hex()
+    return {
+        "address": CONTRACT_ADDRESS,
+        "topics": [topic, "0x" + "00" * 32, "0x" + "00" * 31 + "02", "0x" + "00" * 31 + "07"],
+        "data": "0x",
+        "blockNumber": hex(block_number),
+        "blockHash": "0x" + "11" * 32,
+        "transactionHash": "0x" + "22" * 32,
+        "transactionIndex": "0x0",
+        "logIndex": "0x0",
+        "removed": False,
+    }
+
+
+def serve_chain(rpc_server: RpcServer, chain: Dict[str, Any]) -> ContractEvent:
+    def new_filter(params):
+        chain["filter_from"] = chain["block"] + 1
+        return "0x1"
+
+    def get_filter_changes(params):
+        if chain.get("filter_error") is not None:
+            raise ValueError(chain["filter_error"])
+
+        # Filters only see the logs of blocks mined after they were created
+        logs = [
+            log
+            for log in chain["logs"]
+            if int(log["blockNumber"], 16) >= chain["filter_from"]
+        ]
+        chain["filter_from"] = chain["block"] + 1
+        return logs
+
+    rpc_server.handlers.update(
+        {
+            "eth_blockNumber": lambda params: hex(chain["block"]),
+            "eth_newFilter": new_filter,
+            "eth_getFilterChanges": get_filter_changes,
+            "eth_uninstallFilter": lambda params: True,
+            "eth_getLogs": lambda params: [
+                log
+                for log in chain["logs"]
+                if int(params[0]["fromBlock"], 16)
+                <= int(log["blockNumber"], 16)
+                <= int(params[0]["toBlock"], 16)
+            ],
+        }
+    )
+    provider = Web3(Web3.HTTPProvider(rpc_server.url))
+    return provider.eth.contract(
+        address=CONTRACT_ADDRESS, abi=TokenERC721.abi()
+    ).events.Transfer()
+
+
+@pytest.mark.parametrize("use_filters", [True, False])
+def test_logs_emitted_before_first_poll(rpc_server: RpcServer, use_filters: bool):
+    chain: Dict[str, Any] = {"block": 10, "logs": [], "filter_from": None}
+    event = serve_chain(rpc_server, chain)
+    watcher = LogWatcher(
+        event.web3, EventSettings(poll_interval=0.2, use_filters=use_filters)
+    )
+
+    received = Event()
+    watcher.subscribe(event, lambda e: received.set())
+
+    # The log is emitted before the watcher polls for the first time
+    chain["block"] = 11
+    chain["logs"] = [transfer_log(11)]
+
+    assert received.wait(timeout=3)
+
+
+@pytest.mark.parametrize("error", ["filter not found", "the method is not available"])
+def test_logs_emitted_while_filter_lost(rpc_server: RpcServer, error: str):
+    chain: Dict[str, Any] = {"block": 10, "logs": [], "filter_from": None}
+    event = serve_chain(rpc_server, chain)
+    watcher = LogWatcher(event.web3, EventSettings(poll_interval=0.2))
+
+    received: List[int] = []
+    watcher.subscribe(event, lambda e: received.append(e.blockNumber))
+
+    # The node drops the filter, or stops supporting filters, while a log is emitted
+    chain["filter_error"] = error
+    chain["block"] = 11
+    chain["logs"] = [transfer_log(11)]
+    time.sleep(0.3)
+    chain["filter_error"] = None
+    chain["block"] = 12
+    chain["logs"].append(transfer_log(12))
+    time.sleep(0.7)
+
+    assert received == [11, 12]
@@ -4,7 +4,11 @@ from thirdweb.contracts import Marketplace, NFTCollection, Edition, Token
 from brownie import accounts
 import pytest
 from thirdweb.types.currency import TokenAmount
-from thirdweb.types.marketplace import NewAuctionListing, NewDirectListing
+from thirdweb.types.marketplace import (
+    MarketplaceIndexSettings,
+    NewAuctionListing,
+    NewDirectListing,
+)
 
 from thirdweb.types.nft import EditionMetadataInput, NFTMetadataInput
 from thirdweb.types.settings.metadata import (
@@ -200,3 +204,32 @@ def test_make_offer(
         currency_contract_address=token.get_address(),
         price_per_token=0.1,
     )
+
+
+def test_listing_index(
+    sdk: ThirdwebSDK,
+    marketplace: Marketplace,
+    nft_collection: NFTCollection,
+    token: Token,
+):
+    create_direct_listing(
+        marketplace, token.get_address(), nft_collection.get_address(), 0
+    )
+    create_auction_listing(
+        marketplace, token.get_address(), nft_collection.get_address(), 1
+    )
+
+    index = marketplace.enable_listing_index(
+        MarketplaceIndexSettings(confirmations=0)
+    )
+
+    assert len(index.get_active()) == 2
+    assert len(index.get_by_seller(sdk.get_signer().address)) == 2  # type: ignore
+    assert len(index.get_by_asset(nft_collection.get_address(), token_id=1)) == 1
+    assert len(index.get_by_currency(token.get_address())) == 2
+
+    marketplace.buyout_listing(0, quantity_desired=1, receiver=accounts[0].address)
+    index.sync()
+
+    assert [listing.listing_id for listing in index.get_active()] == [1]
+    assert len(marketplace.get_active_listings()) == 1
@@ -0,0 +1,72 @@
+from eth_abi import encode_abi
+from web3 import Web3
+
+from fixtures.rpc_server import RpcServer
+from thirdweb.abi import Marketplace
+from thirdweb.constants.currency import ZERO_ADDRESS
+from thirdweb.core.classes.contract_wrapper import ContractWrapper
+from thirdweb.core.classes.marketplace_index import MarketplaceIndex
+from thirdweb.types.marketplace import MarketplaceIndexSettings
+
+MARKETPLACE_ADDRESS = "0x0000000000000000000000000000000000000001"
+SELLER = "0x" + "22" * 20
+ASSET = "0x" + "33" * 20
+
+LISTING_TYPES = [
+    "uint256",
+    "address",
+    "address",
+    "uint256",
+    "uint256",
+    "uint256",
+    "uint256",
+    "address",
+    "uint256",
+    "uint256",
+    "uint8",
+    "uint8",
+]
+
+
+def marketplace_call(blocks):
+    def call(params):
+        blocks.append(params[1])
+        data = params[0]["data"]
+        if data[:10] == Web3.keccak(text="totalListings()")[:4].hex():
+            return Web3.toHex(encode_abi(["uint256"], [3]))
+
+        listing_id = int(data[10:], 16)
+        # The second listing was removed, which zeroes its asset contract
+        asset = ZERO_ADDRESS if listing_id == 1 else ASSET
+        values = [listing_id, SELLER, asset, listing_id, 0, 2**40, 1]
+        values += [ZERO_ADDRESS, 0, 10**18 * (listing_id + 1), 0, 0]
+        return Web3.toHex(encode_abi(LISTING_TYPES, values))
+
+    return call
+
+
+def test_seed_at_checkpoint_block(rpc_server: RpcServer):
+    blocks = []
+    rpc_server.handlers.update(
+        {
+            "eth_blockNumber": lambda params: hex(10),
+            "eth_getCode": lambda params: "0x",
+            "eth_call": marketplace_call(blocks),
+            "eth_getBlockByNumber": lambda params: {
+                "number": params[0],
+                "hash": "0x" + "44" * 32,
+            },
+        }
+    )
+    provider = Web3(Web3.HTTPProvider(rpc_server.url))
+    contract_wrapper = ContractWrapper(
+        Marketplace(provider, MARKETPLACE_ADDRESS), provider
+    )
+    index = MarketplaceIndex(contract_wrapper, MarketplaceIndexSettings(confirmations=2))
+
+    assert index.sync() == 8
+
+    # Every read of the seed is made at the checkpoint block
+    assert set(blocks) == {hex(8)}
+    assert [listing.listing_id for listing in index.get_by_seller(SELLER)] == [0, 2]
+    assert len(index.get_by_price_range(2 * 10**18, 3 * 10**18)) == 1
@@ -0,0 +1,98 @@
+import os
+from web3 import Web3
+from thirdweb.common.merkle_tree import MerkleTree
+from thirdweb.core.classes.sharded_merkle_tree import get_sharded_merkle_tree
+
+
+def build_tree(count: int):
+    leaves = [os.urandom(32).hex() for _ in range(count)]
+    tree = MerkleTree()
+    tree.add_leaf(leaves)
+    tree.make_tree()
+    return tree, leaves
+
+
+def test_proofs():
+    for count in [1, 2, 3, 8, 13]:
+        tree, leaves = build_tree(count)
+        root = tree.get_merkle_root()
+
+        for leaf in leaves:
+            proof = tree.get_proof(leaf)
+            assert proof is not None
+            assert tree.validate_proof(proof, leaf, root)
+
+    assert tree.get_proof(os.urandom(32).hex()) is None
+
+
+def test_fixed_vectors():
+    # Root and proofs generated by the MerkleTree this implementation replaced
+    tree = MerkleTree()
+    tree.add_leaf([f"0x{i:040x}" for i in range(1, 6)], do_hash=True)
+    tree.make_tree()
+
+    assert (
+        tree.get_merkle_root()
+        == "fa23376727d71f2bc032c214dd24e218970e4b52d326cc3d0b722fdf825c200a"
+    )
+    assert tree.get_proof(
+        "598c9a9c3ecd8f7c2add2026dbe81835424498dc13ad7b8f962b7a7db71154ac"
+    ) == [
+        {"right": "6f4626cda1fa787a6267f2a3fb88bcf485e1d7d9828bd8c56329dc67d2574640"},
+        {"left": "096c2ea52dce1146203e0996130a76e099985a52b247dac3bc3503fda1afc573"},
+        {"right": "bcc2192660e415142f6fb338081a9efe1152ffbfec1ac3f2f90a6201ea3c5e16"},
+    ]
+    # The odd leaf at the end of a level is carried up without a sibling
+    assert tree.get_proofs(
+        ["bcc2192660e415142f6fb338081a9efe1152ffbfec1ac3f2f90a6201ea3c5e16"]
+    ) == [
+        [{"left": "4c3ef22ed375417add07cb2fdf63948f364ed482b2407fe861249f89cab6bb3c"}]
+    ]
+
+
+def test_get_proofs():
+    tree, leaves = build_tree(100)
+    missing = os.urandom(32).hex()
+
+    proofs = tree.get_proofs(leaves + [missing])
+
+    assert proofs[:-1] == [tree.get_proof(leaf) for leaf in leaves]
+    assert proofs[-1] is None
+
+
+class FileStorage:
+    def __init__(self, files):
+        self.files = files
+
+    def get(self, uri):
+        return self.files[uri]
+
+
+def test_sharded_merkle_trees_per_chain():
+    root = "0x" + os.urandom(32).hex()
+    address = Web3.toChecksumAddress("0x" + "ab" * 20)
+    info = FileStorage({
+        "ipfs://info": {
+            "merkleRoot": root,
+            "baseUri": "ipfs://shards",
+            "originalEntriesUri": "ipfs://entries",
+            "shardNybbles": 2,
+            "tokenDecimals": 0,
+        }
+    })
+    shards = FileStorage({
+        "ipfs://shards/ab.json": {
+            "proofs": [],
+            "entries": [{"address": address, "maxClaimable": "1", "price": "0"}],
+        }
+    })
+
+    tree = get_sharded_merkle_tree(1, root, "ipfs://info", info)
+
+    assert tree is not None
+    assert get_sharded_merkle_tree(1, root.upper(), "ipfs://info", info) is tree
+    assert get_sharded_merkle_tree(2, root, "ipfs://info", info) is not tree
+    # The shared tree fetches its shards with the storage of each caller
+    assert tree.storage is None
+    proof = tree.get_proof(address, Web3(), shards)
+    assert proof is not None and proof.address == address
@@ -127,3 +127,41 @@ def test_ownership(nft_collection: NFTCollection, primary_account):
 
     assert nft_collection.get_owned_token_ids() == [0, 1]
     assert nft_collection.get_owned()[0].metadata.name == "Python SDK NFT 1"
+
+
+def test_get_all(nft_collection: NFTCollection):
+    nft_collection.mint_batch(
+        [
+            NFTMetadataInput.from_json({"name": "Python SDK NFT 1"}),
+            NFTMetadataInput.from_json({"name": "Python SDK NFT 2"}),
+            NFTMetadataInput.from_json({"name": "Python SDK NFT 3"}),
+        ],
+    )
+    nft_collection.burn(1)
+
+    nfts = nft_collection.get_all()
+
+    assert [nft.metadata.id for nft in nfts] == [0, 1, 2]
+    assert [nft.metadata.name for nft in nfts] == [
+        "Python SDK NFT 1",
+        "Python SDK NFT 2",
+        "Python SDK NFT 3",
+    ]
+    assert nfts[0].owner == nft_collection._contract_wrapper.get_signer_address()
+    assert nfts[1].owner == ZERO_ADDRESS
+
+
+def test_submit_mint_to(nft_collection: NFTCollection):
+    pending = [
+        nft_collection.submit_mint_to(
+            accounts[0].address,
+            NFTMetadataInput.from_json({"name": f"Python SDK NFT {i}"}),
+        )
+        for i in range(3)
+    ]
+
+    results = [tx.wait() for tx in pending]
+
+    assert all(tx.done() for tx in pending)
+    assert sorted(result.id for result in results) == [0, 1, 2]
+    assert nft_collection.balance_of(accounts[0].address) == 3
@@ -0,0 +1,111 @@
+import pytest
+from eth_account import Account
+from web3 import Web3
+
+from fixtures.rpc_server import RpcServer
+from thirdweb.core.classes.batch_provider import BatchHTTPProvider
+from thirdweb.core.classes.call_cache import CALL_CACHE_MIDDLEWARE
+from thirdweb.core.classes.provider_handler import ProviderHandler
+from thirdweb.core.classes.read_write_provider import ReadWriteProvider
+from thirdweb.core.helpers.rpc import batch_request
+from thirdweb.types.sdk import CallCacheSettings, ReadOnlySettings, SDKOptions
+
+
+@pytest.fixture()
+def read_rpc_servers():
+    servers = [RpcServer(), RpcServer()]
+    for server in servers:
+        server.start()
+    yield servers
+    for server in servers:
+        server.stop()
+
+
+def test_reads_routed_to_read_only_rpc(rpc_server: RpcServer, read_rpc_servers):
+    first, second = read_rpc_servers
+    rpc_server.handlers["eth_sendRawTransaction"] = lambda params: "0x" + "ab" * 32
+    handler = ProviderHandler(
+        Web3(BatchHTTPProvider(rpc_server.url)),
+        options=SDKOptions(
+            read_only_settings=ReadOnlySettings(
+                rpc_url=first.url, rpc_urls=[second.url], round_robin=True
+            )
+        ),
+    )
+    provider = handler.get_provider()
+    assert isinstance(provider.provider, ReadWriteProvider)
+
+    for _ in range(4):
+        assert provider.eth.block_number == 1
+    provider.eth.send_raw_transaction("0x01")
+
+    # Reads are spread over the read-only RPCs, and transactions go to the signer RPC
+    assert rpc_server.requests == [["eth_sendRawTransaction"]]
+    assert first.requests == [["eth_blockNumber"]] * 2
+    assert second.requests == [["eth_blockNumber"]] * 2
+
+    # Other handlers sharing the provider keep the same read-only connections
+    other = ProviderHandler(provider, options=handler.get_options())
+    assert other.get_provider().provider is provider.provider
+
+    responses = batch_request(
+        provider,
+        [
+            ("eth_getTransactionReceipt", ["0x" + "ab" * 32]),
+            ("eth_getTransactionCount", ["0x" + "00" * 20, "pending"]),
+        ],
+    )
+    assert [response["result"] for response in responses] == ["0x1", "0x1"]
+    assert rpc_server.requests[-1] == ["eth_getTransactionCount"]
+    assert ["eth_getTransactionReceipt"] in first.requests + second.requests
+
+
+def test_provider_passed_in_left_untouched(rpc_server: RpcServer, read_rpc_servers):
+    provider = Web3(BatchHTTPProvider(rpc_server.url))
+    transport = provider.provider
+    middlewares = list(provider.middleware_onion)
+    requests = []
+
+    def record(make_request, w3):
+        return lambda method, params: requests.append(method) or make_request(
+            method, params
+        )
+
+    transport.middlewares = [record]
+    handler = ProviderHandler(
+        provider,
+        options=SDKOptions(
+            read_only_settings=ReadOnlySettings(rpc_url=read_rpc_servers[0].url),
+            call_cache_settings=CallCacheSettings(enabled=True),
+        ),
+    )
+
+    assert provider.provider is transport
+    assert list(provider.middleware_onion) == middlewares
+    assert handler.get_provider() is not provider
+
+    # Requests sent to a provider still go through its own middlewares
+    handler.get_provider().eth.send_raw_transaction("0x01")
+    assert requests == ["eth_sendRawTransaction"]
+
+
+def test_provider_passed_in_used_as_is(rpc_server: RpcServer):
+    provider = Web3(BatchHTTPProvider(rpc_server.url))
+    signer = Account.create()
+    handler = ProviderHandler(provider, signer)
+    requests = []
+
+    def record(make_request, w3):
+        return lambda method, params: requests.append(method) or make_request(
+            method, params
+        )
+
+    # Without reads to route or cache, the provider is neither copied nor changed
+    assert handler.get_provider() is provider
+    assert provider.eth.default_account == signer.address
+    assert CALL_CACHE_MIDDLEWARE not in provider.middleware_onion
+
+    # Middlewares added afterwards apply to the requests of the SDK
+    provider.middleware_onion.add(record)
+    handler.get_provider().eth.block_number
+    assert requests == ["eth_blockNumber"]
@@ -0,0 +1,46 @@
+import time
+
+import pytest
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import TimeExhausted
+
+from fixtures.rpc_server import RpcServer
+from thirdweb.core.classes.receipt_poller import ReceiptPoller
+from thirdweb.types.sdk import TransactionSettings
+
+TX_HASH = HexBytes("0x" + "ab" * 32)
+
+
+def test_timeout_while_node_fails(rpc_server: RpcServer):
+    rpc_server.status = 500
+    poller = ReceiptPoller(
+        Web3(Web3.HTTPProvider(rpc_server.url)),
+        TransactionSettings(receipt_poll_interval=0.05, receipt_timeout=0.3),
+    )
+
+    start = time.monotonic()
+    with pytest.raises(TimeExhausted):
+        poller.track(TX_HASH).wait()
+
+    assert time.monotonic() - start < 2
+    assert poller.pending_count() == 0
+
+
+def test_receipts_without_batch_support(rpc_server: RpcServer):
+    rpc_server.batch_support = False
+    rpc_server.handlers["eth_getTransactionReceipt"] = lambda params: {
+        "transactionHash": params[0],
+        "blockNumber": "0x2",
+        "status": "0x1",
+        "logs": [],
+    }
+    poller = ReceiptPoller(
+        Web3(Web3.HTTPProvider(rpc_server.url)),
+        TransactionSettings(receipt_poll_interval=0.05, receipt_timeout=5),
+    )
+
+    receipt = poller.track(TX_HASH).wait(timeout=3)
+
+    assert receipt["blockNumber"] == 2
+    assert receipt["transactionHash"] == TX_HASH
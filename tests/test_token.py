@@ -1,5 +1,7 @@
 from tkinter.tix import IMAGE
+from concurrent.futures import ThreadPoolExecutor
 from eth_account.account import LocalAccount
+from thirdweb.common.error import MultiCallBatchException
 from thirdweb.constants.currency import ZERO_ADDRESS
 from thirdweb.core.sdk import ThirdwebSDK
 from thirdweb.contracts import Token
@@ -64,9 +66,127 @@ def test_transfer_tokens(token: Token):
     assert token.balance_of(accounts[0].address).display_value == 10
 
 
-# test vote functionality / delegations
+def test_submit_transfer(token: Token):
+    """
+    Should transfer tokens without waiting for each transfer to be mined
+    """
+
+    token.mint(20)
+
+    pending = [token.submit_transfer(accounts[0].address, 2) for _ in range(3)]
+    receipts = [tx.wait() for tx in pending]
+
+    assert all(receipt.get("status") == 1 for receipt in receipts)
+    assert token.balance().display_value == 14
+    assert token.balance_of(accounts[0].address).display_value == 6
+
+
+def test_concurrent_transfers(token: Token):
+    """
+    Should not reuse nonces when the same signer sends from many threads
+    """
+
+    token.mint(20)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        receipts = list(
+            executor.map(
+                lambda _: token.transfer(accounts[0].address, 1), range(10)
+            )
+        )
+
+    assert all(receipt.get("status") == 1 for receipt in receipts)
+    assert token.balance().display_value == 10
+    assert token.balance_of(accounts[0].address).display_value == 10
+
+
+def test_batch_mint_split_by_gas(token: Token):
+    """
+    Should split a batch mint into several multicalls under the gas ceiling
+    """
+
+    contract_wrapper = token._contract_wrapper
+    interface = contract_wrapper.get_contract_interface()
+    encoded = [
+        interface.encodeABI("mintTo", [accounts[i % 3].address, 10**18])
+        for i in range(12)
+    ]
+
+    receipts = contract_wrapper.multi_call_batch(encoded, max_gas=200000)
 
-# test batch minting
+    assert len(receipts) == len(encoded)
+    assert len({receipt["transactionHash"] for receipt in receipts}) > 1
+    assert all(receipt.get("status") == 1 for receipt in receipts)
+    assert token.balance_of(accounts[0].address).display_value == 4
+
+
+def test_batch_dependent_calls_split_by_gas(token: Token):
+    """
+    Should split a batch whose calls depend on earlier calls of the batch
+    """
+
+    contract_wrapper = token._contract_wrapper
+    interface = contract_wrapper.get_contract_interface()
+    signer = contract_wrapper.get_signer_address()
+    # The transfer only succeeds after the mint before it, so it fails to estimate alone
+    encoded = [
+        interface.encodeABI("mintTo", [signer, 10**18]),
+        interface.encodeABI("transfer", [accounts[1].address, 10**18]),
+    ] + [
+        interface.encodeABI("mintTo", [accounts[2].address, 10**18])
+        for _ in range(10)
+    ]
+
+    receipts = contract_wrapper.multi_call_batch(encoded, max_gas=200000)
+
+    assert len({receipt["transactionHash"] for receipt in receipts}) > 1
+    assert all(receipt.get("status") == 1 for receipt in receipts)
+    assert token.balance_of(accounts[1].address).display_value == 1
+    assert token.balance_of(accounts[2].address).display_value == 10
+
+
+def test_batch_partial_failure(token: Token):
+    """
+    Should report which calls of a batch split by gas were not executed
+    """
+
+    token.mint(1)
+    contract_wrapper = token._contract_wrapper
+    interface = contract_wrapper.get_contract_interface()
+    transfer = interface.encodeABI("transfer", [accounts[1].address, 10**18])
+    # Each transfer estimates alone, but the second one reverts after the first
+    encoded = (
+        [transfer]
+        + [
+            interface.encodeABI("mintTo", [accounts[2].address, 10**18])
+            for _ in range(10)
+        ]
+        + [transfer]
+    )
+
+    with pytest.raises(MultiCallBatchException) as e:
+        contract_wrapper.multi_call_batch(encoded, max_gas=200000)
+
+    assert len(e.value.receipts) == len(encoded)
+    assert e.value.succeeded[0] and not e.value.succeeded[-1]
+    assert token.balance_of(accounts[1].address).display_value == 1
+
+
+def test_eip1559_fees(token: Token):
+    """
+    Should price transactions with EIP-1559 fees under the gas price cap
+    """
+
+    receipt = token.mint(20)
+    provider = token._contract_wrapper.get_provider()
+    tx = provider.eth.get_transaction(receipt["transactionHash"])
+    max_price = token._contract_wrapper.get_options().gas_settings.max_price_in_gwei
+
+    assert tx["type"] in (2, "0x2")
+    assert tx["maxFeePerGas"] <= max_price * 10**9
+
+
+# test vote functionality / delegations
 
 # test burning tokens
 
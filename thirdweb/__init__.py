@@ -1 +1 @@
-from .core import ThirdwebSDK
+from .core import ThirdwebSDK, AsyncThirdwebSDK
@@ -1,269 +1,563 @@
+"""Generated wrappers for the thirdweb contracts, each imported on first access."""
 
-from .staking721_upgradeable import Staking721Upgradeable # pylint: disable=unused-import
-from .staking1155 import Staking1155 # pylint: disable=unused-import
-from .i_plugin_map import IPluginMap # pylint: disable=unused-import
-from .signature_action import SignatureAction # pylint: disable=unused-import
-from .i_direct_listings import IDirectListings # pylint: disable=unused-import
-from .multiwrap import Multiwrap # pylint: disable=unused-import
-from .erc20_votes import ERC20Votes # pylint: disable=unused-import
-from .i_t_w_fee import ITWFee # pylint: disable=unused-import
-from .permissions import Permissions # pylint: disable=unused-import
-from .pack import Pack # pylint: disable=unused-import
-from .primary_sale import PrimarySale # pylint: disable=unused-import
-from .drop_single_phase1155 import DropSinglePhase1155 # pylint: disable=unused-import
-from .i_airdrop_erc721 import IAirdropERC721 # pylint: disable=unused-import
-from .t_w_fee import TWFee # pylint: disable=unused-import
-from .i_contract_publisher import IContractPublisher # pylint: disable=unused-import
-from .i_ownable import IOwnable # pylint: disable=unused-import
-from .signaturedrop_v4 import SignatureDrop_V4 # pylint: disable=unused-import
-from .i_token_erc20 import ITokenERC20 # pylint: disable=unused-import
-from .operator_filter_toggle import OperatorFilterToggle # pylint: disable=unused-import
-from .enumerable_set import EnumerableSet # pylint: disable=unused-import
-from .merkle_proof import MerkleProof # pylint: disable=unused-import
-from .safe_cast import SafeCast # pylint: disable=unused-import
-from .staking721 import Staking721 # pylint: disable=unused-import
-from .erc721a import ERC721A # pylint: disable=unused-import
-from .erc721_multiwrap import ERC721Multiwrap # pylint: disable=unused-import
-from .signature_drop import SignatureDrop # pylint: disable=unused-import
-from .i_mintable_erc721 import IMintableERC721 # pylint: disable=unused-import
-from .mock import Mock # pylint: disable=unused-import
-from .i_claim_conditions_single_phase import IClaimConditionsSinglePhase # pylint: disable=unused-import
-from .i_erc2771_context import IERC2771Context # pylint: disable=unused-import
-from .ierc165 import IERC165 # pylint: disable=unused-import
-from .erc721_delayed_reveal import ERC721DelayedReveal # pylint: disable=unused-import
-from .iclaimcondition_v1 import IClaimCondition_V1 # pylint: disable=unused-import
-from .ierc1155 import IERC1155 # pylint: disable=unused-import
-from .i_staking1155 import IStaking1155 # pylint: disable=unused-import
-from .math import Math # pylint: disable=unused-import
-from .i_signature_mint_erc1155 import ISignatureMintERC1155 # pylint: disable=unused-import
-from .i_pack import IPack # pylint: disable=unused-import
-from .i_mintable_erc1155 import IMintableERC1155 # pylint: disable=unused-import
-from .reentrancy_guard_logic import ReentrancyGuardLogic # pylint: disable=unused-import
-from .i_erc1155_receiver import IERC1155Receiver # pylint: disable=unused-import
-from .erc2771_context_logic import ERC2771ContextLogic # pylint: disable=unused-import
-from .t_w_bit_maps import TWBitMaps # pylint: disable=unused-import
-from .ierc2981 import IERC2981 # pylint: disable=unused-import
-from .i_lazy_mint_with_tier import ILazyMintWithTier # pylint: disable=unused-import
-from .erc721_signature_mint import ERC721SignatureMint # pylint: disable=unused-import
-from .i_primary_sale import IPrimarySale # pylint: disable=unused-import
-from .signature_action_upgradeable import SignatureActionUpgradeable # pylint: disable=unused-import
-from .i_permissions import IPermissions # pylint: disable=unused-import
-from .english_auctions_logic import EnglishAuctionsLogic # pylint: disable=unused-import
-from .i_multicall import IMulticall # pylint: disable=unused-import
-from .erc721_lazy_mint import ERC721LazyMint # pylint: disable=unused-import
-from .idropsinglephase_v1 import IDropSinglePhase_V1 # pylint: disable=unused-import
-from .drop_erc721 import DropERC721 # pylint: disable=unused-import
-from .airdrop_erc721 import AirdropERC721 # pylint: disable=unused-import
-from .i_drop_single_phase import IDropSinglePhase # pylint: disable=unused-import
-from .init_storage import InitStorage # pylint: disable=unused-import
-from .i_drop_single_phase1155 import IDropSinglePhase1155 # pylint: disable=unused-import
-from .t_w_storage_slot import TWStorageSlot # pylint: disable=unused-import
-from .t_w_registry import TWRegistry # pylint: disable=unused-import
-from .mock_contract import MockContract # pylint: disable=unused-import
-from .erc2771_context import ERC2771Context # pylint: disable=unused-import
-from .i_erc721_receiver import IERC721Receiver # pylint: disable=unused-import
-from .erc1155_holder import ERC1155Holder # pylint: disable=unused-import
-from .platform_fee_logic import PlatformFeeLogic # pylint: disable=unused-import
-from .royalty import Royalty # pylint: disable=unused-import
-from .i_mintable_erc20 import IMintableERC20 # pylint: disable=unused-import
-from .permissions_logic import PermissionsLogic # pylint: disable=unused-import
-from .staking20_base import Staking20Base # pylint: disable=unused-import
-from .i_context import IContext # pylint: disable=unused-import
-from .staking20_upgradeable import Staking20Upgradeable # pylint: disable=unused-import
-from .proxy import Proxy # pylint: disable=unused-import
-from .erc1967_proxy import ERC1967Proxy # pylint: disable=unused-import
-from .t_w_address import TWAddress # pylint: disable=unused-import
-from .contract_metadata import ContractMetadata # pylint: disable=unused-import
-from .i_offers import IOffers # pylint: disable=unused-import
-from .staking1155_base import Staking1155Base # pylint: disable=unused-import
-from .t_w_factory import TWFactory # pylint: disable=unused-import
-from .safe_math import SafeMath # pylint: disable=unused-import
-from .marketplace_v3 import MarketplaceV3 # pylint: disable=unused-import
-from .erc2771_context_consumer import ERC2771ContextConsumer # pylint: disable=unused-import
-from .droperc721_v3 import DropERC721_V3 # pylint: disable=unused-import
-from .operator_filterer import OperatorFilterer # pylint: disable=unused-import
-from .i_delayed_reveal import IDelayedReveal # pylint: disable=unused-import
-from .token_erc721 import TokenERC721 # pylint: disable=unused-import
-from .platform_fee_storage import PlatformFeeStorage # pylint: disable=unused-import
-from .i_t_w_registry import ITWRegistry # pylint: disable=unused-import
-from .drop_erc20 import DropERC20 # pylint: disable=unused-import
-from .i_drop_erc721 import IDropERC721 # pylint: disable=unused-import
-from .i_marketplace import IMarketplace # pylint: disable=unused-import
-from .i_thirdweb_contract import IThirdwebContract # pylint: disable=unused-import
-from .i_claim_condition_multi_phase import IClaimConditionMultiPhase # pylint: disable=unused-import
-from .reentrancy_guard_storage import ReentrancyGuardStorage # pylint: disable=unused-import
-from .i_burnable_erc20 import IBurnableERC20 # pylint: disable=unused-import
-from .initializable import Initializable # pylint: disable=unused-import
-from .i_airdrop_erc20_claimable import IAirdropERC20Claimable # pylint: disable=unused-import
-from .airdrop_erc1155 import AirdropERC1155 # pylint: disable=unused-import
-from .erc721_a_upgradeable import ERC721AUpgradeable # pylint: disable=unused-import
-from .router_storage import RouterStorage # pylint: disable=unused-import
-from .token_erc20 import TokenERC20 # pylint: disable=unused-import
-from .airdrop_erc20_claimable import AirdropERC20Claimable # pylint: disable=unused-import
-from .signature_mint_erc20 import SignatureMintERC20 # pylint: disable=unused-import
-from .staking1155_upgradeable import Staking1155Upgradeable # pylint: disable=unused-import
-from .english_auctions_storage import EnglishAuctionsStorage # pylint: disable=unused-import
-from .idroperc721_v3 import IDropERC721_V3 # pylint: disable=unused-import
-from .eip712 import EIP712 # pylint: disable=unused-import
-from .delayed_reveal import DelayedReveal # pylint: disable=unused-import
-from .offers_storage import OffersStorage # pylint: disable=unused-import
-from .i_claimable_erc721 import IClaimableERC721 # pylint: disable=unused-import
-from .i_burnable_erc1155 import IBurnableERC1155 # pylint: disable=unused-import
-from .erc165 import ERC165 # pylint: disable=unused-import
-from .router_immutable import RouterImmutable # pylint: disable=unused-import
-from .i_staking20 import IStaking20 # pylint: disable=unused-import
-from .i_erc721_supply import IERC721Supply # pylint: disable=unused-import
-from .i_token_erc721 import ITokenERC721 # pylint: disable=unused-import
-from .erc2771_context_upgradeable import ERC2771ContextUpgradeable # pylint: disable=unused-import
-from .idropclaimcondition_v2 import IDropClaimCondition_V2 # pylint: disable=unused-import
-from .upgradeable import Upgradeable # pylint: disable=unused-import
-from .i_claim_condition import IClaimCondition # pylint: disable=unused-import
-from .i_staking721 import IStaking721 # pylint: disable=unused-import
-from .i_english_auctions import IEnglishAuctions # pylint: disable=unused-import
-from .t_w_multichain_registry import TWMultichainRegistry # pylint: disable=unused-import
-from .default_operator_filterer_upgradeable import DefaultOperatorFiltererUpgradeable # pylint: disable=unused-import
-from .erc20_signature_mint import ERC20SignatureMint # pylint: disable=unused-import
-from .isignatureminterc721_v1 import ISignatureMintERC721_V1 # pylint: disable=unused-import
-from .erc20_drop_vote import ERC20DropVote # pylint: disable=unused-import
-from .erc1155_preset_upgradeable import ERC1155PresetUpgradeable # pylint: disable=unused-import
-from .safe_erc20 import SafeERC20 # pylint: disable=unused-import
-from .i_airdrop_erc1155 import IAirdropERC1155 # pylint: disable=unused-import
-from .offers_logic import OffersLogic # pylint: disable=unused-import
-from .marketplace import Marketplace # pylint: disable=unused-import
-from .t_w_strings import TWStrings # pylint: disable=unused-import
-from .direct_listings_storage import DirectListingsStorage # pylint: disable=unused-import
-from .tiered_drop import TieredDrop # pylint: disable=unused-import
-from .erc1155_receiver import ERC1155Receiver # pylint: disable=unused-import
-from .drop1155 import Drop1155 # pylint: disable=unused-import
-from .i_delayed_reveal_deprecated import IDelayedRevealDeprecated # pylint: disable=unused-import
-from .i_router import IRouter # pylint: disable=unused-import
-from .drop_erc1155 import DropERC1155 # pylint: disable=unused-import
-from .erc20_base import ERC20Base # pylint: disable=unused-import
-from .i_n_f_t_stake import INFTStake # pylint: disable=unused-import
-from .idroperc20_v2 import IDropERC20_V2 # pylint: disable=unused-import
-from .erc2771_context_upgradeable_storage import ERC2771ContextUpgradeableStorage # pylint: disable=unused-import
-from .i_claimable_erc1155 import IClaimableERC1155 # pylint: disable=unused-import
-from .i_lazy_mint import ILazyMint # pylint: disable=unused-import
-from .i_operator_filter_toggle import IOperatorFilterToggle # pylint: disable=unused-import
-from .i_erc1155_metadata import IERC1155Metadata # pylint: disable=unused-import
-from .i_beacon import IBeacon # pylint: disable=unused-import
-from .i_token_bundle import ITokenBundle # pylint: disable=unused-import
-from .reentrancy_guard import ReentrancyGuard # pylint: disable=unused-import
-from .airdrop_erc20 import AirdropERC20 # pylint: disable=unused-import
-from .erc2771_context_storage import ERC2771ContextStorage # pylint: disable=unused-import
-from .signature_mint_erc1155_upgradeable import SignatureMintERC1155Upgradeable # pylint: disable=unused-import
-from .i_pack_v_r_f_direct import IPackVRFDirect # pylint: disable=unused-import
-from .i_drop_erc20 import IDropERC20 # pylint: disable=unused-import
-from .i_erc721_metadata import IERC721Metadata # pylint: disable=unused-import
-from .dropsinglephase_v1 import DropSinglePhase_V1 # pylint: disable=unused-import
-from .permissions_enumerable import PermissionsEnumerable # pylint: disable=unused-import
-from .token_stake import TokenStake # pylint: disable=unused-import
-from .app_u_r_i import AppURI # pylint: disable=unused-import
-from .airdrop_erc721_claimable import AirdropERC721Claimable # pylint: disable=unused-import
-from .drop_single_phase import DropSinglePhase # pylint: disable=unused-import
-from .operator_filterer_upgradeable import OperatorFiltererUpgradeable # pylint: disable=unused-import
-from .i_airdrop_erc721_claimable import IAirdropERC721Claimable # pylint: disable=unused-import
-from .i_operator_filter_registry import IOperatorFilterRegistry # pylint: disable=unused-import
-from .i_contract_factory import IContractFactory # pylint: disable=unused-import
-from .erc20_drop import ERC20Drop # pylint: disable=unused-import
-from .lazy_mint_with_tier import LazyMintWithTier # pylint: disable=unused-import
-from .e_i_p712_chainless_domain import EIP712ChainlessDomain # pylint: disable=unused-import
-from .i_drop_erc1155 import IDropERC1155 # pylint: disable=unused-import
-from .i_permissions_enumerable import IPermissionsEnumerable # pylint: disable=unused-import
-from .signature_mint_erc1155 import SignatureMintERC1155 # pylint: disable=unused-import
-from .forwarder_consumer import ForwarderConsumer # pylint: disable=unused-import
-from .permissions_enumerable_storage import PermissionsEnumerableStorage # pylint: disable=unused-import
-from .i_edition_stake import IEditionStake # pylint: disable=unused-import
-from .erc1155_drop import ERC1155Drop # pylint: disable=unused-import
-from .pack_v_r_f_direct import PackVRFDirect # pylint: disable=unused-import
-from .soulbound_erc721_a import SoulboundERC721A # pylint: disable=unused-import
-from .i_signature_action import ISignatureAction # pylint: disable=unused-import
-from .i_royalty import IRoyalty # pylint: disable=unused-import
-from .contract_metadata_logic import ContractMetadataLogic # pylint: disable=unused-import
-from .erc1155_lazy_mint import ERC1155LazyMint # pylint: disable=unused-import
-from .context import Context # pylint: disable=unused-import
-from .token_erc1155 import TokenERC1155 # pylint: disable=unused-import
-from .reentrancy_guard_upgradeable import ReentrancyGuardUpgradeable # pylint: disable=unused-import
-from .staking20 import Staking20 # pylint: disable=unused-import
-from .t_w_multichain_registry_storage import TWMultichainRegistryStorage # pylint: disable=unused-import
-from .token_store import TokenStore # pylint: disable=unused-import
-from .token_bundle import TokenBundle # pylint: disable=unused-import
-from .i_fee_tier_placement_extension import IFeeTierPlacementExtension # pylint: disable=unused-import
-from .payment_splitter_upgradeable import PaymentSplitterUpgradeable # pylint: disable=unused-import
-from .erc1155_base import ERC1155Base # pylint: disable=unused-import
-from .counters import Counters # pylint: disable=unused-import
-from .erc1967_upgrade import ERC1967Upgrade # pylint: disable=unused-import
-from .i_airdrop_erc1155_claimable import IAirdropERC1155Claimable # pylint: disable=unused-import
-from .i_votes import IVotes # pylint: disable=unused-import
-from .plugin_map import PluginMap # pylint: disable=unused-import
-from .ecdsa import ECDSA # pylint: disable=unused-import
-from .permissions_enumerable_logic import PermissionsEnumerableLogic # pylint: disable=unused-import
-from .i_contract_metadata import IContractMetadata # pylint: disable=unused-import
-from .i_drop_claim_condition import IDropClaimCondition # pylint: disable=unused-import
-from .signature_mint_erc20_upgradeable import SignatureMintERC20Upgradeable # pylint: disable=unused-import
-from .vote_erc20 import VoteERC20 # pylint: disable=unused-import
-from .i_multiwrap import IMultiwrap # pylint: disable=unused-import
-from .i_burnable_erc721 import IBurnableERC721 # pylint: disable=unused-import
-from .fee_type import FeeType # pylint: disable=unused-import
-from .split import Split # pylint: disable=unused-import
-from .i_erc20_metadata import IERC20Metadata # pylint: disable=unused-import
-from .edition_stake import EditionStake # pylint: disable=unused-import
-from .t_w_multichain_registry_logic import TWMultichainRegistryLogic # pylint: disable=unused-import
-from .i_erc1155_enumerable import IERC1155Enumerable # pylint: disable=unused-import
-from .signature_mint_erc721 import SignatureMintERC721 # pylint: disable=unused-import
-from .i_erc1155_supply import IERC1155Supply # pylint: disable=unused-import
-from .airdrop_erc1155_claimable import AirdropERC1155Claimable # pylint: disable=unused-import
-from .i_signature_mint_erc20 import ISignatureMintERC20 # pylint: disable=unused-import
-from .erc1155 import ERC1155 # pylint: disable=unused-import
-from .default_operator_filterer import DefaultOperatorFilterer # pylint: disable=unused-import
-from .router import Router # pylint: disable=unused-import
-from .i_platform_fee import IPlatformFee # pylint: disable=unused-import
-from .proxy_for_upgradeable import ProxyForUpgradeable # pylint: disable=unused-import
-from .i_token_erc1155 import ITokenERC1155 # pylint: disable=unused-import
-from .batch_mint_metadata import BatchMintMetadata # pylint: disable=unused-import
-from .erc20_permit import ERC20Permit # pylint: disable=unused-import
-from .i_app_u_r_i import IAppURI # pylint: disable=unused-import
-from .erc1155_delayed_reveal import ERC1155DelayedReveal # pylint: disable=unused-import
-from .contract_publisher import ContractPublisher # pylint: disable=unused-import
-from .drop import Drop # pylint: disable=unused-import
-from .mock_contract_publisher import MockContractPublisher # pylint: disable=unused-import
-from .erc721_holder import ERC721Holder # pylint: disable=unused-import
-from .iweth import IWETH # pylint: disable=unused-import
-from .erc1155_signature_mint import ERC1155SignatureMint # pylint: disable=unused-import
-from .t_w_proxy import TWProxy # pylint: disable=unused-import
-from .currency_transfer_lib import CurrencyTransferLib # pylint: disable=unused-import
-from .ierc721 import IERC721 # pylint: disable=unused-import
-from .droperc1155_v2 import DropERC1155_V2 # pylint: disable=unused-import
-from .permissions_storage import PermissionsStorage # pylint: disable=unused-import
-from .i_drop1155 import IDrop1155 # pylint: disable=unused-import
-from .i_erc721_enumerable import IERC721Enumerable # pylint: disable=unused-import
-from .idropsinglephase1155_v1 import IDropSinglePhase1155_V1 # pylint: disable=unused-import
-from .dropsinglephase1155_v1 import DropSinglePhase1155_V1 # pylint: disable=unused-import
-from .ownable import Ownable # pylint: disable=unused-import
-from .erc721_base import ERC721Base # pylint: disable=unused-import
-from .n_f_t_stake import NFTStake # pylint: disable=unused-import
-from .contract_metadata_storage import ContractMetadataStorage # pylint: disable=unused-import
-from .erc20 import ERC20 # pylint: disable=unused-import
-from .droperc20_v2 import DropERC20_V2 # pylint: disable=unused-import
-from .platform_fee import PlatformFee # pylint: disable=unused-import
-from .ierc20 import IERC20 # pylint: disable=unused-import
-from .staking721_base import Staking721Base # pylint: disable=unused-import
-from .lazy_mint import LazyMint # pylint: disable=unused-import
-from .multicall import Multicall # pylint: disable=unused-import
-from .t_w_multichain_registry_router import TWMultichainRegistryRouter # pylint: disable=unused-import
-from .i_erc1822_proxiable import IERC1822Proxiable # pylint: disable=unused-import
-from .erc20_vote import ERC20Vote # pylint: disable=unused-import
-from .i_airdrop_erc20 import IAirdropERC20 # pylint: disable=unused-import
-from .direct_listings_logic import DirectListingsLogic # pylint: disable=unused-import
-from .i_erc20_permit import IERC20Permit # pylint: disable=unused-import
-from .i_drop import IDrop # pylint: disable=unused-import
-from .i_signature_mint_erc721 import ISignatureMintERC721 # pylint: disable=unused-import
-from .erc20_signature_mint_vote import ERC20SignatureMintVote # pylint: disable=unused-import
-from .i_token_stake import ITokenStake # pylint: disable=unused-import
-from .i_t_w_multichain_registry import ITWMultichainRegistry # pylint: disable=unused-import
-from .signature_mint_erc721_upgradeable import SignatureMintERC721Upgradeable # pylint: disable=unused-import
-from .ierc721a import IERC721A # pylint: disable=unused-import
-from .idroperc1155_v2 import IDropERC1155_V2 # pylint: disable=unused-import
-from .i_contract_deployer import IContractDeployer # pylint: disable=unused-import
-from .erc721_drop import ERC721Drop # pylint: disable=unused-import
-from .erc2771_context_upgradeable_logic import ERC2771ContextUpgradeableLogic # pylint: disable=unused-import
\ No newline at end of file
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .staking721_upgradeable import Staking721Upgradeable # pylint: disable=unused-import
+    from .staking1155 import Staking1155 # pylint: disable=unused-import
+    from .i_plugin_map import IPluginMap # pylint: disable=unused-import
+    from .signature_action import SignatureAction # pylint: disable=unused-import
+    from .i_direct_listings import IDirectListings # pylint: disable=unused-import
+    from .multiwrap import Multiwrap # pylint: disable=unused-import
+    from .erc20_votes import ERC20Votes # pylint: disable=unused-import
+    from .i_t_w_fee import ITWFee # pylint: disable=unused-import
+    from .permissions import Permissions # pylint: disable=unused-import
+    from .pack import Pack # pylint: disable=unused-import
+    from .primary_sale import PrimarySale # pylint: disable=unused-import
+    from .drop_single_phase1155 import DropSinglePhase1155 # pylint: disable=unused-import
+    from .i_airdrop_erc721 import IAirdropERC721 # pylint: disable=unused-import
+    from .t_w_fee import TWFee # pylint: disable=unused-import
+    from .i_contract_publisher import IContractPublisher # pylint: disable=unused-import
+    from .i_ownable import IOwnable # pylint: disable=unused-import
+    from .signaturedrop_v4 import SignatureDrop_V4 # pylint: disable=unused-import
+    from .i_token_erc20 import ITokenERC20 # pylint: disable=unused-import
+    from .operator_filter_toggle import OperatorFilterToggle # pylint: disable=unused-import
+    from .enumerable_set import EnumerableSet # pylint: disable=unused-import
+    from .merkle_proof import MerkleProof # pylint: disable=unused-import
+    from .safe_cast import SafeCast # pylint: disable=unused-import
+    from .staking721 import Staking721 # pylint: disable=unused-import
+    from .erc721a import ERC721A # pylint: disable=unused-import
+    from .erc721_multiwrap import ERC721Multiwrap # pylint: disable=unused-import
+    from .signature_drop import SignatureDrop # pylint: disable=unused-import
+    from .i_mintable_erc721 import IMintableERC721 # pylint: disable=unused-import
+    from .mock import Mock # pylint: disable=unused-import
+    from .i_claim_conditions_single_phase import IClaimConditionsSinglePhase # pylint: disable=unused-import
+    from .i_erc2771_context import IERC2771Context # pylint: disable=unused-import
+    from .ierc165 import IERC165 # pylint: disable=unused-import
+    from .erc721_delayed_reveal import ERC721DelayedReveal # pylint: disable=unused-import
+    from .iclaimcondition_v1 import IClaimCondition_V1 # pylint: disable=unused-import
+    from .ierc1155 import IERC1155 # pylint: disable=unused-import
+    from .i_staking1155 import IStaking1155 # pylint: disable=unused-import
+    from .math import Math # pylint: disable=unused-import
+    from .i_signature_mint_erc1155 import ISignatureMintERC1155 # pylint: disable=unused-import
+    from .i_pack import IPack # pylint: disable=unused-import
+    from .i_mintable_erc1155 import IMintableERC1155 # pylint: disable=unused-import
+    from .reentrancy_guard_logic import ReentrancyGuardLogic # pylint: disable=unused-import
+    from .i_erc1155_receiver import IERC1155Receiver # pylint: disable=unused-import
+    from .erc2771_context_logic import ERC2771ContextLogic # pylint: disable=unused-import
+    from .t_w_bit_maps import TWBitMaps # pylint: disable=unused-import
+    from .ierc2981 import IERC2981 # pylint: disable=unused-import
+    from .i_lazy_mint_with_tier import ILazyMintWithTier # pylint: disable=unused-import
+    from .erc721_signature_mint import ERC721SignatureMint # pylint: disable=unused-import
+    from .i_primary_sale import IPrimarySale # pylint: disable=unused-import
+    from .signature_action_upgradeable import SignatureActionUpgradeable # pylint: disable=unused-import
+    from .i_permissions import IPermissions # pylint: disable=unused-import
+    from .english_auctions_logic import EnglishAuctionsLogic # pylint: disable=unused-import
+    from .i_multicall import IMulticall # pylint: disable=unused-import
+    from .erc721_lazy_mint import ERC721LazyMint # pylint: disable=unused-import
+    from .idropsinglephase_v1 import IDropSinglePhase_V1 # pylint: disable=unused-import
+    from .drop_erc721 import DropERC721 # pylint: disable=unused-import
+    from .airdrop_erc721 import AirdropERC721 # pylint: disable=unused-import
+    from .i_drop_single_phase import IDropSinglePhase # pylint: disable=unused-import
+    from .init_storage import InitStorage # pylint: disable=unused-import
+    from .i_drop_single_phase1155 import IDropSinglePhase1155 # pylint: disable=unused-import
+    from .t_w_storage_slot import TWStorageSlot # pylint: disable=unused-import
+    from .t_w_registry import TWRegistry # pylint: disable=unused-import
+    from .mock_contract import MockContract # pylint: disable=unused-import
+    from .erc2771_context import ERC2771Context # pylint: disable=unused-import
+    from .i_erc721_receiver import IERC721Receiver # pylint: disable=unused-import
+    from .erc1155_holder import ERC1155Holder # pylint: disable=unused-import
+    from .platform_fee_logic import PlatformFeeLogic # pylint: disable=unused-import
+    from .royalty import Royalty # pylint: disable=unused-import
+    from .i_mintable_erc20 import IMintableERC20 # pylint: disable=unused-import
+    from .permissions_logic import PermissionsLogic # pylint: disable=unused-import
+    from .staking20_base import Staking20Base # pylint: disable=unused-import
+    from .i_context import IContext # pylint: disable=unused-import
+    from .staking20_upgradeable import Staking20Upgradeable # pylint: disable=unused-import
+    from .proxy import Proxy # pylint: disable=unused-import
+    from .erc1967_proxy import ERC1967Proxy # pylint: disable=unused-import
+    from .t_w_address import TWAddress # pylint: disable=unused-import
+    from .contract_metadata import ContractMetadata # pylint: disable=unused-import
+    from .i_offers import IOffers # pylint: disable=unused-import
+    from .staking1155_base import Staking1155Base # pylint: disable=unused-import
+    from .t_w_factory import TWFactory # pylint: disable=unused-import
+    from .safe_math import SafeMath # pylint: disable=unused-import
+    from .marketplace_v3 import MarketplaceV3 # pylint: disable=unused-import
+    from .erc2771_context_consumer import ERC2771ContextConsumer # pylint: disable=unused-import
+    from .droperc721_v3 import DropERC721_V3 # pylint: disable=unused-import
+    from .operator_filterer import OperatorFilterer # pylint: disable=unused-import
+    from .i_delayed_reveal import IDelayedReveal # pylint: disable=unused-import
+    from .token_erc721 import TokenERC721 # pylint: disable=unused-import
+    from .platform_fee_storage import PlatformFeeStorage # pylint: disable=unused-import
+    from .i_t_w_registry import ITWRegistry # pylint: disable=unused-import
+    from .drop_erc20 import DropERC20 # pylint: disable=unused-import
+    from .i_drop_erc721 import IDropERC721 # pylint: disable=unused-import
+    from .i_marketplace import IMarketplace # pylint: disable=unused-import
+    from .i_thirdweb_contract import IThirdwebContract # pylint: disable=unused-import
+    from .i_claim_condition_multi_phase import IClaimConditionMultiPhase # pylint: disable=unused-import
+    from .reentrancy_guard_storage import ReentrancyGuardStorage # pylint: disable=unused-import
+    from .i_burnable_erc20 import IBurnableERC20 # pylint: disable=unused-import
+    from .initializable import Initializable # pylint: disable=unused-import
+    from .i_airdrop_erc20_claimable import IAirdropERC20Claimable # pylint: disable=unused-import
+    from .airdrop_erc1155 import AirdropERC1155 # pylint: disable=unused-import
+    from .erc721_a_upgradeable import ERC721AUpgradeable # pylint: disable=unused-import
+    from .router_storage import RouterStorage # pylint: disable=unused-import
+    from .token_erc20 import TokenERC20 # pylint: disable=unused-import
+    from .airdrop_erc20_claimable import AirdropERC20Claimable # pylint: disable=unused-import
+    from .signature_mint_erc20 import SignatureMintERC20 # pylint: disable=unused-import
+    from .staking1155_upgradeable import Staking1155Upgradeable # pylint: disable=unused-import
+    from .english_auctions_storage import EnglishAuctionsStorage # pylint: disable=unused-import
+    from .idroperc721_v3 import IDropERC721_V3 # pylint: disable=unused-import
+    from .eip712 import EIP712 # pylint: disable=unused-import
+    from .delayed_reveal import DelayedReveal # pylint: disable=unused-import
+    from .offers_storage import OffersStorage # pylint: disable=unused-import
+    from .i_claimable_erc721 import IClaimableERC721 # pylint: disable=unused-import
+    from .i_burnable_erc1155 import IBurnableERC1155 # pylint: disable=unused-import
+    from .erc165 import ERC165 # pylint: disable=unused-import
+    from .router_immutable import RouterImmutable # pylint: disable=unused-import
+    from .i_staking20 import IStaking20 # pylint: disable=unused-import
+    from .i_erc721_supply import IERC721Supply # pylint: disable=unused-import
+    from .i_token_erc721 import ITokenERC721 # pylint: disable=unused-import
+    from .erc2771_context_upgradeable import ERC2771ContextUpgradeable # pylint: disable=unused-import
+    from .idropclaimcondition_v2 import IDropClaimCondition_V2 # pylint: disable=unused-import
+    from .upgradeable import Upgradeable # pylint: disable=unused-import
+    from .i_claim_condition import IClaimCondition # pylint: disable=unused-import
+    from .i_staking721 import IStaking721 # pylint: disable=unused-import
+    from .i_english_auctions import IEnglishAuctions # pylint: disable=unused-import
+    from .t_w_multichain_registry import TWMultichainRegistry # pylint: disable=unused-import
+    from .default_operator_filterer_upgradeable import DefaultOperatorFiltererUpgradeable # pylint: disable=unused-import
+    from .erc20_signature_mint import ERC20SignatureMint # pylint: disable=unused-import
+    from .isignatureminterc721_v1 import ISignatureMintERC721_V1 # pylint: disable=unused-import
+    from .erc20_drop_vote import ERC20DropVote # pylint: disable=unused-import
+    from .erc1155_preset_upgradeable import ERC1155PresetUpgradeable # pylint: disable=unused-import
+    from .safe_erc20 import SafeERC20 # pylint: disable=unused-import
+    from .i_airdrop_erc1155 import IAirdropERC1155 # pylint: disable=unused-import
+    from .offers_logic import OffersLogic # pylint: disable=unused-import
+    from .marketplace import Marketplace # pylint: disable=unused-import
+    from .t_w_strings import TWStrings # pylint: disable=unused-import
+    from .direct_listings_storage import DirectListingsStorage # pylint: disable=unused-import
+    from .tiered_drop import TieredDrop # pylint: disable=unused-import
+    from .erc1155_receiver import ERC1155Receiver # pylint: disable=unused-import
+    from .drop1155 import Drop1155 # pylint: disable=unused-import
+    from .i_delayed_reveal_deprecated import IDelayedRevealDeprecated # pylint: disable=unused-import
+    from .i_router import IRouter # pylint: disable=unused-import
+    from .drop_erc1155 import DropERC1155 # pylint: disable=unused-import
+    from .erc20_base import ERC20Base # pylint: disable=unused-import
+    from .i_n_f_t_stake import INFTStake # pylint: disable=unused-import
+    from .idroperc20_v2 import IDropERC20_V2 # pylint: disable=unused-import
+    from .erc2771_context_upgradeable_storage import ERC2771ContextUpgradeableStorage # pylint: disable=unused-import
+    from .i_claimable_erc1155 import IClaimableERC1155 # pylint: disable=unused-import
+    from .i_lazy_mint import ILazyMint # pylint: disable=unused-import
+    from .i_operator_filter_toggle import IOperatorFilterToggle # pylint: disable=unused-import
+    from .i_erc1155_metadata import IERC1155Metadata # pylint: disable=unused-import
+    from .i_beacon import IBeacon # pylint: disable=unused-import
+    from .i_token_bundle import ITokenBundle # pylint: disable=unused-import
+    from .reentrancy_guard import ReentrancyGuard # pylint: disable=unused-import
+    from .airdrop_erc20 import AirdropERC20 # pylint: disable=unused-import
+    from .erc2771_context_storage import ERC2771ContextStorage # pylint: disable=unused-import
+    from .signature_mint_erc1155_upgradeable import SignatureMintERC1155Upgradeable # pylint: disable=unused-import
+    from .i_pack_v_r_f_direct import IPackVRFDirect # pylint: disable=unused-import
+    from .i_drop_erc20 import IDropERC20 # pylint: disable=unused-import
+    from .i_erc721_metadata import IERC721Metadata # pylint: disable=unused-import
+    from .dropsinglephase_v1 import DropSinglePhase_V1 # pylint: disable=unused-import
+    from .permissions_enumerable import PermissionsEnumerable # pylint: disable=unused-import
+    from .token_stake import TokenStake # pylint: disable=unused-import
+    from .app_u_r_i import AppURI # pylint: disable=unused-import
+    from .airdrop_erc721_claimable import AirdropERC721Claimable # pylint: disable=unused-import
+    from .drop_single_phase import DropSinglePhase # pylint: disable=unused-import
+    from .operator_filterer_upgradeable import OperatorFiltererUpgradeable # pylint: disable=unused-import
+    from .i_airdrop_erc721_claimable import IAirdropERC721Claimable # pylint: disable=unused-import
+    from .i_operator_filter_registry import IOperatorFilterRegistry # pylint: disable=unused-import
+    from .i_contract_factory import IContractFactory # pylint: disable=unused-import
+    from .erc20_drop import ERC20Drop # pylint: disable=unused-import
+    from .lazy_mint_with_tier import LazyMintWithTier # pylint: disable=unused-import
+    from .e_i_p712_chainless_domain import EIP712ChainlessDomain # pylint: disable=unused-import
+    from .i_drop_erc1155 import IDropERC1155 # pylint: disable=unused-import
+    from .i_permissions_enumerable import IPermissionsEnumerable # pylint: disable=unused-import
+    from .signature_mint_erc1155 import SignatureMintERC1155 # pylint: disable=unused-import
+    from .forwarder_consumer import ForwarderConsumer # pylint: disable=unused-import
+    from .permissions_enumerable_storage import PermissionsEnumerableStorage # pylint: disable=unused-import
+    from .i_edition_stake import IEditionStake # pylint: disable=unused-import
+    from .erc1155_drop import ERC1155Drop # pylint: disable=unused-import
+    from .pack_v_r_f_direct import PackVRFDirect # pylint: disable=unused-import
+    from .soulbound_erc721_a import SoulboundERC721A # pylint: disable=unused-import
+    from .i_signature_action import ISignatureAction # pylint: disable=unused-import
+    from .i_royalty import IRoyalty # pylint: disable=unused-import
+    from .contract_metadata_logic import ContractMetadataLogic # pylint: disable=unused-import
+    from .erc1155_lazy_mint import ERC1155LazyMint # pylint: disable=unused-import
+    from .context import Context # pylint: disable=unused-import
+    from .token_erc1155 import TokenERC1155 # pylint: disable=unused-import
+    from .reentrancy_guard_upgradeable import ReentrancyGuardUpgradeable # pylint: disable=unused-import
+    from .staking20 import Staking20 # pylint: disable=unused-import
+    from .t_w_multichain_registry_storage import TWMultichainRegistryStorage # pylint: disable=unused-import
+    from .token_store import TokenStore # pylint: disable=unused-import
+    from .token_bundle import TokenBundle # pylint: disable=unused-import
+    from .i_fee_tier_placement_extension import IFeeTierPlacementExtension # pylint: disable=unused-import
+    from .payment_splitter_upgradeable import PaymentSplitterUpgradeable # pylint: disable=unused-import
+    from .erc1155_base import ERC1155Base # pylint: disable=unused-import
+    from .counters import Counters # pylint: disable=unused-import
+    from .erc1967_upgrade import ERC1967Upgrade # pylint: disable=unused-import
+    from .i_airdrop_erc1155_claimable import IAirdropERC1155Claimable # pylint: disable=unused-import
+    from .i_votes import IVotes # pylint: disable=unused-import
+    from .plugin_map import PluginMap # pylint: disable=unused-import
+    from .ecdsa import ECDSA # pylint: disable=unused-import
+    from .permissions_enumerable_logic import PermissionsEnumerableLogic # pylint: disable=unused-import
+    from .i_contract_metadata import IContractMetadata # pylint: disable=unused-import
+    from .i_drop_claim_condition import IDropClaimCondition # pylint: disable=unused-import
+    from .signature_mint_erc20_upgradeable import SignatureMintERC20Upgradeable # pylint: disable=unused-import
+    from .vote_erc20 import VoteERC20 # pylint: disable=unused-import
+    from .i_multiwrap import IMultiwrap # pylint: disable=unused-import
+    from .i_burnable_erc721 import IBurnableERC721 # pylint: disable=unused-import
+    from .fee_type import FeeType # pylint: disable=unused-import
+    from .split import Split # pylint: disable=unused-import
+    from .i_erc20_metadata import IERC20Metadata # pylint: disable=unused-import
+    from .edition_stake import EditionStake # pylint: disable=unused-import
+    from .t_w_multichain_registry_logic import TWMultichainRegistryLogic # pylint: disable=unused-import
+    from .i_erc1155_enumerable import IERC1155Enumerable # pylint: disable=unused-import
+    from .signature_mint_erc721 import SignatureMintERC721 # pylint: disable=unused-import
+    from .i_erc1155_supply import IERC1155Supply # pylint: disable=unused-import
+    from .airdrop_erc1155_claimable import AirdropERC1155Claimable # pylint: disable=unused-import
+    from .i_signature_mint_erc20 import ISignatureMintERC20 # pylint: disable=unused-import
+    from .erc1155 import ERC1155 # pylint: disable=unused-import
+    from .default_operator_filterer import DefaultOperatorFilterer # pylint: disable=unused-import
+    from .router import Router # pylint: disable=unused-import
+    from .i_platform_fee import IPlatformFee # pylint: disable=unused-import
+    from .proxy_for_upgradeable import ProxyForUpgradeable # pylint: disable=unused-import
+    from .i_token_erc1155 import ITokenERC1155 # pylint: disable=unused-import
+    from .batch_mint_metadata import BatchMintMetadata # pylint: disable=unused-import
+    from .erc20_permit import ERC20Permit # pylint: disable=unused-import
+    from .i_app_u_r_i import IAppURI # pylint: disable=unused-import
+    from .erc1155_delayed_reveal import ERC1155DelayedReveal # pylint: disable=unused-import
+    from .contract_publisher import ContractPublisher # pylint: disable=unused-import
+    from .drop import Drop # pylint: disable=unused-import
+    from .mock_contract_publisher import MockContractPublisher # pylint: disable=unused-import
+    from .erc721_holder import ERC721Holder # pylint: disable=unused-import
+    from .iweth import IWETH # pylint: disable=unused-import
+    from .erc1155_signature_mint import ERC1155SignatureMint # pylint: disable=unused-import
+    from .t_w_proxy import TWProxy # pylint: disable=unused-import
+    from .currency_transfer_lib import CurrencyTransferLib # pylint: disable=unused-import
+    from .ierc721 import IERC721 # pylint: disable=unused-import
+    from .droperc1155_v2 import DropERC1155_V2 # pylint: disable=unused-import
+    from .permissions_storage import PermissionsStorage # pylint: disable=unused-import
+    from .i_drop1155 import IDrop1155 # pylint: disable=unused-import
+    from .i_erc721_enumerable import IERC721Enumerable # pylint: disable=unused-import
+    from .idropsinglephase1155_v1 import IDropSinglePhase1155_V1 # pylint: disable=unused-import
+    from .dropsinglephase1155_v1 import DropSinglePhase1155_V1 # pylint: disable=unused-import
+    from .ownable import Ownable # pylint: disable=unused-import
+    from .erc721_base import ERC721Base # pylint: disable=unused-import
+    from .n_f_t_stake import NFTStake # pylint: disable=unused-import
+    from .contract_metadata_storage import ContractMetadataStorage # pylint: disable=unused-import
+    from .erc20 import ERC20 # pylint: disable=unused-import
+    from .droperc20_v2 import DropERC20_V2 # pylint: disable=unused-import
+    from .platform_fee import PlatformFee # pylint: disable=unused-import
+    from .ierc20 import IERC20 # pylint: disable=unused-import
+    from .staking721_base import Staking721Base # pylint: disable=unused-import
+    from .lazy_mint import LazyMint # pylint: disable=unused-import
+    from .multicall import Multicall # pylint: disable=unused-import
+    from .t_w_multichain_registry_router import TWMultichainRegistryRouter # pylint: disable=unused-import
+    from .i_erc1822_proxiable import IERC1822Proxiable # pylint: disable=unused-import
+    from .erc20_vote import ERC20Vote # pylint: disable=unused-import
+    from .i_airdrop_erc20 import IAirdropERC20 # pylint: disable=unused-import
+    from .direct_listings_logic import DirectListingsLogic # pylint: disable=unused-import
+    from .i_erc20_permit import IERC20Permit # pylint: disable=unused-import
+    from .i_drop import IDrop # pylint: disable=unused-import
+    from .i_signature_mint_erc721 import ISignatureMintERC721 # pylint: disable=unused-import
+    from .erc20_signature_mint_vote import ERC20SignatureMintVote # pylint: disable=unused-import
+    from .i_token_stake import ITokenStake # pylint: disable=unused-import
+    from .i_t_w_multichain_registry import ITWMultichainRegistry # pylint: disable=unused-import
+    from .signature_mint_erc721_upgradeable import SignatureMintERC721Upgradeable # pylint: disable=unused-import
+    from .ierc721a import IERC721A # pylint: disable=unused-import
+    from .idroperc1155_v2 import IDropERC1155_V2 # pylint: disable=unused-import
+    from .i_contract_deployer import IContractDeployer # pylint: disable=unused-import
+    from .erc721_drop import ERC721Drop # pylint: disable=unused-import
+    from .erc2771_context_upgradeable_logic import ERC2771ContextUpgradeableLogic # pylint: disable=unused-import
+
+_BINDINGS: Dict[str, str] = {
+    "Staking721Upgradeable": "staking721_upgradeable",
+    "Staking1155": "staking1155",
+    "IPluginMap": "i_plugin_map",
+    "SignatureAction": "signature_action",
+    "IDirectListings": "i_direct_listings",
+    "Multiwrap": "multiwrap",
+    "ERC20Votes": "erc20_votes",
+    "ITWFee": "i_t_w_fee",
+    "Permissions": "permissions",
+    "Pack": "pack",
+    "PrimarySale": "primary_sale",
+    "DropSinglePhase1155": "drop_single_phase1155",
+    "IAirdropERC721": "i_airdrop_erc721",
+    "TWFee": "t_w_fee",
+    "IContractPublisher": "i_contract_publisher",
+    "IOwnable": "i_ownable",
+    "SignatureDrop_V4": "signaturedrop_v4",
+    "ITokenERC20": "i_token_erc20",
+    "OperatorFilterToggle": "operator_filter_toggle",
+    "EnumerableSet": "enumerable_set",
+    "MerkleProof": "merkle_proof",
+    "SafeCast": "safe_cast",
+    "Staking721": "staking721",
+    "ERC721A": "erc721a",
+    "ERC721Multiwrap": "erc721_multiwrap",
+    "SignatureDrop": "signature_drop",
+    "IMintableERC721": "i_mintable_erc721",
+    "Mock": "mock",
+    "IClaimConditionsSinglePhase": "i_claim_conditions_single_phase",
+    "IERC2771Context": "i_erc2771_context",
+    "IERC165": "ierc165",
+    "ERC721DelayedReveal": "erc721_delayed_reveal",
+    "IClaimCondition_V1": "iclaimcondition_v1",
+    "IERC1155": "ierc1155",
+    "IStaking1155": "i_staking1155",
+    "Math": "math",
+    "ISignatureMintERC1155": "i_signature_mint_erc1155",
+    "IPack": "i_pack",
+    "IMintableERC1155": "i_mintable_erc1155",
+    "ReentrancyGuardLogic": "reentrancy_guard_logic",
+    "IERC1155Receiver": "i_erc1155_receiver",
+    "ERC2771ContextLogic": "erc2771_context_logic",
+    "TWBitMaps": "t_w_bit_maps",
+    "IERC2981": "ierc2981",
+    "ILazyMintWithTier": "i_lazy_mint_with_tier",
+    "ERC721SignatureMint": "erc721_signature_mint",
+    "IPrimarySale": "i_primary_sale",
+    "SignatureActionUpgradeable": "signature_action_upgradeable",
+    "IPermissions": "i_permissions",
+    "EnglishAuctionsLogic": "english_auctions_logic",
+    "IMulticall": "i_multicall",
+    "ERC721LazyMint": "erc721_lazy_mint",
+    "IDropSinglePhase_V1": "idropsinglephase_v1",
+    "DropERC721": "drop_erc721",
+    "AirdropERC721": "airdrop_erc721",
+    "IDropSinglePhase": "i_drop_single_phase",
+    "InitStorage": "init_storage",
+    "IDropSinglePhase1155": "i_drop_single_phase1155",
+    "TWStorageSlot": "t_w_storage_slot",
+    "TWRegistry": "t_w_registry",
+    "MockContract": "mock_contract",
+    "ERC2771Context": "erc2771_context",
+    "IERC721Receiver": "i_erc721_receiver",
+    "ERC1155Holder": "erc1155_holder",
+    "PlatformFeeLogic": "platform_fee_logic",
+    "Royalty": "royalty",
+    "IMintableERC20": "i_mintable_erc20",
+    "PermissionsLogic": "permissions_logic",
+    "Staking20Base": "staking20_base",
+    "IContext": "i_context",
+    "Staking20Upgradeable": "staking20_upgradeable",
+    "Proxy": "proxy",
+    "ERC1967Proxy": "erc1967_proxy",
+    "TWAddress": "t_w_address",
+    "ContractMetadata": "contract_metadata",
+    "IOffers": "i_offers",
+    "Staking1155Base": "staking1155_base",
+    "TWFactory": "t_w_factory",
+    "SafeMath": "safe_math",
+    "MarketplaceV3": "marketplace_v3",
+    "ERC2771ContextConsumer": "erc2771_context_consumer",
+    "DropERC721_V3": "droperc721_v3",
+    "OperatorFilterer": "operator_filterer",
+    "IDelayedReveal": "i_delayed_reveal",
+    "TokenERC721": "token_erc721",
+    "PlatformFeeStorage": "platform_fee_storage",
+    "ITWRegistry": "i_t_w_registry",
+    "DropERC20": "drop_erc20",
+    "IDropERC721": "i_drop_erc721",
+    "IMarketplace": "i_marketplace",
+    "IThirdwebContract": "i_thirdweb_contract",
+    "IClaimConditionMultiPhase": "i_claim_condition_multi_phase",
+    "ReentrancyGuardStorage": "reentrancy_guard_storage",
+    "IBurnableERC20": "i_burnable_erc20",
+    "Initializable": "initializable",
+    "IAirdropERC20Claimable": "i_airdrop_erc20_claimable",
+    "AirdropERC1155": "airdrop_erc1155",
+    "ERC721AUpgradeable": "erc721_a_upgradeable",
+    "RouterStorage": "router_storage",
+    "TokenERC20": "token_erc20",
+    "AirdropERC20Claimable": "airdrop_erc20_claimable",
+    "SignatureMintERC20": "signature_mint_erc20",
+    "Staking1155Upgradeable": "staking1155_upgradeable",
+    "EnglishAuctionsStorage": "english_auctions_storage",
+    "IDropERC721_V3": "idroperc721_v3",
+    "EIP712": "eip712",
+    "DelayedReveal": "delayed_reveal",
+    "OffersStorage": "offers_storage",
+    "IClaimableERC721": "i_claimable_erc721",
+    "IBurnableERC1155": "i_burnable_erc1155",
+    "ERC165": "erc165",
+    "RouterImmutable": "router_immutable",
+    "IStaking20": "i_staking20",
+    "IERC721Supply": "i_erc721_supply",
+    "ITokenERC721": "i_token_erc721",
+    "ERC2771ContextUpgradeable": "erc2771_context_upgradeable",
+    "IDropClaimCondition_V2": "idropclaimcondition_v2",
+    "Upgradeable": "upgradeable",
+    "IClaimCondition": "i_claim_condition",
+    "IStaking721": "i_staking721",
+    "IEnglishAuctions": "i_english_auctions",
+    "TWMultichainRegistry": "t_w_multichain_registry",
+    "DefaultOperatorFiltererUpgradeable": "default_operator_filterer_upgradeable",
+    "ERC20SignatureMint": "erc20_signature_mint",
+    "ISignatureMintERC721_V1": "isignatureminterc721_v1",
+    "ERC20DropVote": "erc20_drop_vote",
+    "ERC1155PresetUpgradeable": "erc1155_preset_upgradeable",
+    "SafeERC20": "safe_erc20",
+    "IAirdropERC1155": "i_airdrop_erc1155",
+    "OffersLogic": "offers_logic",
+    "Marketplace": "marketplace",
+    "TWStrings": "t_w_strings",
+    "DirectListingsStorage": "direct_listings_storage",
+    "TieredDrop": "tiered_drop",
+    "ERC1155Receiver": "erc1155_receiver",
+    "Drop1155": "drop1155",
+    "IDelayedRevealDeprecated": "i_delayed_reveal_deprecated",
+    "IRouter": "i_router",
+    "DropERC1155": "drop_erc1155",
+    "ERC20Base": "erc20_base",
+    "INFTStake": "i_n_f_t_stake",
+    "IDropERC20_V2": "idroperc20_v2",
+    "ERC2771ContextUpgradeableStorage": "erc2771_context_upgradeable_storage",
+    "IClaimableERC1155": "i_claimable_erc1155",
+    "ILazyMint": "i_lazy_mint",
+    "IOperatorFilterToggle": "i_operator_filter_toggle",
+    "IERC1155Metadata": "i_erc1155_metadata",
+    "IBeacon": "i_beacon",
+    "ITokenBundle": "i_token_bundle",
+    "ReentrancyGuard": "reentrancy_guard",
+    "AirdropERC20": "airdrop_erc20",
+    "ERC2771ContextStorage": "erc2771_context_storage",
+    "SignatureMintERC1155Upgradeable": "signature_mint_erc1155_upgradeable",
+    "IPackVRFDirect": "i_pack_v_r_f_direct",
+    "IDropERC20": "i_drop_erc20",
+    "IERC721Metadata": "i_erc721_metadata",
+    "DropSinglePhase_V1": "dropsinglephase_v1",
+    "PermissionsEnumerable": "permissions_enumerable",
+    "TokenStake": "token_stake",
+    "AppURI": "app_u_r_i",
+    "AirdropERC721Claimable": "airdrop_erc721_claimable",
+    "DropSinglePhase": "drop_single_phase",
+    "OperatorFiltererUpgradeable": "operator_filterer_upgradeable",
+    "IAirdropERC721Claimable": "i_airdrop_erc721_claimable",
+    "IOperatorFilterRegistry": "i_operator_filter_registry",
+    "IContractFactory": "i_contract_factory",
+    "ERC20Drop": "erc20_drop",
+    "LazyMintWithTier": "lazy_mint_with_tier",
+    "EIP712ChainlessDomain": "e_i_p712_chainless_domain",
+    "IDropERC1155": "i_drop_erc1155",
+    "IPermissionsEnumerable": "i_permissions_enumerable",
+    "SignatureMintERC1155": "signature_mint_erc1155",
+    "ForwarderConsumer": "forwarder_consumer",
+    "PermissionsEnumerableStorage": "permissions_enumerable_storage",
+    "IEditionStake": "i_edition_stake",
+    "ERC1155Drop": "erc1155_drop",
+    "PackVRFDirect": "pack_v_r_f_direct",
+    "SoulboundERC721A": "soulbound_erc721_a",
+    "ISignatureAction": "i_signature_action",
+    "IRoyalty": "i_royalty",
+    "ContractMetadataLogic": "contract_metadata_logic",
+    "ERC1155LazyMint": "erc1155_lazy_mint",
+    "Context": "context",
+    "TokenERC1155": "token_erc1155",
+    "ReentrancyGuardUpgradeable": "reentrancy_guard_upgradeable",
+    "Staking20": "staking20",
+    "TWMultichainRegistryStorage": "t_w_multichain_registry_storage",
+    "TokenStore": "token_store",
+    "TokenBundle": "token_bundle",
+    "IFeeTierPlacementExtension": "i_fee_tier_placement_extension",
+    "PaymentSplitterUpgradeable": "payment_splitter_upgradeable",
+    "ERC1155Base": "erc1155_base",
+    "Counters": "counters",
+    "ERC1967Upgrade": "erc1967_upgrade",
+    "IAirdropERC1155Claimable": "i_airdrop_erc1155_claimable",
+    "IVotes": "i_votes",
+    "PluginMap": "plugin_map",
+    "ECDSA": "ecdsa",
+    "PermissionsEnumerableLogic": "permissions_enumerable_logic",
+    "IContractMetadata": "i_contract_metadata",
+    "IDropClaimCondition": "i_drop_claim_condition",
+    "SignatureMintERC20Upgradeable": "signature_mint_erc20_upgradeable",
+    "VoteERC20": "vote_erc20",
+    "IMultiwrap": "i_multiwrap",
+    "IBurnableERC721": "i_burnable_erc721",
+    "FeeType": "fee_type",
+    "Split": "split",
+    "IERC20Metadata": "i_erc20_metadata",
+    "EditionStake": "edition_stake",
+    "TWMultichainRegistryLogic": "t_w_multichain_registry_logic",
+    "IERC1155Enumerable": "i_erc1155_enumerable",
+    "SignatureMintERC721": "signature_mint_erc721",
+    "IERC1155Supply": "i_erc1155_supply",
+    "AirdropERC1155Claimable": "airdrop_erc1155_claimable",
+    "ISignatureMintERC20": "i_signature_mint_erc20",
+    "ERC1155": "erc1155",
+    "DefaultOperatorFilterer": "default_operator_filterer",
+    "Router": "router",
+    "IPlatformFee": "i_platform_fee",
+    "ProxyForUpgradeable": "proxy_for_upgradeable",
+    "ITokenERC1155": "i_token_erc1155",
+    "BatchMintMetadata": "batch_mint_metadata",
+    "ERC20Permit": "erc20_permit",
+    "IAppURI": "i_app_u_r_i",
+    "ERC1155DelayedReveal": "erc1155_delayed_reveal",
+    "ContractPublisher": "contract_publisher",
+    "Drop": "drop",
+    "MockContractPublisher": "mock_contract_publisher",
+    "ERC721Holder": "erc721_holder",
+    "IWETH": "iweth",
+    "ERC1155SignatureMint": "erc1155_signature_mint",
+    "TWProxy": "t_w_proxy",
+    "CurrencyTransferLib": "currency_transfer_lib",
+    "IERC721": "ierc721",
+    "DropERC1155_V2": "droperc1155_v2",
+    "PermissionsStorage": "permissions_storage",
+    "IDrop1155": "i_drop1155",
+    "IERC721Enumerable": "i_erc721_enumerable",
+    "IDropSinglePhase1155_V1": "idropsinglephase1155_v1",
+    "DropSinglePhase1155_V1": "dropsinglephase1155_v1",
+    "Ownable": "ownable",
+    "ERC721Base": "erc721_base",
+    "NFTStake": "n_f_t_stake",
+    "ContractMetadataStorage": "contract_metadata_storage",
+    "ERC20": "erc20",
+    "DropERC20_V2": "droperc20_v2",
+    "PlatformFee": "platform_fee",
+    "IERC20": "ierc20",
+    "Staking721Base": "staking721_base",
+    "LazyMint": "lazy_mint",
+    "Multicall": "multicall",
+    "TWMultichainRegistryRouter": "t_w_multichain_registry_router",
+    "IERC1822Proxiable": "i_erc1822_proxiable",
+    "ERC20Vote": "erc20_vote",
+    "IAirdropERC20": "i_airdrop_erc20",
+    "DirectListingsLogic": "direct_listings_logic",
+    "IERC20Permit": "i_erc20_permit",
+    "IDrop": "i_drop",
+    "ISignatureMintERC721": "i_signature_mint_erc721",
+    "ERC20SignatureMintVote": "erc20_signature_mint_vote",
+    "ITokenStake": "i_token_stake",
+    "ITWMultichainRegistry": "i_t_w_multichain_registry",
+    "SignatureMintERC721Upgradeable": "signature_mint_erc721_upgradeable",
+    "IERC721A": "ierc721a",
+    "IDropERC1155_V2": "idroperc1155_v2",
+    "IContractDeployer": "i_contract_deployer",
+    "ERC721Drop": "erc721_drop",
+    "ERC2771ContextUpgradeableLogic": "erc2771_context_upgradeable_logic",
+}
+
+__all__ = list(_BINDINGS)
+
+
+# Type checkers see the bindings through the imports above, resolving every other name
+# through __getattr__ would type the missing names the bindings probe for as Any
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> Any:
+        if name not in _BINDINGS:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+        binding = getattr(importlib.import_module(f".{_BINDINGS[name]}", __name__), name)
+        globals()[name] = binding
+        return binding
+
+    def __dir__() -> List[str]:
+        return sorted(set(globals()) | set(__all__))
@@ -2,7 +2,7 @@
 
 # pylint: disable=too-many-arguments
 
-import json
+from functools import lru_cache
 from typing import (  # pylint: disable=unused-import
     Any,
     List,
@@ -22,6 +22,8 @@ from web3.providers.base import BaseProvider
 from zero_ex.contract_wrappers.bases import ContractMethod, Validator
 from zero_ex.contract_wrappers.tx_params import TxParams
 
+from thirdweb.common.frozen import freeze_json
+
 
 # Try to import a custom validator class definition; if there isn't one,
 # declare one that we can instantiate for the default argument to the
@@ -198,9 +200,10 @@ class IFeeTierPlacementExtension:
         )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def abi():
         """Return the ABI to the underlying contract."""
-        return json.loads(
+        return freeze_json(
             '[{"inputs":[{"internalType":"address","name":"deployer","type":"address"},{"internalType":"address","name":"proxy","type":"address"}],"name":"getFeeTier","outputs":[{"internalType":"uint128","name":"tierId","type":"uint128"},{"internalType":"uint128","name":"validUntilTimestamp","type":"uint128"}],"stateMutability":"view","type":"function"}]'  # noqa: E501 (line-too-long)
         )
 
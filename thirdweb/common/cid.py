@@ -0,0 +1,162 @@
+import hashlib
+from base64 import b32encode
+from typing import BinaryIO, List, Tuple
+
+# Defaults of `ipfs add`: fixed size chunks in a balanced DAG of dag-pb nodes
+CHUNK_SIZE = 256 * 1024
+MAX_LINKS = 174
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+# multihash prefix of a 32 byte sha2-256 digest, and CIDv1 prefix of a dag-pb node
+SHA256_MULTIHASH_PREFIX = b"\x12\x20"
+CIDV1_DAG_PB_PREFIX = b"\x01\x70"
+
+UNIXFS_FILE_TYPE = 2
+
+# A link to a node: its multihash, the size of the DAG under it and its file size
+_Link = Tuple[bytes, int, int]
+
+
+def compute_cid(stream: BinaryIO, version: int = 0) -> str:
+    """
+    Compute the CID IPFS gives to a file added with the default settings, reading the
+    file in chunks so that it is never held in memory.
+
+    :param stream: binary stream of the content of the file
+    :param version: CID version, 0 for base58 Qm... CIDs or 1 for base32 b... CIDs.
+        Version 1 is the dag-pb CIDv1 of the same DAG as version 0, which is not the
+        CID of `ipfs add --cid-version=1`, as that command also stores the chunks as
+        raw leaves
+    :returns: the CID of the file
+    """
+
+    # Links waiting to be grouped under a parent node, per level of the DAG
+    levels: List[List[_Link]] = [[]]
+    read = 0
+
+    while True:
+        chunk = _read_chunk(stream)
+        if len(chunk) == 0 and read > 0:
+            break
+        read += 1
+
+        leaf = _add_node(_encode_unixfs_file(chunk, len(chunk), []), [], len(chunk))
+        _push(levels, 0, leaf)
+        if len(chunk) < CHUNK_SIZE:
+            break
+
+    root = _get_root(levels)
+    multihash = root[0]
+
+    if version == 0:
+        return _encode_base58(multihash)
+    if version == 1:
+        encoded = b32encode(CIDV1_DAG_PB_PREFIX + multihash).decode("ascii")
+        return "b" + encoded.lower().rstrip("=")
+    raise ValueError(f"Unsupported CID version {version}")
+
+
+"""
+INTERNAL FUNCTIONS
+"""
+
+
+def _read_chunk(stream: BinaryIO) -> bytes:
+    # Streams may return less than asked for, but chunk boundaries must be exact
+    chunk = b""
+    while len(chunk) < CHUNK_SIZE:
+        data = stream.read(CHUNK_SIZE - len(chunk))
+        if not data:
+            break
+        chunk += data
+    return chunk
+
+
+def _push(levels: List[List[_Link]], level: int, link: _Link):
+    if len(levels[level]) == MAX_LINKS:
+        # The level is full and more content follows, so it becomes a parent node
+        parent = _add_parent(levels[level])
+        levels[level] = []
+        if len(levels) == level + 1:
+            levels.append([])
+        _push(levels, level + 1, parent)
+
+    levels[level].append(link)
+
+
+def _get_root(levels: List[List[_Link]]) -> _Link:
+    for level in range(len(levels)):
+        links = levels[level]
+        is_top = level == len(levels) - 1
+
+        if is_top and len(links) == 1:
+            return links[0]
+
+        parent = _add_parent(links)
+        if is_top:
+            return parent
+        levels[level + 1].append(parent)
+
+    raise ValueError("Empty DAG")
+
+
+def _add_parent(links: List[_Link]) -> _Link:
+    file_size = sum(link[2] for link in links)
+    data = _encode_unixfs_file(b"", file_size, [link[2] for link in links])
+    return _add_node(data, links, file_size)
+
+
+def _add_node(data: bytes, links: List[_Link], file_size: int) -> _Link:
+    # dag-pb encodes the links of a node before its data
+    block = b""
+    for multihash, tree_size, _ in links:
+        link = (
+            _encode_bytes(1, multihash)
+            + _encode_bytes(2, b"")
+            + _encode_varint_field(3, tree_size)
+        )
+        block += _encode_bytes(2, link)
+    block += _encode_bytes(1, data)
+
+    multihash = SHA256_MULTIHASH_PREFIX + hashlib.sha256(block).digest()
+    tree_size = len(block) + sum(link[1] for link in links)
+    return (multihash, tree_size, file_size)
+
+
+def _encode_unixfs_file(data: bytes, file_size: int, block_sizes: List[int]) -> bytes:
+    encoded = _encode_varint_field(1, UNIXFS_FILE_TYPE)
+    if len(data) > 0:
+        encoded += _encode_bytes(2, data)
+    encoded += _encode_varint_field(3, file_size)
+    for block_size in block_sizes:
+        encoded += _encode_varint_field(4, block_size)
+    return encoded
+
+
+def _encode_varint(value: int) -> bytes:
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _encode_varint_field(field: int, value: int) -> bytes:
+    return _encode_varint(field << 3) + _encode_varint(value)
+
+
+def _encode_bytes(field: int, value: bytes) -> bytes:
+    return _encode_varint((field << 3) | 2) + _encode_varint(len(value)) + value
+
+
+def _encode_base58(data: bytes) -> str:
+    value = int.from_bytes(data, "big")
+    encoded = ""
+    while value > 0:
+        value, remainder = divmod(value, 58)
+        encoded = BASE58_ALPHABET[remainder] + encoded
+
+    leading_zeros = len(data) - len(data.lstrip(b"\x00"))
+    return BASE58_ALPHABET[0] * leading_zeros + encoded
@@ -1,4 +1,4 @@
-from typing import Dict, Optional, cast
+from typing import Dict, Iterable, Optional, cast
 
 from web3 import Web3
 from web3.constants import MAX_INT
@@ -13,14 +13,14 @@ from thirdweb.common.currency import (
     is_native_token,
     normalize_price_value
 )
-from thirdweb.core.classes.sharded_merkle_tree import ShardedMerkleTree
+from thirdweb.core.classes.sharded_merkle_tree import get_sharded_merkle_tree
+from thirdweb.core.helpers.rpc import get_chain_id
 
 from thirdweb.types.contracts.claim_conditions import (
     ClaimCondition,
     ClaimConditionOutput,
     ClaimVerification,
     SnapshotEntryWithProof,
-    ShardedMerkleTreeInfo
 )
 
 
@@ -108,23 +108,36 @@ def fetch_snapshot_entry_for_address(
 ) -> Optional[SnapshotEntryWithProof]:
     if merkle_metadata is None:
         return None
-        
-    merkle_root = merkle_root_hash
 
     snapshot_uri = merkle_metadata[merkle_root_hash]
     if snapshot_uri:
-        raw = storage.get(snapshot_uri)
-        metadata = ShardedMerkleTreeInfo.from_json(raw)
-       
-        if metadata.merkle_root == merkle_root:
-            merkle_tree = ShardedMerkleTree.from_info(
-                metadata,
-                storage
-            )
-            return merkle_tree.get_proof(address_to_claim, provider)
+        merkle_tree = get_sharded_merkle_tree(
+            get_chain_id(provider), merkle_root_hash, snapshot_uri, storage
+        )
+        if merkle_tree is not None:
+            return merkle_tree.get_proof(address_to_claim, provider, storage)
 
     return None
 
+
+def prefetch_snapshot_entries(
+    addresses: Iterable[str],
+    merkle_root_hash: str,
+    merkle_metadata: Optional[Dict[str, str]],
+    provider: Web3,
+    storage: IpfsStorage,
+):
+    if merkle_metadata is None or merkle_root_hash.startswith(ZERO_ADDRESS):
+        return
+
+    snapshot_uri = merkle_metadata.get(merkle_root_hash)
+    if snapshot_uri:
+        merkle_tree = get_sharded_merkle_tree(
+            get_chain_id(provider), merkle_root_hash, snapshot_uri, storage
+        )
+        if merkle_tree is not None:
+            merkle_tree.prefetch(addresses, provider, storage)
+
 def transform_result_to_claim_condition(
     pm: IClaimConditionClaimCondition,
     provider: Web3,
@@ -1,5 +1,11 @@
+from collections import OrderedDict
+from dataclasses import replace
+from threading import Lock
+from typing import Optional, Set, Tuple
+from hexbytes import HexBytes
 from thirdweb.constants.chains import ChainId
 from thirdweb.core.classes.contract_wrapper import ContractWrapper
+from thirdweb.core.helpers.rpc import batch_request, get_chain_id
 from thirdweb.types.currency import Currency, CurrencyValue, Price, PriceWei
 from thirdweb.abi import TokenERC20, IERC20
 from thirdweb.constants.currency import (
@@ -28,14 +34,105 @@ def format_units(wei_value: PriceWei, decimals: int) -> Price:
     return wei_value / (10**decimals)
 
 
+MAX_CACHED_CURRENCIES = 1024
+
+_currency_metadata: "OrderedDict[Tuple[int, str], Currency]" = OrderedDict()
+_pinned_currencies: Set[Tuple[int, str]] = set()
+_currency_metadata_lock = Lock()
+
+
 def fetch_currency_metadata(provider: Web3, asset: str) -> Currency:
+    chain_id = get_chain_id(provider)
+
     if is_native_token(asset):
-        chain_id = provider.eth.chain_id
         native_token = get_native_token_by_chain_id(ChainId(chain_id))
         return Currency(native_token.name, native_token.symbol, native_token.decimals)
 
-    abi = TokenERC20(provider, asset)
-    return Currency(abi.name.call(), abi.symbol.call(), abi.decimals.call())
+    key = (chain_id, asset.lower())
+    with _currency_metadata_lock:
+        if key in _currency_metadata:
+            _currency_metadata.move_to_end(key)
+            return replace(_currency_metadata[key])
+
+    metadata = _fetch_erc20_metadata(provider, asset)
+
+    with _currency_metadata_lock:
+        _currency_metadata[key] = metadata
+        _currency_metadata.move_to_end(key)
+        _evict_currency_metadata()
+
+    return replace(metadata)
+
+
+def pin_currency_metadata(
+    chain_id: int, asset: str, metadata: Optional[Currency] = None
+):
+    """
+    Keep the metadata of a currency cached until it is invalidated.
+
+    :param chain_id: chain ID the currency is deployed on
+    :param asset: address of the currency
+    :param metadata: optional known metadata to cache instead of fetching it
+    """
+
+    key = (chain_id, asset.lower())
+    with _currency_metadata_lock:
+        _pinned_currencies.add(key)
+        if metadata is not None:
+            _currency_metadata[key] = replace(metadata)
+
+
+def invalidate_currency_metadata(
+    chain_id: Optional[int] = None, asset: Optional[str] = None
+):
+    """
+    Drop cached currency metadata, including pinned entries, so it is fetched again.
+
+    :param chain_id: chain ID to invalidate currencies of, by default every chain
+    :param asset: address of the currency to invalidate, by default every currency
+    """
+
+    with _currency_metadata_lock:
+        for key in list(_currency_metadata.keys() | _pinned_currencies):
+            if (chain_id is None or key[0] == chain_id) and (
+                asset is None or key[1] == asset.lower()
+            ):
+                _currency_metadata.pop(key, None)
+                _pinned_currencies.discard(key)
+
+
+def _fetch_erc20_metadata(provider: Web3, asset: str) -> Currency:
+    # name, symbol and decimals are read in a single batch request
+    contract = provider.eth.contract(
+        address=Web3.toChecksumAddress(asset), abi=TokenERC20.abi()
+    )
+    fields = [("name", "string"), ("symbol", "string"), ("decimals", "uint8")]
+    responses = batch_request(
+        provider,
+        [
+            (
+                "eth_call",
+                [{"to": contract.address, "data": contract.encodeABI(fn_name=fn)}, "latest"],
+            )
+            for fn, _ in fields
+        ],
+    )
+
+    values = []
+    for (fn, output_type), response in zip(fields, responses):
+        if "error" in response:
+            raise ValueError(response["error"])
+        values.append(
+            provider.codec.decode_abi([output_type], HexBytes(response["result"]))[0]
+        )
+
+    return Currency(values[0], values[1], values[2])
+
+
+def _evict_currency_metadata():
+    unpinned = [key for key in _currency_metadata if key not in _pinned_currencies]
+    for key in unpinned[: max(len(_currency_metadata) - MAX_CACHED_CURRENCIES, 0)]:
+        del _currency_metadata[key]
 
 
 def fetch_currency_value(provider: Web3, asset: str, price: PriceWei) -> CurrencyValue:
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, List
 
 
 class NotFoundException(Exception):
@@ -82,3 +82,14 @@ class DuplicateLeafsException(Exception):
 
 def includes_error_message(err: Any, message: str) -> bool:
     return message in str(err)
+
+
+class MultiCallBatchException(Exception):
+    def __init__(self, receipts: List[Any], succeeded: List[bool]):
+        self.receipts = receipts
+        self.succeeded = succeeded
+        failed = [str(i) for i, success in enumerate(succeeded) if not success]
+        super().__init__(
+            f"BATCH FAILED: {len(failed)} of {len(succeeded)} calls reverted, "
+            f"calls {', '.join(failed)} were not executed."
+        )
@@ -0,0 +1,67 @@
+import json
+from copy import deepcopy
+from typing import Any, Dict, List
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(
+        f"{type(self).__name__} is shared and cannot be modified, copy it first"
+    )
+
+
+class FrozenList(list):
+    """
+    A list raising on every modification. It is still a list for the code reading it,
+    and its copies are plain lists.
+    """
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        return [deepcopy(item, memo) for item in self]
+
+
+class FrozenDict(dict):
+    """
+    A dict raising on every modification. It is still a dict for the code reading it,
+    and its copies are plain dicts.
+    """
+
+    pop = popitem = clear = update = setdefault = _immutable
+    __setitem__ = __delitem__ = __ior__ = _immutable
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[Any, Any]:
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively freeze the lists and dicts of a JSON value.
+
+    :param value: the value to freeze
+    :returns: the value with every list and dict replaced by a frozen copy
+    """
+
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    return value
+
+
+def freeze_json(text: str) -> Any:
+    """
+    Parse a JSON document into a frozen value, safe to share between callers.
+
+    :param text: the JSON document
+    :returns: the parsed value, with every list and dict frozen
+    """
+
+    return freeze(json.loads(text))
@@ -1,7 +1,8 @@
-
-import binascii
+from typing import Callable, Dict, List, Optional, Sequence, Union
+from eth_utils import keccak
 from hexbytes import HexBytes
-from web3 import Web3
+
+HASH_SIZE = 32
 
 
 class HashedData:
@@ -10,132 +11,182 @@ class HashedData:
 
     def hexdigest(self):
         return self.data.hex()[2:]
-    
+
     def digest(self):
-        digest = binascii.unhexlify(self.data.hex()[2:])
-        return digest
+        return bytes(self.data)
 
 
 def keccak256(x: bytearray) -> HashedData:
-    hexstr = binascii.hexlify(x).decode("ascii")
-    keccak = Web3.keccak(hexstr=hexstr)
-    return HashedData(keccak)
-    
+    return HashedData(HexBytes(keccak(bytes(x))))
+
+
 class MerkleTree(object):
+    """
+    Sorted-pair keccak256 merkle tree, compatible with the OpenZeppelin MerkleProof
+    verification used by the drop contracts.
+
+    Each level is stored as a single contiguous buffer of 32 byte hashes, from the
+    sorted leaves up to the root, and leaves are indexed by value so proofs are
+    generated without scanning the leaves.
+    """
+
+    leaves: List[bytes]
+    is_ready: bool
+    _levels: List[bytes]
+    _leaf_index: Dict[bytes, int]
+
     def __init__(self):
-        self.hash_function = keccak256
         self.reset_tree()
 
-    def _to_hex(self, x):
-        try:  # python3
-            return x.hex()
-        except:  # python2
-            return binascii.hexlify(x)
-
     def reset_tree(self):
-        self.leaves = list()
-        self.levels = None
+        self.leaves = []
         self.is_ready = False
+        self._levels = []
+        self._leaf_index = {}
 
-    def add_leaf(self, values, do_hash=False):
+    def add_leaf(self, values: Union[str, Sequence[str]], do_hash: bool = False):
         self.is_ready = False
         # check if single leaf
         if not isinstance(values, tuple) and not isinstance(values, list):
-            values = [values]
+            values = [values]  # type: ignore
         for v in values:
-            if do_hash:
-                v = v.encode('utf-8')
-                v = self.hash_function(v).hexdigest()
-            v = bytearray.fromhex(v)
-            self.leaves.append(v)
+            leaf = keccak(v.encode("utf-8")) if do_hash else bytes.fromhex(v)
+            if len(leaf) != HASH_SIZE:
+                raise ValueError(f"Merkle tree leaves must be {HASH_SIZE} byte hashes")
+            self.leaves.append(leaf)
 
-    def get_leaf(self, index):
-        return self._to_hex(self.leaves[index])
+    def get_leaf(self, index: int) -> str:
+        return self.leaves[index].hex()
 
-    def get_leaf_count(self):
+    def get_leaf_count(self) -> int:
         return len(self.leaves)
 
-    def get_tree_ready_state(self):
+    def get_tree_ready_state(self) -> bool:
         return self.is_ready
 
-    def _calculate_next_level(self):
-        solo_leave = None
-        N = len(self.levels[0])  # number of leaves on the level
-        if N % 2 == 1:  # if odd number of leaves on the level
-            solo_leave = self.levels[0][-1]
-            N -= 1
-
-        new_level = []
-        for l, r in zip(self.levels[0][0:N:2], self.levels[0][1:N:2]):
-            # IMPORTANT: Sort the leaves before hashing
-            sorted_leaves = [l, r]
-            sorted_leaves.sort()
-            left = sorted_leaves[0]
-            right = sorted_leaves[1]
-
-            new_level.append(self.hash_function(left+right).digest())
-        if solo_leave is not None:
-            new_level.append(solo_leave)
-        self.levels = [new_level, ] + self.levels  # prepend new level
-
     def make_tree(self):
         self.is_ready = False
         # IMPORTANT: Sort the leaves before building tree
         self.leaves.sort()
+
+        self._leaf_index = {}
+        for index, leaf in enumerate(self.leaves):
+            self._leaf_index.setdefault(leaf, index)
+
+        self._levels = []
         if self.get_leaf_count() > 0:
-            self.levels = [self.leaves, ]
-            while len(self.levels[0]) > 1:
-                self._calculate_next_level()
+            level = b"".join(self.leaves)
+            self._levels.append(level)
+            while len(level) > HASH_SIZE:
+                level = self._calculate_next_level(level)
+                self._levels.append(level)
+
         self.is_ready = True
 
-    def get_merkle_root(self):
-        if self.is_ready:
-            if self.levels is not None:
-                return self._to_hex(self.levels[0][0])
-            else:
-                return None
-        else:
+    def get_merkle_root(self) -> Optional[str]:
+        if not self.is_ready or len(self._levels) == 0:
             return None
+        return self._levels[-1].hex()
 
-    def get_proof(self, leaf: str):
-        try:
-            index = self.leaves.index(binascii.unhexlify(leaf))
-        except ValueError:
-            return None
+    def get_proof(self, leaf: str) -> Optional[List[Dict[str, str]]]:
+        """
+        Get the proof of a leaf, as a list of sibling hashes from the leaf up to the root.
+
+        :param leaf: hex encoded leaf, without the 0x prefix
+        :returns: the proof, or None if the leaf is not in the tree
+        """
 
-        if self.levels is None:
+        if not self.is_ready:
             return None
-        elif not self.is_ready or index > len(self.leaves)-1 or index < 0:
+
+        index = self._leaf_index.get(bytes.fromhex(leaf))
+        if index is None:
             return None
-        else:
-            proof = []
-            for x in range(len(self.levels) - 1, 0, -1):
-                level_len = len(self.levels[x])
-                if (index == level_len - 1) and (level_len % 2 == 1):  # skip if this is an odd end node
-                    index = int(index / 2.)
-                    continue
-                is_right_node = index % 2
-                sibling_index = index - 1 if is_right_node else index + 1
-                sibling_pos = "left" if is_right_node else "right"
-                sibling_value = self._to_hex(self.levels[x][sibling_index])
-                proof.append({sibling_pos: sibling_value})
-                index = int(index / 2.)
-            return proof
+
+        return self._build_proof(
+            index,
+            lambda level, i: self._levels[level][
+                i * HASH_SIZE : (i + 1) * HASH_SIZE
+            ].hex(),
+        )
+
+    def get_proofs(self, leaves: Sequence[str]) -> List[Optional[List[Dict[str, str]]]]:
+        """
+        Get the proofs of many leaves at once, hex encoding each level only once.
+
+        :param leaves: hex encoded leaves, without the 0x prefix
+        :returns: the proof of each leaf in order, or None for leaves not in the tree
+        """
+
+        if not self.is_ready:
+            return [None for _ in leaves]
+
+        hex_levels = [level.hex() for level in self._levels]
+        hex_size = HASH_SIZE * 2
+
+        def node(level: int, i: int) -> str:
+            return hex_levels[level][i * hex_size : (i + 1) * hex_size]
+
+        proofs: List[Optional[List[Dict[str, str]]]] = []
+        for leaf in leaves:
+            index = self._leaf_index.get(bytes.fromhex(leaf))
+            proofs.append(None if index is None else self._build_proof(index, node))
+
+        return proofs
 
     def validate_proof(self, proof, target_hash, merkle_root):
-        merkle_root = bytearray.fromhex(merkle_root)
-        target_hash = bytearray.fromhex(target_hash)
-        if len(proof) == 0:
-            return target_hash == merkle_root
-        else:
-            proof_hash = target_hash
-            for p in proof:
-                try:
-                    # the sibling is a left node
-                    sibling = bytearray.fromhex(p['left'])
-                    proof_hash = self.hash_function(sibling + proof_hash).digest()
-                except:
-                    # the sibling is a right node
-                    sibling = bytearray.fromhex(p['right'])
-                    proof_hash = self.hash_function(proof_hash + sibling).digest()
-            return proof_hash == merkle_root
\ No newline at end of file
+        merkle_root = bytes.fromhex(merkle_root)
+        proof_hash = bytes.fromhex(target_hash)
+        for p in proof:
+            sibling = bytes.fromhex(p.get("left", p.get("right")))
+            # Pairs are sorted before hashing, whichever side the sibling is on
+            proof_hash = (
+                keccak(proof_hash + sibling)
+                if proof_hash <= sibling
+                else keccak(sibling + proof_hash)
+            )
+        return proof_hash == merkle_root
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _calculate_next_level(self, level: bytes) -> bytes:
+        count = len(level) // HASH_SIZE
+        pairs = count // 2
+
+        next_level = bytearray(((count + 1) // 2) * HASH_SIZE)
+        for i in range(pairs):
+            offset = 2 * i * HASH_SIZE
+            left = level[offset : offset + HASH_SIZE]
+            right = level[offset + HASH_SIZE : offset + 2 * HASH_SIZE]
+
+            # IMPORTANT: Sort the pair before hashing
+            next_level[i * HASH_SIZE : (i + 1) * HASH_SIZE] = (
+                keccak(left + right) if left <= right else keccak(right + left)
+            )
+
+        # An odd node at the end of a level is promoted without hashing
+        if count % 2 == 1:
+            next_level[pairs * HASH_SIZE :] = level[(count - 1) * HASH_SIZE :]
+
+        return bytes(next_level)
+
+    def _build_proof(
+        self, index: int, node: Callable[[int, int], str]
+    ) -> List[Dict[str, str]]:
+        proof = []
+        for level in range(len(self._levels) - 1):
+            count = len(self._levels[level]) // HASH_SIZE
+            # skip if this is an odd end node
+            if index == count - 1 and count % 2 == 1:
+                index //= 2
+                continue
+
+            is_right_node = index % 2 == 1
+            sibling_index = index - 1 if is_right_node else index + 1
+            sibling_pos = "left" if is_right_node else "right"
+            proof.append({sibling_pos: node(level, sibling_index)})
+            index //= 2
+
+        return proof
@@ -1,4 +1,4 @@
-from typing import List, Union, cast
+from typing import Any, Dict, List, Optional, Union, cast
 
 from web3 import Web3
 from thirdweb.abi import TokenERC1155, IERC165, TokenERC721
@@ -12,6 +12,36 @@ def fetch_token_metadata(
     token_id: int, token_uri: str, storage: IpfsStorage
 ) -> NFTMetadata:
     metadata = storage.get(token_uri)
+    return build_token_metadata(token_id, token_uri, metadata)
+
+
+def fetch_token_metadata_batch(
+    token_ids: List[int],
+    token_uris: List[str],
+    storage: IpfsStorage,
+    allow_failure: bool = False,
+) -> List[Optional[NFTMetadata]]:
+    metadatas = storage.get_batch(token_uris, allow_failure)
+
+    results: List[Optional[NFTMetadata]] = []
+    for token_id, token_uri, metadata in zip(token_ids, token_uris, metadatas):
+        if metadata is None:
+            results.append(None)
+            continue
+
+        try:
+            results.append(build_token_metadata(token_id, token_uri, metadata))
+        except Exception as e:
+            if not allow_failure:
+                raise e
+            results.append(None)
+
+    return results
+
+
+def build_token_metadata(
+    token_id: int, token_uri: str, metadata: Dict[str, Any]
+) -> NFTMetadata:
     return NFTMetadata(
         token_id,
         token_uri,
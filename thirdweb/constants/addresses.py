@@ -8,6 +8,8 @@ DEFAULT_MERKLE_ROOT = (
 OZ_DEFENDER_FORWARDER_ADDRESS = "0xc82BbE41f2cF04e3a8efA18F7032BDD7f6d98a81"
 TWREGISTRY_ADDRESS = "0x7c487845f98938Bb955B1D5AD069d9a30e4131fd"
 TWFACTORY_ADDRESS = "0x5DBC7B840baa9daBcBe9D2492E45D7244B54A2A0"
+# Deterministic deployment, see https://github.com/mds1/multicall
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
 
 CONTRACT_ADDRESSES: Dict[ChainId, Dict[str, str]] = {
     ChainId.MAINNET: {
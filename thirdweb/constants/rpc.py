@@ -1,14 +1,30 @@
 from thirdweb.constants.chains import ChainId
 
 
+# Public RPC endpoints of every chain, the first one being preferred until the others
+# prove healthier
+CHAIN_ID_TO_RPC_URLS = {
+    ChainId.MAINNET: [
+        "https://main-rpc.linkpool.io",
+        "https://cloudflare-eth.com",
+        "https://rpc.ankr.com/eth",
+    ],
+    ChainId.RINKEBY: ["https://rinkeby.arbitrum.io/rpc"],
+    ChainId.GOERLI: ["https://goerli.optimism.io/", "https://rpc.ankr.com/eth_goerli"],
+    ChainId.POLYGON: ["https://polygon-rpc.com/", "https://rpc.ankr.com/polygon"],
+    ChainId.AVALANCHE: [
+        "https://api.avax.network/ext/bc/C/rpc",
+        "https://rpc.ankr.com/avalanche",
+    ],
+    ChainId.MUMBAI: [
+        "https://rpc-mumbai.maticvigil.com",
+        "https://rpc.ankr.com/polygon_mumbai",
+    ],
+    ChainId.FANTOM: ["https://rpc.ftm.tools/", "https://rpc.ankr.com/fantom"],
+    ChainId.LOCALHOST: ["http://localhost:8545"],
+    ChainId.HARDHAT: ["http://localhost:8545"],
+}
+
 CHAIN_ID_TO_RPC_URL = {
-    ChainId.MAINNET: "https://main-rpc.linkpool.io",
-    ChainId.RINKEBY: "https://rinkeby.arbitrum.io/rpc",
-    ChainId.GOERLI: "https://goerli.optimism.io/",
-    ChainId.POLYGON: "https://polygon-rpc.com/",
-    ChainId.AVALANCHE: "https://api.avax.network/ext/bc/C/rpc",
-    ChainId.MUMBAI: "https://rpc-mumbai.maticvigil.com",
-    ChainId.FANTOM: "https://rpc.ftm.tools/",
-    ChainId.LOCALHOST: "http://localhost:8545",
-    ChainId.HARDHAT: "http://localhost:8545",
+    chain_id: urls[0] for chain_id, urls in CHAIN_ID_TO_RPC_URLS.items()
 }
@@ -1,6 +1,10 @@
 from typing import Optional
 from web3 import Web3
 
+from thirdweb.core.classes.batch_provider import BatchHTTPProvider
+from thirdweb.core.classes.failover_provider import FailoverHTTPProvider
+from thirdweb.types.sdk import RpcBatchSettings, RpcFailoverSettings
+
 
 DEFAULT_IPFS_GATEWAY = "https://ipfs.io/ipfs/"
 
@@ -14,36 +18,58 @@ def get_rpc_url(network: str, client_id: Optional[str]) -> str:
   api_key = client_id if client_id is not None else DEFAULT_API_KEY
   return f"https://{network}.rpc.thirdweb.com/{api_key}"
 
-def get_provider_for_network(network: str, client_id: str) -> Web3:
+def get_rpc_url_for_network(network: str, client_id: Optional[str]) -> str:
     """
-    Returns a web3 provider instance for the given network.
+    Returns the RPC URL of the given network, which is either a chain name or an RPC URL.
     """
 
-    rpc_url = ""
     if network == "mainnet" or network == "ethereum":
-        rpc_url = get_rpc_url("ethereum", client_id)
+        return get_rpc_url("ethereum", client_id)
     elif network == "goerli":
-        rpc_url = get_rpc_url("goerli", client_id)
+        return get_rpc_url("goerli", client_id)
     elif network == "polygon":
-        rpc_url = get_rpc_url("polygon", client_id)
+        return get_rpc_url("polygon", client_id)
     elif network == "mumbai":
-        rpc_url = get_rpc_url("mumbai", client_id)
+        return get_rpc_url("mumbai", client_id)
     elif network == "optimism":
-      rpc_url = get_rpc_url("optimism", client_id)
+        return get_rpc_url("optimism", client_id)
     elif network == "optimism-goerli":
-      rpc_url = get_rpc_url("optimism-goerli", client_id)
+        return get_rpc_url("optimism-goerli", client_id)
     elif network == "arbitrum":
-      rpc_url = get_rpc_url("arbitrum", client_id)
+        return get_rpc_url("arbitrum", client_id)
     elif network == "arbitrum-goerli":
-      rpc_url = get_rpc_url("arbitrum-goerli", client_id)
+        return get_rpc_url("arbitrum-goerli", client_id)
     elif network == "fantom":
-        rpc_url = get_rpc_url("fantom", client_id)
+        return get_rpc_url("fantom", client_id)
     elif network == "avalanche":
-        rpc_url = get_rpc_url("avalanche", client_id)
-    else:
-        if network.startswith("http"):
-            rpc_url = network
-        else:
-            raise Exception(f"Unrecognized chain name or RPC url {network}")
-
-    return Web3(Web3.HTTPProvider(rpc_url))
+        return get_rpc_url("avalanche", client_id)
+    elif network.startswith("http"):
+        return network
+
+    raise Exception(f"Unrecognized chain name or RPC url {network}")
+
+
+def get_provider_for_network(
+    network: str,
+    client_id: str,
+    batch_settings: RpcBatchSettings = RpcBatchSettings(),
+    failover_settings: RpcFailoverSettings = RpcFailoverSettings(),
+) -> Web3:
+    """
+    Returns a web3 provider instance for the given network, sending concurrent
+    requests to the node in JSON-RPC batches, and failing over to the fallback URLs
+    of the failover settings when there are any.
+    """
+
+    rpc_url = get_rpc_url_for_network(network, client_id)
+
+    if len(failover_settings.fallback_urls) > 0:
+        return Web3(
+            FailoverHTTPProvider(
+                [rpc_url] + failover_settings.fallback_urls,
+                failover_settings,
+                batch_settings,
+            )
+        )
+
+    return Web3(BatchHTTPProvider(rpc_url, batch_settings))
@@ -1,8 +1,46 @@
-from .nft_collection import NFTCollection
-from .edition import Edition
-from .token import Token
-from .marketplace import Marketplace
-from .nft_drop import NFTDrop
-from .edition_drop import EditionDrop
-from .multiwrap import Multiwrap
-from .maps import *
+"""Prebuilt thirdweb contracts, each imported on first access."""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .nft_collection import NFTCollection
+    from .edition import Edition
+    from .token import Token
+    from .marketplace import Marketplace
+    from .nft_drop import NFTDrop
+    from .edition_drop import EditionDrop
+    from .multiwrap import Multiwrap
+    from .maps import (
+        CONTRACTS_MAP,
+        REMOTE_CONTRACT_NAME,
+        REMOTE_CONTRACT_NAME_TO_CONTRACT_TYPE,
+    )
+
+_EXPORTS: Dict[str, str] = {
+    "NFTCollection": "nft_collection",
+    "Edition": "edition",
+    "Token": "token",
+    "Marketplace": "marketplace",
+    "NFTDrop": "nft_drop",
+    "EditionDrop": "edition_drop",
+    "Multiwrap": "multiwrap",
+    "CONTRACTS_MAP": "maps",
+    "REMOTE_CONTRACT_NAME": "maps",
+    "REMOTE_CONTRACT_NAME_TO_CONTRACT_TYPE": "maps",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
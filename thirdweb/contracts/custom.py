@@ -7,7 +7,6 @@ from web3.contract import ContractFunctions, ContractFunction
 from thirdweb.abi.token_erc1155 import TokenERC1155
 from thirdweb.abi.token_erc20 import TokenERC20
 from thirdweb.abi.token_erc721 import TokenERC721
-from thirdweb.common.error import NoSignerException
 from thirdweb.constants.role import ALL_ROLES
 from thirdweb.core.classes.base_contract import BaseContract
 from thirdweb.core.classes.contract_metadata import ContractMetadata
@@ -20,7 +19,6 @@ from thirdweb.core.classes.erc_1155 import ERC1155
 from thirdweb.core.classes.erc_20 import ERC20
 from thirdweb.core.classes.erc_721 import ERC721
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
-from zero_ex.contract_wrappers.tx_params import TxParams
 from thirdweb.types.contract import ContractType
 from eth_account.account import LocalAccount
 from thirdweb.abi import (
@@ -138,23 +136,7 @@ class CustomContract(BaseContract[Any]):
         if func.abi["stateMutability"] == "view" or func.abi["stateMutability"] == "pure":
             return func(*args).call()
         else:
-            provider = self._contract_wrapper.get_provider()
-            signer = self._contract_wrapper.get_signer()
-
-            if signer is None:
-                raise NoSignerException
-
-            nonce = provider.eth.get_transaction_count(signer.address)  # type: ignore
-
-            tx = func(*args).buildTransaction(
-                TxParams(gas_price=provider.eth.gas_price).as_dict()
-            )
-            tx["nonce"] = nonce
-
-            signed_tx = signer.sign_transaction(tx)  # type: ignore
-            tx_hash = provider.eth.send_raw_transaction(signed_tx.rawTransaction)
-
-            return provider.eth.wait_for_transaction_receipt(tx_hash)
+            return self._contract_wrapper.send_contract_function(func(*args))
 
     """
     INTERNAL FUNCTIONS
@@ -1,4 +1,4 @@
-from typing import Any, Final, List, Optional
+from typing import Any, Callable, Final, Iterable, Iterator, List, Optional
 
 from web3 import Web3
 from thirdweb.abi import DropERC1155
@@ -13,7 +13,12 @@ from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.core.classes.erc_1155_standard import ERC1155Standard
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from thirdweb.types.contract import ContractType
-from thirdweb.types.nft import NFTMetadata, NFTMetadataInput
+from thirdweb.types.nft import (
+    LazyMintProgress,
+    LazyMintSettings,
+    NFTMetadata,
+    NFTMetadataInput,
+)
 from thirdweb.types.sdk import SDKOptions
 from thirdweb.types.settings.metadata import EditionDropContractMetadata
 from eth_account.account import LocalAccount
@@ -86,7 +91,10 @@ class EditionDrop(ERC1155Standard[DropERC1155]):
         self.events = ContractEvents(contract_wrapper)
 
     def create_batch(
-        self, metadatas: List[NFTMetadataInput]
+        self,
+        metadatas: Iterable[NFTMetadataInput],
+        settings: LazyMintSettings = LazyMintSettings(),
+        on_progress: Optional[Callable[[LazyMintProgress], None]] = None,
     ) -> List[TxResultWithId[NFTMetadata]]:
         """
         Create a batch of NFTs.
@@ -119,11 +127,44 @@ class EditionDrop(ERC1155Standard[DropERC1155]):
         first_nft = txs[0].data()
         ```
 
-        :param metadatas: List of NFT metadata inputs.
+        :param metadatas: List or iterator of NFT metadata inputs.
+        :param settings: Optional settings of the batch, to tune chunking and resume
+            an interrupted batch from a checkpoint.
+        :param on_progress: Optional function called with the progress of the batch.
         :return: List of tx results with ids for created NFTs.
         """
 
-        return self._erc1155.create_batch(metadatas)
+        return self._erc1155.create_batch(metadatas, settings, on_progress)
+
+    def create_batch_stream(
+        self,
+        metadatas: Iterable[NFTMetadataInput],
+        settings: LazyMintSettings = LazyMintSettings(),
+        on_progress: Optional[Callable[[LazyMintProgress], None]] = None,
+    ) -> Iterator[TxResultWithId[NFTMetadata]]:
+        """
+        Create a stream of NFTs in chunks, without holding them in memory.
+
+        ```python
+        from thirdweb.types.nft import LazyMintSettings, NFTMetadataInput
+
+        metadatas = (
+            NFTMetadataInput.from_json({"name": f"NFT #{i}"}) for i in range(50000)
+        )
+        settings = LazyMintSettings(checkpoint_path="lazy_mint.json")
+
+        for tx in contract.create_batch_stream(metadatas, settings, print):
+            print(tx.id)
+        ```
+
+        :param metadatas: Iterable of NFT metadata inputs, consumed lazily.
+        :param settings: Optional settings of the batch, to tune chunking and resume
+            an interrupted batch from a checkpoint.
+        :param on_progress: Optional function called with the progress of the batch.
+        :return: Iterator of tx results with ids for created NFTs.
+        """
+
+        return self._erc1155.create_batch_stream(metadatas, settings, on_progress)
 
     def claim_to(
         self,
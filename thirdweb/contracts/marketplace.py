@@ -11,6 +11,7 @@ from thirdweb.types.marketplace import (
     DirectListing,
     ListingType,
     MarketplaceFilter,
+    MarketplaceIndexSettings,
 )
 from thirdweb.types.settings.metadata import MarketplaceContractMetadata
 from thirdweb.core.classes.contract_metadata import ContractMetadata
@@ -20,6 +21,8 @@ from thirdweb.core.classes.base_contract import BaseContract
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from thirdweb.core.classes.marketplace_auction import MarketplaceAuction
 from thirdweb.core.classes.marketplace_direct import MarketplaceDirect
+from thirdweb.core.classes.marketplace_index import MarketplaceIndex
+from thirdweb.core.classes.marketplace_scanner import MarketplaceScanner
 from thirdweb.types.contract import ContractType
 from eth_account.account import LocalAccount
 from thirdweb.types.sdk import SDKOptions
@@ -66,6 +69,8 @@ class Marketplace(BaseContract[MarketplaceABI]):
     direct: MarketplaceDirect
     auction: MarketplaceAuction
     events: ContractEvents[MarketplaceABI]
+    _scanner: MarketplaceScanner
+    _index: Optional[MarketplaceIndex] = None
 
     def __init__(
         self,
@@ -87,6 +92,9 @@ class Marketplace(BaseContract[MarketplaceABI]):
         self.direct = MarketplaceDirect(contract_wrapper, storage)
         self.auction = MarketplaceAuction(contract_wrapper, storage)
         self.events = ContractEvents(contract_wrapper)
+        self._scanner = MarketplaceScanner(
+            contract_wrapper, storage, self.direct, self.auction
+        )
 
     """
     READ FUNCTIONS
@@ -123,7 +131,13 @@ class Marketplace(BaseContract[MarketplaceABI]):
 
         :return: List of listings
         """
-        raw_listings = self._get_all_listings_no_filter()
+        if self._index is not None:
+            self._index.sync()
+            raw_listings = self._scanner.scan(
+                [listing.listing_id for listing in self._index.get_active()]
+            )
+        else:
+            raw_listings = self._get_all_listings_no_filter()
 
         listings: List[Union[DirectListing, AuctionListing]] = []
         for listing in raw_listings:
@@ -218,6 +232,28 @@ class Marketplace(BaseContract[MarketplaceABI]):
         """
         return self._contract_wrapper._contract_abi.time_buffer.call()
 
+    def enable_listing_index(
+        self, settings: MarketplaceIndexSettings = MarketplaceIndexSettings()
+    ) -> MarketplaceIndex:
+        """
+        Keep a local index of the listings of this marketplace, caught up from listing
+        events, so that active listings are found without reading every listing ever
+        made. Once enabled, get_active_listings only loads the active listings.
+
+        ```python
+        from thirdweb.types.marketplace import MarketplaceIndexSettings
+
+        index = contract.enable_listing_index(MarketplaceIndexSettings(path="listings.db"))
+        listings = index.get_by_price_range(0, 10 ** 18)
+        ```
+
+        :param settings: confirmation depth, persistence and log query settings
+        :return: the synced listing index
+        """
+        self._index = MarketplaceIndex(self._contract_wrapper, settings)
+        self._index.sync()
+        return self._index
+
     """
     WRITE FUNCTIONS
     """
@@ -304,6 +340,7 @@ class Marketplace(BaseContract[MarketplaceABI]):
         Restrict marketplace so only specific asset can be listed.
 
         :param contract_address: Address of the asset contract
+        :return: Transaction receipt of the asset being allowed
         """
         encoded = []
         interface = self._contract_wrapper.get_contract_interface()
@@ -322,7 +359,7 @@ class Marketplace(BaseContract[MarketplaceABI]):
             )
         )
 
-        return self._contract_wrapper.multi_call(encoded)
+        return self._contract_wrapper.multi_call_batch(encoded)[-1]
 
     def allow_listing_from_any_asset(self) -> TxReceipt:
         """
@@ -344,7 +381,8 @@ class Marketplace(BaseContract[MarketplaceABI]):
             interface.encodeABI("grant_role", [get_role_hash(Role.ASSET), ZERO_ADDRESS])
         )
 
-        return self._contract_wrapper.multi_call(encoded)
+        # Revoking many assets may not fit in a single transaction, the grant is last
+        return self._contract_wrapper.multi_call_batch(encoded)[-1]
 
     def call(self, fn: str, *args) -> Any:
         return self._contract_wrapper.call(fn, *args)
@@ -357,20 +395,4 @@ class Marketplace(BaseContract[MarketplaceABI]):
         self,
     ) -> List[Union[DirectListing, AuctionListing]]:
         total_listings = self._contract_wrapper._contract_abi.total_listings.call()
-
-        listings = []
-        for i in range(total_listings):
-            try:
-                listing = self.get_listing(i)
-
-                if ListingType(listing.type) == ListingType.AUCTION:
-                    listings.append(listing)
-                else:
-                    valid = self.direct._is_still_valid_listing(cast(Any, listing))
-
-                    if valid:
-                        listings.append(listing)
-            except:
-                pass
-
-        return [listing for listing in listings if listing is not None]
\ No newline at end of file
+        return self._scanner.scan(range(total_listings))
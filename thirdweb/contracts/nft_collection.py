@@ -13,6 +13,7 @@ from thirdweb.core.classes.erc_721_signature_minting import ERC721SignatureMinti
 from thirdweb.abi import TokenERC721
 
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
+from thirdweb.core.classes.receipt_poller import PendingTransaction
 from thirdweb.types.contract import ContractType
 from thirdweb.types.nft import NFTMetadataInput, NFTMetadataOwner
 from eth_account.account import LocalAccount
@@ -104,7 +105,7 @@ class NFTCollection(ERC721Standard[TokenERC721]):
         """
 
         token_ids = self.get_owned_token_ids(address)
-        return [self.get(token_id) for token_id in token_ids]
+        return self._erc721.get_batch(token_ids)
 
     def get_owned_token_ids(self, address: str = "") -> List[int]:
         """
@@ -167,6 +168,31 @@ class NFTCollection(ERC721Standard[TokenERC721]):
 
         return self._erc721.mint_to(to, metadata)
 
+    def submit_mint_to(
+        self, to: str, metadata: Union[NFTMetadataInput, str]
+    ) -> PendingTransaction[TxResultWithId[NFTMetadataOwner]]:
+        """
+        Mint a new NFT to the specified wallet without waiting for the transaction to be mined
+
+        ```python
+        from thirdweb.types.nft import NFTMetadataInput
+
+        metadata = NFTMetadataInput.from_json({"name": "Cool NFT"})
+
+        pending = contract.submit_mint_to("{{wallet_address}}", metadata)
+        pending.add_done_callback(lambda tx: print("Minted", tx.tx_hash.hex()))
+
+        tx = pending.wait()
+        token_id = tx.id
+        ```
+
+        :param to: wallet address to mint the NFT to
+        :param metadata: metadata of the NFT to mint
+        :returns: pending transaction resolved with the receipt, id, and metadata for the mint
+        """
+
+        return self._erc721.submit_mint_to(to, metadata)
+
     def mint_batch(
         self, metadatas: List[Union[NFTMetadataInput, str]]
     ) -> List[TxResultWithId[NFTMetadataOwner]]:
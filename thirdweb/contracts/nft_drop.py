@@ -1,4 +1,4 @@
-from typing import Any, Final, List, Optional
+from typing import Any, Callable, Final, Iterable, Iterator, List, Optional
 from thirdweb.abi import DropERC721
 from thirdweb.abi.drop_erc721 import IDropAllowlistProof
 from thirdweb.constants.role import Role
@@ -14,6 +14,8 @@ from thirdweb.core.classes.erc_721_standard import ERC721Standard
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from thirdweb.types.contract import ContractType
 from thirdweb.types.nft import (
+    LazyMintProgress,
+    LazyMintSettings,
     NFTMetadata,
     NFTMetadataInput,
     NFTMetadataOwner,
@@ -102,7 +104,7 @@ class NFTDrop(ERC721Standard[DropERC721]):
         """
 
         token_ids = self.get_owned_token_ids(address)
-        return [self.get(token_id) for token_id in token_ids]
+        return self._erc721.get_batch(token_ids)
 
     def get_owned_token_ids(self, address: str = "") -> List[int]:
         """
@@ -181,7 +183,10 @@ class NFTDrop(ERC721Standard[DropERC721]):
         return self._erc721.total_unclaimed_supply()
 
     def create_batch(
-        self, metadatas: List[NFTMetadataInput]
+        self,
+        metadatas: Iterable[NFTMetadataInput],
+        settings: LazyMintSettings = LazyMintSettings(),
+        on_progress: Optional[Callable[[LazyMintProgress], None]] = None,
     ) -> List[TxResultWithId[NFTMetadata]]:
         """
         Create a batch of NFTs.
@@ -209,11 +214,44 @@ class NFTDrop(ERC721Standard[DropERC721]):
         ```
 
 
-        :param metadatas: List of NFT metadata inputs.
+        :param metadatas: List or iterator of NFT metadata inputs.
+        :param settings: Optional settings of the batch, to tune chunking and resume
+            an interrupted batch from a checkpoint.
+        :param on_progress: Optional function called with the progress of the batch.
         :return: List of tx results with ids for created NFTs.
         """
 
-        return self._erc721.create_batch(metadatas)
+        return self._erc721.create_batch(metadatas, settings, on_progress)
+
+    def create_batch_stream(
+        self,
+        metadatas: Iterable[NFTMetadataInput],
+        settings: LazyMintSettings = LazyMintSettings(),
+        on_progress: Optional[Callable[[LazyMintProgress], None]] = None,
+    ) -> Iterator[TxResultWithId[NFTMetadata]]:
+        """
+        Create a stream of NFTs in chunks, without holding them in memory.
+
+        ```python
+        from thirdweb.types.nft import LazyMintSettings, NFTMetadataInput
+
+        metadatas = (
+            NFTMetadataInput.from_json({"name": f"NFT #{i}"}) for i in range(50000)
+        )
+        settings = LazyMintSettings(checkpoint_path="lazy_mint.json")
+
+        for tx in contract.create_batch_stream(metadatas, settings, print):
+            print(tx.id)
+        ```
+
+        :param metadatas: Iterable of NFT metadata inputs, consumed lazily.
+        :param settings: Optional settings of the batch, to tune chunking and resume
+            an interrupted batch from a checkpoint.
+        :param on_progress: Optional function called with the progress of the batch.
+        :return: Iterator of tx results with ids for created NFTs.
+        """
+
+        return self._erc721.create_batch_stream(metadatas, settings, on_progress)
 
     def claim_to(
         self,
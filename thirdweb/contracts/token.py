@@ -152,7 +152,7 @@ class Token(ERC20Standard):
 
         return self._erc20.mint_to(to, amount)
 
-    def mint_batch_to(self, args: List[TokenAmount]) -> TxReceipt:
+    def mint_batch_to(self, args: List[TokenAmount]) -> List[TxReceipt]:
         """
         Mint tokens to a list of wallets.
 
@@ -168,7 +168,7 @@ class Token(ERC20Standard):
         ```
 
         :param args: list of wallet addresses and amounts to mint
-        :returns: transaction receipt of the mint
+        :returns: transaction receipt of each mint, in the same order as the args
         """
 
         return self._erc20.mint_batch_to(args)
@@ -1 +1,2 @@
 from .sdk import ThirdwebSDK
+from .async_sdk import AsyncThirdwebSDK
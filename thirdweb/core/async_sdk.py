@@ -0,0 +1,198 @@
+from typing import Dict, Optional, Type, Union, cast
+
+from eth_account import Account
+from eth_account.account import LocalAccount
+from web3 import Web3
+from web3.eth import AsyncEth
+
+from thirdweb.abi.token_erc1155 import TokenERC1155
+from thirdweb.abi.token_erc20 import TokenERC20
+from thirdweb.abi.token_erc721 import TokenERC721
+from thirdweb.common.keys import derive_client_id_from_secret_key
+from thirdweb.constants.urls import get_rpc_url_for_network
+from thirdweb.core.classes.async_batch_provider import AsyncBatchHTTPProvider
+from thirdweb.core.classes.async_contract_wrapper import AsyncContractWrapper
+from thirdweb.core.classes.async_erc_1155 import AsyncERC1155
+from thirdweb.core.classes.async_erc_20 import AsyncERC20
+from thirdweb.core.classes.async_erc_721 import AsyncERC721
+from thirdweb.core.classes.async_ipfs_storage import AsyncIpfsStorage
+from thirdweb.types.sdk import SDKOptions
+
+AsyncContract = Union[AsyncERC721, AsyncERC1155, AsyncERC20]
+
+
+class AsyncThirdwebSDK:
+    """
+    Entry point of the thirdweb SDK for asyncio code.
+
+    Requests made while other coroutines are waiting on the node are sent together
+    in JSON-RPC batches, so reads awaited with asyncio.gather share round trips.
+
+    ```python
+    import asyncio
+    from thirdweb import AsyncThirdwebSDK
+
+    async def main():
+        async with AsyncThirdwebSDK("mumbai") as sdk:
+            contract = sdk.get_nft_collection("{{contract_address}}")
+            nfts = await asyncio.gather(*[contract.get(i) for i in range(10)])
+
+    asyncio.run(main())
+    ```
+    """
+
+    __contract_cache: Dict[str, AsyncContract]
+    __provider: Web3
+    __signer: Optional[LocalAccount]
+    __options: SDKOptions
+    storage: AsyncIpfsStorage
+
+    @staticmethod
+    def from_private_key(
+        private_key: str,
+        network: str,
+        options: SDKOptions = SDKOptions(),
+    ) -> "AsyncThirdwebSDK":
+        signer = Account.from_key(private_key)
+        sdk = AsyncThirdwebSDK(network, signer, options)
+        return sdk
+
+    def __init__(
+        self,
+        network: str,
+        signer: Optional[LocalAccount] = None,
+        options: Optional[SDKOptions] = None,
+        storage: Optional[AsyncIpfsStorage] = None,
+    ):
+        """
+        Initialize the async thirdweb SDK.
+
+        :param network: name of the chain or URL of the RPC to connect to
+        :param signer: signer to use for sending transactions
+        :param options: optional SDK configuration options
+        :param storage: optional async IPFS storage instance to use for storing data
+        """
+
+        if options is None:
+            options = SDKOptions()
+
+        if storage is None:
+            storage = AsyncIpfsStorage(
+                options.secret_key, settings=options.storage_settings
+            )
+
+        client_id = (
+            derive_client_id_from_secret_key(options.secret_key)
+            if options.secret_key is not None
+            else None
+        )
+        provider = AsyncBatchHTTPProvider(
+            get_rpc_url_for_network(network, client_id),
+            options.rpc_batch_settings,
+        )
+
+        self.__provider = Web3(
+            provider,  # type: ignore
+            modules={"eth": (AsyncEth,)},
+            middlewares=[],
+        )
+        self.__signer = signer
+        self.__options = options
+        self.__contract_cache = {}
+        self.storage = storage
+
+    async def __aenter__(self) -> "AsyncThirdwebSDK":
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def get_provider(self) -> Web3:
+        """
+        Get the async web3 provider instance of the SDK.
+
+        :returns: the async web3 provider instance
+        """
+
+        return self.__provider
+
+    def get_signer(self) -> Optional[LocalAccount]:
+        """
+        Get the signer of the SDK.
+
+        :returns: the signer, if any
+        """
+
+        return self.__signer
+
+    def get_options(self) -> SDKOptions:
+        return self.__options
+
+    def get_nft_collection(self, address: str) -> AsyncERC721:
+        """
+        Returns an async NFT Collection contract SDK instance
+
+        :param address: address of the NFT Collection contract
+        :returns: async NFT Collection contract SDK instance
+        """
+
+        return cast(AsyncERC721, self._get_contract(address, AsyncERC721))
+
+    def get_edition(self, address: str) -> AsyncERC1155:
+        """
+        Returns an async Edition contract SDK instance
+
+        :param address: address of the Edition contract
+        :returns: async Edition contract SDK instance
+        """
+
+        return cast(AsyncERC1155, self._get_contract(address, AsyncERC1155))
+
+    def get_token(self, address: str) -> AsyncERC20:
+        """
+        Returns an async Token contract SDK instance
+
+        :param address: address of the Token contract
+        :returns: async Token contract SDK instance
+        """
+
+        return cast(AsyncERC20, self._get_contract(address, AsyncERC20))
+
+    async def close(self):
+        """
+        Close the connections to the node and to the IPFS storage.
+        """
+
+        await cast(AsyncBatchHTTPProvider, self.__provider.provider).close()
+        await self.storage.close()
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _get_contract(
+        self, address: str, contract_type: Type[AsyncContract]
+    ) -> AsyncContract:
+        key = f"{contract_type.__name__}:{address.lower()}"
+        if key in self.__contract_cache:
+            return self.__contract_cache[key]
+
+        contract: AsyncContract
+        if contract_type == AsyncERC721:
+            contract = AsyncERC721(
+                self._get_contract_wrapper(TokenERC721, address), self.storage
+            )
+        elif contract_type == AsyncERC1155:
+            contract = AsyncERC1155(
+                self._get_contract_wrapper(TokenERC1155, address), self.storage
+            )
+        else:
+            contract = AsyncERC20(self._get_contract_wrapper(TokenERC20, address))
+
+        self.__contract_cache[key] = contract
+        return contract
+
+    def _get_contract_wrapper(self, abi_type: Type, address: str) -> AsyncContractWrapper:
+        return AsyncContractWrapper(
+            abi_type, address, self.__provider, self.__signer, self.__options
+        )
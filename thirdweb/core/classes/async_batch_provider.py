@@ -0,0 +1,204 @@
+import asyncio
+import itertools
+import json
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from aiohttp import ClientResponseError, ClientSession, ClientTimeout, TCPConnector
+from web3.providers.async_rpc import AsyncHTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from thirdweb.core.classes.batch_provider import (
+    BatchFailure,
+    get_batch_failure,
+    get_coalescing_key,
+)
+from thirdweb.types.sdk import RpcBatchSettings
+
+# A queued request: its method, params, coalescing key and the future of its response
+_Request = Tuple[str, Any, Optional[str], "asyncio.Future[RPCResponse]"]
+
+
+class AsyncBatchHTTPProvider(AsyncHTTPProvider):
+    """
+    Async HTTP provider sending the requests made in the same iteration of the event
+    loop as a single JSON-RPC batch, over a pool of kept-alive connections.
+
+    Reads awaited together with asyncio.gather therefore share a round trip, and
+    identical reads in flight at the same time are only sent once.
+    """
+
+    _settings: RpcBatchSettings
+    _queue: List[_Request]
+    _in_flight: Dict[str, "asyncio.Future[RPCResponse]"]
+    _flush_scheduled: bool
+    _tasks: Set["asyncio.Task[None]"]
+    _supports_batch: bool
+    _ids: "itertools.count[int]"
+    _session: Optional[ClientSession]
+    _pool_size: int
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        settings: RpcBatchSettings = RpcBatchSettings(),
+        request_kwargs: Optional[Any] = None,
+        pool_size: int = 100,
+    ):
+        """
+        Initialize the provider.
+
+        :param endpoint_uri: URL of the JSON-RPC endpoint
+        :param settings: settings of the request batching
+        :param request_kwargs: optional keyword arguments passed to aiohttp
+        :param pool_size: maximum number of connections kept open to the endpoint
+        """
+
+        super().__init__(endpoint_uri, request_kwargs)
+        self._settings = settings
+        self._queue = []
+        self._in_flight = {}
+        self._flush_scheduled = False
+        self._tasks = set()
+        self._supports_batch = True
+        self._ids = itertools.count()
+        self._session = None
+        self._pool_size = pool_size
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        key = get_coalescing_key(method, params)
+        if key is not None and key in self._in_flight:
+            return await asyncio.shield(self._in_flight[key])
+
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[RPCResponse]" = loop.create_future()
+        if key is not None:
+            self._in_flight[key] = future
+        self._queue.append((method, params, key, future))
+
+        # Requests queued until the loop gets back to the flush are sent together
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            if self._settings.window > 0:
+                loop.call_later(self._settings.window, self._flush)
+            else:
+                loop.call_soon(self._flush)
+
+        return await asyncio.shield(future)
+
+    async def close(self):
+        """
+        Close the connections of the provider.
+        """
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _flush(self):
+        self._flush_scheduled = False
+        queue, self._queue = self._queue, []
+
+        size = max(self._settings.max_batch_size, 1)
+        for i in range(0, len(queue), size):
+            # The loop only keeps weak references to tasks, so they are held until done
+            task = asyncio.ensure_future(self._send_batch(queue[i : i + size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send_batch(self, batch: List[_Request]):
+        try:
+            responses = await self._send(
+                [(method, params) for method, params, _, _ in batch]
+            )
+        except Exception as e:
+            responses = [e] * len(batch)
+
+        for (_, _, key, future), response in zip(batch, responses):
+            if key is not None:
+                self._in_flight.pop(key, None)
+            if future.done():
+                continue
+            if isinstance(response, Exception):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
+
+    async def _send(self, calls: List[Tuple[str, Any]], attempt: int = 0) -> List[Any]:
+        if len(calls) == 1 or not self._supports_batch:
+            return await asyncio.gather(
+                *[
+                    self._post(
+                        {
+                            "jsonrpc": "2.0",
+                            "method": method,
+                            "params": params,
+                            "id": next(self._ids),
+                        }
+                    )
+                    for method, params in calls
+                ],
+                return_exceptions=True,
+            )
+
+        ids = [next(self._ids) for _ in calls]
+        payload = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": id}
+            for id, (method, params) in zip(ids, calls)
+        ]
+        error: Optional[Exception] = None
+        try:
+            responses = await self._post(payload)
+            failure = get_batch_failure(response=responses)
+        except ClientResponseError as e:
+            failure = get_batch_failure(status_code=e.status)
+            if failure is None:
+                raise
+            responses, error = None, e
+        except ValueError:
+            responses, failure = None, BatchFailure.UNSUPPORTED
+
+        if failure == BatchFailure.UNSUPPORTED:
+            self._supports_batch = False
+            return await self._send(calls)
+        if failure == BatchFailure.TOO_LARGE:
+            half = len(calls) // 2
+            return await self._send(calls[:half]) + await self._send(calls[half:])
+        if failure == BatchFailure.TRANSIENT:
+            if attempt >= self._settings.max_retries:
+                if error is not None:
+                    raise error
+                return [responses] * len(calls)
+            await asyncio.sleep(self._settings.retry_backoff * 2**attempt)
+            return await self._send(calls, attempt + 1)
+
+        by_id: Dict[int, RPCResponse] = {
+            response.get("id"): response for response in responses
+        }
+        return [
+            by_id.get(id, {"error": {"code": -32603, "message": "Missing batch response"}})  # type: ignore
+            for id in ids
+        ]
+
+    async def _post(self, payload: Any) -> Any:
+        if self.endpoint_uri is None:
+            raise ValueError("The provider has no endpoint to send requests to")
+
+        kwargs = dict(self.get_request_kwargs())
+        kwargs.setdefault("timeout", ClientTimeout(10))
+
+        async with self._get_session().post(
+            str(self.endpoint_uri), data=json.dumps(payload).encode("utf-8"), **kwargs
+        ) as response:
+            response.raise_for_status()
+            return json.loads(await response.read())
+
+    def _get_session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                connector=TCPConnector(limit=max(self._pool_size, 1))
+            )
+        return self._session
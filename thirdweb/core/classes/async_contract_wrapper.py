@@ -0,0 +1,488 @@
+import asyncio
+import time
+from dataclasses import astuple
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, cast
+
+from eth_account.account import LocalAccount
+from eth_typing import Address
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.contract import Contract, ContractFunction
+from web3.datastructures import AttributeDict
+from web3.logs import DISCARD
+from web3.types import BlockIdentifier, TxReceipt
+from zero_ex.contract_wrappers.tx_params import TxParams
+
+from thirdweb.common.error import NoSignerException
+from thirdweb.core.classes.contract_wrapper import MAX_NONCE_RETRIES
+from thirdweb.core.classes.fee_oracle import (
+    SPEED_PERCENTILES,
+    get_eip1559_fees,
+    get_priority_fee_from_history,
+)
+from thirdweb.core.classes.multicall import decode_function_result
+from thirdweb.core.classes.nonce_manager import is_nonce_error
+from thirdweb.types.contract import TContractABI
+from thirdweb.types.sdk import GasSettings, SDKOptions
+
+
+class AsyncNonceManager:
+    """
+    Hands out transaction nonces for a single signer from a local counter, so that
+    transactions sent concurrently from the same event loop never reuse a nonce.
+    """
+
+    _provider: Web3
+    _address: str
+    _next_nonce: Optional[int]
+    _lock: Optional[asyncio.Lock]
+
+    def __init__(self, provider: Web3, address: str):
+        """
+        Initialize the nonce manager.
+
+        :param provider: async web3 provider instance to read the chain nonce from
+        :param address: address of the signer to manage nonces for
+        """
+
+        self._provider = provider
+        self._address = address
+        self._next_nonce = None
+        self._lock = None
+
+    async def next_nonce(self) -> int:
+        """
+        Allocate the next nonce for the signer, syncing with the chain if needed.
+
+        :returns: the nonce to use for the next transaction
+        """
+
+        # The lock is created lazily, as it belongs to the loop it is first used in
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = await self._provider.eth.get_transaction_count(  # type: ignore
+                    cast(Address, self._address), "pending"
+                )
+
+            nonce = cast(int, self._next_nonce)
+            self._next_nonce = nonce + 1
+            return nonce
+
+    def release(self, nonce: int):
+        """
+        Return a nonce that was allocated but never reached the chain.
+
+        :param nonce: the nonce that was not used
+        """
+
+        if self._next_nonce is not None and nonce == self._next_nonce - 1:
+            self._next_nonce = nonce
+        else:
+            # Later nonces are already in flight, so there is a gap the
+            # chain needs to tell us about
+            self._next_nonce = None
+
+    def resync(self):
+        """
+        Read the nonce from the chain again for the next transaction.
+        """
+
+        self._next_nonce = None
+
+
+def _get_provider_registry(provider: Web3, name: str) -> Dict[Any, Any]:
+    # Kept on the transport of the provider rather than in the module, so that the
+    # state of an SDK is freed along with its connections
+    registry = getattr(provider.provider, name, None)
+    if registry is None:
+        registry = {}
+        setattr(provider.provider, name, registry)
+    return registry
+
+
+def get_async_nonce_manager(provider: Web3, address: str) -> AsyncNonceManager:
+    """
+    Get the nonce manager of a signer on the given async provider.
+
+    :param provider: async web3 provider instance the transactions are sent through
+    :param address: address of the signer
+    :returns: the nonce manager shared by every contract of the provider
+    """
+
+    nonce_managers: Dict[str, AsyncNonceManager] = _get_provider_registry(
+        provider, "_thirdweb_nonce_managers"
+    )
+    key = address.lower()
+    if key not in nonce_managers:
+        nonce_managers[key] = AsyncNonceManager(provider, address)
+    return nonce_managers[key]
+
+
+class AsyncFeeOracle:
+    """
+    Async counterpart of the FeeOracle. The fees read with eth_feeHistory are cached for
+    the block they were read at, and for at most the fee cache seconds of the gas
+    settings, so that transactions sent back to back do not each look them up.
+    """
+
+    _provider: Web3
+    _settings: GasSettings
+    _fees: Optional[Dict[str, int]]
+    _block: int
+    _latest_block: int
+    _fetched_at: float
+    _supports_eip1559: Optional[bool]
+    _lock: Optional[asyncio.Lock]
+
+    def __init__(self, provider: Web3, settings: GasSettings = GasSettings()):
+        """
+        Initialize the fee oracle.
+
+        :param provider: async web3 provider instance to read fees from
+        :param settings: gas settings with the speed and maximum price to use
+        """
+
+        self._provider = provider
+        self._settings = settings
+        self._fees = None
+        self._block = -1
+        self._latest_block = -1
+        self._fetched_at = 0
+        self._supports_eip1559 = None
+        self._lock = None
+
+    async def get_tx_params(self) -> Dict[str, int]:
+        """
+        Get the fee fields of a transaction to send.
+
+        :returns: maxFeePerGas and maxPriorityFeePerGas, or gasPrice on chains
+            without EIP-1559
+        """
+
+        # The lock is created lazily, as it belongs to the loop it is first used in
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if (
+                self._fees is None
+                or time.monotonic() - self._fetched_at > self._settings.fee_cache_seconds
+            ):
+                self._fees = await self._fetch_fees()
+                self._fetched_at = time.monotonic()
+
+            return dict(self._fees)
+
+    def observe_block(self, block_number: int):
+        """
+        Drop the cached fees once a newer block than the one they were read at is seen,
+        for instance in the receipt of a mined transaction.
+
+        :param block_number: number of a block known to be mined
+        """
+
+        self._latest_block = max(self._latest_block, block_number)
+        if block_number > self._block:
+            self._fees = None
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    async def _fetch_fees(self) -> Dict[str, int]:
+        settings = self._settings
+
+        if self._supports_eip1559 is not False:
+            try:
+                history = await self._provider.eth.fee_history(  # type: ignore
+                    settings.fee_history_blocks,
+                    "latest",
+                    [SPEED_PERCENTILES[settings.speed]],
+                )
+            except Exception:
+                history = None
+
+            base_fees = history["baseFeePerGas"] if history is not None else []
+            self._supports_eip1559 = len(base_fees) > 0 and base_fees[-1] > 0
+
+            if self._supports_eip1559:
+                self._block = history["oldestBlock"] + len(base_fees) - 2  # type: ignore
+
+                priority_fee = get_priority_fee_from_history(history)
+                if priority_fee is None:
+                    priority_fee = await self._provider.eth.max_priority_fee  # type: ignore
+                fees = get_eip1559_fees(base_fees[-1], cast(int, priority_fee), settings)
+                return {
+                    "maxFeePerGas": cast(int, fees.max_fee_per_gas),
+                    "maxPriorityFeePerGas": cast(int, fees.max_priority_fee_per_gas),
+                }
+
+        # The block of the gas price is not known, so it lasts until a newer block is seen
+        self._block = self._latest_block
+        gas_price = await self._provider.eth.gas_price  # type: ignore
+        return {
+            "gasPrice": min(gas_price, Web3.toWei(settings.max_price_in_gwei, "gwei"))
+        }
+
+
+def get_async_fee_oracle(
+    provider: Web3, settings: GasSettings = GasSettings()
+) -> AsyncFeeOracle:
+    """
+    Get the fee oracle of the given async provider and gas settings.
+
+    :param provider: async web3 provider instance the transactions are sent through
+    :param settings: gas settings the fees are priced with
+    :returns: the fee oracle shared by every contract of the provider using the settings
+    """
+
+    fee_oracles: Dict[Tuple[Any, ...], AsyncFeeOracle] = _get_provider_registry(
+        provider, "_thirdweb_fee_oracles"
+    )
+    key = astuple(settings)
+    if key not in fee_oracles:
+        fee_oracles[key] = AsyncFeeOracle(provider, settings)
+    return fee_oracles[key]
+
+
+class AsyncContractWrapper(Generic[TContractABI]):
+    """
+    Async counterpart of the ContractWrapper. The generated ABI bindings of the contract
+    encode calls and decode their results, while every request is awaited through an
+    async provider, so reads awaited together with asyncio.gather share JSON-RPC batches.
+    """
+
+    _contract_abi: TContractABI
+    _interface: Contract
+    _provider: Web3
+    _signer: Optional[LocalAccount]
+    _options: SDKOptions
+    _chain_id: Optional[int]
+
+    def __init__(
+        self,
+        abi_type: Type[TContractABI],
+        address: str,
+        provider: Web3,
+        signer: Optional[LocalAccount] = None,
+        options: SDKOptions = SDKOptions(),
+    ):
+        """
+        Initialize the contract wrapper.
+
+        :param abi_type: generated ABI binding class of the contract
+        :param address: address of the contract
+        :param provider: async web3 provider instance to use
+        :param signer: optional account to use for signing transactions
+        :param options: optional SDKOptions instance with the gas and transaction settings
+        """
+
+        # Bindings only encode and decode, so they are built without a connection
+        encoder = Web3()
+        self._contract_abi = abi_type(encoder, address)  # type: ignore
+        self._interface = encoder.eth.contract(
+            address=cast(Address, Web3.toChecksumAddress(address)),
+            abi=abi_type.abi(),  # type: ignore
+        )
+        self._provider = provider
+        self._signer = signer
+        self._options = options
+        self._chain_id = None
+
+    def get_address(self) -> str:
+        return self._interface.address
+
+    def get_provider(self) -> Web3:
+        return self._provider
+
+    def get_signer(self) -> Optional[LocalAccount]:
+        return self._signer
+
+    def get_options(self) -> SDKOptions:
+        return self._options
+
+    def get_signer_address(self) -> str:
+        """
+        Get the address of the active signer
+
+        :returns: address of the active signer
+        """
+
+        if self._signer is None:
+            raise NoSignerException
+
+        return self._signer.address
+
+    async def get_chain_id(self) -> int:
+        """
+        Get the chain ID of the active provider
+
+        :returns: chain ID of the active provider
+        """
+
+        if self._chain_id is None:
+            self._chain_id = await self._provider.eth.chain_id  # type: ignore
+        return cast(int, self._chain_id)
+
+    async def read(
+        self, fn: str, *args: Any, block_identifier: BlockIdentifier = "latest"
+    ) -> Any:
+        """
+        Call a read-only function of the contract.
+
+        :param fn: name of the function in the ABI bindings, such as owner_of
+        :param args: arguments to pass to the function
+        :param block_identifier: block to read the state at, defaults to the latest block
+        :returns: the decoded return value of the function
+        """
+
+        function = self._get_function(fn, args)
+        tx: Dict[str, Any] = {
+            "to": self.get_address(),
+            "data": function._encode_transaction_data(),
+        }
+        if self._signer is not None:
+            tx["from"] = self._signer.address
+
+        return_data = await self._provider.eth.call(tx, block_identifier)  # type: ignore
+        return decode_function_result(function, return_data)
+
+    async def read_many(
+        self,
+        calls: Sequence[Tuple[str, List[Any]]],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> List[Any]:
+        """
+        Call many read-only functions of the contract concurrently, in a single batch.
+
+        :param calls: list of (function name, arguments) pairs to call on the contract
+        :param block_identifier: block to read the state at, defaults to the latest block
+        :returns: list of decoded return values in the same order as the calls
+        """
+
+        return await asyncio.gather(
+            *[
+                self.read(fn, *args, block_identifier=block_identifier)
+                for fn, args in calls
+            ]
+        )
+
+    async def send_transaction(
+        self, fn: str, args: List[Any], overrides: Optional[TxParams] = None
+    ) -> TxReceipt:
+        """
+        Send and execute a transaction and return the receipt.
+
+        :param fn: name of the function in the ABI bindings, such as transfer_from
+        :param args: list of arguments to pass to the function
+        :param overrides: optional transaction parameters overriding the defaults
+        :returns: the receipt of the transaction once mined
+        """
+
+        signer = self._signer
+        if signer is None:
+            raise NoSignerException
+
+        overrides = overrides if overrides is not None else TxParams()
+        function = self._get_function(fn, args)
+        tx: Dict[str, Any] = {
+            "from": signer.address,
+            "to": self.get_address(),
+            "data": function._encode_transaction_data(),
+            "value": overrides.value if overrides.value is not None else 0,
+        }
+
+        # The chain, the fees and the gas are independent, so they share a batch
+        chain_id, fees, gas = await asyncio.gather(
+            self.get_chain_id(),
+            self._get_fees(overrides),
+            self._get_gas(tx, overrides),
+        )
+        tx.update(fees)
+        tx["chainId"] = chain_id
+        tx["gas"] = gas
+
+        # The nonce is taken last so that a call failing to estimate never burns one
+        if overrides.nonce is not None:
+            tx["nonce"] = overrides.nonce
+            try:
+                tx_hash = await self._provider.eth.send_raw_transaction(  # type: ignore
+                    signer.sign_transaction(tx).rawTransaction
+                )
+            except Exception as e:
+                if is_nonce_error(e):
+                    get_async_nonce_manager(self._provider, signer.address).resync()
+                raise e
+        else:
+            tx_hash = await self._submit_transaction(signer, tx)
+
+        settings = self._options.transaction_settings
+        receipt = await self._provider.eth.wait_for_transaction_receipt(  # type: ignore
+            tx_hash,
+            timeout=settings.receipt_timeout,
+            poll_latency=settings.receipt_poll_interval,
+        )
+        get_async_fee_oracle(self._provider, self._options.gas_settings).observe_block(
+            receipt["blockNumber"]
+        )
+
+        return receipt
+
+    def get_events(self, event: str, receipt: TxReceipt) -> Tuple[AttributeDict]:
+        """
+        Get the events from a transaction receipt.
+
+        :param event: name of the event to get
+        :param receipt: transaction receipt to get the events from
+        """
+
+        return self._interface.events[event]().processReceipt(receipt, errors=DISCARD)
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _get_function(self, fn: str, args: Sequence[Any]) -> ContractFunction:
+        return getattr(self._contract_abi, fn)._underlying_method(*args)
+
+    async def _submit_transaction(
+        self, signer: LocalAccount, tx: Dict[str, Any]
+    ) -> HexBytes:
+        nonce_manager = get_async_nonce_manager(self._provider, signer.address)
+
+        for attempt in range(MAX_NONCE_RETRIES + 1):
+            nonce = await nonce_manager.next_nonce()
+            tx["nonce"] = nonce
+
+            try:
+                signed = signer.sign_transaction(tx)
+                return await self._provider.eth.send_raw_transaction(  # type: ignore
+                    signed.rawTransaction
+                )
+            except Exception as e:
+                if is_nonce_error(e) and attempt < MAX_NONCE_RETRIES:
+                    nonce_manager.resync()
+                    continue
+
+                if is_nonce_error(e):
+                    nonce_manager.resync()
+                else:
+                    nonce_manager.release(nonce)
+                raise e
+
+        raise Exception("Failed to send transaction")
+
+    async def _get_fees(self, overrides: TxParams) -> Dict[str, int]:
+        if overrides.gas_price is not None:
+            return {"gasPrice": overrides.gas_price}
+
+        oracle = get_async_fee_oracle(self._provider, self._options.gas_settings)
+        return await oracle.get_tx_params()
+
+    async def _get_gas(self, tx: Dict[str, Any], overrides: TxParams) -> int:
+        if overrides.gas is not None:
+            return overrides.gas
+        return await self._provider.eth.estimate_gas(tx)  # type: ignore
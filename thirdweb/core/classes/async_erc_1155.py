@@ -0,0 +1,257 @@
+import asyncio
+from typing import List, Union
+
+from web3.eth import TxReceipt
+
+from thirdweb.abi.token_erc1155 import TokenERC1155
+from thirdweb.common.error import NotFoundException
+from thirdweb.common.nft import build_token_metadata
+from thirdweb.core.classes.async_contract_wrapper import AsyncContractWrapper
+from thirdweb.core.classes.async_ipfs_storage import AsyncIpfsStorage
+from thirdweb.types.nft import EditionMetadata, NFTMetadata, QueryAllParams
+
+
+class AsyncERC1155:
+    """
+    Read and transfer the NFTs of an ERC1155 contract from asyncio code.
+
+    ```python
+    from thirdweb import AsyncThirdwebSDK
+
+    async with AsyncThirdwebSDK("mumbai") as sdk:
+        contract = sdk.get_edition("{{contract_address}}")
+        nfts = await contract.get_all()
+    ```
+    """
+
+    _contract_wrapper: AsyncContractWrapper[TokenERC1155]
+    _storage: AsyncIpfsStorage
+
+    def __init__(
+        self,
+        contract_wrapper: AsyncContractWrapper[TokenERC1155],
+        storage: AsyncIpfsStorage,
+    ):
+        self._contract_wrapper = contract_wrapper
+        self._storage = storage
+
+    def get_address(self) -> str:
+        return self._contract_wrapper.get_address()
+
+    """
+    READ FUNCTIONS
+    """
+
+    async def get(self, token_id: int) -> EditionMetadata:
+        """
+        Get metadata for a token
+
+        ```python
+        nft = await contract.get(0)
+        print(nft)
+        ```
+
+        :extension: ERC1155
+        :param token_id: token ID of the token to get the metadata for
+        :return: the metadata for the token and its supply
+        """
+
+        supply, metadata = await asyncio.gather(
+            self._get_supply(token_id), self._get_token_metadata(token_id)
+        )
+        return EditionMetadata(metadata, supply)
+
+    async def get_all(
+        self, query_params: QueryAllParams = QueryAllParams()
+    ) -> List[EditionMetadata]:
+        """
+        Get the metadata for all tokens
+
+        ```python
+        nfts = await contract.get_all()
+        print(nfts)
+        ```
+
+        :extension: ERC1155Enumerable
+        :param query_params: optionally define a QueryAllParams instance to narrow the metadata query to specific tokens
+        :return: the metadata for all tokens
+        """
+
+        max_id = min(
+            query_params.start + query_params.count, await self.get_total_count()
+        )
+        token_ids = list(range(query_params.start, max_id))
+
+        # Supplies and URIs of every token are read in the same batch
+        supplies, token_uris = await asyncio.gather(
+            asyncio.gather(*[self._get_supply(id) for id in token_ids]),
+            asyncio.gather(*[self._get_token_uri(id) for id in token_ids]),
+        )
+
+        for token_id, token_uri in zip(token_ids, token_uris):
+            if not token_uri:
+                raise NotFoundException(str(token_id))
+
+        metadatas = await self._storage.get_batch(token_uris)
+
+        return [
+            EditionMetadata(build_token_metadata(token_id, token_uri, metadata), supply)
+            for token_id, token_uri, metadata, supply in zip(
+                token_ids, token_uris, metadatas, supplies
+            )
+        ]
+
+    async def get_total_count(self) -> int:
+        """
+        Get the total number of NFTs
+
+        ```python
+        total_count = await contract.get_total_count()
+        print(total_count)
+        ```
+
+        :extension: ERC1155Enumerable
+        :return: the total number of NFTs on the contract
+        """
+
+        return await self._contract_wrapper.read("next_token_id_to_mint")
+
+    async def total_supply(self, token_id: int) -> int:
+        """
+        Get the total number of tokens on the contract
+
+        ```python
+        total_supply = await contract.total_supply(0)
+        print(total_supply)
+        ```
+
+        :extension: ERC1155
+        :param token_id: the token ID to get the total supply of
+        :return: the total number of tokens on the contract
+        """
+
+        return await self._contract_wrapper.read("total_supply", token_id)
+
+    async def balance(self, token_id: int) -> int:
+        """
+        Get the connected wallets balance of a specific token
+
+        ```python
+        balance = await contract.balance(0)
+        print(balance)
+        ```
+
+        :extension: ERC1155
+        :param token_id: the token ID to get the balance of
+        :return: the balance of the token
+        """
+
+        return await self.balance_of(
+            self._contract_wrapper.get_signer_address(), token_id
+        )
+
+    async def balance_of(self, address: str, token_id: int) -> int:
+        """
+        Get a specific wallets balance of a specific token
+
+        ```python
+        balance = await contract.balance_of("{{wallet_address}}", 0)
+        print(balance)
+        ```
+
+        :extension: ERC1155
+        :param address: the address to get the balance of
+        :param token_id: the token ID to get the balance of
+        :return: the balance of the token
+        """
+
+        return await self._contract_wrapper.read("balance_of", address, token_id)
+
+    async def is_approved(self, address: str, operator: str) -> bool:
+        """
+        Check if an operator address is approved to manage a target addresses assets
+
+        ```python
+        is_approved = await contract.is_approved("{{wallet_address}}", "0x...")
+        print(is_approved)
+        ```
+
+        :extension: ERC1155
+        :param address: the address whose assets are to be checked
+        :param operator: the address of the operator to check
+        :return: True if the operator is approved for all operations of the assets, False otherwise
+        """
+
+        return await self._contract_wrapper.read(
+            "is_approved_for_all", address, operator
+        )
+
+    """
+    WRITE FUNCTIONS
+    """
+
+    async def transfer(
+        self, to: str, token_id: int, amount: int, data: Union[bytes, str] = b"0"
+    ) -> TxReceipt:
+        """
+        Transfer NFTs
+
+        ```python
+        receipt = await contract.transfer("{{wallet_address}}", 0, 1)
+        ```
+
+        :extension: ERC1155
+        :param to: wallet address to transfer the tokens to
+        :param token_id: the specific token ID to transfer
+        :param amount: the amount of tokens to transfer
+        :returns: transaction receipt of the transfer
+        """
+
+        fr = self._contract_wrapper.get_signer_address()
+        return await self._contract_wrapper.send_transaction(
+            "safe_transfer_from",
+            [fr, to, token_id, amount, data],
+        )
+
+    async def set_approval_for_all(self, operator: str, approved: bool) -> TxReceipt:
+        """
+        Set the approval for all tokens of the connected wallet for an operator
+
+        ```python
+        receipt = await contract.set_approval_for_all("{{wallet_address}}", True)
+        ```
+
+        :extension: ERC1155
+        :param operator: operator address to set the approval for
+        :param approved: True if the operator is approved, False otherwise
+        :returns: transaction receipt of the approval
+        """
+
+        return await self._contract_wrapper.send_transaction(
+            "set_approval_for_all", [operator, approved]
+        )
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    async def _get_supply(self, token_id: int) -> int:
+        try:
+            return await self.total_supply(token_id)
+        except Exception:
+            return 0
+
+    async def _get_token_uri(self, token_id: int) -> str:
+        try:
+            return await self._contract_wrapper.read("uri", token_id)
+        except Exception:
+            return ""
+
+    async def _get_token_metadata(self, token_id: int) -> NFTMetadata:
+        token_uri = await self._get_token_uri(token_id)
+
+        if not token_uri:
+            raise NotFoundException(str(token_id))
+
+        metadata = await self._storage.get(token_uri)
+        return build_token_metadata(token_id, token_uri, metadata)
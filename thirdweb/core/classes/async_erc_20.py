@@ -0,0 +1,189 @@
+import asyncio
+from typing import Awaitable, Optional
+
+from web3.eth import TxReceipt
+
+from thirdweb.abi.token_erc20 import TokenERC20
+from thirdweb.common.currency import format_units, parse_units
+from thirdweb.core.classes.async_contract_wrapper import AsyncContractWrapper
+from thirdweb.types.currency import Currency, CurrencyValue, Price, PriceWei
+
+
+class AsyncERC20:
+    """
+    Read and transfer the tokens of an ERC20 contract from asyncio code.
+
+    ```python
+    from thirdweb import AsyncThirdwebSDK
+
+    async with AsyncThirdwebSDK("mumbai") as sdk:
+        contract = sdk.get_token("{{contract_address}}")
+        balance = await contract.balance_of("{{wallet_address}}")
+    ```
+    """
+
+    _contract_wrapper: AsyncContractWrapper[TokenERC20]
+    _currency: Optional[Currency]
+
+    def __init__(self, contract_wrapper: AsyncContractWrapper[TokenERC20]):
+        self._contract_wrapper = contract_wrapper
+        self._currency = None
+
+    def get_address(self) -> str:
+        return self._contract_wrapper.get_address()
+
+    """
+    READ FUNCTIONS
+    """
+
+    async def get(self) -> Currency:
+        """
+        Get the token metadata
+
+        ```python
+        token = await contract.get()
+        print(token)
+        ```
+
+        :extension: ERC20
+        :returns: token metadata
+        """
+
+        # The name, symbol and decimals of a token never change, so they are read once
+        if self._currency is None:
+            name, symbol, decimals = await asyncio.gather(
+                self._contract_wrapper.read("name"),
+                self._contract_wrapper.read("symbol"),
+                self._contract_wrapper.read("decimals"),
+            )
+            self._currency = Currency(name, symbol, decimals)
+
+        return self._currency
+
+    async def balance(self) -> CurrencyValue:
+        """
+        Get the token balance of the connected wallet
+
+        ```python
+        balance = await contract.balance()
+        print(balance)
+        ```
+
+        :extension: ERC20
+        :returns: balance of the connected wallet
+        """
+
+        return await self.balance_of(self._contract_wrapper.get_signer_address())
+
+    async def balance_of(self, address: str) -> CurrencyValue:
+        """
+        Get the balance of a specific wallet
+
+        ```python
+        balance = await contract.balance_of("{{wallet_address}}")
+        print(balance)
+        ```
+
+        :extension: ERC20
+        :param address: address of the wallet to get the balance of
+        :returns: balance of the specified wallet
+        """
+
+        return await self._get_value(
+            self._contract_wrapper.read("balance_of", address)
+        )
+
+    async def total_supply(self) -> CurrencyValue:
+        """
+        Get the total minted supply of the token
+
+        ```python
+        supply = await contract.total_supply()
+        print(supply)
+        ```
+
+        :extension: ERC20
+        :returns: total minted supply of the token
+        """
+
+        return await self._get_value(self._contract_wrapper.read("total_supply"))
+
+    async def allowance_of(self, owner: str, spender: str) -> CurrencyValue:
+        """
+        Get the allowance of one wallet over anothers funds
+
+        ```python
+        allowance = await contract.allowance_of("{{wallet_address}}", "0x...")
+        print(allowance)
+        ```
+
+        :extension: ERC20
+        :param owner: wallet address whose assets will be spent
+        :param spender: wallet address to check the allowance of
+        :returns: allowance of one wallet over anothers funds
+        """
+
+        return await self._get_value(
+            self._contract_wrapper.read("allowance", owner, spender)
+        )
+
+    """
+    WRITE FUNCTIONS
+    """
+
+    async def transfer(self, to: str, amount: Price) -> TxReceipt:
+        """
+        Transfer tokens
+
+        ```python
+        receipt = await contract.transfer("{{wallet_address}}", 0.1)
+        ```
+
+        :extension: ERC20
+        :param to: wallet address to transfer the tokens to
+        :param amount: amount of tokens to transfer
+        :returns: transaction receipt of the transfer
+        """
+
+        amount_with_decimals = await self.normalize_amount(amount)
+        return await self._contract_wrapper.send_transaction(
+            "transfer", [to, amount_with_decimals]
+        )
+
+    async def set_allowance(self, spender: str, amount: Price) -> TxReceipt:
+        """
+        Sets the allowance of a wallet to spend the connected wallets funds
+
+        ```python
+        receipt = await contract.set_allowance("0x...", 100)
+        ```
+
+        :extension: ERC20
+        :param spender: wallet address to set the allowance of
+        :param amount: amount of tokens to allow the wallet to spend
+        :returns: transaction receipt of the allowance set
+        """
+
+        amount_with_decimals = await self.normalize_amount(amount)
+        return await self._contract_wrapper.send_transaction(
+            "approve", [spender, amount_with_decimals]
+        )
+
+    async def normalize_amount(self, amount: Price) -> PriceWei:
+        decimals = (await self.get()).decimals
+        return parse_units(amount, decimals)
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    async def _get_value(self, read: Awaitable[PriceWei]) -> CurrencyValue:
+        # The value is read in the same batch as the token metadata, if not known yet
+        currency, value = await asyncio.gather(self.get(), read)
+        return CurrencyValue(
+            currency.name,
+            currency.symbol,
+            currency.decimals,
+            value,
+            format_units(value, currency.decimals),
+        )
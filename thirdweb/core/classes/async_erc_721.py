@@ -0,0 +1,259 @@
+import asyncio
+from typing import List, Optional
+
+from web3.eth import TxReceipt
+
+from thirdweb.abi.token_erc721 import TokenERC721
+from thirdweb.common.error import NotFoundException
+from thirdweb.common.nft import build_token_metadata
+from thirdweb.constants.currency import ZERO_ADDRESS
+from thirdweb.core.classes.async_contract_wrapper import AsyncContractWrapper
+from thirdweb.core.classes.async_ipfs_storage import AsyncIpfsStorage
+from thirdweb.types.nft import NFTMetadata, NFTMetadataOwner, QueryAllParams
+
+
+class AsyncERC721:
+    """
+    Read and transfer the NFTs of an ERC721 contract from asyncio code.
+
+    ```python
+    from thirdweb import AsyncThirdwebSDK
+
+    async with AsyncThirdwebSDK("mumbai") as sdk:
+        contract = sdk.get_nft_collection("{{contract_address}}")
+        nfts = await contract.get_all()
+    ```
+    """
+
+    _contract_wrapper: AsyncContractWrapper[TokenERC721]
+    _storage: AsyncIpfsStorage
+
+    def __init__(
+        self,
+        contract_wrapper: AsyncContractWrapper[TokenERC721],
+        storage: AsyncIpfsStorage,
+    ):
+        self._contract_wrapper = contract_wrapper
+        self._storage = storage
+
+    def get_address(self) -> str:
+        return self._contract_wrapper.get_address()
+
+    """
+    READ FUNCTIONS
+    """
+
+    async def get(self, token_id: int) -> NFTMetadataOwner:
+        """
+        Get a single NFT
+
+        ```python
+        nft = await contract.get(0)
+        print(nft)
+        ```
+
+        :extension: ERC721
+        :param token_id: token ID of the token to get the metadata for
+        :return: the metadata for the token and its owner
+        """
+
+        owner, metadata = await asyncio.gather(
+            self._get_owner(token_id), self._get_token_metadata(token_id)
+        )
+        return NFTMetadataOwner(metadata, owner)
+
+    async def get_all(
+        self, query_params: QueryAllParams = QueryAllParams()
+    ) -> List[NFTMetadataOwner]:
+        """
+        Get all NFTs
+
+        ```python
+        nfts = await contract.get_all()
+        print(nfts)
+        ```
+
+        :extension: ERC721Supply | ERC721Enumerable
+        :param query_params: optionally define a QueryAllParams instance to narrow the metadata query to specific tokens
+        :return: the metadata of all tokens in the contract
+        """
+
+        max_id = min(
+            query_params.start + query_params.count, await self.get_total_count()
+        )
+        token_ids = list(range(query_params.start, max_id))
+
+        # Owners and URIs of every token are read in the same batch
+        owners, token_uris = await asyncio.gather(
+            asyncio.gather(*[self._get_owner(id) for id in token_ids]),
+            asyncio.gather(
+                *[self._get_token_uri(id) for id in token_ids], return_exceptions=True
+            ),
+        )
+
+        found = [
+            (token_id, owner, token_uri)
+            for token_id, owner, token_uri in zip(token_ids, owners, token_uris)
+            if isinstance(token_uri, str) and token_uri
+        ]
+        metadatas = await self._storage.get_batch(
+            [token_uri for _, _, token_uri in found], allow_failure=True
+        )
+
+        results: List[NFTMetadataOwner] = []
+        for (token_id, owner, token_uri), metadata in zip(found, metadatas):
+            if metadata is None:
+                continue
+            try:
+                results.append(
+                    NFTMetadataOwner(
+                        build_token_metadata(token_id, token_uri, metadata), owner
+                    )
+                )
+            except Exception:
+                continue
+
+        return results
+
+    async def get_total_count(self) -> int:
+        """
+        Get the total number of NFTs
+
+        ```python
+        total_count = await contract.get_total_count()
+        print(total_count)
+        ```
+
+        :extension: ERC721ClaimCustom | ERC721ClaimPhasesV2 | ERC721ClaimConditionsV2
+        :return: the total number of NFTs minted by this contract
+        """
+
+        return await self._contract_wrapper.read("next_token_id_to_mint")
+
+    async def owner_of(self, token_id: int) -> str:
+        """
+        Get the owner of an NFT
+
+        ```python
+        owner = await contract.owner_of(0)
+        print(owner)
+        ```
+
+        :extension: ERC721
+        :param token_id: the token ID of the token to get the owner of
+        :return: the owner of the token
+        """
+
+        return await self._contract_wrapper.read("owner_of", token_id)
+
+    async def balance(self) -> int:
+        """
+        Get NFT balance
+
+        ```python
+        balance = await contract.balance()
+        print(balance)
+        ```
+
+        :extension: ERC721
+        :return: the token balance of the connected wallet
+        """
+
+        return await self.balance_of(self._contract_wrapper.get_signer_address())
+
+    async def balance_of(self, address: str) -> int:
+        """
+        Get NFT balance of a specific wallet
+
+        ```python
+        balance = await contract.balance_of("{{wallet_address}}")
+        print(balance)
+        ```
+
+        :extension: ERC721
+        :param address: the address to get the token balance of
+        """
+
+        return await self._contract_wrapper.read("balance_of", address)
+
+    async def is_approved(self, address: str, operator: str) -> bool:
+        """
+        Check approval of a specific wallet
+
+        ```python
+        is_approved = await contract.is_approved("{{wallet_address}}", "0x...")
+        print(is_approved)
+        ```
+
+        :extension: ERC721
+        :param address: the address whose assets are to be checked
+        :param operator: the address of the operator to check
+        :return: True if the operator is approved for all operations of the assets, False otherwise
+        """
+
+        return await self._contract_wrapper.read(
+            "is_approved_for_all", address, operator
+        )
+
+    """
+    WRITE FUNCTIONS
+    """
+
+    async def transfer(self, to: str, token_id: int) -> TxReceipt:
+        """
+        Transfer an NFT
+
+        ```python
+        receipt = await contract.transfer("{{wallet_address}}", 0)
+        ```
+
+        :extension: ERC721
+        :param to: wallet address to transfer the tokens to
+        :param token_id: the specific token ID to transfer
+        :returns: transaction receipt of the transfer
+        """
+
+        fr = self._contract_wrapper.get_signer_address()
+        return await self._contract_wrapper.send_transaction(
+            "safe_transfer_from1", [fr, to, token_id]
+        )
+
+    async def set_approval_for_all(self, operator: str, approved: bool) -> TxReceipt:
+        """
+        Set approval for all NFTs
+
+        ```python
+        receipt = await contract.set_approval_for_all("{{wallet_address}}", True)
+        ```
+
+        :extension: ERC721
+        :param operator: the address of the operator to set the approval for
+        :param approved: whether the operator is approved to manage the assets
+        :returns: transaction receipt of the approval
+        """
+
+        return await self._contract_wrapper.send_transaction(
+            "set_approval_for_all", [operator, approved]
+        )
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    async def _get_owner(self, token_id: int) -> str:
+        try:
+            return await self.owner_of(token_id)
+        except Exception:
+            return ZERO_ADDRESS
+
+    async def _get_token_uri(self, token_id: int) -> Optional[str]:
+        return await self._contract_wrapper.read("token_uri", token_id)
+
+    async def _get_token_metadata(self, token_id: int) -> NFTMetadata:
+        token_uri = await self._get_token_uri(token_id)
+
+        if not token_uri:
+            raise NotFoundException(str(token_id))
+
+        metadata = await self._storage.get(token_uri)
+        return build_token_metadata(token_id, token_uri, metadata)
@@ -0,0 +1,425 @@
+import asyncio
+import json
+import random
+from pathlib import PurePath
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Union,
+    cast,
+)
+from urllib.parse import urlparse
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, TCPConnector
+
+from thirdweb.common.error import FetchException, UploadException
+from thirdweb.constants.urls import TW_STORAGE_SERVER_URL
+from thirdweb.core.classes.ipfs_storage import (
+    build_upload_files,
+    get_file_properties,
+    get_gateway_url,
+)
+from thirdweb.core.classes.ipfs_uploader import (
+    READ_BLOCK_SIZE,
+    MultipartBody,
+    UploadFile,
+    plan_deduplicated_upload,
+    split_parts,
+)
+from thirdweb.core.classes.pin_index import PinIndex
+from thirdweb.core.classes.storage_cache import StorageCache
+from thirdweb.core.helpers.http import RETRY_STATUS_CODES
+from thirdweb.core.helpers.storage import (
+    replace_file_properties_with_hashes,
+    replace_gateway_url_with_hash,
+    replace_hash_with_gateway_url,
+    resolve_gateway_url,
+)
+from thirdweb.types.sdk import StorageSettings
+from thirdweb.types.storage import CidWithFileName, StorageCacheStats, UriWithMetadata
+
+
+class AsyncIpfsStorage:
+    """
+    Upload and download files from IPFS without blocking the event loop.
+
+    Requests share a pool of kept-alive connections, and downloads of many hashes run
+    concurrently within the limits of the storage settings. The files of metadata
+    properties are uploaded in concurrent parts and deduplicated by CID, within the
+    same upload settings as the IpfsStorage.
+
+    ```python
+    from thirdweb import AsyncThirdwebSDK
+
+    async with AsyncThirdwebSDK("mumbai") as sdk:
+        metadata = await sdk.storage.get("<IPFS_HASH>")
+    ```
+    """
+
+    _gateway_url: str
+    _server_url: str
+    _secret_key: Optional[str]
+    _settings: StorageSettings
+    _session: Optional[ClientSession]
+    _cache: StorageCache
+    _pin_index: PinIndex
+
+    def __init__(
+        self,
+        secret_key: Optional[str],
+        gateway_url: Optional[str] = None,
+        settings: StorageSettings = StorageSettings(),
+        server_url: Optional[str] = None,
+    ):
+        self._secret_key = secret_key
+        self._settings = settings
+        self._server_url = server_url if server_url is not None else TW_STORAGE_SERVER_URL
+        self._gateway_url = get_gateway_url(secret_key, gateway_url)
+        self._session = None
+        self._cache = StorageCache(
+            settings.cache_max_bytes,
+            settings.cache_path,
+            settings.cache_max_disk_bytes,
+        )
+        self._pin_index = PinIndex(settings.pin_index_path)
+
+    async def get(self, hash: str) -> Any:
+        """
+        Gets IPFS data at a given hash and returns the data.
+
+        :param hash: hash of the data to get.
+        :returns: dictionary of the data if JSON, otherwise raw data.
+        """
+
+        content = await self._get_content(hash)
+        try:
+            data = json.loads(content)
+
+            if isinstance(data, dict) or isinstance(data, list) or isinstance(data, str):
+                return replace_hash_with_gateway_url(
+                    cast(Dict[str, Any], data), "ipfs://", self._gateway_url
+                )
+            return data
+        except:
+            return content.decode("utf-8", errors="replace")
+
+    async def get_batch(
+        self, hashes: Sequence[str], allow_failure: bool = False
+    ) -> List[Any]:
+        """
+        Gets IPFS data at many hashes concurrently and returns the data in the same order.
+
+        :param hashes: list of hashes of the data to get.
+        :param allow_failure: whether to return None for data that could not be fetched
+            instead of raising.
+        :returns: list of dictionaries of the data if JSON, otherwise raw data.
+        """
+
+        limit = asyncio.Semaphore(max(self._settings.max_concurrent_requests, 1))
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+
+        async def fetch(hash: str) -> Any:
+            url = resolve_gateway_url(hash, "ipfs://", self._gateway_url)
+            host = urlparse(url).netloc
+            if host not in host_limits:
+                host_limits[host] = asyncio.Semaphore(
+                    max(self._settings.max_requests_per_host, 1)
+                )
+
+            async with limit, host_limits[host]:
+                return await self.get(hash)
+
+        results = await asyncio.gather(
+            *[fetch(hash) for hash in hashes], return_exceptions=True
+        )
+
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                if not allow_failure:
+                    raise result
+                results[i] = None
+
+        return results
+
+    def cache_stats(self) -> StorageCacheStats:
+        """
+        Gets the hit and miss counters of the IPFS content cache.
+
+        :returns: hits on the in-memory and on-disk caches, misses and the in-memory size.
+        """
+
+        return self._cache.stats()
+
+    async def upload(self, data: Union[TextIO, BinaryIO, str]) -> str:
+        """
+        Uploads data to IPFS and returns the hash of the data.
+
+        :param data: data to upload.
+        :returns: hash of the data.
+        """
+
+        cid = await self.upload_batch([data], 0)
+        return f"{cid}0"
+
+    async def upload_batch(
+        self,
+        files: Sequence[Union[TextIO, BinaryIO, str, Dict[str, Any]]],
+        file_start_number: int = 0,
+    ) -> str:
+        """
+        Uploads a list of files to IPFS and returns the hash. The files share a single
+        directory, so they are uploaded in a single request.
+
+        :param files: list of files to upload.
+        :param file_start_number: optional number to start the file names with.
+        :returns: hash of the data.
+        """
+
+        cid_with_filename = await self._upload_batch_with_cid(files, file_start_number)
+        return f"ipfs://{cid_with_filename.cid}"
+
+    async def upload_metadata(self, metadata: Dict[str, Any]) -> str:
+        """
+        Uploads metadata to IPFS and returns the hash of the metadata.
+
+        :param metadata: metadata to upload.
+        :returns: hash of the metadata.
+        """
+
+        uri_with_metadata = await self.upload_metadata_batch([metadata], 0)
+        return uri_with_metadata.metadata_uris[0]
+
+    async def upload_metadata_batch(
+        self,
+        metadatas: Sequence[Dict[str, Any]],
+        file_start_number: int = 0,
+    ) -> UriWithMetadata:
+        """
+        Uploads a list of metadata to IPFS and returns the hash.
+
+        :param metadatas: list of metadata to upload.
+        :param file_start_number: optional number to start the file names with.
+        :returns: hash of the metadata.
+        """
+
+        metadata_to_upload = await self._batch_upload_properties(metadatas)
+        cid_with_filename = await self._upload_batch_with_cid(
+            metadata_to_upload, file_start_number
+        )
+
+        base_uri = f"ipfs://{cid_with_filename.cid}/"
+        metadata_uris = [
+            f"{base_uri}{filename}" for filename in cid_with_filename.filenames
+        ]
+
+        return UriWithMetadata(base_uri, metadata_uris)
+
+    async def close(self):
+        """
+        Close the connections of the storage.
+        """
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    async def _get_content(self, hash: str) -> bytes:
+        # Only content addressed by CID is immutable, anything else is always refetched
+        key: Optional[str] = None
+        for prefix in ["ipfs://", self._gateway_url]:
+            if hash.startswith(prefix):
+                key = hash[len(prefix) :]
+                break
+
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        url = resolve_gateway_url(hash, "ipfs://", self._gateway_url)
+        headers = (
+            {"x-secret-key": self._secret_key}
+            if ".ipfscdn.io" in self._gateway_url
+            else {}
+        )
+
+        attempt = 0
+        while True:
+            try:
+                async with self._get_session().get(
+                    url,
+                    headers=headers,
+                    timeout=ClientTimeout(self._settings.timeout),
+                ) as res:
+                    if res.status < 400:
+                        content = await res.read()
+                        break
+                    if res.status not in RETRY_STATUS_CODES:
+                        raise FetchException(f"Could not get {url}")
+            except (ClientError, asyncio.TimeoutError):
+                pass
+
+            if attempt >= self._settings.max_retries:
+                raise FetchException(f"Could not get {url}")
+            await self._backoff(attempt)
+            attempt += 1
+
+        if key is not None:
+            self._cache.set(key, content)
+
+        return content
+
+    async def _batch_upload_properties(
+        self, metadatas: Sequence[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        sanitized_metadatas = [
+            replace_gateway_url_with_hash(metadata, "ipfs://", self._gateway_url)
+            for metadata in metadatas
+        ]
+
+        files_to_upload = [
+            file
+            for metadata in sanitized_metadatas
+            for file in get_file_properties(metadata, [])
+        ]
+
+        if len(files_to_upload) == 0:
+            return sanitized_metadatas
+
+        # Files don't need to share a directory, so large files are uploaded in parts
+        paths = await self._upload_parts(
+            build_upload_files(
+                cast(List[Union[TextIO, BinaryIO, PurePath, str, Dict[str, Any]]], files_to_upload)
+            )
+        )
+
+        return cast(
+            List[Dict[str, Any]],
+            replace_file_properties_with_hashes(
+                cast(List[Any], sanitized_metadatas), paths
+            ),
+        )
+
+    async def _upload_batch_with_cid(
+        self,
+        files: Sequence[Union[TextIO, BinaryIO, str, Dict[str, Any]]],
+        file_start_number: int = 0,
+    ) -> CidWithFileName:
+        upload_files = build_upload_files(files, file_start_number)
+        cid = await self._post(upload_files)
+
+        return CidWithFileName(cid, [file.name for file in upload_files])
+
+    async def _upload_parts(self, files: Sequence[UploadFile]) -> List[str]:
+        if not self._settings.deduplicate_uploads:
+            return await self._upload_split(files)
+
+        cids = await self._get_cids(files)
+        paths, unique = plan_deduplicated_upload(files, cids, self._pin_index)
+
+        uploaded = await self._upload_split(list(unique.values()))
+        for cid, path in zip(unique.keys(), uploaded):
+            self._pin_index.set(cid, path)
+            paths[cid] = path
+
+        return [paths[cid] for cid in cids]
+
+    async def _get_cids(self, files: Sequence[UploadFile]) -> List[str]:
+        # The same file often appears many times, so each source is only hashed once
+        sources: Dict[str, UploadFile] = {}
+        for file in files:
+            sources.setdefault(file.fingerprint, file)
+
+        loop = asyncio.get_running_loop()
+        limit = asyncio.Semaphore(max(self._settings.max_concurrent_uploads, 1))
+
+        async def get_cid(file: UploadFile) -> str:
+            async with limit:
+                return await loop.run_in_executor(None, file.cid)
+
+        source_cids = dict(
+            zip(
+                sources.keys(),
+                await asyncio.gather(*[get_cid(file) for file in sources.values()]),
+            )
+        )
+        return [source_cids[file.fingerprint] for file in files]
+
+    async def _upload_split(self, files: Sequence[UploadFile]) -> List[str]:
+        if len(files) == 0:
+            return []
+
+        parts = split_parts(files, self._settings)
+        limit = asyncio.Semaphore(max(self._settings.max_concurrent_uploads, 1))
+
+        async def upload(part: List[UploadFile]) -> str:
+            async with limit:
+                return await self._post(part)
+
+        cids = await asyncio.gather(*[upload(part) for part in parts])
+        return [f"{cid}/{file.name}" for cid, part in zip(cids, parts) for file in part]
+
+    async def _post(self, files: Sequence[UploadFile]) -> str:
+        attempt = 0
+        while True:
+            body = MultipartBody(files)
+            headers = {
+                "Content-Type": body.content_type,
+                "Content-Length": str(len(body)),
+            }
+            if self._secret_key is not None:
+                headers["x-secret-key"] = self._secret_key
+
+            error: str
+            try:
+                async with self._get_session().post(
+                    f"{self._server_url}/ipfs/upload",
+                    data=self._stream(body),
+                    headers=headers,
+                    timeout=ClientTimeout(self._settings.timeout),
+                ) as res:
+                    if res.status < 400:
+                        return (await res.json(content_type=None))["IpfsHash"]
+
+                    error = await res.text()
+                    if res.status not in RETRY_STATUS_CODES:
+                        raise UploadException(f"Failed to upload files to IPFS. {error}")
+            except (ClientError, asyncio.TimeoutError) as e:
+                error = str(e)
+            finally:
+                body.close()
+
+            if attempt >= self._settings.max_retries:
+                raise UploadException(f"Failed to upload files to IPFS. {error}")
+            await self._backoff(attempt)
+            attempt += 1
+
+    async def _stream(self, body: MultipartBody) -> AsyncIterator[bytes]:
+        # Files are read from disk in a thread so the loop keeps serving other requests
+        loop = asyncio.get_running_loop()
+        while True:
+            chunk = await loop.run_in_executor(None, body.read, READ_BLOCK_SIZE)
+            if len(chunk) == 0:
+                return
+            yield chunk
+
+    async def _backoff(self, attempt: int):
+        backoff = self._settings.retry_backoff_factor * (2**attempt)
+        await asyncio.sleep(random.uniform(0, backoff))
+
+    def _get_session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                connector=TCPConnector(limit=max(self._settings.pool_size, 1))
+            )
+        return self._session
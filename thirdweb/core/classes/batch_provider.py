@@ -0,0 +1,421 @@
+import itertools
+import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from threading import Condition
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from eth_typing import URI
+from requests.exceptions import HTTPError
+from web3 import Web3
+from web3._utils.request import make_post_request
+from web3.providers.rpc import HTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from thirdweb.types.sdk import RpcBatchSettings
+
+T = TypeVar("T")
+
+# Methods whose identical in-flight requests can share a single response
+COALESCED_METHODS = {
+    "eth_blockNumber",
+    "eth_call",
+    "eth_chainId",
+    "eth_estimateGas",
+    "eth_feeHistory",
+    "eth_gasPrice",
+    "eth_getBalance",
+    "eth_getBlockByHash",
+    "eth_getBlockByNumber",
+    "eth_getCode",
+    "eth_getLogs",
+    "eth_getStorageAt",
+    "eth_getTransactionByHash",
+    "eth_getTransactionCount",
+    "eth_getTransactionReceipt",
+    "eth_maxPriorityFeePerGas",
+    "net_version",
+}
+
+# HTTP status codes nodes without batch support reject batches with
+BATCH_REJECTED_STATUS_CODES = {400, 405, 415, 422}
+
+# HTTP status code of requests larger than the node accepts
+PAYLOAD_TOO_LARGE_STATUS_CODE = 413
+
+# JSON-RPC error code some nodes answer with when a client exceeds its rate limit
+RATE_LIMIT_ERROR_CODE = 429
+
+
+class BatchFailure(Enum):
+    """
+    How a batch the node did not answer with a list of responses is handled.
+    """
+
+    # The node does not support batches, so requests are sent one by one from now on
+    UNSUPPORTED = "unsupported"
+    # The batch is too large for the node, so it is split in two
+    TOO_LARGE = "too_large"
+    # The node is rate limiting or failing, so the batch is sent again later
+    TRANSIENT = "transient"
+
+
+# A queued request: its method, params, coalescing key and the future of its response
+_Request = Tuple[str, Any, Optional[str], "Future[RPCResponse]"]
+
+
+class BatchHTTPProvider(HTTPProvider):
+    """
+    HTTP provider sending the requests made concurrently as JSON-RPC batches.
+
+    A request made while no batch is being sent goes out at once. Requests made while
+    batches are in flight are queued and sent together in the next batch, so serial
+    code keeps its latency while concurrent reads share round trips. Identical reads
+    in flight at the same time are only sent once and share the response.
+
+    Batches are sent by the callers waiting on them, one batch per free sending slot.
+    A caller stops sending once its own request is answered, and the slot goes to the
+    next caller still waiting, so no caller keeps sending the requests of others.
+    """
+
+    _settings: RpcBatchSettings
+    _queue: List[_Request]
+    _in_flight: Dict[str, "Future[RPCResponse]"]
+    _sending: int
+    _scopes: int
+    _supports_batch: bool
+    _ids: "itertools.count[int]"
+    _condition: Condition
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        settings: RpcBatchSettings = RpcBatchSettings(),
+        request_kwargs: Optional[Any] = None,
+    ):
+        """
+        Initialize the provider.
+
+        :param endpoint_uri: URL of the JSON-RPC endpoint
+        :param settings: settings of the request batching
+        :param request_kwargs: optional keyword arguments passed to requests
+        """
+
+        super().__init__(endpoint_uri, request_kwargs)
+        self._settings = settings
+        self._queue = []
+        self._in_flight = {}
+        self._sending = 0
+        self._scopes = 0
+        self._supports_batch = True
+        self._ids = itertools.count()
+        self._condition = Condition()
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        key = self._get_key(method, params)
+
+        with self._condition:
+            if key is not None and key in self._in_flight:
+                future = self._in_flight[key]
+            else:
+                future = Future()
+                if key is not None:
+                    self._in_flight[key] = future
+                self._queue.append((method, params, key, future))
+
+        while True:
+            with self._condition:
+                # The caller sends queued batches itself when a sending slot is free
+                while not future.done() and (
+                    len(self._queue) == 0
+                    or self._sending >= max(self._settings.max_concurrent_batches, 1)
+                ):
+                    self._condition.wait()
+
+                if future.done():
+                    return future.result()
+                self._sending += 1
+
+            self._send_next_batch()
+
+    def begin_batch(self):
+        """
+        Hold requests for the scope window of the settings before sending them, so that
+        requests made by functions running concurrently are sent in the same batch.
+        """
+
+        with self._condition:
+            self._scopes += 1
+
+    def end_batch(self):
+        """
+        Stop holding requests once every batch scope has ended.
+        """
+
+        with self._condition:
+            self._scopes = max(self._scopes - 1, 0)
+
+    def request_batch(self, calls: List[Tuple[str, Any]]) -> List[RPCResponse]:
+        """
+        Send requests at once, in as few batches as possible, without queueing them.
+
+        :param calls: method and params of each request
+        :returns: the raw response of each request, in order
+        """
+
+        size = max(self._settings.max_batch_size, 1)
+        responses: List[RPCResponse] = []
+        for i in range(0, len(calls), size):
+            for response in self._send(calls[i : i + size]):
+                if isinstance(response, Exception):
+                    raise response
+                responses.append(response)
+
+        return responses
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _get_key(self, method: str, params: Any) -> Optional[str]:
+        return get_coalescing_key(method, params)
+
+    def _send_next_batch(self):
+        try:
+            with self._condition:
+                window = (
+                    self._settings.scope_window if self._scopes > 0 else self._settings.window
+                )
+
+            if window > 0:
+                time.sleep(window)
+
+            with self._condition:
+                batch = self._queue[: self._settings.max_batch_size]
+                del self._queue[: self._settings.max_batch_size]
+
+            # Another sender may have taken the queued requests during the window
+            if len(batch) == 0:
+                return
+
+            try:
+                responses = self._send(
+                    [(method, params) for method, params, _, _ in batch]
+                )
+            except Exception as e:
+                responses = [e] * len(batch)
+
+            with self._condition:
+                for _, _, key, _ in batch:
+                    if key is not None:
+                        self._in_flight.pop(key, None)
+
+            for (_, _, _, future), response in zip(batch, responses):
+                if isinstance(response, Exception):
+                    future.set_exception(response)
+                else:
+                    future.set_result(response)
+        finally:
+            # Waiting callers are woken under the lock, so a queued request is never
+            # left without a caller taking the free slot to send it
+            with self._condition:
+                self._sending -= 1
+                self._condition.notify_all()
+
+    def _send(self, calls: List[Tuple[str, Any]], attempt: int = 0) -> List[Any]:
+        if len(calls) == 1 or not self._supports_batch:
+            results: List[Any] = []
+            for method, params in calls:
+                try:
+                    results.append(
+                        self._post(
+                            {
+                                "jsonrpc": "2.0",
+                                "method": method,
+                                "params": params,
+                                "id": next(self._ids),
+                            }
+                        )
+                    )
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        ids = [next(self._ids) for _ in calls]
+        payload = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": id}
+            for id, (method, params) in zip(ids, calls)
+        ]
+        error: Optional[Exception] = None
+        try:
+            responses = self._post(payload)
+            failure = get_batch_failure(response=responses)
+        except HTTPError as e:
+            if e.response is None:
+                raise
+            failure = get_batch_failure(status_code=e.response.status_code)
+            if failure is None:
+                raise
+            responses, error = None, e
+        except ValueError:
+            responses, failure = None, BatchFailure.UNSUPPORTED
+
+        if failure == BatchFailure.UNSUPPORTED:
+            self._supports_batch = False
+            return self._send(calls)
+        if failure == BatchFailure.TOO_LARGE:
+            half = len(calls) // 2
+            return self._send(calls[:half]) + self._send(calls[half:])
+        if failure == BatchFailure.TRANSIENT:
+            if attempt >= self._settings.max_retries:
+                if error is not None:
+                    raise error
+                return [responses] * len(calls)
+            time.sleep(self._settings.retry_backoff * 2**attempt)
+            return self._send(calls, attempt + 1)
+
+        by_id: Dict[int, RPCResponse] = {
+            response.get("id"): response for response in responses
+        }
+        return [
+            by_id.get(id, {"error": {"code": -32603, "message": "Missing batch response"}})  # type: ignore
+            for id in ids
+        ]
+
+    def _post(self, payload: Any) -> Any:
+        if self.endpoint_uri is None:
+            raise ValueError("The provider has no endpoint to send requests to")
+
+        raw = make_post_request(
+            URI(self.endpoint_uri),
+            json.dumps(payload).encode("utf-8"),
+            **dict(self.get_request_kwargs()),
+        )
+        return json.loads(raw)
+
+
+def get_coalescing_key(method: str, params: Any) -> Optional[str]:
+    """
+    Returns the key identical requests in flight share a response under, or None for
+    requests that must always be sent.
+    """
+
+    if method not in COALESCED_METHODS:
+        return None
+
+    try:
+        return method + json.dumps(params, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+
+
+def is_rate_limited(response: Any) -> bool:
+    """
+    Returns whether a JSON-RPC response, or any response of a batch, is a rate limit
+    error.
+    """
+
+    responses = response if isinstance(response, list) else [response]
+    for r in responses:
+        error = r.get("error") if isinstance(r, dict) else None
+        if not isinstance(error, dict):
+            continue
+
+        message = str(error.get("message", "")).lower()
+        if (
+            error.get("code") == RATE_LIMIT_ERROR_CODE
+            or "rate limit" in message
+            or "too many requests" in message
+        ):
+            return True
+
+    return False
+
+
+def get_batch_failure(
+    status_code: Optional[int] = None, response: Any = None
+) -> Optional[BatchFailure]:
+    """
+    Returns how to handle a batch the node answered with an HTTP error status code or
+    a response other than a list, or None when the batch did not fail this way.
+
+    Only client errors nodes reject batches with, and single error objects other than
+    rate limits, mean the node does not support batches. Rate limits and server errors
+    are transient, so batching is never turned off because of them.
+    """
+
+    if status_code is not None:
+        if status_code in BATCH_REJECTED_STATUS_CODES:
+            return BatchFailure.UNSUPPORTED
+        if status_code == PAYLOAD_TOO_LARGE_STATUS_CODE:
+            return BatchFailure.TOO_LARGE
+        if status_code == RATE_LIMIT_ERROR_CODE or status_code >= 500:
+            return BatchFailure.TRANSIENT
+        return None
+
+    if isinstance(response, list):
+        return None
+    if is_rate_limited(response):
+        return BatchFailure.TRANSIENT
+    return BatchFailure.UNSUPPORTED
+
+
+class RequestBatch:
+    """
+    Runs functions concurrently while their provider holds requests, so that all the
+    reads they make are sent to the node in as few JSON-RPC batches as possible.
+
+    ```python
+    with sdk.batch() as batch:
+        token = batch.submit(contract.get)
+        roles = batch.submit(contract.roles.get_all)
+
+    print(token.result().symbol, roles.result())
+    ```
+    """
+
+    _provider: Web3
+    _executor: ThreadPoolExecutor
+    _futures: List["Future[Any]"]
+
+    def __init__(self, provider: Web3, max_workers: int = 16):
+        """
+        Initialize the batch.
+
+        :param provider: web3 provider instance the functions read through
+        :param max_workers: maximum number of functions run at the same time
+        """
+
+        self._provider = provider
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = []
+
+    def __enter__(self) -> "RequestBatch":
+        # Providers wrapping batch providers hold requests through them as well
+        begin_batch = getattr(self._provider.provider, "begin_batch", None)
+        if begin_batch is not None:
+            begin_batch()
+        return self
+
+    def __exit__(self, *args):
+        try:
+            for future in self._futures:
+                future.exception()
+        finally:
+            end_batch = getattr(self._provider.provider, "end_batch", None)
+            if end_batch is not None:
+                end_batch()
+            self._executor.shutdown(wait=True)
+
+    def submit(self, fn: Callable[..., T], *args, **kwargs) -> "Future[T]":
+        """
+        Run a function as part of the batch.
+
+        :param fn: function to run
+        :returns: future resolved with the result of the function once it returns
+        """
+
+        future = self._executor.submit(fn, *args, **kwargs)
+        self._futures.append(future)
+        return future
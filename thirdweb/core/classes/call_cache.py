@@ -0,0 +1,253 @@
+import json
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import astuple
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from web3 import Web3
+from web3.types import RPCEndpoint, RPCResponse
+
+from thirdweb.core.helpers.rpc import get_provider_key
+from thirdweb.types.sdk import CallCacheSettings
+
+# Name of the middleware in the middleware onion of a provider
+CALL_CACHE_MIDDLEWARE = "thirdweb_call_cache"
+
+
+class CallCache:
+    """
+    Memoizes the results of eth_call for the block they were read at, keyed by the
+    block number, the target and the calldata of the call, so that a value read many
+    times during the same operation is only requested from the node once.
+
+    Reads of the latest block are cached for the latest block number seen, which is
+    read again at most every poll interval. Once a newer block is seen, results of
+    older blocks are dropped. Reads can also be pinned to a block, so that every read
+    made in the same thread or task in the meantime sees the same snapshot of the chain.
+    """
+
+    _provider: Web3
+    _settings: CallCacheSettings
+    _results: "OrderedDict[Tuple[int, str], RPCResponse]"
+    _block: int
+    _checked_at: float
+    _pin: "ContextVar[Optional[int]]"
+    _pinned_blocks: "Counter[int]"
+    _lock: Lock
+
+    def __init__(self, provider: Web3, settings: CallCacheSettings = CallCacheSettings()):
+        """
+        Initialize the call cache.
+
+        :param provider: web3 provider instance whose reads are cached
+        :param settings: settings of the cache
+        """
+
+        self._provider = provider
+        self._settings = settings
+        self._results = OrderedDict()
+        self._block = -1
+        self._checked_at = 0
+        # Each thread or task has its own pin, the counts only keep pinned results alive
+        self._pin = ContextVar(f"call_cache_pin_{id(self)}", default=None)
+        self._pinned_blocks = Counter()
+        self._lock = Lock()
+
+    def install(self, provider: Web3):
+        """
+        Cache the reads made through a provider, as its innermost middleware.
+
+        :param provider: web3 provider instance connected to the node of the cache
+        """
+
+        onion = provider.middleware_onion
+        if CALL_CACHE_MIDDLEWARE not in onion:
+            onion.inject(self.middleware, name=CALL_CACHE_MIDDLEWARE, layer=0)
+
+    def middleware(
+        self, make_request: Callable[[RPCEndpoint, Any], Any], w3: Web3
+    ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+        """
+        Web3 middleware answering eth_call from the cache.
+        """
+
+        def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if method != "eth_call":
+                response = make_request(method, params)
+                self._observe_response(method, response)
+                return response
+
+            return self._call(make_request, params)
+
+        return middleware
+
+    def observe_block(self, block_number: int):
+        """
+        Drop the results of blocks older than a block known to be mined, for instance
+        the block of a mined transaction.
+
+        :param block_number: number of a block known to be mined
+        """
+
+        with self._lock:
+            self._set_block(block_number)
+
+    @contextmanager
+    def pin(self, block_number: Optional[int] = None) -> Iterator[int]:
+        """
+        Pin the reads made through the provider to a block while the context is open.
+        Only reads made from the same thread or asyncio task are pinned, reads made by
+        others keep reading the latest block.
+
+        :param block_number: block to read at, defaults to the latest block
+        :returns: the number of the pinned block
+        """
+
+        if block_number is None:
+            block_number = self._provider.eth.block_number
+
+        token = self._pin.set(block_number)
+        with self._lock:
+            self._pinned_blocks[block_number] += 1
+        try:
+            yield block_number
+        finally:
+            self._pin.reset(token)
+            with self._lock:
+                self._pinned_blocks[block_number] -= 1
+                if self._pinned_blocks[block_number] <= 0:
+                    del self._pinned_blocks[block_number]
+
+    def clear(self):
+        """
+        Drop every cached result.
+        """
+
+        with self._lock:
+            self._results.clear()
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _call(
+        self, make_request: Callable[[RPCEndpoint, Any], Any], params: Any
+    ) -> RPCResponse:
+        # Calls overriding the state of the chain are never cached
+        if len(params) > 2:
+            return make_request(RPCEndpoint("eth_call"), params)
+
+        tx = params[0]
+        block_identifier = params[1] if len(params) > 1 else "latest"
+
+        pinned = self._pin.get()
+
+        if block_identifier == "latest" and pinned is not None:
+            block_identifier = hex(pinned)
+            params = [tx, block_identifier]
+        elif not self._settings.enabled:
+            # Without caching, the cache is only installed to pin reads
+            return make_request(RPCEndpoint("eth_call"), params)
+
+        block = self._get_block_number(make_request, block_identifier)
+        if block is None:
+            return make_request(RPCEndpoint("eth_call"), params)
+
+        # The head may have moved on since it was polled, so the call is made at the
+        # block its result is cached for rather than at the latest block
+        params = [tx, hex(block)]
+
+        # The sender and value of a call can change its result as much as its calldata
+        key = (block, json.dumps(tx, sort_keys=True, default=str))
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+
+        response = make_request(RPCEndpoint("eth_call"), params)
+        if "error" in response:
+            return response
+
+        with self._lock:
+            if block >= self._block or block in self._pinned_blocks:
+                self._results[key] = response
+                while len(self._results) > max(self._settings.max_entries, 0):
+                    self._results.popitem(last=False)
+
+        return response
+
+    def _get_block_number(
+        self, make_request: Callable[[RPCEndpoint, Any], Any], block_identifier: Any
+    ) -> Optional[int]:
+        if isinstance(block_identifier, int):
+            return block_identifier
+        if isinstance(block_identifier, str) and block_identifier.startswith("0x"):
+            return int(block_identifier, 16)
+        if block_identifier != "latest":
+            # Pending and earliest blocks are never cached
+            return None
+
+        with self._lock:
+            if time.monotonic() - self._checked_at <= self._settings.block_poll_interval:
+                return self._block
+
+        response = make_request(RPCEndpoint("eth_blockNumber"), [])
+        if "result" not in response:
+            return None
+
+        with self._lock:
+            self._set_block(int(response["result"], 16))
+            self._checked_at = time.monotonic()
+            return self._block
+
+    def _observe_response(self, method: str, response: Any):
+        result = response.get("result") if isinstance(response, dict) else None
+        if result is None:
+            return
+
+        if method == "eth_blockNumber":
+            block_number = result
+        elif method == "eth_getTransactionReceipt":
+            block_number = result.get("blockNumber")
+        else:
+            return
+
+        if isinstance(block_number, str):
+            self.observe_block(int(block_number, 16))
+
+    def _set_block(self, block_number: int):
+        if block_number <= self._block:
+            return
+
+        self._block = block_number
+        self._checked_at = time.monotonic()
+        for key in list(self._results.keys()):
+            if key[0] < block_number and key[0] not in self._pinned_blocks:
+                del self._results[key]
+
+
+_call_caches: Dict[Tuple[str, Tuple[Any, ...]], CallCache] = {}
+_call_caches_lock = Lock()
+
+
+def get_call_cache(
+    provider: Web3, settings: CallCacheSettings = CallCacheSettings()
+) -> CallCache:
+    """
+    Get the process-wide call cache for the node of the given provider and the
+    given settings.
+
+    :param provider: web3 provider instance the reads are made through
+    :param settings: settings of the cache
+    :returns: the call cache shared by every contract using this node and settings
+    """
+
+    key = (get_provider_key(provider), astuple(settings))
+
+    with _call_caches_lock:
+        if key not in _call_caches:
+            _call_caches[key] = CallCache(provider, settings)
+        return _call_caches[key]
@@ -1,15 +1,19 @@
-from typing import Any, Callable, Dict, Generic, Tuple
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Tuple
 from thirdweb.constants.events import EventType
 from thirdweb.core.classes.contract_wrapper import ContractWrapper
+from thirdweb.core.classes.event_backfill import EventBackfill
+from thirdweb.core.classes.log_watcher import LogWatcher, get_log_watcher
 from thirdweb.types.contract import TContractABI
-from thirdweb.types.events import EventQueryOptions, TxEvent
+from thirdweb.types.events import EventBackfillSettings, EventQueryOptions, TxEvent
 from web3.datastructures import AttributeDict
 
 class ContractEvents(Generic[TContractABI]):
     _contract_wrapper: ContractWrapper[TContractABI]
+    _subscriptions: Dict[Tuple[str, Callable], List[int]]
 
     def __init__(self, contract_wrapper: ContractWrapper[TContractABI]):
         self._contract_wrapper = contract_wrapper
+        self._subscriptions = {}
 
     def add_transaction_listener(self, listener: Callable[[TxEvent], Any]):
         """
@@ -35,22 +39,24 @@ class ContractEvents(Generic[TContractABI]):
     ):
         """
         Add an event listener to this contract to listen for a specific event type.
+        The chain is watched for new events in the background, and the listener is
+        called from a worker thread with the arguments of each event.
 
         :param event_name: The name of the event to listen for.
         :param listener: The listener function to be called on the event.
         """
 
         interface = self._contract_wrapper.get_contract_interface()
-        event = interface.events[event_name].abi
-        event_names = [i["name"] for i in event["inputs"]]
+        event = interface.events[event_name]()
 
-        def event_listener(*args):
-            results: Dict[str, Any] = {}
-            for i, arg in enumerate(event_names):
-                results[arg] = args[i]
-            listener(results)
+        def event_listener(log: AttributeDict):
+            listener(dict(log["args"]))
 
-        self._contract_wrapper.on(event["name"], event_listener)
+        watcher = self._get_log_watcher()
+        subscription_id = watcher.subscribe(event, event_listener)
+        self._subscriptions.setdefault((event_name, listener), []).append(
+            subscription_id
+        )
 
     def remove_event_listener(self, event_name: str, listener):
         """
@@ -60,27 +66,81 @@ class ContractEvents(Generic[TContractABI]):
         :param listener: The listener function to be removed.
         """
 
-        interface = self._contract_wrapper.get_contract_interface()
-        event = interface.events[event_name].abi
-
-        self._contract_wrapper.remove_listener(event["name"], listener)
+        watcher = self._get_log_watcher()
+        for subscription_id in self._subscriptions.pop((event_name, listener), []):
+            watcher.unsubscribe(subscription_id)
 
     def remove_all_listeners(self):
         """
         Remove all event listeners from this contract.
         """
 
+        watcher = self._get_log_watcher()
+        for subscription_ids in self._subscriptions.values():
+            for subscription_id in subscription_ids:
+                watcher.unsubscribe(subscription_id)
+        self._subscriptions = {}
+
         self._contract_wrapper.remove_all_listeners()
 
-    def get_events(self, event_name: str, options: EventQueryOptions = EventQueryOptions()) -> Tuple[AttributeDict]:
+    def get_events(
+        self,
+        event_name: str,
+        options: EventQueryOptions = EventQueryOptions(),
+        settings: Optional[EventBackfillSettings] = None,
+    ) -> Tuple[AttributeDict]:
         """
         Query past events of a specific type on the contract.
 
         :param event_name: The name of the event to query.
         :param options: The options to use when querying for events, including block range specifications and filters
+        :param settings: Optional settings of the block windows the range is queried in
         :return: A list of events.
         """
 
-        events_interface = self._contract_wrapper.get_contract_interface().events[event_name]
-        return events_interface.getLogs(options.filters, options.from_block, options.to_block)
+        return tuple(self.stream_events(event_name, options, settings))  # type: ignore
+
+    def stream_events(
+        self,
+        event_name: str,
+        options: EventQueryOptions = EventQueryOptions(),
+        settings: Optional[EventBackfillSettings] = None,
+    ) -> Iterator[AttributeDict]:
+        """
+        Query past events of a specific type on the contract over a large block range,
+        in windows fetched concurrently, yielding the events in block order as they
+        arrive. With a checkpoint path in the settings, an interrupted query resumes
+        from the last completed window when it is run again.
+
+        ```python
+        from thirdweb.types.events import EventBackfillSettings
 
+        settings = EventBackfillSettings(checkpoint_path="events.db")
+        for event in contract.events.stream_events("TokensMinted", settings=settings):
+            print(event.args)
+        ```
+
+        :param event_name: The name of the event to query.
+        :param options: The options to use when querying for events, including block range specifications and filters
+        :param settings: Optional settings of the windows, concurrency and checkpoint
+        :return: A generator of the events.
+        """
+
+        events_interface = self._contract_wrapper.get_contract_interface().events[event_name]
+        backfill = EventBackfill(
+            self._contract_wrapper.get_provider(),
+            events_interface,
+            options.filters,
+            settings if settings is not None else EventBackfillSettings(),
+        )
+        return backfill.run(options.from_block, options.to_block)
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _get_log_watcher(self) -> LogWatcher:
+        return get_log_watcher(
+            self._contract_wrapper.get_provider(),
+            self._contract_wrapper.get_options().event_settings,
+        )
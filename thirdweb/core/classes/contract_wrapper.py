@@ -1,23 +1,50 @@
-from typing import Any, Generic, Tuple, List, Optional, cast
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from typing import Any, Dict, Generic, Tuple, List, Optional, cast
 from eth_typing import Address
+from hexbytes import HexBytes
 
 from web3 import Web3
 from web3.datastructures import AttributeDict
 from web3.contract import Contract, ContractFunction
-from thirdweb.common.error import NoSignerException
+from thirdweb.common.error import MultiCallBatchException, NoSignerException
 from web3._utils.events import EventLogErrorFlags
 from thirdweb.common.sign import EIP712Domain, sign_typed_data_internal
 from thirdweb.constants.events import EventStatus, EventType
 
+from thirdweb.core.classes.fee_oracle import FeeOracle, get_fee_oracle
+from thirdweb.core.classes.nonce_manager import (
+    NonceManager,
+    get_nonce_manager,
+    is_nonce_error,
+)
 from thirdweb.core.classes.provider_handler import ProviderHandler
+from thirdweb.core.helpers.rpc import get_chain_id
+from thirdweb.core.classes.receipt_poller import (
+    PendingTransaction,
+    ReceiptPoller,
+    get_receipt_poller,
+)
 from web3.eth import TxReceipt
+from web3.types import BlockIdentifier, TxParams as Web3TxParams
 from eth_account.account import LocalAccount
 from zero_ex.contract_wrappers.tx_params import TxParams
 from thirdweb.types.contract import TContractABI
 from thirdweb.types.events import SignatureEvent, TxEvent
+from thirdweb.types.multicall import ReadCall, ReadResult
 
 from thirdweb.types.sdk import SDKOptions
 
+MAX_NONCE_RETRIES = 3
+
+# Intrinsic gas of a transaction, paid once per multicall rather than once per call
+TX_BASE_GAS = 21000
+# Gas of dispatching a single call inside a multicall
+MULTICALL_CALL_OVERHEAD_GAS = 5000
+# Margin applied to the estimated gas of a chunk of calls packed into a multicall
+MULTICALL_GAS_MARGIN = 1.2
+MAX_CONCURRENT_ESTIMATES = 8
+
 
 class ContractWrapper(Generic[TContractABI], ProviderHandler):
     """
@@ -26,6 +53,7 @@ class ContractWrapper(Generic[TContractABI], ProviderHandler):
     """
 
     _contract_abi: TContractABI
+    __contract_interface: Optional[Contract] = None
 
     def __init__(
         self,
@@ -52,8 +80,7 @@ class ContractWrapper(Generic[TContractABI], ProviderHandler):
         :returns: chain ID of the active provider
         """
 
-        provider = self.get_provider()
-        return provider.eth.chain_id
+        return get_chain_id(self.get_provider())
 
     def get_signer_address(self) -> str:
         """
@@ -76,10 +103,20 @@ class ContractWrapper(Generic[TContractABI], ProviderHandler):
         :returns: contract interface of the contract wrapper
         """
 
-        return self.get_provider().eth.contract(
-            address=cast(Address, self._contract_abi.contract_address),
-            abi=self._contract_abi.abi(),
-        )
+        provider = self.get_provider()
+
+        # Building a contract parses and indexes the whole ABI, so reuse the
+        # interface until the provider changes
+        if (
+            self.__contract_interface is None
+            or self.__contract_interface.web3 is not provider
+        ):
+            self.__contract_interface = provider.eth.contract(
+                address=cast(Address, self._contract_abi.contract_address),
+                abi=self._contract_abi.abi(),
+            )
+
+        return self.__contract_interface
 
     def get_events(self, event: str, receipt: TxReceipt) -> Tuple[AttributeDict]:
         """
@@ -95,6 +132,28 @@ class ContractWrapper(Generic[TContractABI], ProviderHandler):
             .processReceipt(receipt, errors=EventLogErrorFlags.Discard)
         )
 
+    def get_batch_events(
+        self, event: str, receipts: List[TxReceipt]
+    ) -> List[Tuple[TxReceipt, AttributeDict]]:
+        """
+        Get the events from the receipts of a batch sent with multi_call_batch.
+
+        :param event: name of the event to get
+        :param receipts: receipt of each call of the batch
+        :returns: every event emitted by the batch with the receipt it was emitted
+            in, in the order the calls were executed
+        """
+
+        events: List[Tuple[TxReceipt, AttributeDict]] = []
+        tx_hashes = set()
+        for receipt in receipts:
+            if receipt["transactionHash"] in tx_hashes:
+                continue
+            tx_hashes.add(receipt["transactionHash"])
+            events.extend((receipt, e) for e in self.get_events(event, receipt))
+
+        return events
+
     def call(self, fn: str, *args) -> Any:
         func = cast(ContractFunction, getattr(self.get_contract_interface().functions, fn, None))
         if func is None:
@@ -124,23 +183,30 @@ class ContractWrapper(Generic[TContractABI], ProviderHandler):
         if func.abi["stateMutability"] == "view" or func.abi["stateMutability"] == "pure":
             return func(*args).call()
         else:
-            provider = self.get_provider()
-            signer = self.get_signer()
+            return self.send_contract_function(func(*args))
 
-            if signer is None:
-                raise NoSignerException
-
-            nonce = provider.eth.get_transaction_count(signer.address)  # type: ignore
-
-            tx = func(*args).buildTransaction(
-                TxParams(gas_price=provider.eth.gas_price).as_dict()
-            )
-            tx["nonce"] = nonce
+    def multi_read(
+        self,
+        calls: List[Tuple[str, List[Any]]],
+        allow_failure: Optional[bool] = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> List[ReadResult]:
+        """
+        Execute many read-only calls on the contract in batched Multicall3 requests.
 
-            signed_tx = signer.sign_transaction(tx)  # type: ignore
-            tx_hash = provider.eth.send_raw_transaction(signed_tx.rawTransaction)
+        :param calls: list of (function name, arguments) pairs to call on the contract
+        :param allow_failure: whether failed calls are returned as unsuccessful results
+            instead of raising, defaults to the SDK multicall settings
+        :param block_identifier: block to read the state at, defaults to the latest block
+        :returns: list of results in the same order as the calls
+        """
 
-            return provider.eth.wait_for_transaction_receipt(tx_hash)
+        interface = self.get_contract_interface()
+        return self.get_multicall_reader().read(
+            [ReadCall(interface, fn, args) for fn, args in calls],
+            allow_failure,
+            block_identifier,
+        )
 
     def send_transaction(self, fn: str, args: List[Any], overrides: TxParams = None) -> TxReceipt:
         """
@@ -150,30 +216,61 @@ class ContractWrapper(Generic[TContractABI], ProviderHandler):
         :param args: list of arguments to pass to the function
         """
 
-        provider = self.get_provider()
-        signer = self.get_signer()
+        return self.wait_for_receipt(self._send_transaction(fn, args, overrides))
 
-        if signer is None:
+    def send_contract_function(self, func: ContractFunction) -> TxReceipt:
+        """
+        Send a web3 contract function called with its arguments and return the receipt.
+
+        :param func: contract function to send, already called with its arguments
+        :returns: the receipt of the transaction
+        """
+
+        if self.get_signer() is None:
             raise NoSignerException
 
-        if overrides is None:
-            overrides = TxParams()
-        overrides.gas_price = provider.eth.gas_price
-        
-        nonce = provider.eth.get_transaction_count(signer.address)
-        tx = getattr(self._contract_abi, fn).build_transaction(
-            *args, tx_params=overrides
+        tx = func.buildTransaction(
+            cast(Web3TxParams, self.get_fee_oracle().get_tx_params())
         )
-        tx["nonce"] = nonce
-
-        signed_tx = signer.sign_transaction(tx)
-        tx_hash = provider.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = self._submit_transaction(cast(Dict[str, Any], tx))
 
         self.emit_transaction_event(EventStatus.SUBMITTED, tx_hash.hex())
 
-        receipt = provider.eth.wait_for_transaction_receipt(tx_hash)
+        return self.wait_for_receipt(tx_hash)
 
-        self.emit_transaction_event(EventStatus.COMPLETED, tx_hash.hex())
+    def submit_transaction(
+        self, fn: str, args: List[Any], overrides: TxParams = None
+    ) -> PendingTransaction[TxReceipt]:
+        """
+        Send a transaction and return a handle to it without waiting for it to be mined.
+
+        :param fn: name of the function you want to call on the contract
+        :param args: list of arguments to pass to the function
+        :returns: pending transaction resolved with the receipt once mined
+        """
+
+        tx_hash = self._send_transaction(fn, args, overrides)
+
+        pending = self.get_receipt_poller().track(tx_hash)
+        pending.add_done_callback(self._on_transaction_mined)
+
+        return pending
+
+    def wait_for_receipt(self, tx_hash: HexBytes) -> TxReceipt:
+        """
+        Block until a sent transaction is mined, without going through the receipt poller.
+
+        :param tx_hash: hash of the sent transaction
+        :returns: the receipt of the transaction
+        """
+
+        settings = self.get_options().transaction_settings
+        receipt = self.get_provider().eth.wait_for_transaction_receipt(
+            tx_hash,
+            timeout=settings.receipt_timeout,
+            poll_latency=settings.receipt_poll_interval,
+        )
+        self._on_receipt(tx_hash, receipt)
 
         return receipt
 
@@ -186,6 +283,114 @@ class ContractWrapper(Generic[TContractABI], ProviderHandler):
 
         return self.send_transaction("multicall", [encoded])
 
+    def submit_multi_call(self, encoded: List[str]) -> PendingTransaction[TxReceipt]:
+        """
+        Send a multicall and return a handle to it without waiting for it to be mined.
+
+        :param encoded: list of encoded function calls to execute
+        :returns: pending transaction resolved with the receipt once mined
+        """
+
+        return self.submit_transaction("multicall", [encoded])
+
+    def multi_call_batch(
+        self, encoded: List[str], max_gas: Optional[int] = None
+    ) -> List[TxReceipt]:
+        """
+        Execute encoded calls in as few multicall transactions as fit under a gas
+        ceiling and return the receipt of each call.
+
+        A batch split into several transactions is not atomic: the transactions are
+        mined on their own, so one of them can revert after the others succeeded.
+        Every call is estimated against the state of the chain before the batch, so a
+        call that only succeeds after a call packed into an earlier transaction fails
+        to estimate, and the batch is not sent at all.
+
+        :param encoded: list of encoded function calls to execute, in order
+        :param max_gas: optional gas ceiling of a single transaction, defaults to the
+            SDK multicall settings
+        :returns: receipt of the transaction that executed each call, in the same
+            order as the calls
+        :raises MultiCallBatchException: if a transaction of the batch reverted, with
+            the receipt of each call and whether it succeeded, in the same order as
+            the calls
+        """
+
+        # Every chunk is sent before waiting, so that they are mined together
+        tx_hashes = [
+            (self._send_transaction("multicall", [chunk], overrides), len(chunk))
+            for chunk, overrides in self._get_multi_call_chunks(encoded, max_gas)
+        ]
+
+        receipts: List[TxReceipt] = []
+        for tx_hash, count in tx_hashes:
+            receipts.extend([self.wait_for_receipt(tx_hash)] * count)
+
+        succeeded = [receipt["status"] == 1 for receipt in receipts]
+        if not all(succeeded):
+            raise MultiCallBatchException(receipts, succeeded)
+
+        return receipts
+
+    def submit_multi_call_batch(
+        self, encoded: List[str], max_gas: Optional[int] = None
+    ) -> List[PendingTransaction[TxReceipt]]:
+        """
+        Send encoded calls in as few multicall transactions as fit under a gas ceiling,
+        without waiting for them to be mined.
+
+        When the whole batch is estimated above the ceiling, the gas of every call is
+        estimated on its own and the calls are packed in order into transactions under
+        the ceiling, which are all sent at once with consecutive nonces. Each of them
+        can revert on its own, so the status of every receipt should be checked.
+
+        :param encoded: list of encoded function calls to execute, in order
+        :param max_gas: optional gas ceiling of a single transaction, defaults to the
+            SDK multicall settings
+        :returns: pending transaction of each call, in the same order as the calls
+        """
+
+        results: List[PendingTransaction[TxReceipt]] = []
+        for chunk, overrides in self._get_multi_call_chunks(encoded, max_gas):
+            pending = self.submit_transaction("multicall", [chunk], overrides)
+            results.extend([pending] * len(chunk))
+
+        return results
+
+    def get_nonce_manager(self) -> NonceManager:
+        """
+        Get the nonce manager of the active signer.
+
+        :returns: the nonce manager shared by every contract using the active signer
+        """
+
+        signer = self.get_signer()
+
+        if signer is None:
+            raise NoSignerException
+
+        return get_nonce_manager(self.get_provider(), signer.address)
+
+    def get_receipt_poller(self) -> ReceiptPoller:
+        """
+        Get the receipt poller tracking transactions sent through the active provider.
+
+        :returns: the receipt poller shared by every contract using the active provider
+        """
+
+        return get_receipt_poller(
+            self.get_provider(), self.get_options().transaction_settings
+        )
+
+    def get_fee_oracle(self) -> FeeOracle:
+        """
+        Get the fee oracle pricing transactions sent through the active provider.
+
+        :returns: the fee oracle shared by every contract using the active provider
+        """
+
+        return get_fee_oracle(self.get_provider(), self.get_options().gas_settings)
+
     def emit_transaction_event(self, status: EventStatus, tx_hash: str):
         self.emit(EventType.TRANSACTION, TxEvent(status, tx_hash))  # type: ignore
 
@@ -207,3 +412,241 @@ class ContractWrapper(Generic[TContractABI], ProviderHandler):
         )
 
         return signature
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _on_transaction_mined(self, pending: PendingTransaction):
+        if pending.exception() is None:
+            self._on_receipt(pending.tx_hash, pending.wait())
+
+    def _on_receipt(self, tx_hash: HexBytes, receipt: TxReceipt):
+        block_number = receipt["blockNumber"]
+        self.get_fee_oracle().observe_block(block_number)
+
+        call_cache = self.get_call_cache()
+        if call_cache is not None:
+            call_cache.observe_block(block_number)
+        self.emit_transaction_event(EventStatus.COMPLETED, tx_hash.hex())
+
+    def _get_max_multi_call_gas(self) -> int:
+        max_gas = self.get_options().multicall_settings.max_gas_per_transaction
+        if max_gas is not None:
+            return max_gas
+
+        block = self.get_provider().eth.get_block("latest")
+        return block["gasLimit"] // 2
+
+    def _get_multi_call_chunks(
+        self, encoded: List[str], max_gas: Optional[int]
+    ) -> List[Tuple[List[str], Optional[TxParams]]]:
+        if len(encoded) == 0:
+            return []
+
+        if max_gas is None:
+            max_gas = self._get_max_multi_call_gas()
+
+        return [
+            (chunk, TxParams(gas=gas) if gas is not None else None)
+            for chunk, gas in self._pack_multi_call(encoded, max_gas)
+        ]
+
+    def _estimate_multi_call(self, encoded: List[str]) -> int:
+        # Only contracts with a multicall function are packed into multicalls
+        multicall = getattr(self._contract_abi, "multicall")
+        return multicall.estimate_gas(encoded)
+
+    def _pack_multi_call(
+        self, encoded: List[str], max_gas: int
+    ) -> List[Tuple[List[str], Optional[int]]]:
+        """
+        Split encoded calls into consecutive chunks whose multicall fits under the gas
+        ceiling, with the gas limit to send each chunk with.
+        """
+
+        try:
+            gas = self._estimate_multi_call(encoded)
+            if gas <= max_gas:
+                return [(encoded, None)]
+        except Exception:
+            # A batch above the block gas limit fails to estimate at all, the calls
+            # estimated one by one below surface any genuine revert
+            if len(encoded) == 1:
+                raise
+
+        provider = self.get_provider()
+        tx = {
+            "from": self.get_signer_address(),
+            "to": self._contract_abi.contract_address,
+        }
+
+        def estimate(data: str) -> Optional[int]:
+            try:
+                gas = provider.eth.estimate_gas({**tx, "data": data})  # type: ignore
+            except Exception:
+                return None
+            # Calls are sent inside a single transaction, so its base cost is shared
+            return max(gas - TX_BASE_GAS, 0) + MULTICALL_CALL_OVERHEAD_GAS
+
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CONCURRENT_ESTIMATES, len(encoded))
+        ) as executor:
+            call_gas = list(executor.map(estimate, encoded))
+
+        # Calls depending on earlier calls of the batch fail to estimate on their own
+        if any(gas is None for gas in call_gas):
+            return self._pack_multi_call_prefixes(encoded, max_gas)
+
+        # Calls are packed in order, as later calls can depend on earlier ones
+        chunks: List[Tuple[List[str], Optional[int]]] = []
+        chunk: List[str] = []
+        chunk_gas = TX_BASE_GAS
+        for data, gas in zip(encoded, cast(List[int], call_gas)):
+            if len(chunk) > 0 and (chunk_gas + gas) * MULTICALL_GAS_MARGIN > max_gas:
+                chunks.append((chunk, int(chunk_gas * MULTICALL_GAS_MARGIN)))
+                chunk = []
+                chunk_gas = TX_BASE_GAS
+
+            chunk.append(data)
+            chunk_gas += gas
+
+        chunks.append((chunk, int(chunk_gas * MULTICALL_GAS_MARGIN)))
+        return chunks
+
+    def _pack_multi_call_prefixes(
+        self, encoded: List[str], max_gas: int
+    ) -> List[Tuple[List[str], Optional[int]]]:
+        """
+        Split encoded calls into consecutive chunks by estimating the multicall of the
+        chunk being built, so that calls are estimated after the earlier calls of their
+        chunk. The longest fitting prefix of the remaining calls is found by doubling
+        its length, then by bisecting between the last prefix that fit and the first
+        that did not.
+        """
+
+        chunks: List[Tuple[List[str], Optional[int]]] = []
+        start = 0
+        while start < len(encoded):
+            remaining = len(encoded) - start
+            error: Optional[Exception] = None
+
+            def estimate(length: int) -> Optional[int]:
+                nonlocal error
+                try:
+                    gas = self._estimate_multi_call(encoded[start : start + length])
+                except Exception as e:
+                    # A prefix above the block gas limit fails to estimate as well
+                    error = e
+                    return None
+                return gas if gas * MULTICALL_GAS_MARGIN <= max_gas else None
+
+            fit, fit_gas = 0, 0
+            too_long = None
+            length = 1
+            while too_long is None and fit < remaining:
+                gas = estimate(length)
+                if gas is None:
+                    too_long = length
+                else:
+                    fit, fit_gas = length, gas
+                    length = min(length * 2, remaining)
+
+            while too_long is not None and too_long - fit > 1:
+                length = (fit + too_long) // 2
+                gas = estimate(length)
+                if gas is None:
+                    too_long = length
+                else:
+                    fit, fit_gas = length, gas
+
+            if fit == 0:
+                # The call reverts even after the earlier calls of its chunk. Calls of
+                # earlier chunks are not executed by the estimate, so a call depending
+                # on them fails here as well
+                if error is not None:
+                    raise error
+                fit = 1
+
+            chunk = encoded[start : start + fit]
+            chunks.append(
+                (chunk, int(fit_gas * MULTICALL_GAS_MARGIN) if fit_gas > 0 else None)
+            )
+            start += fit
+
+        return chunks
+
+    def _send_transaction(
+        self, fn: str, args: List[Any], overrides: Optional[TxParams] = None
+    ) -> HexBytes:
+        """
+        Build a transaction of a contract function priced by the fee oracle, and send it
+        without waiting for it to be mined.
+
+        :param fn: name of the function you want to call on the contract
+        :param args: list of arguments to pass to the function
+        :returns: the hash of the sent transaction
+        """
+
+        signer = self.get_signer()
+
+        if signer is None:
+            raise NoSignerException
+
+        # Overrides are often reused across calls, so the gas price is set on a copy
+        overrides = copy(overrides) if overrides is not None else TxParams()
+
+        # Transactions are built with a gas price, only swapped for EIP-1559 fees once
+        # built, as the generated bindings only accept legacy transaction parameters
+        fees = None
+        if overrides.gas_price is None:
+            fees = self.get_fee_oracle().get_fees()
+            overrides.gas_price = fees.max_price
+
+        tx = getattr(self._contract_abi, fn).build_transaction(
+            *args, tx_params=overrides
+        )
+        if fees is not None:
+            tx = self.get_fee_oracle().apply(tx, fees)
+        tx_hash = self._submit_transaction(tx)
+
+        self.emit_transaction_event(EventStatus.SUBMITTED, tx_hash.hex())
+
+        return tx_hash
+
+    def _submit_transaction(self, tx: Dict[str, Any]) -> HexBytes:
+        """
+        Assign a nonce to a built transaction, sign it with the active signer and
+        send it without waiting for it to be mined.
+
+        :param tx: the built transaction to send
+        :returns: the hash of the sent transaction
+        """
+
+        provider = self.get_provider()
+        signer = self.get_signer()
+
+        if signer is None:
+            raise NoSignerException
+
+        nonce_manager = self.get_nonce_manager()
+
+        for attempt in range(MAX_NONCE_RETRIES + 1):
+            nonce = nonce_manager.next_nonce()
+            tx["nonce"] = nonce
+
+            try:
+                signed_tx = signer.sign_transaction(tx)
+                return provider.eth.send_raw_transaction(signed_tx.rawTransaction)
+            except Exception as e:
+                if is_nonce_error(e) and attempt < MAX_NONCE_RETRIES:
+                    nonce_manager.resync()
+                    continue
+
+                if is_nonce_error(e):
+                    nonce_manager.resync()
+                else:
+                    nonce_manager.release(nonce)
+                raise e
+
+        raise Exception("Failed to send transaction")
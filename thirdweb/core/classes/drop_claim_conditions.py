@@ -1,6 +1,7 @@
 from typing import List
 from thirdweb.abi.drop_erc721 import DropERC721
 from thirdweb.common.claim_conditions import (
+    prefetch_snapshot_entries,
     transform_result_to_claim_condition,
 )
 from thirdweb.core.classes.contract_metadata import ContractMetadata
@@ -69,3 +70,20 @@ class DropClaimConditions:
             )
             for c in conditions
         ]
+
+    def prefetch_proofs(self, addresses: List[str]):
+        """
+        Load the allowlist proofs of many addresses for the active claim condition
+        ahead of time, so that their claims don't fetch snapshot shards one by one.
+
+        :param addresses: addresses that are about to claim.
+        """
+
+        active = self.get_active()
+        prefetch_snapshot_entries(
+            addresses,
+            active.merkle_root_hash,
+            self._metadata.get().merkle,
+            self._contract_wrapper.get_provider(),
+            self._storage,
+        )
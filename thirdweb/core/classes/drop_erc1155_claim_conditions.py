@@ -1,6 +1,7 @@
 from typing import List
 from thirdweb.abi.drop_erc1155 import DropERC1155
 from thirdweb.common.claim_conditions import (
+    prefetch_snapshot_entries,
     transform_result_to_claim_condition,
 )
 from thirdweb.core.classes.contract_metadata import ContractMetadata
@@ -79,3 +80,21 @@ class DropERC1155ClaimConditions:
             )
             for c in conditions
         ]
+
+    def prefetch_proofs(self, token_id: int, addresses: List[str]):
+        """
+        Load the allowlist proofs of many addresses for the active claim condition
+        ahead of time, so that their claims don't fetch snapshot shards one by one.
+
+        :param token_id: token ID of the token the addresses are about to claim.
+        :param addresses: addresses that are about to claim.
+        """
+
+        active = self.get_active(token_id)
+        prefetch_snapshot_entries(
+            addresses,
+            active.merkle_root_hash,
+            self._metadata.get().merkle,
+            self._contract_wrapper.get_provider(),
+            self._storage,
+        )
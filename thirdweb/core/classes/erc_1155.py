@@ -1,12 +1,17 @@
-from typing import Generic, List, Union
+from functools import partial
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Optional, Tuple, Union, cast
 
-from web3 import Web3
 from thirdweb.abi.drop_erc1155 import DropERC1155
 from thirdweb.abi.drop_erc721 import IDropAllowlistProof
 from thirdweb.abi.token_erc1155 import TokenERC1155
 from thirdweb.common.claim_conditions import prepare_claim
 from thirdweb.common.error import NotFoundException
-from thirdweb.common.nft import fetch_token_metadata, upload_or_extract_uri, upload_or_extract_uris
+from thirdweb.common.nft import (
+    fetch_token_metadata,
+    fetch_token_metadata_batch,
+    upload_or_extract_uri,
+    upload_or_extract_uris,
+)
 from thirdweb.constants.currency import ZERO_ADDRESS
 from thirdweb.constants.role import Role, get_role_hash
 from thirdweb.core.classes.contract_metadata import ContractMetadata
@@ -14,6 +19,7 @@ from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.core.classes.base_contract import BaseContract
 from thirdweb.core.classes.drop_erc1155_claim_conditions import DropERC1155ClaimConditions
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
+from thirdweb.core.classes.lazy_mint import LazyMintPipeline
 from web3.constants import MAX_INT
 from thirdweb.types.contract import TERC1155
 from zero_ex.contract_wrappers.tx_params import TxParams
@@ -22,6 +28,8 @@ from thirdweb.types.nft import (
     EditionMetadata,
     EditionMetadataInput,
     EditionMetadataOwner,
+    LazyMintProgress,
+    LazyMintSettings,
     NFTMetadata,
     NFTMetadataInput,
     QueryAllParams,
@@ -119,7 +127,7 @@ class ERC1155(Generic[TERC1155], BaseContract[TERC1155]):
         """
 
         max_id = min(query_params.start + query_params.count, self.get_total_count())
-        return [self.get(token_id) for token_id in range(query_params.start, max_id)]
+        return self._get_batch(list(range(query_params.start, max_id)))
 
     def get_total_count(self) -> int:
         """
@@ -159,8 +167,7 @@ class ERC1155(Generic[TERC1155], BaseContract[TERC1155]):
         )
 
         metadatas = []
-        for index, balance in enumerate(balances):
-            metadata = self.get(index)
+        for metadata, balance in zip(self._get_batch(list(range(max_id))), balances):
             metadatas.append(
                 EditionMetadataOwner(metadata.metadata, metadata.supply, owner, balance)
             )
@@ -554,6 +561,8 @@ class ERC1155(Generic[TERC1155], BaseContract[TERC1155]):
         :param to: wallet address to mint the NFTs to
         :param metadatas_with_supply: list of EditionMetadataInput for the NFTs to mint
         :returns: receipts, ids, and metadatas of the mint
+        :raises MultiCallBatchException: if the mints were split into several
+            transactions and some of them reverted, with whether each NFT was minted
         """
 
         metadatas = [a.metadata for a in metadatas_with_supply]
@@ -569,21 +578,26 @@ class ERC1155(Generic[TERC1155], BaseContract[TERC1155]):
                 )
             )
 
-        receipt = self._token.multi_call(encoded)
-        events = self._token.get_events("TokensMinted", receipt)
+        receipts = self._token.multi_call_batch(encoded)
+        events = self._token.get_batch_events("TokensMinted", receipts)
 
-        if len(events) == 0 and len(events) < len(metadatas):
+        if len(events) == 0 or len(events) < len(metadatas):
             raise Exception("No TokensMinted event found, minting failed")
 
         results = []
-        for event in events:
+        for receipt, event in events:
             id = event.get("args").get("tokenIdMinted")  # type: ignore
-            results.append(TxResultWithId(receipt, id=id, data=lambda: self.get(id)))
+            results.append(
+                TxResultWithId(receipt, id=id, data=partial(self.get, id))
+            )
 
         return results
     
     def create_batch(
-        self, metadatas: List[NFTMetadataInput]
+        self,
+        metadatas: Iterable[NFTMetadataInput],
+        settings: LazyMintSettings = LazyMintSettings(),
+        on_progress: Optional[Callable[[LazyMintProgress], None]] = None,
     ) -> List[TxResultWithId[NFTMetadata]]:
         """
         Lazy mint NFTs
@@ -617,45 +631,52 @@ class ERC1155(Generic[TERC1155], BaseContract[TERC1155]):
         ```
 
         :extension: ERC1155LazyMintableV2
-        :param metadatas: List of NFT metadata inputs.
+        :param metadatas: List or iterator of NFT metadata inputs.
+        :param settings: Optional settings of the batch, to tune chunking and resume
+            an interrupted batch from a checkpoint.
+        :param on_progress: Optional function called with the progress of the batch.
         :return: List of tx results with ids for created NFTs.
         """
 
-        start_file_number = (
-            self._drop._contract_abi.next_token_id_to_mint.call()
-        )
-        batch = self._storage.upload_metadata_batch(
-            [metadata.to_json() for metadata in metadatas],
-            start_file_number,
-            self._drop._contract_abi.contract_address,
-            self._drop.get_signer_address(),
-        )
-        base_uri = batch.base_uri
+        return list(self.create_batch_stream(metadatas, settings, on_progress))
 
-        receipt = self._drop.send_transaction(
-            "lazy_mint",
-            [
-                len(batch.metadata_uris),
-                base_uri if base_uri.endswith("/") else base_uri + "/",
-                Web3.toBytes(text=""),
-            ],
+    def create_batch_stream(
+        self,
+        metadatas: Iterable[NFTMetadataInput],
+        settings: LazyMintSettings = LazyMintSettings(),
+        on_progress: Optional[Callable[[LazyMintProgress], None]] = None,
+    ) -> Iterator[TxResultWithId[NFTMetadata]]:
+        """
+        Lazy mint a stream of NFTs in chunks
+
+        The metadata is read, uploaded and lazy minted chunk by chunk, so collections
+        of any size can be lazy minted without holding them in memory.
+
+        ```python
+        from thirdweb.types.nft import LazyMintSettings, NFTMetadataInput
+
+        metadatas = (
+            NFTMetadataInput.from_json({"name": f"NFT #{i}"}) for i in range(50000)
         )
+        settings = LazyMintSettings(checkpoint_path="lazy_mint.json")
 
-        events = self._drop.get_events("TokensLazyMinted", receipt)
-        start_index = events[0].get("args").get("startTokenId")  # type: ignore
-        ending_index = events[0].get("args").get("endTokenId")  # type: ignore
-        results = []
+        for tx in contract.erc1155.create_batch_stream(metadatas, settings, print):
+            print(tx.id)
+        ```
 
-        for id in range(start_index, ending_index + 1):
-            results.append(
-                TxResultWithId(
-                    receipt,
-                    id=id,
-                    data=lambda: self._get_token_metadata(id),
-                )
-            )
+        :extension: ERC1155LazyMintableV2
+        :param metadatas: Iterable of NFT metadata inputs, consumed lazily.
+        :param settings: Optional settings of the batch, to tune chunking and resume
+            an interrupted batch from a checkpoint.
+        :param on_progress: Optional function called with the progress of the batch.
+        :return: Iterator of tx results with ids for created NFTs, yielded as the lazy
+            mint transaction of each chunk is mined.
+        """
 
-        return results
+        pipeline = LazyMintPipeline(
+            self._drop, self._storage, self._get_token_metadata, settings
+        )
+        return pipeline.run(metadatas, on_progress)
 
     def claim_to(
         self,
@@ -751,6 +772,34 @@ class ERC1155(Generic[TERC1155], BaseContract[TERC1155]):
 
         return fetch_token_metadata(token_id, token_uri, self._storage)
 
+    def _get_batch(self, token_ids: List[int]) -> List[EditionMetadata]:
+        calls: List[Tuple[str, List[Any]]] = []
+        for token_id in token_ids:
+            calls.append(("totalSupply", [token_id]))
+            calls.append(("uri", [token_id]))
+
+        results = self._contract_wrapper.multi_read(calls, allow_failure=True)
+        supplies = [
+            supply.data if supply.success else 0 for supply in results[0::2]
+        ]
+        token_uris = [
+            token_uri.data if token_uri.success else None
+            for token_uri in results[1::2]
+        ]
+
+        for token_id, token_uri in zip(token_ids, token_uris):
+            if not token_uri:
+                raise NotFoundException(str(token_id))
+
+        metadatas = fetch_token_metadata_batch(
+            token_ids, cast(List[str], token_uris), self._storage
+        )
+
+        return [
+            EditionMetadata(cast(NFTMetadata, metadata), supply)
+            for metadata, supply in zip(metadatas, supplies)
+        ]
+
     def _prepare_claim(
         self,
         token_id: int,
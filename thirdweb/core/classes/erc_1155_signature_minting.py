@@ -96,8 +96,10 @@ class ERC1155SignatureMinting:
                 interface.encodeABI("mintWithSignature", [message, signature])
             )
 
-        receipt = self._contract_wrapper.multi_call(encoded)
-        events = self._contract_wrapper.get_events("TokensMintedWithSignature", receipt)
+        receipts = self._contract_wrapper.multi_call_batch(encoded)
+        events = self._contract_wrapper.get_batch_events(
+            "TokensMintedWithSignature", receipts
+        )
 
         if len(events) == 0:
             raise Exception("No MintWithSignature event found")
@@ -106,7 +108,7 @@ class ERC1155SignatureMinting:
             TxResultWithId(
                 receipt, data=lambda: None, id=event.get("args").get("tokenIdMinted")  # type: ignore
             )
-            for event in events
+            for receipt, event in events
         ]
 
     def verify(self, signed_payload: SignedPayload1155) -> bool:
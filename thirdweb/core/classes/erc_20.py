@@ -10,6 +10,7 @@ from thirdweb.constants.role import Role, get_role_hash
 from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.core.classes.base_contract import BaseContract
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
+from thirdweb.core.classes.receipt_poller import PendingTransaction
 from thirdweb.types.currency import (
     Currency,
     CurrencyValue,
@@ -205,7 +206,7 @@ class ERC20(BaseContract[TokenERC20]):
             "mint_to", [to, amount_with_decimals]
         )
 
-    def mint_batch_to(self, args: List[TokenAmount]) -> TxReceipt:
+    def mint_batch_to(self, args: List[TokenAmount]) -> List[TxReceipt]:
         """
         Mint tokens to many wallets
 
@@ -222,7 +223,7 @@ class ERC20(BaseContract[TokenERC20]):
         ```
 
         :param args: list of wallet addresses and amounts to mint
-        :returns: transaction receipt of the mint
+        :returns: transaction receipt of each mint, in the same order as the args
         """
 
         encoded = []
@@ -234,7 +235,7 @@ class ERC20(BaseContract[TokenERC20]):
                     [arg.to_address, parse_units(arg.amount, self.get().decimals)],
                 )
             )
-        return self._contract_wrapper.multi_call(encoded)
+        return self._contract_wrapper.multi_call_batch(encoded)
 
     def transfer(self, to: str, amount: Price) -> TxReceipt:
         """
@@ -261,6 +262,30 @@ class ERC20(BaseContract[TokenERC20]):
             "transfer", [to, amount_with_decimals]
         )
 
+    def submit_transfer(
+        self, to: str, amount: Price
+    ) -> PendingTransaction[TxReceipt]:
+        """
+        Transfer tokens without waiting for the transaction to be mined
+
+        ```python
+        pending = contract.erc20.submit_transfer("0x...", 0.1)
+        pending.add_done_callback(lambda tx: print("Transferred", tx.tx_hash.hex()))
+
+        receipt = pending.wait()
+        ```
+
+        :extension: ERC20
+        :param to: wallet address to transfer the tokens to
+        :param amount: amount of tokens to transfer
+        :returns: pending transaction resolved with the receipt of the transfer
+        """
+
+        amount_with_decimals = parse_units(amount, self.get().decimals)
+        return self._contract_wrapper.submit_transaction(
+            "transfer", [to, amount_with_decimals]
+        )
+
     def transfer_from(self, fr: str, to: str, amount: Price) -> TxReceipt:
         """
         Transfer tokens from a specific wallet
@@ -311,7 +336,7 @@ class ERC20(BaseContract[TokenERC20]):
             "approve", [spender, amount_with_decimals]
         )
 
-    def transfer_batch(self, args: List[TokenAmount]):
+    def transfer_batch(self, args: List[TokenAmount]) -> List[TxReceipt]:
         """
         Transfer tokens to many wallets
 
@@ -327,7 +352,7 @@ class ERC20(BaseContract[TokenERC20]):
         ```
 
         :param args: list of token amounts and addressed to transfer to
-        :returns: transaction receipt of the transfers
+        :returns: transaction receipt of each transfer, in the same order as the args
         """
 
         encoded = []
@@ -339,7 +364,7 @@ class ERC20(BaseContract[TokenERC20]):
                 interface.encodeABI("transfer", [arg.to_address, amount_with_decimals])
             )
 
-        return self._contract_wrapper.multi_call(encoded)
+        return self._contract_wrapper.multi_call_batch(encoded)
 
     def burn(self, amount: Price) -> TxReceipt:
         """
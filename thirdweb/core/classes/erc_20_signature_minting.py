@@ -2,6 +2,7 @@ from typing import Any, Dict, List
 
 from thirdweb.abi.token_erc20 import ITokenERC20MintRequest
 from thirdweb.common.currency import (
+    fetch_currency_metadata,
     normalize_price_value,
     parse_units,
     set_erc20_allowance,
@@ -64,12 +65,12 @@ class ERC20SignatureMinting:
             "mint_with_signature", [message, signature], overrides
         )
 
-    def mint_batch(self, signed_payloads: List[SignedPayload20]) -> TxReceipt:
+    def mint_batch(self, signed_payloads: List[SignedPayload20]) -> List[TxReceipt]:
         """
         Mint a batch of tokens with the given payloads
 
         :param signed_payloads: Signed payloads
-        :return: transaction results with the token IDs of the minted tokens
+        :return: transaction receipt of each mint, in the same order as the payloads
         """
         contract_payloads = []
         for payload in signed_payloads:
@@ -91,7 +92,7 @@ class ERC20SignatureMinting:
                 interface.encodeABI("mintWithSignature", [message, signature])
             )
 
-        return self._contract_wrapper.multi_call(encoded)
+        return self._contract_wrapper.multi_call_batch(encoded)
 
     def verify(self, signed_payload: SignedPayload20) -> bool:
         """
@@ -182,7 +183,11 @@ class ERC20SignatureMinting:
         )
 
         amount_with_decimals = parse_units(
-            mint_request.quantity, self._contract_wrapper._contract_abi.decimals.call()
+            mint_request.quantity,
+            fetch_currency_metadata(
+                self._contract_wrapper.get_provider(),
+                self._contract_wrapper._contract_abi.contract_address,
+            ).decimals,
         )
 
         return ITokenERC20MintRequest(
@@ -4,6 +4,7 @@ from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.core.classes.base_contract import BaseContract
 from thirdweb.core.classes.erc_20 import ERC20
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
+from thirdweb.core.classes.receipt_poller import PendingTransaction
 from thirdweb.types.currency import (
     Currency,
     CurrencyValue,
@@ -145,6 +146,27 @@ class ERC20Standard(BaseContract[TokenERC20]):
 
         return self._erc20.transfer(to, amount)
 
+    def submit_transfer(
+        self, to: str, amount: Price
+    ) -> PendingTransaction[TxReceipt]:
+        """
+        Transfer a specified amount of tokens from the connected wallet to a specified address,
+        without waiting for the transaction to be mined.
+
+        ```python
+        pending = contract.submit_transfer("0x...", 0.1)
+        pending.add_done_callback(lambda tx: print("Transferred", tx.tx_hash.hex()))
+
+        receipt = pending.wait()
+        ```
+
+        :param to: wallet address to transfer the tokens to
+        :param amount: amount of tokens to transfer
+        :returns: pending transaction resolved with the receipt of the transfer
+        """
+
+        return self._erc20.submit_transfer(to, amount)
+
     def transfer_from(self, fr: str, to: str, amount: Price) -> TxReceipt:
         """
         Transfer a specified amount of tokens from one specified address to another.
@@ -188,7 +210,7 @@ class ERC20Standard(BaseContract[TokenERC20]):
 
         return self._erc20.set_allowance(spender, amount)
 
-    def transfer_batch(self, args: List[TokenAmount]):
+    def transfer_batch(self, args: List[TokenAmount]) -> List[TxReceipt]:
         """
         Transfer tokens from the connected wallet to many wallets.
 
@@ -204,7 +226,7 @@ class ERC20Standard(BaseContract[TokenERC20]):
         ```
 
         :param args: list of token amounts and addressed to transfer to
-        :returns: transaction receipt of the transfers
+        :returns: transaction receipt of each transfer, in the same order as the args
         """
 
         return self._erc20.transfer_batch(args)
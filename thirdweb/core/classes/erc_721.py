@@ -1,11 +1,16 @@
-from typing import Generic, List, Union
+from functools import partial
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Optional, Tuple, Union, cast
 
-from web3 import Web3
 from thirdweb.abi.drop_erc721 import DropERC721, IDropAllowlistProof
 from thirdweb.abi.token_erc721 import TokenERC721
 from thirdweb.common.claim_conditions import prepare_claim
 from thirdweb.common.error import NotFoundException
-from thirdweb.common.nft import fetch_token_metadata, upload_or_extract_uri, upload_or_extract_uris
+from thirdweb.common.nft import (
+    fetch_token_metadata,
+    fetch_token_metadata_batch,
+    upload_or_extract_uri,
+    upload_or_extract_uris,
+)
 from thirdweb.constants.currency import ZERO_ADDRESS
 from thirdweb.constants.role import Role, get_role_hash
 from thirdweb.core.classes.base_contract import BaseContract
@@ -13,10 +18,19 @@ from thirdweb.core.classes.contract_metadata import ContractMetadata
 from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.core.classes.drop_claim_conditions import DropClaimConditions
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
+from thirdweb.core.classes.lazy_mint import LazyMintPipeline
+from thirdweb.core.classes.receipt_poller import PendingTransaction
 from thirdweb.types.contract import TERC721
 from zero_ex.contract_wrappers.tx_params import TxParams
 from thirdweb.types.contracts.claim_conditions import ClaimVerification
-from thirdweb.types.nft import NFTMetadata, NFTMetadataInput, NFTMetadataOwner, QueryAllParams
+from thirdweb.types.nft import (
+    LazyMintProgress,
+    LazyMintSettings,
+    NFTMetadata,
+    NFTMetadataInput,
+    NFTMetadataOwner,
+    QueryAllParams,
+)
 from web3.eth import TxReceipt
 from thirdweb.types.settings.metadata import NFTDropContractMetadata
 
@@ -106,17 +120,49 @@ class ERC721(Generic[TERC721], BaseContract[TERC721]):
         """
 
         max_id = min(query_params.start + query_params.count, self.get_total_count())
+        return self.get_batch(
+            list(range(query_params.start, max_id)), allow_failure=True
+        )
+    
+    def get_batch(
+        self, token_ids: List[int], allow_failure: bool = False
+    ) -> List[NFTMetadataOwner]:
+        """
+        Get the metadata and owners of several NFTs at once
+
+        ```python
+        nfts = contract.erc721.get_batch([0, 1, 2])
+        print(nfts)
+        ```
+
+        :extension: ERC721
+        :param token_ids: token IDs of the NFTs to get
+        :param allow_failure: skip the tokens that do not exist instead of raising
+        :return: the metadata of the tokens and their owners, in order
+        """
 
-        nfts = []
-        for token_id in range(query_params.start, max_id):
-            try:
-                nft = self.get(token_id)
-                nfts.append(nft)
-            except:
-                pass
+        owners_and_token_uris = self._get_owners_and_token_uris(token_ids)
+
+        found = []
+        for token_id, (owner, token_uri) in zip(token_ids, owners_and_token_uris):
+            if token_uri:
+                found.append((token_id, owner, token_uri))
+            elif not allow_failure:
+                raise NotFoundException(str(token_id))
+
+        metadatas = fetch_token_metadata_batch(
+            [token_id for token_id, _, _ in found],
+            [token_uri for _, _, token_uri in found],
+            self._storage,
+            allow_failure,
+        )
+
+        return [
+            NFTMetadataOwner(metadata, owner)
+            for (_, owner, _), metadata in zip(found, metadatas)
+            if metadata is not None
+        ]
 
-        return nfts
-    
     def get_all_claimed(
         self, query_params: QueryAllParams = QueryAllParams()
     ) -> List[NFTMetadataOwner]:
@@ -137,7 +183,7 @@ class ERC721(Generic[TERC721], BaseContract[TERC721]):
             query_params.start + query_params.count,
         )
 
-        return [self.get(token_id) for token_id in range(query_params.start, max_id)]
+        return self.get_batch(list(range(query_params.start, max_id)))
 
     def get_all_unclaimed(
         self, query_params: QueryAllParams = QueryAllParams()
@@ -160,10 +206,19 @@ class ERC721(Generic[TERC721], BaseContract[TERC721]):
         )
         unminted_id = self._drop._contract_abi.next_token_id_to_claim.call()
 
-        return [
-            self._get_token_metadata(unminted_id + i)
-            for i in range(max_id - unminted_id)
-        ]
+        token_ids = [unminted_id + i for i in range(max_id - unminted_id)]
+        token_uris = self._get_token_uris(token_ids)
+
+        for token_id, token_uri in zip(token_ids, token_uris):
+            if not token_uri:
+                raise NotFoundException(str(token_id))
+
+        return cast(
+            List[NFTMetadata],
+            fetch_token_metadata_batch(
+                token_ids, cast(List[str], token_uris), self._storage
+            ),
+        )
 
     def total_claimed_supply(self) -> int:
         """
@@ -459,14 +514,35 @@ class ERC721(Generic[TERC721], BaseContract[TERC721]):
 
         uri = upload_or_extract_uri(metadata, self._storage)
         receipt = self._token.send_transaction("mint_to", [to, uri])
-        events = self._token.get_events("Transfer", receipt)
+        return self._get_minted_token(receipt)
 
-        if len(events) == 0:
-            raise Exception("No Transfer event found")
+    def submit_mint_to(
+        self, to: str, metadata: Union[NFTMetadataInput, str]
+    ) -> PendingTransaction[TxResultWithId[NFTMetadataOwner]]:
+        """
+        Mint an NFT to a specific wallet without waiting for the transaction to be mined
 
-        id = events[0].get("args").get("tokenId")  # type: ignore
+        ```python
+        from thirdweb.types.nft import NFTMetadataInput
 
-        return TxResultWithId(receipt, id=id, data=lambda: self.get(id))
+        metadata = NFTMetadataInput.from_json({"name": "Cool NFT"})
+
+        pending = contract.erc721.submit_mint_to("{{wallet_address}}", metadata)
+        pending.add_done_callback(lambda tx: print("Minted", tx.tx_hash.hex()))
+
+        tx = pending.wait()
+        token_id = tx.id
+        ```
+
+        :extension: ERC721Mintable
+        :param to: wallet address to mint the NFT to
+        :param metadata: metadata of the NFT to mint
+        :returns: pending transaction resolved with the receipt, id, and metadata for the mint
+        """
+
+        uri = upload_or_extract_uri(metadata, self._storage)
+        pending = self._token.submit_transaction("mint_to", [to, uri])
+        return pending.map(self._get_minted_token)
 
     def mint_batch(
         self, metadatas: List[Union[NFTMetadataInput, str]]
@@ -541,6 +617,8 @@ class ERC721(Generic[TERC721], BaseContract[TERC721]):
         :param to: wallet address to mint the NFTs to
         :param metadatas: list of metadata of the NFTs to mint
         :returns: receipts, ids, and metadatas for each mint
+        :raises MultiCallBatchException: if the mints were split into several
+            transactions and some of them reverted, with whether each NFT was minted
         """
 
         uris = upload_or_extract_uris(metadatas, self._storage)
@@ -550,21 +628,26 @@ class ERC721(Generic[TERC721], BaseContract[TERC721]):
         for uri in uris:
             encoded.append(interface.encodeABI("mintTo", [to, uri]))
 
-        receipt = self._token.multi_call(encoded)
-        events = self._token.get_events("TokensMinted", receipt)
+        receipts = self._token.multi_call_batch(encoded)
+        events = self._token.get_batch_events("TokensMinted", receipts)
 
         if len(events) == 0 or len(events) < len(metadatas):
             raise Exception("No TokensMinted event found, minting failed")
 
         results = []
-        for event in events:
+        for receipt, event in events:
             id = event.get("args").get("tokenIdMinted")  # type: ignore
-            results.append(TxResultWithId(receipt, id=id, data=lambda: self.get(id)))
+            results.append(
+                TxResultWithId(receipt, id=id, data=partial(self.get, id))
+            )
 
         return results
 
     def create_batch(
-        self, metadatas: List[NFTMetadataInput]
+        self,
+        metadatas: Iterable[NFTMetadataInput],
+        settings: LazyMintSettings = LazyMintSettings(),
+        on_progress: Optional[Callable[[LazyMintProgress], None]] = None,
     ) -> List[TxResultWithId[NFTMetadata]]:
         """
         Lazy mint NFTs
@@ -592,45 +675,52 @@ class ERC721(Generic[TERC721], BaseContract[TERC721]):
         ```
 
         :extension: ERC721LazyMintable
-        :param metadatas: List of NFT metadata inputs.
+        :param metadatas: List or iterator of NFT metadata inputs.
+        :param settings: Optional settings of the batch, to tune chunking and resume
+            an interrupted batch from a checkpoint.
+        :param on_progress: Optional function called with the progress of the batch.
         :return: List of tx results with ids for created NFTs.
         """
 
-        start_file_number = (
-            self._drop._contract_abi.next_token_id_to_mint.call()
-        )
-        batch = self._storage.upload_metadata_batch(
-            [metadata.to_json() for metadata in metadatas],
-            start_file_number,
-            self._drop._contract_abi.contract_address,
-            self._drop.get_signer_address(),
-        )
-        base_uri = batch.base_uri
+        return list(self.create_batch_stream(metadatas, settings, on_progress))
 
-        receipt = self._drop.send_transaction(
-            "lazy_mint",
-            [
-                len(batch.metadata_uris),
-                base_uri if base_uri.endswith("/") else base_uri + "/",
-                Web3.toBytes(text=""),
-            ],
+    def create_batch_stream(
+        self,
+        metadatas: Iterable[NFTMetadataInput],
+        settings: LazyMintSettings = LazyMintSettings(),
+        on_progress: Optional[Callable[[LazyMintProgress], None]] = None,
+    ) -> Iterator[TxResultWithId[NFTMetadata]]:
+        """
+        Lazy mint a stream of NFTs in chunks
+
+        The metadata is read, uploaded and lazy minted chunk by chunk, so collections
+        of any size can be lazy minted without holding them in memory.
+
+        ```python
+        from thirdweb.types.nft import LazyMintSettings, NFTMetadataInput
+
+        metadatas = (
+            NFTMetadataInput.from_json({"name": f"NFT #{i}"}) for i in range(50000)
         )
+        settings = LazyMintSettings(checkpoint_path="lazy_mint.json")
 
-        events = self._drop.get_events("TokensLazyMinted", receipt)
-        start_index = events[0].get("args").get("startTokenId")  # type: ignore
-        ending_index = events[0].get("args").get("endTokenId")  # type: ignore
-        results = []
+        for tx in contract.erc721.create_batch_stream(metadatas, settings, print):
+            print(tx.id)
+        ```
 
-        for id in range(start_index, ending_index + 1):
-            results.append(
-                TxResultWithId(
-                    receipt,
-                    id=id,
-                    data=lambda: self._get_token_metadata(id),
-                )
-            )
+        :extension: ERC721LazyMintable
+        :param metadatas: Iterable of NFT metadata inputs, consumed lazily.
+        :param settings: Optional settings of the batch, to tune chunking and resume
+            an interrupted batch from a checkpoint.
+        :param on_progress: Optional function called with the progress of the batch.
+        :return: Iterator of tx results with ids for created NFTs, yielded as the lazy
+            mint transaction of each chunk is mined.
+        """
 
-        return results
+        pipeline = LazyMintPipeline(
+            self._drop, self._storage, self._get_token_metadata, settings
+        )
+        return pipeline.run(metadatas, on_progress)
 
     def claim_to(
         self,
@@ -734,7 +824,42 @@ class ERC721(Generic[TERC721], BaseContract[TERC721]):
             raise NotFoundException(str(token_id))
 
         return fetch_token_metadata(token_id, token_uri, self._storage)
-    
+
+    def _get_minted_token(self, receipt: TxReceipt) -> TxResultWithId[NFTMetadataOwner]:
+        events = self._token.get_events("Transfer", receipt)
+
+        if len(events) == 0:
+            raise Exception("No Transfer event found")
+
+        id = events[0].get("args").get("tokenId")  # type: ignore
+
+        return TxResultWithId(receipt, id=id, data=lambda: self.get(id))
+
+    def _get_owners_and_token_uris(
+        self, token_ids: List[int]
+    ) -> List[Tuple[str, Optional[str]]]:
+        calls: List[Tuple[str, List[Any]]] = []
+        for token_id in token_ids:
+            calls.append(("ownerOf", [token_id]))
+            calls.append(("tokenURI", [token_id]))
+
+        results = self._contract_wrapper.multi_read(calls, allow_failure=True)
+
+        return [
+            (
+                owner.data if owner.success else ZERO_ADDRESS,
+                token_uri.data if token_uri.success else None,
+            )
+            for owner, token_uri in zip(results[0::2], results[1::2])
+        ]
+
+    def _get_token_uris(self, token_ids: List[int]) -> List[Optional[str]]:
+        results = self._contract_wrapper.multi_read(
+            [("tokenURI", [token_id]) for token_id in token_ids], allow_failure=True
+        )
+
+        return [result.data if result.success else None for result in results]
+
     def _prepare_claim(
         self,
         quantity: int,
@@ -0,0 +1,258 @@
+import json
+import sqlite3
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Type
+
+from requests.exceptions import Timeout
+from web3 import Web3
+from web3.contract import ContractEvent
+from web3.datastructures import AttributeDict
+from web3.types import BlockIdentifier
+
+from thirdweb.core.helpers.rpc import get_chain_id
+from thirdweb.types.events import EventBackfillSettings
+
+# Fragments of the errors nodes return when a getLogs query spans too many blocks or
+# matches too many logs, which are fixed by querying a smaller range
+RANGE_ERROR_MESSAGES = [
+    "more than",
+    "too many",
+    "too large",
+    "block range",
+    "response size",
+    "limit exceeded",
+    "timeout",
+    "timed out",
+]
+
+# Error code used by several nodes for a getLogs query that exceeds their limits
+RANGE_ERROR_CODE = -32005
+
+
+class _Window:
+    start: int
+    end: int
+    future: "Future[Sequence[AttributeDict]]"
+    logs: Optional[Sequence[AttributeDict]]
+
+    def __init__(
+        self, start: int, end: int, future: "Future[Sequence[AttributeDict]]"
+    ):
+        self.start = start
+        self.end = end
+        self.future = future
+        self.logs = None
+
+
+class EventBackfill:
+    """
+    Fetches the logs of an event over a block range in windows, several at a time, and
+    yields them in block order.
+
+    Windows that return too many results are split in two and the window size adapts
+    to how dense the logs are, shrinking when a query fails and growing when windows
+    come back sparse. When a checkpoint path is set, the next block to fetch is saved
+    after every window, so an interrupted backfill resumes from that block.
+    """
+
+    _provider: Web3
+    _event: Type[ContractEvent]
+    _filters: Dict[str, Any]
+    _settings: EventBackfillSettings
+    _block_range: int
+    _lock: Lock
+    _db: Optional[sqlite3.Connection]
+
+    def __init__(
+        self,
+        provider: Web3,
+        event: Type[ContractEvent],
+        filters: Dict[str, Any],
+        settings: EventBackfillSettings = EventBackfillSettings(),
+    ):
+        """
+        Initialize the backfill.
+
+        :param provider: provider to query the logs with
+        :param event: contract event to get the logs of
+        :param filters: values of indexed event arguments to filter the logs on
+        :param settings: window sizes, concurrency and checkpoint settings
+        """
+
+        self._provider = provider
+        self._event = event
+        self._filters = filters
+        self._settings = settings
+        self._block_range = self._clamp(settings.block_range)
+        self._lock = Lock()
+
+        self._db = None
+        if settings.checkpoint_path is not None:
+            self._db = sqlite3.connect(settings.checkpoint_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints "
+                "(key TEXT PRIMARY KEY, next_block INTEGER NOT NULL)"
+            )
+            self._db.commit()
+
+    def run(
+        self,
+        from_block: Optional[BlockIdentifier] = "earliest",
+        to_block: Optional[BlockIdentifier] = "latest",
+    ) -> Iterator[AttributeDict]:
+        """
+        Fetch the logs in a block range, resuming from the checkpoint if there is one.
+
+        Logs of a window are only checkpointed once all of them were consumed, so logs
+        of a window that was interrupted part way are yielded again on resume.
+
+        :param from_block: first block of the range, defaults to the earliest block
+        :param to_block: last block of the range, defaults to the latest block
+        :returns: generator of the decoded logs, in block order
+        """
+
+        start = self._resolve_block(from_block, "earliest")
+        end = self._resolve_block(to_block, "latest")
+
+        checkpoint = self._load_checkpoint()
+        if checkpoint is not None:
+            start = max(start, checkpoint)
+
+        max_workers = max(self._settings.max_workers, 1)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        windows: List[_Window] = []
+        next_start = start
+
+        try:
+            while len(windows) > 0 or next_start <= end:
+                # Completed windows wait for the ones before them, so the number of
+                # windows held at once is bounded as well as the number in flight
+                while next_start <= end and len(windows) < 2 * max_workers:
+                    window_end = min(next_start + self._block_range - 1, end)
+                    windows.append(self._submit(executor, next_start, window_end))
+                    next_start = window_end + 1
+
+                wait(
+                    [window.future for window in windows if window.logs is None],
+                    return_when=FIRST_COMPLETED,
+                )
+                windows = self._collect(executor, windows)
+
+                while len(windows) > 0 and windows[0].logs is not None:
+                    window = windows.pop(0)
+                    yield from window.logs  # type: ignore
+                    self._save_checkpoint(window.end + 1)
+        finally:
+            for window in windows:
+                window.future.cancel()
+            executor.shutdown(wait=False)
+
+    def reset(self):
+        """
+        Delete the checkpoint of the backfill, so that the next run starts over.
+        """
+
+        if self._db is None:
+            return
+
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM checkpoints WHERE key = ?", (self._get_checkpoint_key(),)
+            )
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _clamp(self, block_range: int) -> int:
+        min_block_range = max(self._settings.min_block_range, 1)
+        return min(max(block_range, min_block_range), self._settings.max_block_range)
+
+    def _resolve_block(
+        self, block: Optional[BlockIdentifier], default: BlockIdentifier
+    ) -> int:
+        block = default if block is None else block
+        if isinstance(block, int):
+            return block
+        if block == "earliest":
+            return 0
+        return self._provider.eth.get_block(block)["number"]
+
+    def _submit(self, executor: ThreadPoolExecutor, start: int, end: int) -> _Window:
+        future = executor.submit(self._event.getLogs, self._filters, start, end)
+        return _Window(start, end, future)
+
+    def _collect(
+        self, executor: ThreadPoolExecutor, windows: List[_Window]
+    ) -> List[_Window]:
+        collected: List[_Window] = []
+        for window in windows:
+            if window.logs is not None or not window.future.done():
+                collected.append(window)
+                continue
+
+            size = window.end - window.start + 1
+            try:
+                window.logs = window.future.result()
+            except Exception as e:
+                if not self._is_range_error(e) or size <= self._clamp(1):
+                    raise e
+
+                self._block_range = self._clamp(min(self._block_range, size // 2))
+                middle = window.start + size // 2 - 1
+                collected.append(self._submit(executor, window.start, middle))
+                collected.append(self._submit(executor, middle + 1, window.end))
+                continue
+
+            count = len(window.logs)
+            if count > self._settings.target_results:
+                self._block_range = self._clamp(size // 2)
+            elif count < self._settings.target_results // 2 and size >= self._block_range:
+                self._block_range = self._clamp(self._block_range * 2)
+            collected.append(window)
+
+        return collected
+
+    def _is_range_error(self, e: Exception) -> bool:
+        if isinstance(e, Timeout):
+            return True
+
+        message = str(e)
+        if isinstance(e, ValueError) and len(e.args) > 0 and isinstance(e.args[0], dict):
+            if e.args[0].get("code") == RANGE_ERROR_CODE:
+                return True
+            message = str(e.args[0].get("message", ""))
+
+        return any(fragment in message.lower() for fragment in RANGE_ERROR_MESSAGES)
+
+    def _get_checkpoint_key(self) -> str:
+        return ":".join(
+            [
+                str(get_chain_id(self._provider)),
+                str(self._event.address).lower(),
+                str(self._event.event_name),
+                json.dumps(self._filters, sort_keys=True, default=str),
+            ]
+        )
+
+    def _load_checkpoint(self) -> Optional[int]:
+        if self._db is None:
+            return None
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT next_block FROM checkpoints WHERE key = ?",
+                (self._get_checkpoint_key(),),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def _save_checkpoint(self, next_block: int):
+        if self._db is None:
+            return
+
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO checkpoints (key, next_block) VALUES (?, ?)",
+                (self._get_checkpoint_key(), next_block),
+            )
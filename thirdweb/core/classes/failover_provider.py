@@ -0,0 +1,287 @@
+import json
+import time
+from collections import deque
+from threading import Lock, Timer
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from eth_typing import URI
+from requests.exceptions import ReadTimeout, RequestException
+from web3._utils.request import make_post_request
+
+from thirdweb.core.classes.batch_provider import BatchHTTPProvider, is_rate_limited
+from thirdweb.types.sdk import RpcBatchSettings, RpcFailoverSettings
+
+# Methods that must not be sent again once an endpoint may have received them
+WRITE_METHODS = {"eth_sendRawTransaction", "eth_sendTransaction"}
+
+# How much more than its latency an endpoint failing every request is penalized by
+ERROR_RATE_PENALTY = 10
+
+
+class RpcEndpoint:
+    """
+    Health of a single JSON-RPC endpoint, measured from the requests sent to it.
+    """
+
+    uri: str
+    latency: Optional[float]
+    outcomes: Deque[bool]
+    consecutive_failures: int
+    last_used: float
+    ejected_at: Optional[float]
+    cooldown: float
+    supports_batch: bool
+
+    def __init__(self, uri: str, window_size: int, cooldown: float):
+        self.uri = uri
+        self.latency = None
+        self.outcomes = deque(maxlen=max(window_size, 1))
+        self.consecutive_failures = 0
+        self.last_used = time.monotonic()
+        self.ejected_at = None
+        self.cooldown = cooldown
+        self.supports_batch = True
+
+    @property
+    def error_rate(self) -> float:
+        if len(self.outcomes) == 0:
+            return 0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    @property
+    def score(self) -> float:
+        # Endpoints never used score best, so that every endpoint gets measured
+        if self.latency is None:
+            return 0 if len(self.outcomes) == 0 else float("inf")
+        return self.latency * (1 + ERROR_RATE_PENALTY * self.error_rate)
+
+
+class FailoverHTTPProvider(BatchHTTPProvider):
+    """
+    HTTP provider spreading JSON-RPC requests over several endpoints of the same chain.
+
+    The rolling latency and error rate of every endpoint is tracked, and each request
+    is sent to the endpoint with the best score, or to every healthy endpoint in turn
+    with round robin, then to the next ones if it fails. Endpoints failing too often
+    are ejected for a cooldown, after which they are probed in the background and
+    only take requests again once they answer.
+
+    Concurrent requests are batched as with the BatchHTTPProvider. Batch support is
+    tracked per endpoint, and the requests of a batch routed to an endpoint without it
+    are sent to that endpoint one by one.
+    """
+
+    _endpoints: List[RpcEndpoint]
+    _failover_settings: RpcFailoverSettings
+    _turn: int
+    _lock: Lock
+
+    def __init__(
+        self,
+        endpoint_uris: List[str],
+        settings: RpcFailoverSettings = RpcFailoverSettings(),
+        batch_settings: RpcBatchSettings = RpcBatchSettings(),
+        request_kwargs: Optional[Any] = None,
+    ):
+        """
+        Initialize the provider.
+
+        :param endpoint_uris: URLs of the JSON-RPC endpoints of the chain, the first
+            one also identifies the provider
+        :param settings: settings of the health tracking and failover
+        :param batch_settings: settings of the request batching
+        :param request_kwargs: optional keyword arguments passed to requests
+        """
+
+        if len(endpoint_uris) == 0:
+            raise ValueError("At least one RPC endpoint is required")
+
+        super().__init__(endpoint_uris[0], batch_settings, request_kwargs)
+        self._failover_settings = settings
+        self._endpoints = [
+            RpcEndpoint(uri, settings.window_size, settings.cooldown)
+            for uri in dict.fromkeys(endpoint_uris)
+        ]
+        self._turn = 0
+        self._lock = Lock()
+
+    def get_endpoints(self) -> List[RpcEndpoint]:
+        """
+        Get the endpoints of the provider, from the healthiest to the least healthy.
+
+        :returns: the endpoints with their health, ejected ones last
+        """
+
+        with self._lock:
+            return sorted(
+                self._endpoints, key=lambda e: (e.ejected_at is not None, e.score)
+            )
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _post(self, payload: Any) -> Any:
+        requests = payload if isinstance(payload, list) else [payload]
+        is_write = any(request["method"] in WRITE_METHODS for request in requests)
+
+        kwargs = dict(self.get_request_kwargs())
+        kwargs.setdefault("timeout", self._failover_settings.timeout)
+
+        tried: Set[str] = set()
+        response: Any = None
+        error: Optional[Exception] = None
+        while True:
+            endpoint = self._select(tried)
+            if endpoint is None:
+                break
+            tried.add(endpoint.uri)
+
+            start = time.monotonic()
+            try:
+                response = self._post_to(endpoint, payload, kwargs)
+            except (RequestException, ValueError) as e:
+                self._record_failure(endpoint)
+                error = e
+                response = None
+
+                # A write may have reached the node before it stopped answering
+                if is_write and isinstance(e, ReadTimeout):
+                    raise
+                continue
+
+            if is_rate_limited(response):
+                self._record_failure(endpoint)
+                continue
+
+            self._record_success(endpoint, time.monotonic() - start)
+            return response
+
+        # The last rate limited response is more useful than an earlier error
+        if response is not None:
+            return response
+        raise error  # type: ignore
+
+    def _post_to(self, endpoint: RpcEndpoint, payload: Any, kwargs: Dict[str, Any]) -> Any:
+        if isinstance(payload, list) and not endpoint.supports_batch:
+            return [self._post_to(endpoint, request, kwargs) for request in payload]
+
+        response = json.loads(
+            make_post_request(
+                URI(endpoint.uri), json.dumps(payload).encode("utf-8"), **kwargs
+            )
+        )
+
+        # Endpoints without batch support answer a batch with a single error object
+        if (
+            isinstance(payload, list)
+            and isinstance(response, dict)
+            and not is_rate_limited(response)
+        ):
+            endpoint.supports_batch = False
+            return self._post_to(endpoint, payload, kwargs)
+
+        return response
+
+    def _select(self, tried: Set[str]) -> Optional[RpcEndpoint]:
+        now = time.monotonic()
+        with self._lock:
+            candidates = [e for e in self._endpoints if e.uri not in tried]
+            if len(candidates) == 0:
+                return None
+
+            healthy = [e for e in candidates if e.ejected_at is None]
+            if len(healthy) == 0:
+                # With every endpoint ejected, the one ejected first is still tried
+                endpoint = min(candidates, key=lambda e: e.ejected_at)  # type: ignore
+            elif self._failover_settings.round_robin:
+                endpoint = healthy[self._turn % len(healthy)]
+                self._turn += 1
+            else:
+                # Endpoints left idle for long are tried again to refresh their latency
+                idle = [
+                    e
+                    for e in healthy
+                    if now - e.last_used > self._failover_settings.probe_interval
+                ]
+                endpoint = min(idle or healthy, key=lambda e: e.score)
+
+            endpoint.last_used = now
+            return endpoint
+
+    def _record_success(self, endpoint: RpcEndpoint, latency: float):
+        with self._lock:
+            smoothing = self._failover_settings.latency_smoothing
+            endpoint.latency = (
+                latency
+                if endpoint.latency is None
+                else smoothing * latency + (1 - smoothing) * endpoint.latency
+            )
+            endpoint.outcomes.append(True)
+            endpoint.consecutive_failures = 0
+
+            if endpoint.ejected_at is not None:
+                self._reinstate(endpoint)
+
+    def _record_failure(self, endpoint: RpcEndpoint):
+        with self._lock:
+            endpoint.outcomes.append(False)
+            endpoint.consecutive_failures += 1
+
+            if endpoint.ejected_at is not None:
+                return
+
+            if endpoint.consecutive_failures >= max(
+                self._failover_settings.max_consecutive_failures, 1
+            ) or (
+                len(endpoint.outcomes) == endpoint.outcomes.maxlen
+                and endpoint.error_rate > self._failover_settings.max_error_rate
+            ):
+                endpoint.ejected_at = time.monotonic()
+                self._schedule_probe(endpoint)
+
+    def _reinstate(self, endpoint: RpcEndpoint):
+        # Failures from before the ejection say nothing about the endpoint anymore
+        endpoint.ejected_at = None
+        endpoint.cooldown = self._failover_settings.cooldown
+        endpoint.consecutive_failures = 0
+        endpoint.outcomes.clear()
+        endpoint.outcomes.append(True)
+
+    def _schedule_probe(self, endpoint: RpcEndpoint):
+        timer = Timer(endpoint.cooldown, self._probe, [endpoint, endpoint.ejected_at])
+        timer.daemon = True
+        timer.start()
+
+    def _probe(self, endpoint: RpcEndpoint, ejected_at: float):
+        # Probes scheduled before the endpoint was reinstated and ejected again are stale
+        with self._lock:
+            if endpoint.ejected_at != ejected_at:
+                return
+
+        payload = {"jsonrpc": "2.0", "method": "eth_blockNumber", "params": [], "id": 0}
+        kwargs = dict(self.get_request_kwargs())
+        kwargs.setdefault("timeout", self._failover_settings.timeout)
+
+        start = time.monotonic()
+        try:
+            response = json.loads(
+                make_post_request(
+                    URI(endpoint.uri), json.dumps(payload).encode("utf-8"), **kwargs
+                )
+            )
+            is_healthy = "result" in response
+        except (RequestException, ValueError):
+            is_healthy = False
+
+        if is_healthy:
+            self._record_success(endpoint, time.monotonic() - start)
+            return
+
+        with self._lock:
+            if endpoint.ejected_at != ejected_at:
+                return
+            endpoint.cooldown = min(
+                endpoint.cooldown * 2, self._failover_settings.max_cooldown
+            )
+            self._schedule_probe(endpoint)
@@ -0,0 +1,213 @@
+import time
+from dataclasses import astuple
+from statistics import median
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+from web3 import Web3
+
+from thirdweb.core.helpers.rpc import get_provider_key
+from thirdweb.types.sdk import GasSettings, GasSpeed
+from thirdweb.types.tx import TxFees
+
+# Percentile of the priority fees paid in recent blocks to tip at, per gas speed
+SPEED_PERCENTILES = {
+    GasSpeed.STANDARD: 25,
+    GasSpeed.FAST: 60,
+    GasSpeed.FASTEST: 90,
+}
+
+# The base fee can rise by 12.5% per block, doubling it covers 6 full blocks in a row
+BASE_FEE_MULTIPLIER = 2
+
+
+class FeeOracle:
+    """
+    Prices transactions from the fees paid in recent blocks, read with a single
+    eth_feeHistory request that is cached for the block it was read at, so that
+    transactions sent back to back do not each look up the gas price.
+
+    On chains without EIP-1559, transactions are priced with eth_gasPrice instead.
+    Fees are capped to the maximum price of the gas settings either way.
+    """
+
+    _provider: Web3
+    _settings: GasSettings
+    _fees: Optional[TxFees]
+    _block: int
+    _latest_block: int
+    _fetched_at: float
+    _supports_eip1559: Optional[bool]
+    _lock: Lock
+
+    def __init__(self, provider: Web3, settings: GasSettings = GasSettings()):
+        """
+        Initialize the fee oracle.
+
+        :param provider: web3 provider instance to read fees from
+        :param settings: gas settings with the speed and maximum price to use
+        """
+
+        self._provider = provider
+        self._settings = settings
+        self._fees = None
+        self._block = -1
+        self._latest_block = -1
+        self._fetched_at = 0
+        self._supports_eip1559 = None
+        self._lock = Lock()
+
+    def get_fees(self) -> TxFees:
+        """
+        Get the fees to price a transaction with.
+
+        :returns: the EIP-1559 fees, or the gas price on chains without EIP-1559
+        """
+
+        with self._lock:
+            if (
+                self._fees is None
+                or time.monotonic() - self._fetched_at > self._settings.fee_cache_seconds
+            ):
+                self._fees = self._fetch_fees()
+                self._fetched_at = time.monotonic()
+
+            return self._fees
+
+    def observe_block(self, block_number: int):
+        """
+        Drop the cached fees once a newer block than the one they were read at is seen,
+        for instance in the receipt of a mined transaction.
+
+        :param block_number: number of a block known to be mined
+        """
+
+        with self._lock:
+            self._latest_block = max(self._latest_block, block_number)
+            if block_number > self._block:
+                self._fees = None
+
+    def get_tx_params(self) -> Dict[str, Any]:
+        """
+        Get the fee fields of a transaction to build.
+
+        :returns: maxFeePerGas and maxPriorityFeePerGas, or gasPrice on chains
+            without EIP-1559
+        """
+
+        fees = self.get_fees()
+        if fees.gas_price is not None:
+            return {"gasPrice": fees.gas_price}
+
+        return {
+            "maxFeePerGas": fees.max_fee_per_gas,
+            "maxPriorityFeePerGas": fees.max_priority_fee_per_gas,
+        }
+
+    def apply(self, tx: Dict[str, Any], fees: TxFees) -> Dict[str, Any]:
+        """
+        Replace the gas price of a transaction built with the maximum price of its fees
+        by the fees themselves.
+
+        :param tx: the built transaction
+        :param fees: fees the transaction was built with
+        :returns: the transaction, priced with EIP-1559 fees if the chain supports them
+        """
+
+        if fees.gas_price is not None:
+            return tx
+
+        tx.pop("gasPrice", None)
+        tx["maxFeePerGas"] = fees.max_fee_per_gas
+        tx["maxPriorityFeePerGas"] = fees.max_priority_fee_per_gas
+        return tx
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _fetch_fees(self) -> TxFees:
+        max_price = Web3.toWei(self._settings.max_price_in_gwei, "gwei")
+
+        if self._supports_eip1559 is not False:
+            percentile = SPEED_PERCENTILES[self._settings.speed]
+            try:
+                history = self._provider.eth.fee_history(
+                    self._settings.fee_history_blocks, "latest", [percentile]
+                )
+            except Exception:
+                history = None
+
+            base_fees = history["baseFeePerGas"] if history is not None else []
+            self._supports_eip1559 = len(base_fees) > 0 and base_fees[-1] > 0
+
+            if self._supports_eip1559:
+                self._block = history["oldestBlock"] + len(base_fees) - 2  # type: ignore
+
+                priority_fee = get_priority_fee_from_history(history)
+                if priority_fee is None:
+                    priority_fee = self._provider.eth.max_priority_fee
+                return get_eip1559_fees(base_fees[-1], priority_fee, self._settings)
+
+        # The block of the gas price is not known, so it lasts until a newer block is seen
+        self._block = self._latest_block
+        return TxFees(gas_price=min(self._provider.eth.gas_price, max_price))
+
+
+def get_priority_fee_from_history(history: Any) -> Optional[int]:
+    """
+    Get the priority fee to tip from the rewards of an eth_feeHistory response.
+
+    :param history: fee history read with a single reward percentile
+    :returns: the median tip of the recent blocks, None if they were all empty
+    """
+
+    # Empty blocks report no tips, so only blocks with transactions count
+    rewards = [
+        reward[0]
+        for reward, ratio in zip(history.get("reward", []), history["gasUsedRatio"])
+        if len(reward) > 0 and ratio > 0
+    ]
+    return int(median(rewards)) if len(rewards) > 0 else None
+
+
+def get_eip1559_fees(
+    next_base_fee: int, priority_fee: int, settings: GasSettings = GasSettings()
+) -> TxFees:
+    """
+    Get the EIP-1559 fees of a transaction, capped to the maximum price of the settings.
+
+    :param next_base_fee: base fee of the next block
+    :param priority_fee: tip to pay the block producer
+    :param settings: gas settings with the maximum price to use
+    :returns: the fees to price the transaction with
+    """
+
+    max_price = Web3.toWei(settings.max_price_in_gwei, "gwei")
+    max_fee = min(next_base_fee * BASE_FEE_MULTIPLIER + priority_fee, max_price)
+    return TxFees(
+        max_fee_per_gas=max_fee,
+        max_priority_fee_per_gas=min(priority_fee, max_fee),
+    )
+
+
+_fee_oracles: Dict[Tuple[str, Tuple[Any, ...]], FeeOracle] = {}
+_fee_oracles_lock = Lock()
+
+
+def get_fee_oracle(provider: Web3, settings: GasSettings = GasSettings()) -> FeeOracle:
+    """
+    Get the process-wide fee oracle for the node of the given provider and the given
+    gas settings, so that each speed and maximum price is enforced on its own.
+
+    :param provider: web3 provider instance the transactions are sent through
+    :param settings: gas settings with the speed and maximum price to use
+    :returns: the fee oracle shared by every contract using this node and settings
+    """
+
+    key = (get_provider_key(provider), astuple(settings))
+
+    with _fee_oracles_lock:
+        if key not in _fee_oracles:
+            _fee_oracles[key] = FeeOracle(provider, settings)
+        return _fee_oracles[key]
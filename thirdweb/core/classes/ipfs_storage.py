@@ -1,26 +1,34 @@
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from io import IOBase
+from pathlib import PurePath
+from threading import BoundedSemaphore, Lock
+from urllib.parse import urlparse
 import re
 import json
-from requests import get, Response, post
-from typing import Any, Dict, List, Optional, Sequence, TextIO, BinaryIO, Union, cast
+from requests import Response, Session
+from typing import Any, Dict, List, Optional, Sequence, Set, TextIO, BinaryIO, Union, cast
 from thirdweb.common.error import (
     DuplicateFileNameException,
     FetchException,
-    UploadException,
 )
 from thirdweb.common.keys import derive_client_id_from_secret_key
 from thirdweb.constants.urls import (
     DEFAULT_IPFS_GATEWAY,
     TW_STORAGE_SERVER_URL,
 )
+from thirdweb.core.classes.ipfs_uploader import IpfsUploader, UploadFile
+from thirdweb.core.classes.pin_index import PinIndex
+from thirdweb.core.classes.storage_cache import StorageCache
+from thirdweb.core.helpers.http import create_session
 from thirdweb.core.helpers.storage import (
     replace_file_properties_with_hashes,
     replace_gateway_url_with_hash,
     replace_hash_with_gateway_url,
     resolve_gateway_url,
 )
-from thirdweb.types.storage import CidWithFileName, UriWithMetadata
+from thirdweb.types.sdk import StorageSettings
+from thirdweb.types.storage import CidWithFileName, StorageCacheStats, UriWithMetadata
 
 
 class IpfsStorage(ABC):
@@ -42,17 +50,37 @@ class IpfsStorage(ABC):
 
     _gateway_url: str
     _secret_key: Optional[str]
+    _settings: StorageSettings
+    _session: Session
+    _cache: StorageCache
+    _uploader: IpfsUploader
 
-    def __init__(self, secret_key: Optional[str], gateway_url: Optional[str] = None):
+    def __init__(
+        self,
+        secret_key: Optional[str],
+        gateway_url: Optional[str] = None,
+        settings: StorageSettings = StorageSettings(),
+        server_url: Optional[str] = None,
+    ):
         self._secret_key = secret_key
+        self._settings = settings
+        self._session = create_session(
+            settings.pool_size, settings.max_retries, settings.retry_backoff_factor
+        )
+        self._uploader = IpfsUploader(
+            self._session,
+            server_url if server_url is not None else TW_STORAGE_SERVER_URL,
+            secret_key,
+            settings,
+            PinIndex(settings.pin_index_path),
+        )
+        self._cache = StorageCache(
+            settings.cache_max_bytes,
+            settings.cache_path,
+            settings.cache_max_disk_bytes,
+        )
 
-        if gateway_url is not None:
-            self._gateway_url = re.sub(r"\/$", "", gateway_url) + "/"
-        elif secret_key is not None:
-            client_id = derive_client_id_from_secret_key(self._secret_key)
-            self._gateway_url = f"https://{client_id}.ipfscdn.io/ipfs/"
-        else:
-            self._gateway_url = DEFAULT_IPFS_GATEWAY
+        self._gateway_url = get_gateway_url(secret_key, gateway_url)
 
     def get(self, hash: str) -> Any:
         """
@@ -62,15 +90,69 @@ class IpfsStorage(ABC):
         :returns: dictionary of the data if JSON, otherwise raw data.
         """
 
-        res = self._get(hash)
+        content = self._get_content(hash)
         try:
-            data = res.json()
+            data = json.loads(content)
 
             if isinstance(data, dict) or isinstance(data, list) or isinstance(data, str):
                 return replace_hash_with_gateway_url(data, "ipfs://", self._gateway_url)
             return data
         except:
-            return res.text
+            return content.decode("utf-8", errors="replace")
+
+    def get_batch(self, hashes: Sequence[str], allow_failure: bool = False) -> List[Any]:
+        """
+        Gets IPFS data at many hashes concurrently and returns the data in the same order.
+
+        :param hashes: list of hashes of the data to get.
+        :param allow_failure: whether to return None for data that could not be fetched
+            instead of raising.
+        :returns: list of dictionaries of the data if JSON, otherwise raw data.
+        """
+
+        if len(hashes) == 0:
+            return []
+
+        host_limits: Dict[str, BoundedSemaphore] = {}
+        host_limits_lock = Lock()
+
+        def fetch(hash: str) -> Any:
+            url = resolve_gateway_url(hash, "ipfs://", self._gateway_url)
+            host = urlparse(url).netloc
+
+            with host_limits_lock:
+                if host not in host_limits:
+                    host_limits[host] = BoundedSemaphore(
+                        max(self._settings.max_requests_per_host, 1)
+                    )
+                limit = host_limits[host]
+
+            with limit:
+                return self.get(hash)
+
+        max_workers = min(max(self._settings.max_concurrent_requests, 1), len(hashes))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(fetch, hash) for hash in hashes]
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if not allow_failure:
+                    raise e
+                results.append(None)
+
+        return results
+
+    def cache_stats(self) -> StorageCacheStats:
+        """
+        Gets the hit and miss counters of the IPFS content cache.
+
+        :returns: hits on the in-memory and on-disk caches, misses and the in-memory size.
+        """
+
+        return self._cache.stats()
 
     def upload(
         self,
@@ -110,6 +192,40 @@ class IpfsStorage(ABC):
 
         return f"ipfs://{cid_with_filename.cid}"
 
+    def upload_files(
+        self,
+        files: Sequence[Union[TextIO, BinaryIO, PurePath, str, Dict[str, Any]]],
+        file_start_number: int = 0,
+        manifest_path: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Uploads a large list of files to IPFS and returns the hash of each file.
+
+        Files on disk are streamed instead of being loaded in memory, and the files are
+        uploaded concurrently in parts bounded by the upload settings, so the files
+        don't share a single directory hash. A manifest records the uploaded parts, so
+        that running the same upload again after an interruption only uploads the
+        parts that were not finished.
+
+        ```python
+        from pathlib import Path
+
+        uris = sdk.storage.upload_files(
+            sorted(Path("images").iterdir()), manifest_path="images.manifest.json"
+        )
+        ```
+
+        :param files: list of files to upload, as paths, open files, strings or data.
+        :param file_start_number: optional number to start the file names with.
+        :param manifest_path: optional path of the JSON manifest of uploaded parts.
+        :returns: hash of each file, in order.
+        """
+
+        upload_files = self._build_upload_files(files, file_start_number)
+        paths = self._uploader.upload_parts(upload_files, manifest_path)
+
+        return [f"ipfs://{path}" for path in paths]
+
     def upload_metadata(
         self,
         metadata: Dict[str, Any],
@@ -160,10 +276,32 @@ class IpfsStorage(ABC):
     INTERNAL FUNCTIONS
     """
 
+    def _get_content(self, hash: str) -> bytes:
+        key = self._get_cache_key(hash)
+
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        content = self._get(hash).content
+
+        if key is not None:
+            self._cache.set(key, content)
+
+        return content
+
+    def _get_cache_key(self, hash: str) -> Optional[str]:
+        # Only content addressed by CID is immutable, anything else is always refetched
+        for prefix in ["ipfs://", self._gateway_url]:
+            if hash.startswith(prefix):
+                return hash[len(prefix) :]
+        return None
+
     def _get(self, hash: str) -> Response:
         hash = resolve_gateway_url(hash, "ipfs://", self._gateway_url)
         headers = { "x-secret-key": self._secret_key } if ".ipfscdn.io" in self._gateway_url else {}
-        res = get(hash, headers=headers)
+        res = self._session.get(hash, headers=headers, timeout=self._settings.timeout)
 
         if not res.ok:
             raise FetchException(f"Could not get {hash}")
@@ -185,14 +323,13 @@ class IpfsStorage(ABC):
         if len(files_to_upload) == 0:
             return sanitized_metadatas
 
-        cid_with_filename = self._upload_batch_with_cid(
-            cast(List[Union[TextIO, BinaryIO, str, Dict[str, Any]]], files_to_upload)
+        # Files don't need to share a directory, so large files are uploaded in parts
+        cids = self._uploader.upload_parts(
+            self._build_upload_files(
+                cast(List[Union[TextIO, BinaryIO, str, Dict[str, Any]]], files_to_upload)
+            )
         )
 
-        cids = []
-        for filename in cid_with_filename.filenames:
-            cids.append(f"{cid_with_filename.cid}/{filename}")
-
         final_metadata = replace_file_properties_with_hashes(metadatas, cids)
         return final_metadata
 
@@ -201,63 +338,108 @@ class IpfsStorage(ABC):
         object: Union[Dict[str, Any], List[Any]],
         files: List[IOBase],
     ) -> List[IOBase]:
-        if isinstance(object, list):
-            [self._build_file_properties_map(item, files) for item in object]
-        else:
-            for val in object.values():
-                if isinstance(val, IOBase):
-                    files.append(cast(IOBase, val))
-                elif isinstance(val, dict) or isinstance(val, list):
-                    self._build_file_properties_map(val, files)
-        return files
+        return get_file_properties(object, files)
 
     def _upload_batch_with_cid(
         self,
         files: Sequence[Union[TextIO, BinaryIO, str, Dict[str, Any]]],
         file_start_number: int = 0
     ) -> CidWithFileName:
-        form: List[Any] = []
-        file_names: List[str] = []
-
-        for i, file in enumerate(files):
-            file_name = f"{file_start_number + i}"
-            file_data = cast(Union[str, Dict[str, Any]], file)
-
-            if not isinstance(file, str) and not isinstance(file, dict):
-                if file.name:
-                    extensions = file.name.split(".")
-                    extension = extensions[-1]
-                    file_name = f"{file_start_number + i}.{extension}"
-            elif (
-                isinstance(file, dict)
-                and "name" in file
-                and file["name"] is not None
-                and "data" in file
-                and file["data"] is not None
-            ):
-                file_name = file["name"]
-                file_data = file["data"]
-            else:
-                file_data = json.dumps(file)
-
-            if file_name in file_names:
-                raise DuplicateFileNameException(file_name)
-
-            file_names.append(file_name)
-            form.append(("file", (f"files/{file_name}", file_data)))
-
-        # form.append(("pinataMetadata", metadata))
-
-        res = post(
-            f"{TW_STORAGE_SERVER_URL}/ipfs/upload",
-            files=form,
-            headers={
-                "x-secret-key": self._secret_key,
-            },
-        )
-        body = res.json()
+        upload_files = self._build_upload_files(files, file_start_number)
+        cid = self._uploader.upload_directory(upload_files)
 
-        if not res.ok:
-            raise UploadException(f"Failed to upload files to IPFS. {res.json()}")
+        return CidWithFileName(cid, [file.name for file in upload_files])
+
+    def _build_upload_files(
+        self,
+        files: Sequence[Union[TextIO, BinaryIO, PurePath, str, Dict[str, Any]]],
+        file_start_number: int = 0,
+    ) -> List[UploadFile]:
+        return build_upload_files(files, file_start_number)
+
+
+def get_gateway_url(secret_key: Optional[str], gateway_url: Optional[str] = None) -> str:
+    """
+    Returns the IPFS gateway to read from, the thirdweb gateway of the secret key by
+    default.
+    """
+
+    if gateway_url is not None:
+        return re.sub(r"\/$", "", gateway_url) + "/"
+    elif secret_key is not None:
+        client_id = derive_client_id_from_secret_key(secret_key)
+        return f"https://{client_id}.ipfscdn.io/ipfs/"
+    return DEFAULT_IPFS_GATEWAY
+
+
+def get_file_properties(
+    object: Union[Dict[str, Any], List[Any]],
+    files: List[IOBase],
+) -> List[IOBase]:
+    """
+    Collects the files found in the properties of metadata, in order.
+    """
+
+    if isinstance(object, list):
+        [get_file_properties(item, files) for item in object]
+    else:
+        for val in object.values():
+            if isinstance(val, IOBase):
+                files.append(cast(IOBase, val))
+            elif isinstance(val, dict) or isinstance(val, list):
+                get_file_properties(val, files)
+    return files
+
+
+def build_upload_files(
+    files: Sequence[Union[TextIO, BinaryIO, PurePath, str, Dict[str, Any]]],
+    file_start_number: int = 0,
+) -> List[UploadFile]:
+    """
+    Names the files of an upload after their position, keeping their extension, and
+    wraps them as files to upload. A stream given several times is only read once.
+    """
+
+    upload_files: List[UploadFile] = []
+    file_names: Set[str] = set()
+    # A stream can only be read once, so a stream used by several entries, such as a
+    # shared placeholder image, is read for the first one and reused for the others
+    streams: Dict[int, UploadFile] = {}
+
+    for i, file in enumerate(files):
+        file_name = f"{file_start_number + i}"
+        file_data: Any = file
+
+        if isinstance(file, PurePath):
+            if file.suffix:
+                file_name = f"{file_start_number + i}{file.suffix}"
+        elif not isinstance(file, str) and not isinstance(file, dict):
+            if file.name:
+                extensions = file.name.split(".")
+                extension = extensions[-1]
+                file_name = f"{file_start_number + i}.{extension}"
+        elif (
+            isinstance(file, dict)
+            and "name" in file
+            and file["name"] is not None
+            and "data" in file
+            and file["data"] is not None
+        ):
+            file_name = file["name"]
+            file_data = file["data"]
+        else:
+            file_data = json.dumps(file)
+
+        if file_name in file_names:
+            raise DuplicateFileNameException(file_name)
+
+        file_names.add(file_name)
+        if not isinstance(file_data, IOBase):
+            upload_files.append(UploadFile.from_data(file_name, file_data))
+        elif id(file_data) in streams:
+            upload_files.append(streams[id(file_data)].with_name(file_name))
+        else:
+            streams[id(file_data)] = UploadFile.from_data(file_name, file_data)
+            upload_files.append(streams[id(file_data)])
 
-        return CidWithFileName(body["IpfsHash"], file_names)
+    return upload_files
@@ -0,0 +1,442 @@
+import hashlib
+import json
+import os
+import random
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, IOBase
+from pathlib import PurePath
+from threading import Lock
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Sequence, Tuple
+
+from requests import Response, Session
+from requests.exceptions import ConnectionError, Timeout
+
+from thirdweb.common.cid import compute_cid
+from thirdweb.common.error import UploadException
+from thirdweb.core.classes.pin_index import PinIndex
+from thirdweb.core.helpers.http import RETRY_STATUS_CODES
+from thirdweb.types.sdk import StorageSettings
+
+# Size of the blocks files are streamed from disk in
+READ_BLOCK_SIZE = 1024 * 1024
+
+
+class UploadFile:
+    """
+    A file to upload, read from its source only when the request body is streamed.
+    """
+
+    name: str
+    size: int
+    fingerprint: str
+
+    def __init__(
+        self, name: str, size: int, fingerprint: str, open: Callable[[], BinaryIO]
+    ):
+        self.name = name
+        self.size = size
+        self.fingerprint = fingerprint
+        # Set on the instance, so that the callable is not bound as a method
+        self._open: Callable[[], BinaryIO] = open
+
+    @staticmethod
+    def from_data(name: str, data: Any) -> "UploadFile":
+        """
+        Create a file to upload from a path, a file object, a string or JSON data.
+
+        Files on disk, given by path or as an open file, are reopened and streamed when
+        uploaded, so they are never held in memory. Other streams are read once.
+
+        :param name: name of the file in the uploaded directory
+        :param data: content of the file
+        :returns: the file to upload
+        """
+
+        if isinstance(data, PurePath):
+            return UploadFile._from_path(name, str(data), 0)
+
+        if isinstance(data, IOBase):
+            path = getattr(data, "name", None)
+            if isinstance(path, str) and os.path.isfile(path):
+                start = data.tell() if data.seekable() else 0
+                return UploadFile._from_path(name, path, start)
+
+            content = data.read()  # type: ignore
+            data = content
+
+        if isinstance(data, str):
+            content = data.encode("utf-8")
+        elif isinstance(data, (bytes, bytearray)):
+            content = bytes(data)
+        else:
+            content = json.dumps(data).encode("utf-8")
+
+        return UploadFile(
+            name,
+            len(content),
+            hashlib.sha256(content).hexdigest(),
+            lambda: BytesIO(content),
+        )
+
+    def open(self) -> BinaryIO:
+        """
+        Open the content of the file for reading from the start.
+        """
+
+        return self._open()
+
+    def with_name(self, name: str) -> "UploadFile":
+        """
+        Get the same content under another name, without reading it again.
+
+        :param name: name of the file in the uploaded directory
+        :returns: the file to upload, sharing the source of this one
+        """
+
+        return UploadFile(name, self.size, self.fingerprint, self._open)
+
+    def cid(self) -> str:
+        """
+        Compute the CIDv0 of the content of the file, streaming it from its source.
+        """
+
+        with self.open() as stream:
+            return compute_cid(stream)
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    @staticmethod
+    def _from_path(name: str, path: str, start: int) -> "UploadFile":
+        stat = os.stat(path)
+
+        def open_file() -> BinaryIO:
+            file = open(path, "rb")
+            file.seek(start)
+            return file
+
+        return UploadFile(
+            name,
+            stat.st_size - start,
+            f"{os.path.abspath(path)}:{start}:{stat.st_size}:{stat.st_mtime_ns}",
+            open_file,
+        )
+
+
+class MultipartBody:
+    """
+    Streamed multipart/form-data body of a directory upload. Its length is known up
+    front, so it is sent with a Content-Length and files are only read block by block
+    while the request is sent.
+    """
+
+    content_type: str
+    _parts: List[Tuple[bytes, Optional[UploadFile]]]
+    _length: int
+    _index: int
+    _current: Optional[BinaryIO]
+    _buffer: bytes
+
+    def __init__(self, files: Sequence[UploadFile]):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        self._parts = []
+        for file in files:
+            header = (
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="file"; filename="files/{file.name}"\r\n'
+                "\r\n"
+            ).encode("utf-8")
+            self._parts.append((header, file))
+            self._parts.append((b"\r\n", None))
+        self._parts.append((f"--{boundary}--\r\n".encode("utf-8"), None))
+
+        self._length = sum(
+            len(data) + (file.size if file is not None else 0)
+            for data, file in self._parts
+        )
+        self._index = 0
+        self._current = None
+        self._buffer = b""
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        size = READ_BLOCK_SIZE if size is None or size < 0 else size
+
+        while len(self._buffer) < size:
+            if self._current is not None:
+                block = self._current.read(READ_BLOCK_SIZE)
+                if len(block) > 0:
+                    self._buffer += block
+                    continue
+                self._current.close()
+                self._current = None
+
+            if self._index >= len(self._parts):
+                break
+
+            data, file = self._parts[self._index]
+            self._index += 1
+            self._buffer += data
+            if file is not None:
+                self._current = file.open()
+
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+    def close(self):
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+
+
+class IpfsUploader:
+    """
+    Uploads files to the storage server, streaming them from disk and retrying failed
+    uploads. Large batches are split into parts bounded in size and number of files
+    which are uploaded concurrently, and whose CIDs can be recorded in a manifest so
+    that an interrupted batch resumes without uploading the finished parts again.
+
+    When uploading in parts, the CID of every file is computed locally first, so that
+    identical files are only uploaded once and files already in the pin index are not
+    uploaded at all.
+    """
+
+    _session: Session
+    _server_url: str
+    _secret_key: Optional[str]
+    _settings: StorageSettings
+    _pin_index: PinIndex
+
+    def __init__(
+        self,
+        session: Session,
+        server_url: str,
+        secret_key: Optional[str],
+        settings: StorageSettings = StorageSettings(),
+        pin_index: Optional[PinIndex] = None,
+    ):
+        self._session = session
+        self._server_url = server_url
+        self._secret_key = secret_key
+        self._settings = settings
+        self._pin_index = pin_index if pin_index is not None else PinIndex()
+
+    def upload_directory(self, files: Sequence[UploadFile]) -> str:
+        """
+        Upload files as a single directory.
+
+        :param files: files of the directory
+        :returns: CID of the directory
+        """
+
+        return self._post(files)
+
+    def upload_parts(
+        self, files: Sequence[UploadFile], manifest_path: Optional[str] = None
+    ) -> List[str]:
+        """
+        Upload files in concurrent parts, each part as its own directory.
+
+        :param files: files to upload
+        :param manifest_path: optional path of a JSON file recording the CID of every
+            uploaded part, used to skip parts that were already uploaded
+        :returns: the path of each file, as the CID of its part followed by its name
+        """
+
+        if not self._settings.deduplicate_uploads:
+            return self._upload_parts(files, manifest_path)
+
+        cids = self._get_cids(files)
+        paths, unique = plan_deduplicated_upload(files, cids, self._pin_index)
+
+        uploaded = self._upload_parts(list(unique.values()), manifest_path)
+        for cid, path in zip(unique.keys(), uploaded):
+            self._pin_index.set(cid, path)
+            paths[cid] = path
+
+        return [paths[cid] for cid in cids]
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _get_cids(self, files: Sequence[UploadFile]) -> List[str]:
+        # The same file often appears many times, so each source is only hashed once
+        sources: Dict[str, UploadFile] = {}
+        for file in files:
+            sources.setdefault(file.fingerprint, file)
+
+        max_workers = min(
+            max(self._settings.max_concurrent_uploads, 1), max(len(sources), 1)
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            source_cids = dict(
+                zip(sources.keys(), executor.map(UploadFile.cid, sources.values()))
+            )
+
+        return [source_cids[file.fingerprint] for file in files]
+
+    def _upload_parts(
+        self, files: Sequence[UploadFile], manifest_path: Optional[str]
+    ) -> List[str]:
+        if len(files) == 0:
+            return []
+
+        parts = split_parts(files, self._settings)
+        manifest = self._load_manifest(manifest_path)
+        manifest_lock = Lock()
+
+        def upload(part: List[UploadFile]) -> str:
+            key = get_part_key(part)
+            with manifest_lock:
+                if key in manifest:
+                    return manifest[key]
+
+            cid = self._post(part)
+
+            with manifest_lock:
+                manifest[key] = cid
+                self._save_manifest(manifest_path, manifest)
+            return cid
+
+        max_workers = min(max(self._settings.max_concurrent_uploads, 1), max(len(parts), 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            cids = list(executor.map(upload, parts))
+
+        return [f"{cid}/{file.name}" for cid, part in zip(cids, parts) for file in part]
+
+    def _post(self, files: Sequence[UploadFile]) -> str:
+        attempt = 0
+        while True:
+            body = MultipartBody(files)
+            error: str
+            try:
+                res = self._session.post(
+                    f"{self._server_url}/ipfs/upload",
+                    data=body,  # type: ignore
+                    headers={
+                        "Content-Type": body.content_type,
+                        "x-secret-key": self._secret_key,  # type: ignore
+                    },
+                    timeout=self._settings.timeout,
+                )
+                if res.ok:
+                    return res.json()["IpfsHash"]
+
+                error = self._get_error(res)
+                if res.status_code not in RETRY_STATUS_CODES:
+                    raise UploadException(f"Failed to upload files to IPFS. {error}")
+            except (ConnectionError, Timeout) as e:
+                error = str(e)
+            finally:
+                body.close()
+
+            if attempt >= self._settings.max_retries:
+                raise UploadException(f"Failed to upload files to IPFS. {error}")
+
+            backoff = self._settings.retry_backoff_factor * (2**attempt)
+            time.sleep(random.uniform(0, backoff))
+            attempt += 1
+
+    def _get_error(self, res: Response) -> str:
+        try:
+            return str(res.json())
+        except Exception:
+            return res.text
+
+    def _load_manifest(self, manifest_path: Optional[str]) -> Dict[str, str]:
+        if manifest_path is None or not os.path.isfile(manifest_path):
+            return {}
+
+        with open(manifest_path, "r") as f:
+            return json.load(f).get("parts", {})
+
+    def _save_manifest(self, manifest_path: Optional[str], manifest: Dict[str, str]):
+        if manifest_path is None:
+            return
+
+        # Written to a temporary file first so an interruption never corrupts it
+        temporary_path = f"{manifest_path}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump({"parts": manifest}, f)
+        os.replace(temporary_path, manifest_path)
+
+
+def split_parts(
+    files: Sequence[UploadFile], settings: StorageSettings
+) -> List[List[UploadFile]]:
+    """
+    Split files into parts bounded by the part size and number of files of the
+    settings. Files are split in order so the same files always make the same parts.
+
+    :param files: files to upload
+    :param settings: storage settings with the upload part limits
+    :returns: the files of each part, in order
+    """
+
+    max_bytes = max(settings.upload_part_max_bytes, 1)
+    max_files = max(settings.upload_part_max_files, 1)
+
+    parts: List[List[UploadFile]] = []
+    part: List[UploadFile] = []
+    part_size = 0
+    for file in files:
+        if len(part) > 0 and (
+            len(part) >= max_files or part_size + file.size > max_bytes
+        ):
+            parts.append(part)
+            part = []
+            part_size = 0
+
+        part.append(file)
+        part_size += file.size
+
+    if len(part) > 0:
+        parts.append(part)
+
+    return parts
+
+
+def get_part_key(part: Sequence[UploadFile]) -> str:
+    """
+    Returns the key a part is recorded under in an upload manifest.
+    """
+
+    data = json.dumps([[file.name, file.size, file.fingerprint] for file in part])
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def plan_deduplicated_upload(
+    files: Sequence[UploadFile], cids: Sequence[str], pin_index: PinIndex
+) -> Tuple[Dict[str, str], Dict[str, UploadFile]]:
+    """
+    Plan the upload of files whose CIDs were computed locally, so that identical files
+    are uploaded once, and only if they are not in the pin index already.
+
+    :param files: files to upload
+    :param cids: CID of each file, in order
+    :param pin_index: index of the content already uploaded
+    :returns: the paths of the files already pinned, and the files left to upload,
+        both by CID
+    """
+
+    paths: Dict[str, str] = {}
+    unique: Dict[str, UploadFile] = {}
+    for cid, file in zip(cids, files):
+        if cid in paths or cid in unique:
+            continue
+
+        path = pin_index.get(cid)
+        if path is not None:
+            paths[cid] = path
+        else:
+            unique[cid] = file
+
+    return paths, unique
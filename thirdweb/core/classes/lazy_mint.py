@@ -0,0 +1,330 @@
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from threading import Event
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple
+
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import TransactionNotFound
+from web3.types import TxReceipt
+
+from thirdweb.core.classes.contract_wrapper import ContractWrapper
+from thirdweb.core.classes.ipfs_storage import IpfsStorage
+from thirdweb.core.classes.receipt_poller import PendingTransaction
+from thirdweb.types.nft import (
+    LazyMintProgress,
+    LazyMintSettings,
+    NFTMetadata,
+    NFTMetadataInput,
+)
+from thirdweb.types.storage import UriWithMetadata
+from thirdweb.types.tx import TxResultWithId
+
+# Base URI as long as the ones lazy minted, used to estimate the gas of a lazy mint
+PLACEHOLDER_BASE_URI = "ipfs://" + "Q" * 46 + "/"
+
+
+class LazyMintPipeline:
+    """
+    Lazy mints a stream of NFT metadata in chunks. Chunks are read from the stream
+    only when needed and uploaded concurrently, and each chunk is lazy minted in its
+    own transaction as soon as its upload finishes, without waiting for the previous
+    transactions to be mined.
+
+    The progress of the pipeline can be saved to a checkpoint, so that an interrupted
+    batch resumes after the last chunk whose TokensLazyMinted event was confirmed. The
+    checkpoint records the transaction of every chunk sent but not yet mined, and a
+    resumed batch checks their receipts to count the ones mined since. A batch is not
+    resumed while one of these transactions is still pending.
+    """
+
+    _contract_wrapper: ContractWrapper
+    _storage: IpfsStorage
+    _settings: LazyMintSettings
+
+    def __init__(
+        self,
+        contract_wrapper: ContractWrapper,
+        storage: IpfsStorage,
+        get_metadata: Callable[[int], NFTMetadata],
+        settings: LazyMintSettings = LazyMintSettings(),
+    ):
+        """
+        Initialize the pipeline.
+
+        :param contract_wrapper: wrapper of a contract implementing lazyMint
+        :param storage: storage the metadata is uploaded to
+        :param get_metadata: function getting the metadata of a lazy minted token
+        :param settings: settings of the pipeline
+        """
+
+        self._contract_wrapper = contract_wrapper
+        self._storage = storage
+        # Set on the instance, so that the callable is not bound as a method
+        self._get_metadata: Callable[[int], NFTMetadata] = get_metadata
+        self._settings = settings
+
+    def run(
+        self,
+        metadatas: Iterable[NFTMetadataInput],
+        on_progress: Optional[Callable[[LazyMintProgress], None]] = None,
+    ) -> Iterator[TxResultWithId[NFTMetadata]]:
+        """
+        Lazy mint NFTs, yielding them chunk by chunk as their transactions are mined.
+
+        :param metadatas: metadata of the NFTs to lazy mint, in order
+        :param on_progress: optional function called with the progress of the batch
+            every time a chunk is uploaded, submitted or mined
+        :returns: iterator of tx results with ids for the created NFTs
+        """
+
+        checkpoint = self._load_checkpoint()
+        minted = self._get_minted_count(checkpoint) if checkpoint is not None else 0
+
+        # Metadata lazy minted before the batch was interrupted is skipped
+        items = iter(metadatas)
+        for _ in islice(items, minted):
+            pass
+
+        progress = LazyMintProgress(minted, minted, minted, None)
+        pending: Deque[Tuple[int, int, PendingTransaction]] = deque()
+        self._save_checkpoint(minted, pending)
+
+        next_token_id = self._contract_wrapper._contract_abi.next_token_id_to_mint.call()
+        chunk_size = self._get_chunk_size()
+
+        uploads: Deque[Tuple[int, int, "Future[UriWithMetadata]"]] = deque()
+        ready = Event()
+        exhausted = False
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(self._settings.max_concurrent_uploads, 1)
+        )
+        try:
+            while True:
+                ready.clear()
+
+                # Chunks are only read from the stream when there is room to upload them
+                while (
+                    not exhausted
+                    and len(uploads) < self._settings.max_concurrent_uploads
+                ):
+                    chunk = [m.to_json() for m in islice(items, chunk_size)]
+                    if len(chunk) == 0:
+                        exhausted = True
+                        break
+
+                    # Files are named after the ids the tokens will have once minted
+                    future = executor.submit(
+                        self._storage.upload_metadata_batch, chunk, next_token_id
+                    )
+                    future.add_done_callback(lambda _: ready.set())
+                    uploads.append((next_token_id, len(chunk), future))
+                    next_token_id += len(chunk)
+
+                if len(uploads) == 0 and len(pending) == 0:
+                    break
+
+                if len(pending) > 0 and pending[0][2].done():
+                    start_token_id, count, tx = pending.popleft()
+                    receipt = tx.wait()
+                    events = self._contract_wrapper.get_events(
+                        "TokensLazyMinted", receipt
+                    )
+                    start_index = events[0].get("args").get("startTokenId")  # type: ignore
+                    ending_index = events[0].get("args").get("endTokenId")  # type: ignore
+
+                    if start_index != start_token_id:
+                        raise Exception(
+                            f"Tokens were lazy minted by another transaction during the batch, "
+                            f"expected the chunk to start at token {start_token_id} but it "
+                            f"started at {start_index}"
+                        )
+
+                    progress.minted += count
+                    progress.last_token_id = ending_index
+                    self._save_checkpoint(progress.minted, pending)
+                    self._report(on_progress, progress)
+
+                    for id in range(start_index, ending_index + 1):
+                        yield TxResultWithId(
+                            receipt,
+                            id=id,
+                            data=partial(self._get_metadata, id),
+                        )
+                    continue
+
+                if (
+                    len(uploads) > 0
+                    and uploads[0][2].done()
+                    and len(pending) < self._settings.max_pending_transactions
+                ):
+                    start_token_id, count, future = uploads.popleft()
+                    base_uri = future.result().base_uri
+                    progress.uploaded += count
+                    self._report(on_progress, progress)
+
+                    tx = self._contract_wrapper.submit_transaction(
+                        "lazy_mint",
+                        [
+                            count,
+                            base_uri if base_uri.endswith("/") else base_uri + "/",
+                            Web3.toBytes(text=""),
+                        ],
+                    )
+                    tx.add_done_callback(lambda _: ready.set())
+                    pending.append((start_token_id, count, tx))
+                    self._save_checkpoint(progress.minted, pending)
+                    progress.submitted += count
+                    self._report(on_progress, progress)
+                    continue
+
+                ready.wait()
+        finally:
+            for _, _, future in uploads:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        self._remove_checkpoint()
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _get_chunk_size(self) -> int:
+        # Chunks are halved until lazy minting one fits in the share of a block allowed
+        provider = self._contract_wrapper.get_provider()
+        block_gas_limit = provider.eth.get_block("latest")["gasLimit"]
+        max_gas = block_gas_limit * self._settings.max_block_gas_fraction
+
+        chunk_size = max(self._settings.chunk_size, 1)
+        while chunk_size > 1:
+            gas = self._contract_wrapper._contract_abi.lazy_mint.estimate_gas(
+                chunk_size, PLACEHOLDER_BASE_URI, Web3.toBytes(text="")
+            )
+            if gas <= max_gas:
+                break
+            chunk_size //= 2
+
+        return chunk_size
+
+    def _get_minted_count(self, checkpoint: Dict[str, Any]) -> int:
+        # Chunks still pending when the batch was interrupted may have been mined since,
+        # they count as minted once their receipt shows the tokens they were sent for
+        minted = checkpoint["minted"]
+        unconfirmed = None
+
+        for chunk in checkpoint.get("pending", []):
+            receipt = self._get_receipt(chunk["transaction_hash"])
+            if receipt is None or receipt["status"] != 1:
+                unconfirmed = chunk
+                continue
+
+            # The metadata is skipped by count, so minted chunks must follow each other
+            if unconfirmed is not None:
+                raise Exception(
+                    f"Cannot resume the batch, the chunk starting at token "
+                    f"{chunk['start_token_id']} was minted but the one starting at token "
+                    f"{unconfirmed['start_token_id']} was not"
+                )
+
+            events = self._contract_wrapper.get_events("TokensLazyMinted", receipt)
+            start_index = (
+                events[0].get("args").get("startTokenId")  # type: ignore
+                if len(events) > 0
+                else None
+            )
+            if start_index != chunk["start_token_id"]:
+                raise Exception(
+                    f"Cannot resume the batch, transaction {chunk['transaction_hash']} "
+                    f"was expected to lazy mint from token {chunk['start_token_id']}"
+                )
+            minted += chunk["count"]
+
+        return minted
+
+    def _get_receipt(self, tx_hash: str) -> Optional[TxReceipt]:
+        # A transaction unknown to the node was dropped, its chunk is minted again
+        provider = self._contract_wrapper.get_provider()
+        try:
+            return provider.eth.get_transaction_receipt(HexBytes(tx_hash))
+        except TransactionNotFound:
+            pass
+
+        try:
+            tx = provider.eth.get_transaction(HexBytes(tx_hash))
+        except TransactionNotFound:
+            return None
+        if tx["blockNumber"] is not None:
+            return provider.eth.get_transaction_receipt(HexBytes(tx_hash))
+
+        # Minting the chunk again while its transaction may still be mined would mint it twice
+        raise Exception(
+            f"Cannot resume the batch, transaction {tx_hash} is still pending, "
+            f"wait for it to be mined or dropped before resuming"
+        )
+
+    def _report(
+        self,
+        on_progress: Optional[Callable[[LazyMintProgress], None]],
+        progress: LazyMintProgress,
+    ):
+        if on_progress is not None:
+            on_progress(
+                LazyMintProgress(
+                    progress.uploaded,
+                    progress.submitted,
+                    progress.minted,
+                    progress.last_token_id,
+                )
+            )
+
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        path = self._settings.checkpoint_path
+        if path is None or not os.path.isfile(path):
+            return None
+
+        with open(path, "r") as f:
+            checkpoint = json.load(f)
+
+        if checkpoint.get("contract") != self._contract_wrapper._contract_abi.contract_address:
+            raise Exception(
+                f"Checkpoint {path} belongs to a batch on another contract"
+            )
+        return checkpoint
+
+    def _save_checkpoint(
+        self, minted: int, pending: Iterable[Tuple[int, int, PendingTransaction]]
+    ):
+        path = self._settings.checkpoint_path
+        if path is None:
+            return
+
+        # Written to a temporary file first so an interruption never corrupts it
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump(
+                {
+                    "contract": self._contract_wrapper._contract_abi.contract_address,
+                    "minted": minted,
+                    "pending": [
+                        {
+                            "transaction_hash": tx.tx_hash.hex(),
+                            "start_token_id": start_token_id,
+                            "count": count,
+                        }
+                        for start_token_id, count, tx in pending
+                    ],
+                },
+                f,
+            )
+        os.replace(temporary_path, path)
+
+    def _remove_checkpoint(self):
+        path = self._settings.checkpoint_path
+        if path is not None and os.path.isfile(path):
+            os.remove(path)
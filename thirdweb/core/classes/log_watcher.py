@@ -0,0 +1,435 @@
+import time
+from dataclasses import astuple
+from itertools import count
+from queue import Full, Queue
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+from eth_utils import event_abi_to_log_topic
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.contract import ContractEvent
+from web3.datastructures import AttributeDict
+from web3.types import LogReceipt
+
+from thirdweb.core.helpers.rpc import get_provider_key
+from thirdweb.types.sdk import EventSettings
+
+
+class _Subscription:
+    address: str
+    topic: str
+    event: ContractEvent
+
+    def __init__(
+        self,
+        address: str,
+        topic: str,
+        event: ContractEvent,
+        callback: Callable[[AttributeDict], Any],
+    ):
+        self.address = address
+        self.topic = topic
+        self.event = event
+        # Set on the instance, so that the callable is not bound as a method
+        self.callback: Callable[[AttributeDict], Any] = callback
+
+
+class LogWatcher:
+    """
+    Watches the chain for the logs of every event subscribed to through a provider.
+
+    All subscriptions are served by a single eth_getFilterChanges or eth_getLogs call
+    per tick on a background thread. Each log is decoded once and handed with its
+    listeners to a dispatch thread, so slow listeners never delay polling. When too
+    many events are waiting to be dispatched, polling pauses until the listeners catch
+    up, or new events are dropped if the settings say so.
+    """
+
+    _provider: Web3
+    _settings: EventSettings
+    _subscriptions: Dict[int, _Subscription]
+    _ids: "count[int]"
+    _lock: Lock
+    _poll_lock: Lock
+    _thread: Optional[Thread]
+    _dispatcher: Optional[Thread]
+    _queue: "Queue[Tuple[AttributeDict, List[int]]]"
+    _dropped: int
+
+    _use_filters: bool
+    _filter_id: Optional[str]
+    _filter_key: Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]
+    _next_block: Optional[int]
+    _skipped_block: Optional[int]
+    _carried_logs: List[LogReceipt]
+
+    def __init__(self, provider: Web3, settings: EventSettings = EventSettings()):
+        """
+        Initialize the log watcher.
+
+        :param provider: web3 provider instance to poll logs with
+        :param settings: poll interval, confirmation and back-pressure settings
+        """
+
+        self._provider = provider
+        self._settings = settings
+        self._subscriptions = {}
+        self._ids = count()
+        self._lock = Lock()
+        self._poll_lock = Lock()
+        self._thread = None
+        self._dispatcher = None
+        self._queue = Queue(maxsize=max(settings.max_pending_events, 1))
+        self._dropped = 0
+
+        self._use_filters = settings.use_filters and settings.confirmations == 0
+        self._filter_id = None
+        self._filter_key = None
+        self._next_block = None
+        self._skipped_block = None
+        self._carried_logs = []
+
+    def subscribe(
+        self, event: ContractEvent, callback: Callable[[AttributeDict], Any]
+    ) -> int:
+        """
+        Start delivering the logs of a contract event to a callback.
+
+        :param event: contract event to watch, bound to the address of its contract
+        :param callback: function called on the dispatch thread with each decoded log
+        :returns: ID of the subscription, to unsubscribe with
+        """
+
+        subscription = _Subscription(
+            str(event.address).lower(),
+            HexBytes(event_abi_to_log_topic(cast(Dict[str, Any], event.abi))).hex(),
+            event,
+            callback,
+        )
+
+        # The filter or start block is set up before returning, so that every log
+        # emitted from now on is delivered, even before the first poll
+        with self._poll_lock:
+            with self._lock:
+                subscription_id = next(self._ids)
+                self._subscriptions[subscription_id] = subscription
+                subscriptions = list(self._subscriptions.values())
+
+            try:
+                self._prepare(subscriptions)
+            except Exception:
+                # Left to the first poll, as before the node could be reached
+                pass
+
+        with self._lock:
+            if self._dispatcher is None:
+                self._dispatcher = Thread(target=self._dispatch, daemon=True)
+                self._dispatcher.start()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+        return subscription_id
+
+    def unsubscribe(self, subscription_id: int):
+        """
+        Stop delivering logs to a subscription. The watcher stops polling once it has
+        no subscriptions left.
+
+        :param subscription_id: ID returned when subscribing
+        """
+
+        with self._lock:
+            self._subscriptions.pop(subscription_id, None)
+
+    def subscription_count(self) -> int:
+        """
+        Get the number of active subscriptions.
+        """
+
+        with self._lock:
+            return len(self._subscriptions)
+
+    def dropped_count(self) -> int:
+        """
+        Get the number of events dropped because too many were waiting to be dispatched.
+        """
+
+        with self._lock:
+            return self._dropped
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _run(self):
+        while True:
+            time.sleep(self._settings.poll_interval)
+
+            with self._poll_lock:
+                with self._lock:
+                    if len(self._subscriptions) == 0:
+                        self._thread = None
+                        self._reset()
+                        return
+                    subscriptions = dict(self._subscriptions)
+
+                try:
+                    logs = self._poll(list(subscriptions.values()))
+                except Exception:
+                    # Transient RPC failures are retried on the next tick
+                    continue
+
+            self._publish(subscriptions, logs)
+
+    def _reset(self):
+        if self._filter_id is not None:
+            try:
+                self._provider.eth.uninstall_filter(self._filter_id)  # type: ignore
+            except Exception:
+                pass
+        self._filter_id = None
+        self._filter_key = None
+        self._next_block = None
+        self._skipped_block = None
+        self._carried_logs = []
+
+    def _prepare(self, subscriptions: List[_Subscription]):
+        addresses, topics = self._get_filter_key(subscriptions)
+
+        if self._use_filters:
+            try:
+                if self._filter_key != (addresses, topics):
+                    self._carried_logs.extend(self._replace_filter(addresses, topics))
+                return
+            except ValueError:
+                # The node does not support filters, so block ranges are used instead
+                self._use_filters = False
+                self._filter_id = None
+                self._filter_key = None
+
+        if self._next_block is None:
+            head = self._provider.eth.block_number - self._settings.confirmations
+            self._next_block = head + 1
+
+    def _get_filter_key(
+        self, subscriptions: List[_Subscription]
+    ) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        addresses = tuple(sorted({s.address for s in subscriptions}))
+        topics = tuple(sorted({s.topic for s in subscriptions}))
+        return addresses, topics
+
+    def _poll(self, subscriptions: List[_Subscription]) -> List[LogReceipt]:
+        addresses, topics = self._get_filter_key(subscriptions)
+        carried_logs, self._carried_logs = self._carried_logs, []
+
+        return carried_logs + self._poll_changes(addresses, topics)
+
+    def _poll_changes(
+        self, addresses: Tuple[str, ...], topics: Tuple[str, ...]
+    ) -> List[LogReceipt]:
+        if self._use_filters:
+            try:
+                return self._poll_filter(addresses, topics)
+            except ValueError as e:
+                if "filter not found" in str(e).lower():
+                    # Nodes drop filters that were not polled for a while, the next
+                    # one is created on the next tick and catches up from the last
+                    # delivered block
+                    self._filter_id = None
+                    self._filter_key = None
+                    return []
+
+                # The node does not support filters, so block ranges are used from
+                # the last delivered block instead
+                self._use_filters = False
+                self._filter_id = None
+                self._filter_key = None
+
+        return self._poll_logs(addresses, topics)
+
+    def _poll_filter(
+        self, addresses: Tuple[str, ...], topics: Tuple[str, ...]
+    ) -> List[LogReceipt]:
+        if self._filter_key != (addresses, topics):
+            return self._replace_filter(addresses, topics)
+
+        logs = list(self._provider.eth.get_filter_changes(self._filter_id))  # type: ignore
+
+        # Logs of the blocks caught up on when creating the filter are not sent again
+        if self._skipped_block is not None:
+            logs = [log for log in logs if log["blockNumber"] > self._skipped_block]
+            self._skipped_block = None
+
+        # Logs of blocks that were reorged out are sent again with removed set
+        logs = [log for log in logs if not log.get("removed", False)]
+        self._record_delivered(logs)
+        return logs
+
+    def _replace_filter(
+        self, addresses: Tuple[str, ...], topics: Tuple[str, ...]
+    ) -> List[LogReceipt]:
+        # Logs still pending on a live filter are collected before replacing it, while
+        # the ones a lost filter missed are fetched from the last delivered block
+        is_lost = self._filter_key is None
+        logs: List[LogReceipt] = []
+        if self._filter_id is not None:
+            try:
+                logs = list(self._provider.eth.get_filter_changes(self._filter_id))  # type: ignore
+            except ValueError:
+                # The node may have dropped the old filter already
+                is_lost = True
+
+            try:
+                self._provider.eth.uninstall_filter(self._filter_id)  # type: ignore
+            except Exception:
+                pass
+            self._filter_id = None
+            self._filter_key = None
+
+        logs = [log for log in logs if not log.get("removed", False)]
+        self._record_delivered(logs)
+
+        filter_id = self._provider.eth.filter(
+            {
+                "address": [Web3.toChecksumAddress(a) for a in addresses],
+                "topics": [list(topics)],  # type: ignore
+            }
+        ).filter_id
+        try:
+            head = self._provider.eth.block_number
+            from_block = self._next_block if is_lost else None
+            if from_block is not None:
+                logs.extend(self._get_logs(addresses, topics, from_block, head))
+        except Exception:
+            # The filter is created again on the next tick, to catch up from scratch
+            try:
+                self._provider.eth.uninstall_filter(filter_id)  # type: ignore
+            except Exception:
+                pass
+            raise
+
+        self._filter_id = filter_id
+        self._filter_key = (addresses, topics)
+        self._next_block = max(self._next_block or 0, head + 1)
+        self._skipped_block = head if from_block is not None else None
+
+        return logs
+
+    def _poll_logs(
+        self, addresses: Tuple[str, ...], topics: Tuple[str, ...]
+    ) -> List[LogReceipt]:
+        head = self._provider.eth.block_number - self._settings.confirmations
+        if self._next_block is None:
+            self._next_block = head + 1
+            return []
+        if head < self._next_block:
+            return []
+
+        to_block = min(head, self._next_block + max(self._settings.max_block_range, 1) - 1)
+        logs = self._get_logs(addresses, topics, self._next_block, to_block)
+        self._next_block = to_block + 1
+
+        return logs
+
+    def _get_logs(
+        self,
+        addresses: Tuple[str, ...],
+        topics: Tuple[str, ...],
+        from_block: int,
+        to_block: int,
+    ) -> List[LogReceipt]:
+        logs: List[LogReceipt] = []
+        size = max(self._settings.max_block_range, 1)
+        for start in range(from_block, to_block + 1, size):
+            logs.extend(
+                self._provider.eth.get_logs(
+                    {
+                        "address": [Web3.toChecksumAddress(a) for a in addresses],
+                        "topics": [list(topics)],  # type: ignore
+                        "fromBlock": start,
+                        "toBlock": min(start + size - 1, to_block),
+                    }
+                )
+            )
+        return logs
+
+    def _record_delivered(self, logs: List[LogReceipt]):
+        # Filters resume from the block after the last one a log was delivered for
+        for log in logs:
+            self._next_block = max(self._next_block or 0, log["blockNumber"] + 1)
+
+    def _publish(self, subscriptions: Dict[int, _Subscription], logs: List[LogReceipt]):
+        for log in logs:
+            if len(log["topics"]) == 0:
+                continue
+
+            address = str(log["address"]).lower()
+            topic = HexBytes(log["topics"][0]).hex()
+            matches = [
+                subscription_id
+                for subscription_id, s in subscriptions.items()
+                if s.address == address and s.topic == topic
+            ]
+            if len(matches) == 0:
+                continue
+
+            try:
+                event = subscriptions[matches[0]].event.processLog(log)
+            except Exception:
+                continue
+
+            item = (event, matches)
+            if not self._settings.drop_when_full:
+                self._queue.put(item)
+                continue
+
+            try:
+                self._queue.put_nowait(item)
+            except Full:
+                with self._lock:
+                    self._dropped += 1
+
+    def _dispatch(self):
+        while True:
+            event, subscription_ids = self._queue.get()
+
+            # Listeners removed while the event was waiting are skipped
+            with self._lock:
+                callbacks = [
+                    self._subscriptions[subscription_id].callback
+                    for subscription_id in subscription_ids
+                    if subscription_id in self._subscriptions
+                ]
+
+            for callback in callbacks:
+                try:
+                    callback(event)
+                except Exception:
+                    # A failing listener must not stop the others
+                    pass
+
+
+_log_watchers: Dict[Tuple[str, Tuple[Any, ...]], LogWatcher] = {}
+_log_watchers_lock = Lock()
+
+
+def get_log_watcher(
+    provider: Web3, settings: EventSettings = EventSettings()
+) -> LogWatcher:
+    """
+    Get the process-wide log watcher for the node of the given provider and the
+    given settings.
+
+    :param provider: web3 provider instance to poll logs with
+    :param settings: poll interval, confirmation and back-pressure settings
+    :returns: the log watcher shared by every contract using this node and settings
+    """
+
+    key = (get_provider_key(provider), astuple(settings))
+
+    with _log_watchers_lock:
+        if key not in _log_watchers:
+            _log_watchers[key] = LogWatcher(provider, settings)
+        return _log_watchers[key]
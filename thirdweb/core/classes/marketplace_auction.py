@@ -35,6 +35,7 @@ from thirdweb.types.marketplace import (
     NewAuctionListing,
     Offer,
 )
+from thirdweb.types.nft import NFTMetadata
 from web3.eth import TxReceipt
 
 
@@ -299,7 +300,17 @@ class MarketplaceAuction(BaseContract[Marketplace]):
         except:
             raise ListingNotFoundException(listing_id)
 
-    def _map_listing(self, listing: ContractListing) -> AuctionListing:
+    def _map_listing(
+        self, listing: ContractListing, asset: Optional[NFTMetadata] = None
+    ) -> AuctionListing:
+        if asset is None:
+            asset = fetch_token_metadata_for_contract(
+                listing.asset_contract,
+                self._contract_wrapper.get_provider(),
+                listing.token_id,
+                self._storage,
+            )
+
         return AuctionListing(
             id=listing.listing_id,
             asset_contract_address=listing.asset_contract,
@@ -313,12 +324,7 @@ class MarketplaceAuction(BaseContract[Marketplace]):
             token_id=listing.token_id,
             quantity=listing.quantity,
             start_time_in_epoch_seconds=listing.start_time,
-            asset=fetch_token_metadata_for_contract(
-                listing.asset_contract,
-                self._contract_wrapper.get_provider(),
-                listing.token_id,
-                self._storage,
-            ),
+            asset=asset,
             reserve_price_currency_value_per_token=fetch_currency_value(
                 self._contract_wrapper.get_provider(),
                 listing.currency,
@@ -37,6 +37,7 @@ from thirdweb.types.marketplace import (
     NewDirectListing,
     Offer,
 )
+from thirdweb.types.nft import NFTMetadata
 from web3.eth import TxReceipt
 
 
@@ -301,7 +302,17 @@ class MarketplaceDirect(BaseContract[Marketplace]):
         except:
             raise ListingNotFoundException(listing_id)
 
-    def _map_listing(self, listing: ContractListing) -> DirectListing:
+    def _map_listing(
+        self, listing: ContractListing, asset: Optional[NFTMetadata] = None
+    ) -> DirectListing:
+        if asset is None:
+            asset = fetch_token_metadata_for_contract(
+                listing.asset_contract,
+                self._contract_wrapper.get_provider(),
+                listing.token_id,
+                self._storage,
+            )
+
         return DirectListing(
             id=listing.listing_id,
             asset_contract_address=listing.asset_contract,
@@ -315,12 +326,7 @@ class MarketplaceDirect(BaseContract[Marketplace]):
             ),
             quantity=listing.quantity,
             start_time_in_seconds=listing.start_time,
-            asset=fetch_token_metadata_for_contract(
-                listing.asset_contract,
-                self._contract_wrapper.get_provider(),
-                listing.token_id,
-                self._storage,
-            ),
+            asset=asset,
             seconds_until_end=listing.end_time,
             seller_address=listing.token_owner,
         )
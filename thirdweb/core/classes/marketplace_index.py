@@ -0,0 +1,402 @@
+import json
+import sqlite3
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import astuple
+from threading import Lock
+from time import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, cast
+
+from eth_typing import Address
+from eth_utils import event_abi_to_log_topic
+from hexbytes import HexBytes
+
+from thirdweb.abi import Marketplace
+from thirdweb.constants.currency import ZERO_ADDRESS
+from thirdweb.core.classes.contract_wrapper import ContractWrapper
+from thirdweb.core.helpers.rpc import get_chain_id
+from thirdweb.types.marketplace import (
+    ContractListing,
+    ListingType,
+    MarketplaceIndexSettings,
+)
+
+LISTING_EVENTS = [
+    "ListingAdded",
+    "ListingUpdated",
+    "ListingRemoved",
+    "NewSale",
+    "NewOffer",
+    "AuctionClosed",
+]
+
+
+class MarketplaceIndex:
+    """
+    Local index of the listings of a marketplace, seeded once from the contract and
+    then caught up from listing events, which answers listing queries from memory.
+
+    The index trails the chain head by the configured number of confirmations and
+    reads listing state at its checkpoint block. If the checkpoint block is reorged
+    out anyway, the index is seeded again.
+
+    ```python
+    index = contract.enable_listing_index(MarketplaceIndexSettings(path="listings.db"))
+
+    index.sync()
+    listings = index.get_by_seller("{{wallet_address}}")
+    ```
+    """
+
+    _contract_wrapper: ContractWrapper[Marketplace]
+    _settings: MarketplaceIndexSettings
+    _lock: Lock
+    _db: Optional[sqlite3.Connection]
+
+    _block: Optional[int]
+    _block_hash: Optional[str]
+    _listings: Dict[int, ContractListing]
+    _by_seller: Dict[str, Set[int]]
+    _by_asset: Dict[str, Set[int]]
+    _by_currency: Dict[str, Set[int]]
+    _by_price: List[Tuple[int, int]]
+
+    def __init__(
+        self,
+        contract_wrapper: ContractWrapper[Marketplace],
+        settings: MarketplaceIndexSettings = MarketplaceIndexSettings(),
+    ):
+        """
+        Initialize the index, loading it from its database if there is one.
+
+        :param contract_wrapper: contract wrapper of the marketplace to index
+        :param settings: confirmation depth, persistence and log query settings
+        """
+
+        self._contract_wrapper = contract_wrapper
+        self._settings = settings
+        self._lock = Lock()
+        self._reset()
+
+        self._db = None
+        if settings.path is not None:
+            self._db = sqlite3.connect(settings.path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS listings (id INTEGER PRIMARY KEY, data TEXT NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoint "
+                "(id INTEGER PRIMARY KEY CHECK (id = 0), chain_id INTEGER NOT NULL, "
+                "address TEXT NOT NULL, block INTEGER NOT NULL, hash TEXT NOT NULL)"
+            )
+            self._db.commit()
+            self._load()
+
+    def get_block(self) -> Optional[int]:
+        """
+        Get the block the index is up to date with.
+
+        :returns: the checkpoint block, or None if the index was never synced
+        """
+
+        return self._block
+
+    def sync(self) -> int:
+        """
+        Catch the index up with the chain, seeding it first if needed.
+
+        :returns: the block the index is now up to date with
+        """
+
+        with self._lock:
+            provider = self._contract_wrapper.get_provider()
+            target = max(provider.eth.block_number - self._settings.confirmations, 0)
+
+            if self._block is None or not self._is_checkpoint_canonical():
+                self._seed(target)
+            elif target > self._block:
+                self._catch_up(target)
+
+            return cast(int, self._block)
+
+    def get(self, listing_id: int) -> Optional[ContractListing]:
+        """
+        Get an indexed listing.
+
+        :param listing_id: ID of the listing
+        :returns: the listing, or None if it does not exist or was removed
+        """
+
+        with self._lock:
+            return self._listings.get(listing_id)
+
+    def get_active(self, now: Optional[int] = None) -> List[ContractListing]:
+        """
+        Get the listings that can currently be bought or bid on.
+
+        :param now: timestamp auctions must end after, defaults to the current time
+        :returns: the active listings, in order of ID
+        """
+
+        with self._lock:
+            return self._filter(self._listings.keys(), True, now)
+
+    def get_by_seller(
+        self, seller: str, active_only: bool = True
+    ) -> List[ContractListing]:
+        """
+        Get the listings of a seller.
+
+        :param seller: address of the seller
+        :param active_only: whether to only return active listings
+        :returns: the listings, in order of ID
+        """
+
+        with self._lock:
+            return self._filter(
+                self._by_seller.get(seller.lower(), set()), active_only
+            )
+
+    def get_by_asset(
+        self,
+        asset_contract: str,
+        token_id: Optional[int] = None,
+        active_only: bool = True,
+    ) -> List[ContractListing]:
+        """
+        Get the listings of the tokens of an asset contract.
+
+        :param asset_contract: address of the asset contract
+        :param token_id: optional ID of the token to get the listings of
+        :param active_only: whether to only return active listings
+        :returns: the listings, in order of ID
+        """
+
+        with self._lock:
+            listings = self._filter(
+                self._by_asset.get(asset_contract.lower(), set()), active_only
+            )
+
+        if token_id is None:
+            return listings
+        return [listing for listing in listings if listing.token_id == token_id]
+
+    def get_by_currency(
+        self, currency: str, active_only: bool = True
+    ) -> List[ContractListing]:
+        """
+        Get the listings priced in a currency.
+
+        :param currency: address of the currency
+        :param active_only: whether to only return active listings
+        :returns: the listings, in order of ID
+        """
+
+        with self._lock:
+            return self._filter(
+                self._by_currency.get(currency.lower(), set()), active_only
+            )
+
+    def get_by_price_range(
+        self,
+        min_price: int,
+        max_price: int,
+        currency: Optional[str] = None,
+        active_only: bool = True,
+    ) -> List[ContractListing]:
+        """
+        Get the listings with a buyout price per token in a range.
+
+        :param min_price: minimum buyout price per token in wei, inclusive
+        :param max_price: maximum buyout price per token in wei, inclusive
+        :param currency: optional address of the currency the prices are in
+        :param active_only: whether to only return active listings
+        :returns: the listings, in order of ID
+        """
+
+        with self._lock:
+            start = bisect_left(self._by_price, (min_price, -1))
+            end = bisect_right(self._by_price, (max_price, float("inf")))
+            listings = self._filter(
+                [listing_id for _, listing_id in self._by_price[start:end]],
+                active_only,
+            )
+
+        if currency is None:
+            return listings
+        return [
+            listing
+            for listing in listings
+            if listing.currency.lower() == currency.lower()
+        ]
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _reset(self):
+        self._block = None
+        self._block_hash = None
+        self._listings = {}
+        self._by_seller = {}
+        self._by_asset = {}
+        self._by_currency = {}
+        self._by_price = []
+
+    def _filter(
+        self, listing_ids: Iterable[int], active_only: bool, now: Optional[int] = None
+    ) -> List[ContractListing]:
+        now = now if now is not None else int(time())
+
+        listings = []
+        for listing_id in sorted(listing_ids):
+            listing = self._listings[listing_id]
+            if not active_only or self._is_active(listing, now):
+                listings.append(listing)
+
+        return listings
+
+    def _is_active(self, listing: ContractListing, now: int) -> bool:
+        if ListingType(listing.listing_type) == ListingType.AUCTION:
+            return listing.end_time > now
+        return listing.quantity > 0
+
+    def _is_checkpoint_canonical(self) -> bool:
+        block = self._contract_wrapper.get_provider().eth.get_block(
+            cast(int, self._block)
+        )
+        return HexBytes(block["hash"]).hex() == self._block_hash
+
+    def _seed(self, block: int):
+        self._reset()
+
+        # Read at the checkpoint block, which the generated bindings cannot do
+        [total_listings] = self._contract_wrapper.multi_read(
+            [("totalListings", [])], allow_failure=False, block_identifier=block
+        )
+        self._refresh(block, list(range(total_listings.data)), full=True)
+
+    def _catch_up(self, target: int):
+        provider = self._contract_wrapper.get_provider()
+        interface = self._contract_wrapper.get_contract_interface()
+        topics = [
+            HexBytes(event_abi_to_log_topic(cast(Dict[str, Any], abi))).hex()
+            for abi in interface.abi
+            if abi.get("type") == "event" and abi.get("name") in LISTING_EVENTS
+        ]
+
+        # Every listing event has the listing ID as its first indexed argument
+        listing_ids: Set[int] = set()
+        from_block = cast(int, self._block) + 1
+        while from_block <= target:
+            to_block = min(from_block + max(self._settings.max_block_range, 1) - 1, target)
+            logs = provider.eth.get_logs(
+                {
+                    "address": cast(Address, interface.address),
+                    "fromBlock": from_block,
+                    "toBlock": to_block,
+                    "topics": [topics],  # type: ignore
+                }
+            )
+            for log in logs:
+                listing_ids.add(int(HexBytes(log["topics"][1]).hex(), 16))
+            from_block = to_block + 1
+
+        self._refresh(target, sorted(listing_ids))
+
+    def _refresh(self, block: int, listing_ids: List[int], full: bool = False):
+        results = self._contract_wrapper.multi_read(
+            [("listings", [listing_id]) for listing_id in listing_ids],
+            allow_failure=False,
+            block_identifier=block,
+        )
+
+        updated: List[ContractListing] = []
+        removed: List[int] = []
+        for listing_id, result in zip(listing_ids, results):
+            listing = ContractListing(*result.data)
+            self._remove(listing_id)
+
+            if listing.asset_contract == ZERO_ADDRESS:
+                removed.append(listing_id)
+            else:
+                self._add(listing)
+                updated.append(listing)
+
+        block_hash = HexBytes(
+            self._contract_wrapper.get_provider().eth.get_block(block)["hash"]
+        ).hex()
+        self._block = block
+        self._block_hash = block_hash
+        self._save(updated, removed, full)
+
+    def _add(self, listing: ContractListing):
+        self._listings[listing.listing_id] = listing
+        self._by_seller.setdefault(listing.token_owner.lower(), set()).add(
+            listing.listing_id
+        )
+        self._by_asset.setdefault(listing.asset_contract.lower(), set()).add(
+            listing.listing_id
+        )
+        self._by_currency.setdefault(listing.currency.lower(), set()).add(
+            listing.listing_id
+        )
+        insort(self._by_price, (listing.buyout_price_per_token, listing.listing_id))
+
+    def _remove(self, listing_id: int):
+        listing = self._listings.pop(listing_id, None)
+        if listing is None:
+            return
+
+        self._by_seller[listing.token_owner.lower()].discard(listing_id)
+        self._by_asset[listing.asset_contract.lower()].discard(listing_id)
+        self._by_currency[listing.currency.lower()].discard(listing_id)
+
+        entry = (listing.buyout_price_per_token, listing_id)
+        i = bisect_left(self._by_price, entry)
+        if i < len(self._by_price) and self._by_price[i] == entry:
+            del self._by_price[i]
+
+    def _get_chain_key(self) -> Tuple[int, str]:
+        return (
+            get_chain_id(self._contract_wrapper.get_provider()),
+            self._contract_wrapper._contract_abi.contract_address.lower(),
+        )
+
+    def _load(self):
+        assert self._db is not None
+
+        row = self._db.execute(
+            "SELECT chain_id, address, block, hash FROM checkpoint WHERE id = 0"
+        ).fetchone()
+        if row is None or (row[0], row[1]) != self._get_chain_key():
+            return
+
+        for (data,) in self._db.execute("SELECT data FROM listings"):
+            self._add(ContractListing(*json.loads(data)))
+        self._block = row[2]
+        self._block_hash = row[3]
+
+    def _save(self, updated: List[ContractListing], removed: List[int], full: bool):
+        if self._db is None:
+            return
+
+        chain_id, address = self._get_chain_key()
+        with self._db:
+            if full:
+                self._db.execute("DELETE FROM listings")
+            self._db.executemany(
+                "INSERT OR REPLACE INTO listings (id, data) VALUES (?, ?)",
+                [
+                    (listing.listing_id, json.dumps(astuple(listing)))
+                    for listing in updated
+                ],
+            )
+            self._db.executemany(
+                "DELETE FROM listings WHERE id = ?",
+                [(listing_id,) for listing_id in removed],
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO checkpoint (id, chain_id, address, block, hash) "
+                "VALUES (0, ?, ?, ?, ?)",
+                (chain_id, address, self._block, self._block_hash),
+            )
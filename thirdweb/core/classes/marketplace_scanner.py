@@ -0,0 +1,280 @@
+from typing import Any, Dict, Iterable, List, Set, Tuple, Union, cast
+
+from eth_typing import Address
+from web3 import Web3
+from web3.contract import Contract
+
+from thirdweb.abi import IERC165, IERC721, IERC1155, Marketplace
+from thirdweb.common.currency import fetch_currency_metadata
+from thirdweb.common.nft import build_token_metadata
+from thirdweb.constants.contract import INTERFACE_ID_IERC1155, INTERFACE_ID_IERC721
+from thirdweb.constants.currency import ZERO_ADDRESS
+from thirdweb.core.classes.contract_wrapper import ContractWrapper
+from thirdweb.core.classes.ipfs_storage import IpfsStorage
+from thirdweb.core.classes.marketplace_auction import MarketplaceAuction
+from thirdweb.core.classes.marketplace_direct import MarketplaceDirect
+from thirdweb.types.marketplace import (
+    AuctionListing,
+    ContractListing,
+    DirectListing,
+    ListingType,
+)
+from thirdweb.types.multicall import ReadCall, ReadResult
+from thirdweb.types.nft import NFTMetadata
+
+ERC721 = "ERC721"
+ERC1155 = "ERC1155"
+
+
+class MarketplaceScanner:
+    """
+    Loads many marketplace listings at once in a few batched stages: listing structs,
+    asset standards, ownership and approvals, token URIs and metadata, and currencies.
+    Each stage deduplicates its lookups across listings and reads through Multicall3.
+    """
+
+    _contract_wrapper: ContractWrapper[Marketplace]
+    _storage: IpfsStorage
+    _direct: MarketplaceDirect
+    _auction: MarketplaceAuction
+    _contracts: Dict[Tuple[str, Any], Contract]
+
+    def __init__(
+        self,
+        contract_wrapper: ContractWrapper[Marketplace],
+        storage: IpfsStorage,
+        direct: MarketplaceDirect,
+        auction: MarketplaceAuction,
+    ):
+        self._contract_wrapper = contract_wrapper
+        self._storage = storage
+        self._direct = direct
+        self._auction = auction
+        # Only used to encode calls and decode results, so they outlive provider changes
+        self._contracts = {}
+
+    def scan(
+        self, listing_ids: Iterable[int]
+    ) -> List[Union[DirectListing, AuctionListing]]:
+        """
+        Get the listings with the given IDs, skipping removed listings and direct
+        listings whose seller no longer owns or approved the asset.
+
+        :param listing_ids: IDs of the listings to get
+        :returns: the valid listings, in order of ID
+        """
+
+        listings = self._get_contract_listings(list(listing_ids))
+
+        standards = self._get_asset_standards(
+            {listing.asset_contract for listing in listings}
+        )
+        listings = [
+            listing for listing in listings if standards.get(listing.asset_contract)
+        ]
+
+        valid = self._validate_direct_listings(
+            [
+                listing
+                for listing in listings
+                if ListingType(listing.listing_type) == ListingType.DIRECT
+            ],
+            standards,
+        )
+        listings = [
+            listing
+            for listing in listings
+            if ListingType(listing.listing_type) == ListingType.AUCTION
+            or listing.listing_id in valid
+        ]
+
+        assets = self._get_assets(listings, standards)
+        currencies = self._get_currencies({listing.currency for listing in listings})
+
+        results: List[Union[DirectListing, AuctionListing]] = []
+        for listing in listings:
+            asset = assets.get((listing.asset_contract, listing.token_id))
+            if asset is None or listing.currency.lower() not in currencies:
+                continue
+
+            if ListingType(listing.listing_type) == ListingType.AUCTION:
+                results.append(self._auction._map_listing(listing, asset))
+            else:
+                results.append(self._direct._map_listing(listing, asset))
+
+        return results
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _read(self, calls: List[ReadCall]) -> List[ReadResult]:
+        if len(calls) == 0:
+            return []
+        return self._contract_wrapper.get_multicall_reader().read(
+            calls, allow_failure=True
+        )
+
+    def _get_contract(self, address: str, abi: Any) -> Contract:
+        address = Web3.toChecksumAddress(address)
+        if (address, abi) not in self._contracts:
+            self._contracts[(address, abi)] = (
+                self._contract_wrapper.get_provider().eth.contract(
+                    address=cast(Address, address), abi=abi.abi()
+                )
+            )
+        return self._contracts[(address, abi)]
+
+    def _get_contract_listings(self, listing_ids: List[int]) -> List[ContractListing]:
+        results = self._contract_wrapper.multi_read(
+            [("listings", [listing_id]) for listing_id in listing_ids],
+            allow_failure=True,
+        )
+
+        listings = []
+        for result in results:
+            if not result.success:
+                continue
+
+            listing = ContractListing(*result.data)
+            if listing.asset_contract == ZERO_ADDRESS:
+                continue
+            if listing.listing_type not in [t.value for t in ListingType]:
+                continue
+
+            listings.append(listing)
+
+        return listings
+
+    def _get_asset_standards(self, asset_contracts: Set[str]) -> Dict[str, str]:
+        contracts = sorted(asset_contracts)
+        calls = []
+        for address in contracts:
+            erc165 = self._get_contract(address, IERC165)
+            calls.append(ReadCall(erc165, "supportsInterface", [INTERFACE_ID_IERC721]))
+            calls.append(ReadCall(erc165, "supportsInterface", [INTERFACE_ID_IERC1155]))
+
+        results = self._read(calls)
+
+        standards: Dict[str, str] = {}
+        for address, is_erc721, is_erc1155 in zip(
+            contracts, results[0::2], results[1::2]
+        ):
+            if is_erc721.success and is_erc721.data:
+                standards[address] = ERC721
+            elif is_erc1155.success and is_erc1155.data:
+                standards[address] = ERC1155
+
+        return standards
+
+    def _validate_direct_listings(
+        self, listings: List[ContractListing], standards: Dict[str, str]
+    ) -> Set[int]:
+        marketplace = self._contract_wrapper._contract_abi.contract_address
+
+        # Operator approvals are shared by every listing of a seller on a contract
+        sellers = sorted(
+            {(listing.asset_contract, listing.token_owner) for listing in listings}
+        )
+        calls = []
+        for asset_contract, seller in sellers:
+            abi = IERC721 if standards[asset_contract] == ERC721 else IERC1155
+            calls.append(
+                ReadCall(
+                    self._get_contract(asset_contract, abi),
+                    "isApprovedForAll",
+                    [seller, marketplace],
+                )
+            )
+
+        for listing in listings:
+            if standards[listing.asset_contract] == ERC721:
+                erc721 = self._get_contract(listing.asset_contract, IERC721)
+                calls.append(ReadCall(erc721, "getApproved", [listing.token_id]))
+                calls.append(ReadCall(erc721, "ownerOf", [listing.token_id]))
+            else:
+                erc1155 = self._get_contract(listing.asset_contract, IERC1155)
+                calls.append(
+                    ReadCall(erc1155, "balanceOf", [listing.token_owner, listing.token_id])
+                )
+
+        results = self._read(calls)
+        approved_for_all = {
+            seller: result.success and bool(result.data)
+            for seller, result in zip(sellers, results[: len(sellers)])
+        }
+
+        valid: Set[int] = set()
+        offset = len(sellers)
+        for listing in listings:
+            approved = approved_for_all[(listing.asset_contract, listing.token_owner)]
+
+            if standards[listing.asset_contract] == ERC721:
+                approved_token, owner = results[offset], results[offset + 1]
+                offset += 2
+
+                approved = approved or (
+                    approved_token.success
+                    and approved_token.data.lower() == marketplace.lower()
+                )
+                owned = owner.success and owner.data.lower() == listing.token_owner.lower()
+            else:
+                balance = results[offset]
+                offset += 1
+
+                owned = balance.success and balance.data > listing.quantity
+
+            if approved and owned:
+                valid.add(listing.listing_id)
+
+        return valid
+
+    def _get_assets(
+        self, listings: List[ContractListing], standards: Dict[str, str]
+    ) -> Dict[Tuple[str, int], NFTMetadata]:
+        tokens = sorted({(listing.asset_contract, listing.token_id) for listing in listings})
+
+        calls = []
+        for asset_contract, token_id in tokens:
+            if standards[asset_contract] == ERC721:
+                contract = self._get_contract(asset_contract, IERC721)
+                calls.append(ReadCall(contract, "tokenURI", [token_id]))
+            else:
+                contract = self._get_contract(asset_contract, IERC1155)
+                calls.append(ReadCall(contract, "uri", [token_id]))
+
+        token_uris: Dict[Tuple[str, int], str] = {}
+        for token, result in zip(tokens, self._read(calls)):
+            if result.success and result.data:
+                token_uris[token] = result.data
+
+        # Tokens often share a metadata URI, so each one is only fetched once
+        uris = sorted(set(token_uris.values()))
+        metadatas = dict(zip(uris, self._storage.get_batch(uris, allow_failure=True)))
+
+        assets: Dict[Tuple[str, int], NFTMetadata] = {}
+        for token, token_uri in token_uris.items():
+            metadata = metadatas.get(token_uri)
+            if metadata is None:
+                continue
+
+            try:
+                assets[token] = build_token_metadata(token[1], token_uri, metadata)
+            except:
+                pass
+
+        return assets
+
+    def _get_currencies(self, currencies: Set[str]) -> Set[str]:
+        # Warms the currency metadata cache used when mapping listings
+        provider = self._contract_wrapper.get_provider()
+
+        resolved: Set[str] = set()
+        for currency in currencies:
+            try:
+                fetch_currency_metadata(provider, currency)
+                resolved.add(currency.lower())
+            except:
+                pass
+
+        return resolved
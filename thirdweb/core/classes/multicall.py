@@ -0,0 +1,184 @@
+from typing import Any, List, Optional, Sequence, cast
+
+from eth_typing import Address
+from web3 import Web3
+from web3.types import BlockIdentifier
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract import ContractFunction
+
+from thirdweb.types.multicall import ReadCall, ReadResult
+from thirdweb.types.sdk import MulticallSettings
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+
+
+class MulticallReader:
+    """
+    Batches contract reads into Multicall3 aggregate3 calls, falling back to
+    one eth_call per read on chains where Multicall3 is not deployed.
+    """
+
+    _provider: Web3
+    _settings: MulticallSettings
+    _is_deployed: Optional[bool]
+
+    def __init__(
+        self, provider: Web3, settings: MulticallSettings = MulticallSettings()
+    ):
+        """
+        Initialize the multicall reader.
+
+        :param provider: web3 provider instance to use
+        :param settings: multicall address, chunk size and failure settings
+        """
+
+        self._provider = provider
+        self._settings = settings
+        self._is_deployed = None
+
+    def is_deployed(self) -> bool:
+        """
+        Check if the Multicall3 contract exists on the connected chain.
+
+        :returns: True if reads can be batched through Multicall3
+        """
+
+        if self._is_deployed is None:
+            code = self._provider.eth.get_code(
+                cast(Address, Web3.toChecksumAddress(self._settings.address))
+            )
+            self._is_deployed = len(code) > 0
+
+        return self._is_deployed
+
+    def read(
+        self,
+        calls: Sequence[ReadCall],
+        allow_failure: Optional[bool] = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> List[ReadResult]:
+        """
+        Execute a list of contract reads in as few RPC round trips as possible.
+
+        :param calls: list of reads to execute
+        :param allow_failure: whether failed reads are returned as unsuccessful results
+            instead of raising, defaults to the multicall settings
+        :param block_identifier: block to read the state at, defaults to the latest block
+        :returns: list of results in the same order as the calls
+        """
+
+        if allow_failure is None:
+            allow_failure = self._settings.allow_failure
+
+        functions = [
+            cast(
+                ContractFunction,
+                getattr(call.contract.functions, call.fn)(*call.args),
+            )
+            for call in calls
+        ]
+
+        if not self.is_deployed():
+            return [
+                self._read_single(fn, allow_failure, block_identifier)
+                for fn in functions
+            ]
+
+        multicall = self._provider.eth.contract(
+            address=cast(Address, Web3.toChecksumAddress(self._settings.address)),
+            abi=MULTICALL3_ABI,
+        )
+
+        results: List[ReadResult] = []
+        chunk_size = max(self._settings.chunk_size, 1)
+        for i in range(0, len(functions), chunk_size):
+            chunk = functions[i : i + chunk_size]
+            encoded = [
+                (fn.address, allow_failure, fn._encode_transaction_data())
+                for fn in chunk
+            ]
+            returned = multicall.functions.aggregate3(encoded).call(
+                block_identifier=block_identifier
+            )
+
+            for fn, (success, return_data) in zip(chunk, returned):
+                if not success or len(return_data) == 0:
+                    results.append(ReadResult(False))
+                    continue
+
+                try:
+                    results.append(ReadResult(True, self._decode(fn, return_data)))
+                except Exception as e:
+                    if not allow_failure:
+                        raise e
+                    results.append(ReadResult(False))
+
+        return results
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _read_single(
+        self,
+        fn: ContractFunction,
+        allow_failure: bool,
+        block_identifier: BlockIdentifier,
+    ) -> ReadResult:
+        try:
+            return ReadResult(True, fn.call(block_identifier=block_identifier))
+        except Exception as e:
+            if not allow_failure:
+                raise e
+            return ReadResult(False)
+
+    def _decode(self, fn: ContractFunction, return_data: bytes) -> Any:
+        return decode_function_result(fn, return_data)
+
+
+def decode_function_result(fn: ContractFunction, return_data: bytes) -> Any:
+    """
+    Decode the data returned by a call to a contract function, the way web3 does.
+
+    :param fn: the called contract function
+    :param return_data: raw data returned by the call
+    :returns: the single return value of the function, or a list of its return values
+    """
+
+    output_types = get_abi_output_types(fn.abi)
+    output_data = fn.web3.codec.decode_abi(output_types, return_data)
+    normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+
+    if len(normalized) == 1:
+        return normalized[0]
+    return normalized
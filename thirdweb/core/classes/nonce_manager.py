@@ -0,0 +1,109 @@
+from threading import Lock
+from typing import Dict, Optional, Tuple, cast
+
+from eth_typing import Address
+from web3 import Web3
+
+from thirdweb.common.error import includes_error_message
+from thirdweb.core.helpers.rpc import get_provider_key
+
+NONCE_ERROR_MESSAGES = [
+    "nonce too low",
+    "replacement transaction underpriced",
+    "replacement underpriced",
+    "invalid nonce",
+]
+
+
+class NonceManager:
+    """
+    Hands out transaction nonces for a single signer from a local counter, so that
+    many transactions can be submitted back to back without waiting for each one
+    to be mined, and so that threads sharing a signer never reuse a nonce.
+    """
+
+    _provider: Web3
+    _address: str
+    _next_nonce: Optional[int]
+    _lock: Lock
+
+    def __init__(self, provider: Web3, address: str):
+        """
+        Initialize the nonce manager.
+
+        :param provider: web3 provider instance to read the chain nonce from
+        :param address: address of the signer to manage nonces for
+        """
+
+        self._provider = provider
+        self._address = address
+        self._next_nonce = None
+        self._lock = Lock()
+
+    def next_nonce(self) -> int:
+        """
+        Allocate the next nonce for the signer, syncing with the chain if needed.
+
+        :returns: the nonce to use for the next transaction
+        """
+
+        with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = self._provider.eth.get_transaction_count(
+                    cast(Address, self._address), "pending"
+                )
+
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+
+    def release(self, nonce: int):
+        """
+        Return a nonce that was allocated but never reached the chain.
+
+        :param nonce: the nonce that was not used
+        """
+
+        with self._lock:
+            if self._next_nonce is not None and nonce == self._next_nonce - 1:
+                self._next_nonce = nonce
+            else:
+                # Later nonces are already in flight, so there is a gap the
+                # chain needs to tell us about
+                self._next_nonce = None
+
+    def resync(self):
+        """
+        Drop the local counter so the next allocation reads the nonce from the chain.
+        """
+
+        with self._lock:
+            self._next_nonce = None
+
+
+def is_nonce_error(err: Exception) -> bool:
+    return any(
+        includes_error_message(str(err).lower(), message)
+        for message in NONCE_ERROR_MESSAGES
+    )
+
+
+_nonce_managers: Dict[Tuple[str, str], NonceManager] = {}
+_nonce_managers_lock = Lock()
+
+
+def get_nonce_manager(provider: Web3, address: str) -> NonceManager:
+    """
+    Get the process-wide nonce manager of a signer on the given provider.
+
+    :param provider: web3 provider instance the transactions are sent through
+    :param address: address of the signer
+    :returns: the nonce manager shared by every contract using this signer
+    """
+
+    key = (get_provider_key(provider), address.lower())
+
+    with _nonce_managers_lock:
+        if key not in _nonce_managers:
+            _nonce_managers[key] = NonceManager(provider, address)
+        return _nonce_managers[key]
@@ -0,0 +1,93 @@
+import sqlite3
+from threading import Lock
+from typing import Dict, Optional
+
+
+class PinIndex:
+    """
+    Local index of the content already uploaded to IPFS, mapping the CID of each
+    uploaded file to the path it was pinned at, so identical content is never
+    uploaded twice.
+
+    The index is kept in memory and, when a path is given, in a sqlite database that
+    survives process restarts. It is not checked against the pinning service, so
+    content unpinned elsewhere stays in the index until it is removed.
+    """
+
+    _pins: Dict[str, str]
+    _db: Optional[sqlite3.Connection]
+    _lock: Lock
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the pin index.
+
+        :param path: optional path of the sqlite database the index is persisted to
+        """
+
+        self._pins = {}
+        self._lock = Lock()
+
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS pins (cid TEXT PRIMARY KEY, path TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+    def get(self, cid: str) -> Optional[str]:
+        """
+        Get the path content was pinned at.
+
+        :param cid: CID of the content
+        :returns: the path of the pinned content, or None if it was never uploaded
+        """
+
+        with self._lock:
+            if cid in self._pins:
+                return self._pins[cid]
+
+            if self._db is None:
+                return None
+
+            row = self._db.execute(
+                "SELECT path FROM pins WHERE cid = ?", (cid,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._pins[cid] = row[0]
+            return row[0]
+
+    def set(self, cid: str, path: str):
+        """
+        Record the path content was pinned at.
+
+        :param cid: CID of the content
+        :param path: path of the pinned content, as a directory CID and a file name
+        """
+
+        with self._lock:
+            self._pins[cid] = path
+
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO pins (cid, path) VALUES (?, ?)",
+                        (cid, path),
+                    )
+
+    def remove(self, cid: str):
+        """
+        Forget content, so that it is uploaded again the next time it is seen.
+
+        :param cid: CID of the content
+        """
+
+        with self._lock:
+            self._pins.pop(cid, None)
+
+            if self._db is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM pins WHERE cid = ?", (cid,))
@@ -1,11 +1,22 @@
 import re
+from dataclasses import replace
 from typing import Optional
 from pyee.base import EventEmitter
 from thirdweb.constants.chains import ChainId
-from thirdweb.constants.rpc import CHAIN_ID_TO_RPC_URL
-from thirdweb.types.sdk import SDKOptions
+from thirdweb.constants.rpc import CHAIN_ID_TO_RPC_URLS
+from thirdweb.core.classes.batch_provider import BatchHTTPProvider
+from thirdweb.core.classes.call_cache import (
+    CALL_CACHE_MIDDLEWARE,
+    CallCache,
+    get_call_cache,
+)
+from thirdweb.core.classes.failover_provider import FailoverHTTPProvider
+from thirdweb.core.classes.multicall import MulticallReader
+from thirdweb.core.classes.read_write_provider import ReadWriteProvider
+from thirdweb.types.sdk import ReadOnlySettings, SDKOptions
 from eth_account.account import LocalAccount
 from web3.middleware import geth_poa_middleware
+from web3.providers.base import BaseProvider
 from web3 import Web3
 
 
@@ -13,11 +24,18 @@ class ProviderHandler(EventEmitter):
     """
     The provider handler is responsible for managing the connected provider and signer
     for any class including the read-only provider.
+
+    The provider passed in is used as is, unless reads have to be routed to the
+    read-only RPC or cached. Requests are then sent through a Web3 instance of the SDK,
+    returned by get_provider, with the transport and the middlewares the provider
+    passed in had at that point. Middlewares added to that provider afterwards are not
+    used by the SDK.
     """
 
     __provider: Web3
     __signer: Optional[LocalAccount]
     __options: SDKOptions
+    __multicall_reader: Optional[MulticallReader] = None
 
     def __init__(
         self,
@@ -35,9 +53,9 @@ class ProviderHandler(EventEmitter):
 
         super().__init__()
 
+        self.__options = options
         self._update_provider(provider)
         self._update_signer(signer)
-        self.__options = options
 
     def is_read_only(self):
         """
@@ -67,14 +85,50 @@ class ProviderHandler(EventEmitter):
     def get_options(self) -> SDKOptions:
         return self.__options
 
+    def get_multicall_reader(self) -> MulticallReader:
+        """
+        Get the multicall reader for the active provider.
+
+        :returns: the MulticallReader used to batch contract reads
+        """
+
+        if self.__multicall_reader is None:
+            self.__multicall_reader = MulticallReader(
+                self.get_provider(), self.get_options().multicall_settings
+            )
+
+        return self.__multicall_reader
+
+    def get_call_cache(self) -> Optional[CallCache]:
+        """
+        Get the cache of contract reads for the active provider.
+
+        :returns: the CallCache of the provider, or None if reads are not cached
+        """
+
+        settings = self.get_options().call_cache_settings
+        if not settings.enabled:
+            return None
+
+        return get_call_cache(self.get_provider(), settings)
+
     def _update_provider(self, provider: Web3):
         """
-        Update the active provider.
+        Update the active provider. With read-only settings, reads made through it
+        are sent to the read-only RPC and everything else to its own RPC.
 
         :param provider: web3 provider instance to use
         """
 
+        # The provider passed in is left untouched, reads are only routed or cached
+        # through a Web3 of the SDK with the same transport and middlewares. Other
+        # handlers given that Web3 use it as is, so that all of them share the same
+        # read-only connections
+        if self._needs_own_provider(provider):
+            provider = self._create_own_provider(provider)
+
         self.__provider = provider
+        self.__multicall_reader = None
 
     def _update_signer(self, signer: Optional[LocalAccount] = None):
         """
@@ -89,13 +143,95 @@ class ProviderHandler(EventEmitter):
             provider = self.get_provider()
             provider.eth.default_account = signer.address
 
+    def _needs_own_provider(self, provider: Web3) -> bool:
+        """
+        Check if reads made through a provider have to be routed to the read-only RPC
+        or cached, and it was not created by a provider handler doing so already.
+
+        :param provider: web3 provider instance to check
+        """
+
+        options = self.get_options()
+        read_only_settings = options.read_only_settings
+        needs_routing = (
+            read_only_settings is not None
+            and read_only_settings.rpc_url != ""
+            and not isinstance(provider.provider, ReadWriteProvider)
+        )
+        needs_cache = (
+            options.call_cache_settings.enabled
+            and CALL_CACHE_MIDDLEWARE not in provider.middleware_onion
+        )
+
+        return needs_routing or needs_cache
+
+    def _create_own_provider(self, provider: Web3) -> Web3:
+        """
+        Create the Web3 instance requests are sent through, reading from the read-only
+        RPC if there is one and caching reads.
+
+        :param provider: web3 provider instance given to the SDK
+        """
+
+        transport = provider.provider
+        read_only_settings = self.get_options().read_only_settings
+        if (
+            read_only_settings is not None
+            and read_only_settings.rpc_url != ""
+            and not isinstance(transport, ReadWriteProvider)
+        ):
+            transport = ReadWriteProvider(
+                transport, self._get_read_only_provider(read_only_settings)
+            )
+
+        own_provider = Web3(transport, middlewares=provider.middleware_onion.middlewares)
+        # Installed even when reads are not cached, so that reads can be pinned to a block
+        get_call_cache(own_provider, self.get_options().call_cache_settings).install(
+            own_provider
+        )
+
+        return own_provider
+
     def _get_default_provider(self, chain_id: ChainId) -> Optional[Web3]:
         """
-        Get a default provider for the given chain id using default public RPC URLs.
+        Get a default provider for the given chain id using default public RPC URLs,
+        failing over between them.
 
         :param chain_id: the chain id to get the default provider for
         """
 
-        if chain_id in CHAIN_ID_TO_RPC_URL:
-            return Web3(Web3.HTTPProvider(CHAIN_ID_TO_RPC_URL[chain_id]))
+        if chain_id in CHAIN_ID_TO_RPC_URLS:
+            options = self.get_options()
+            return Web3(
+                FailoverHTTPProvider(
+                    CHAIN_ID_TO_RPC_URLS[chain_id],
+                    options.rpc_failover_settings,
+                    options.rpc_batch_settings,
+                )
+            )
         return None
+
+    def _get_read_only_provider(
+        self, read_only_settings: ReadOnlySettings
+    ) -> BaseProvider:
+        """
+        Get a provider for the read-only RPCs, failing over between them if there are
+        several.
+
+        :param read_only_settings: settings of the read-only RPCs
+        """
+
+        options = self.get_options()
+        urls = [read_only_settings.rpc_url] + read_only_settings.rpc_urls
+        if len(urls) == 1:
+            return BatchHTTPProvider(urls[0], options.rpc_batch_settings)
+
+        return FailoverHTTPProvider(
+            urls,
+            replace(
+                options.rpc_failover_settings,
+                fallback_urls=[],
+                round_robin=read_only_settings.round_robin,
+            ),
+            options.rpc_batch_settings,
+        )
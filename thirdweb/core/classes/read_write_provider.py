@@ -0,0 +1,144 @@
+from typing import Any, Callable, Dict, List, Tuple
+
+from web3 import Web3
+from web3.providers.base import BaseProvider
+from web3.types import MiddlewareOnion, RPCEndpoint, RPCResponse
+
+from thirdweb.core.classes.batch_provider import BatchHTTPProvider
+
+# Methods that only read the chain and can be answered by any node of the chain.
+# Nonces, gas estimates and signing stay on the node transactions are sent to, so that
+# they see the transactions it has pending.
+READ_METHODS = {
+    "eth_blockNumber",
+    "eth_call",
+    "eth_feeHistory",
+    "eth_gasPrice",
+    "eth_getBalance",
+    "eth_getBlockByHash",
+    "eth_getBlockByNumber",
+    "eth_getCode",
+    "eth_getLogs",
+    "eth_getStorageAt",
+    "eth_getTransactionByHash",
+    "eth_getTransactionReceipt",
+    "eth_maxPriorityFeePerGas",
+}
+
+
+class ReadWriteProvider(BaseProvider):
+    """
+    Provider sending contract reads, log queries and receipt polling to read-only nodes,
+    and everything else, transactions included, to the node of the signer. Heavy read
+    traffic then never slows down the node transactions are sent through.
+    """
+
+    write_provider: BaseProvider
+    read_provider: BaseProvider
+
+    def __init__(self, write_provider: BaseProvider, read_provider: BaseProvider):
+        """
+        Initialize the provider.
+
+        :param write_provider: provider of the node transactions are sent to
+        :param read_provider: provider of the read-only nodes
+        """
+
+        super().__init__()
+        self.write_provider = write_provider
+        self.read_provider = read_provider
+
+    @property
+    def endpoint_uri(self) -> str:
+        # State shared per node, such as nonces, belongs to the node of the signer
+        return str(
+            getattr(self.write_provider, "endpoint_uri", id(self.write_provider))
+        )
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return self.get_provider_for(method).make_request(method, params)
+
+    def request_func(
+        self, web3: Web3, outer_middlewares: MiddlewareOnion
+    ) -> Callable[..., RPCResponse]:
+        # Requests go through the middlewares of the provider they are sent to, such as
+        # the retries of HTTPProvider, after the middlewares of the Web3 instance
+        middlewares = tuple(outer_middlewares) + tuple(self.middlewares)
+        read = self.read_provider.request_func(web3, middlewares)  # type: ignore
+        write = self.write_provider.request_func(web3, middlewares)  # type: ignore
+
+        def request(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if method in READ_METHODS:
+                return read(method, params)
+            return write(method, params)
+
+        return request
+
+    def isConnected(self) -> bool:
+        return self.write_provider.isConnected() and self.read_provider.isConnected()
+
+    def begin_batch(self):
+        """
+        Hold the requests of both providers to send them in batches.
+        """
+
+        for provider in self._get_batch_providers():
+            provider.begin_batch()
+
+    def end_batch(self):
+        """
+        Stop holding the requests of both providers.
+        """
+
+        for provider in self._get_batch_providers():
+            provider.end_batch()
+
+    def get_provider_for(self, method: str) -> BaseProvider:
+        """
+        Get the provider a request is sent through.
+
+        :param method: JSON-RPC method of the request
+        :returns: the read-only provider for reads, the provider of the signer otherwise
+        """
+
+        return self.read_provider if method in READ_METHODS else self.write_provider
+
+    def request_batch(self, calls: List[Tuple[str, Any]]) -> List[RPCResponse]:
+        """
+        Send requests at once, each group of them in batches to its own provider.
+
+        :param calls: method and params of each request
+        :returns: the raw response of each request, in order
+        """
+
+        groups: Dict[int, Tuple[BaseProvider, List[int]]] = {}
+        for i, (method, _) in enumerate(calls):
+            provider = self.get_provider_for(method)
+            groups.setdefault(id(provider), (provider, []))[1].append(i)
+
+        responses: List[RPCResponse] = [None] * len(calls)  # type: ignore
+        for provider, indexes in groups.values():
+            group = [calls[i] for i in indexes]
+            if isinstance(provider, BatchHTTPProvider):
+                group_responses = provider.request_batch(group)
+            else:
+                group_responses = [
+                    provider.make_request(method, params)  # type: ignore
+                    for method, params in group
+                ]
+
+            for i, response in zip(indexes, group_responses):
+                responses[i] = response
+
+        return responses
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _get_batch_providers(self) -> List[BatchHTTPProvider]:
+        return [
+            provider
+            for provider in dict.fromkeys([self.write_provider, self.read_provider])
+            if isinstance(provider, BatchHTTPProvider)
+        ]
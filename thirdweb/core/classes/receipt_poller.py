@@ -0,0 +1,277 @@
+import time
+from dataclasses import astuple
+from concurrent.futures import Future, TimeoutError
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar, cast
+
+from hexbytes import HexBytes
+from web3 import Web3
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.eth import TxReceipt
+from web3.exceptions import TimeExhausted
+from web3.types import RPCEndpoint
+
+from thirdweb.core.helpers.rpc import batch_request, get_provider_key
+from thirdweb.types.sdk import TransactionSettings
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+# Failed batched lookups in a row after which receipts are looked up one at a time
+MAX_BATCH_FAILURES = 3
+
+
+class PendingTransaction(Generic[T]):
+    """
+    Handle to a sent transaction that may not have been mined yet.
+
+    ```python
+    pending = contract.submit_mint_to(address, metadata)
+    pending.add_done_callback(lambda tx: print("mined", tx.tx_hash.hex()))
+
+    tx = pending.wait()
+    ```
+    """
+
+    tx_hash: HexBytes
+    _receipt: "Future[TxReceipt]"
+
+    def __init__(
+        self,
+        tx_hash: HexBytes,
+        receipt: "Future[TxReceipt]",
+        transform: Optional[Callable[[TxReceipt], T]] = None,
+    ):
+        self.tx_hash = tx_hash
+        self._receipt = receipt
+        # Set on the instance, so that the callable is not bound as a method
+        self._transform: Callable[[TxReceipt], T] = (
+            transform if transform is not None else lambda r: cast(T, r)
+        )
+
+    def done(self) -> bool:
+        """
+        Check if the transaction was mined or tracking it failed.
+
+        :returns: True if wait() will return without blocking
+        """
+
+        return self._receipt.done()
+
+    def exception(self) -> Optional[BaseException]:
+        """
+        Get the error raised while tracking the transaction, if it is done.
+
+        :returns: the error, or None if the transaction was mined or is still pending
+        """
+
+        if not self._receipt.done():
+            return None
+        return self._receipt.exception()
+
+    def wait(self, timeout: Optional[float] = None) -> T:
+        """
+        Block until the transaction is mined.
+
+        :param timeout: optional number of seconds to wait for, by default waits until
+            the poller gives up after the receipt timeout of the transaction settings
+        :returns: the result of the transaction
+        """
+
+        try:
+            receipt = self._receipt.result(timeout)
+        except TimeoutError:
+            raise TimeExhausted(
+                f"Transaction {self.tx_hash.hex()} is not in the chain after {timeout} seconds"
+            )
+
+        return self._transform(receipt)
+
+    def add_done_callback(self, callback: Callable[["PendingTransaction[T]"], None]):
+        """
+        Register a function to call from the poller thread once the transaction is mined.
+
+        :param callback: function called with this pending transaction
+        """
+
+        self._receipt.add_done_callback(lambda _: callback(self))
+
+    def map(self, transform: Callable[[T], U]) -> "PendingTransaction[U]":
+        """
+        Derive a pending transaction whose result is transformed once mined.
+
+        :param transform: function applied to the result of this transaction
+        :returns: a new handle to the same transaction
+        """
+
+        return PendingTransaction(
+            self.tx_hash, self._receipt, lambda r: transform(self._transform(r))
+        )
+
+
+class ReceiptPoller:
+    """
+    Tracks every pending transaction sent through a provider and looks up all of
+    their receipts in a single JSON-RPC batch per tick on a background thread.
+    """
+
+    _provider: Web3
+    _settings: TransactionSettings
+    _pending: Dict[HexBytes, Tuple["Future[TxReceipt]", float]]
+    _lock: Lock
+    _thread: Optional[Thread]
+    _batch_failures: int
+
+    def __init__(
+        self, provider: Web3, settings: TransactionSettings = TransactionSettings()
+    ):
+        """
+        Initialize the receipt poller.
+
+        :param provider: web3 provider instance to look up receipts with
+        :param settings: poll interval and timeout settings
+        """
+
+        self._provider = provider
+        self._settings = settings
+        self._pending = {}
+        self._lock = Lock()
+        self._thread = None
+        self._batch_failures = 0
+
+    def track(self, tx_hash: HexBytes) -> PendingTransaction[TxReceipt]:
+        """
+        Start tracking a sent transaction.
+
+        :param tx_hash: hash of the sent transaction
+        :returns: a handle resolved with the receipt once the transaction is mined
+        """
+
+        tx_hash = HexBytes(tx_hash)
+
+        with self._lock:
+            if tx_hash in self._pending:
+                receipt = self._pending[tx_hash][0]
+            else:
+                receipt = Future()
+                self._pending[tx_hash] = (receipt, time.monotonic())
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+        return PendingTransaction(tx_hash, receipt)
+
+    def pending_count(self) -> int:
+        """
+        Get the number of transactions waiting to be mined.
+        """
+
+        with self._lock:
+            return len(self._pending)
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _run(self):
+        while True:
+            time.sleep(self._settings.receipt_poll_interval)
+
+            with self._lock:
+                if len(self._pending) == 0:
+                    self._thread = None
+                    return
+                pending = dict(self._pending)
+
+            try:
+                self._tick(pending)
+            except Exception:
+                # Transient RPC failures are retried on the next tick
+                pass
+
+            # Transactions time out even while the node cannot be reached
+            self._expire(pending)
+
+    def _tick(self, pending: Dict[HexBytes, Tuple["Future[TxReceipt]", float]]):
+        tx_hashes = list(pending.keys())
+        responses = self._get_receipts(tx_hashes)
+
+        for tx_hash, response in zip(tx_hashes, responses):
+            receipt = pending[tx_hash][0]
+            result = response.get("result") if isinstance(response, dict) else None
+
+            if result is not None and not receipt.done():
+                self._resolve(tx_hash)
+                receipt.set_result(
+                    cast(TxReceipt, AttributeDict.recursive(receipt_formatter(result)))
+                )
+
+    def _get_receipts(self, tx_hashes: List[HexBytes]) -> List[Any]:
+        calls: List[Tuple[str, List[Any]]] = [
+            ("eth_getTransactionReceipt", [tx_hash.hex()]) for tx_hash in tx_hashes
+        ]
+
+        if self._batch_failures < MAX_BATCH_FAILURES:
+            try:
+                responses = batch_request(self._provider, calls)
+                self._batch_failures = 0
+                return responses
+            except Exception:
+                self._batch_failures += 1
+                if self._batch_failures < MAX_BATCH_FAILURES:
+                    raise
+
+        # Nodes that keep failing batches are asked for each receipt on its own
+        receipts: List[Any] = []
+        for method, params in calls:
+            try:
+                receipts.append(
+                    self._provider.provider.make_request(RPCEndpoint(method), params)
+                )
+            except Exception:
+                receipts.append(None)
+        return receipts
+
+    def _expire(self, pending: Dict[HexBytes, Tuple["Future[TxReceipt]", float]]):
+        now = time.monotonic()
+        for tx_hash, (receipt, submitted_at) in pending.items():
+            if receipt.done() or now - submitted_at <= self._settings.receipt_timeout:
+                continue
+
+            self._resolve(tx_hash)
+            receipt.set_exception(
+                TimeExhausted(
+                    f"Transaction {tx_hash.hex()} is not in the chain after "
+                    f"{self._settings.receipt_timeout} seconds"
+                )
+            )
+
+    def _resolve(self, tx_hash: HexBytes):
+        with self._lock:
+            self._pending.pop(tx_hash, None)
+
+
+_receipt_pollers: Dict[Tuple[str, Tuple[Any, ...]], ReceiptPoller] = {}
+_receipt_pollers_lock = Lock()
+
+
+def get_receipt_poller(
+    provider: Web3, settings: TransactionSettings = TransactionSettings()
+) -> ReceiptPoller:
+    """
+    Get the process-wide receipt poller for the node of the given provider and the
+    given settings.
+
+    :param provider: web3 provider instance the transactions are sent through
+    :param settings: poll interval and timeout settings of the poller
+    :returns: the receipt poller shared by every contract using this node and settings
+    """
+
+    key = (get_provider_key(provider), astuple(settings))
+
+    with _receipt_pollers_lock:
+        if key not in _receipt_pollers:
+            _receipt_pollers[key] = ReceiptPoller(provider, settings)
+        return _receipt_pollers[key]
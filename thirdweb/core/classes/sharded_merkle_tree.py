@@ -1,4 +1,6 @@
-from typing import List, Optional, Dict
+from collections import OrderedDict
+from threading import Lock
+from typing import Iterable, List, Optional, Dict, Tuple
 from web3 import Web3
 from thirdweb.common.currency import fetch_currency_metadata, convert_quantity_to_number
 from thirdweb.constants.currency import ZERO_ADDRESS
@@ -7,17 +9,22 @@ from thirdweb.types.contracts.claim_conditions import ShardData, ShardedMerkleTr
 from thirdweb.common.merkle_tree import MerkleTree
 
 class ShardedMerkleTree:
-    storage: IpfsStorage
+    storage: Optional[IpfsStorage]
     base_uri: str
     original_entries_uri: str
     shard_nybbles: int 
     token_decimals: int
     shards: Dict[str, ShardData]
     trees: Dict[str, MerkleTree]
+    _entries: Dict[str, Dict[str, SnapshotEntry]]
+    _leaves: Dict[str, Dict[str, str]]
+    _currency_decimals: Dict[str, int]
+    _lock: Lock
+    _shard_locks: Dict[str, Lock]
 
     def __init__(
         self,
-        storage: IpfsStorage,
+        storage: Optional[IpfsStorage],
         base_uri: str,
         original_entries_uri: str,
         shard_nybbles: int,
@@ -30,9 +37,16 @@ class ShardedMerkleTree:
         self.token_decimals = token_decimals
         self.shards = {}
         self.trees = {}
+        self._entries = {}
+        self._leaves = {}
+        self._currency_decimals = {}
+        self._lock = Lock()
+        self._shard_locks = {}
     
     @staticmethod
-    def from_info(metadata: ShardedMerkleTreeInfo, storage: IpfsStorage) -> "ShardedMerkleTree":
+    def from_info(
+        metadata: ShardedMerkleTreeInfo, storage: Optional[IpfsStorage] = None
+    ) -> "ShardedMerkleTree":
         return ShardedMerkleTree(
             storage,
             metadata.base_uri,
@@ -73,69 +87,174 @@ class ShardedMerkleTree:
 
         return hash.hex()[2:]
 
-    def get_proof(self, address: str, provider: Web3) -> Optional[SnapshotEntryWithProof]:
-        shard_id = address[2:self.shard_nybbles+2]
-        shard: ShardData = self.shards.get(shard_id)
-        
-        currency_decimal_map: Dict[str, int] = {}
+    def get_proof(
+        self, address: str, provider: Web3, storage: Optional[IpfsStorage] = None
+    ) -> Optional[SnapshotEntryWithProof]:
+        shard_id = self._get_shard_id(address)
+        if not self._load_shard(shard_id, provider, self._get_storage(storage)):
+            return None
+
+        shard = self.shards[shard_id]
+        entry = self._entries[shard_id].get(address.lower())
+        if entry is None:
+            return None
+
+        leaf = self._leaves[shard_id][address.lower()]
+
+        proof: List[str] = []
+        merkle_proof = self.trees[shard_id].get_proof(leaf)
+        if merkle_proof is not None:
+            proof = [p["left"] if "left" in p else p["right"] for p in merkle_proof]
+
+        proof += shard.proofs
+
+        return SnapshotEntryWithProof(
+            address=entry.address,
+            max_claimable=entry.max_claimable,
+            price=entry.price,
+            currency_address=entry.currency_address,
+            proof=proof
+        )
+
+    def prefetch(
+        self,
+        addresses: Iterable[str],
+        provider: Web3,
+        storage: Optional[IpfsStorage] = None,
+    ):
+        """
+        Load the shards of many addresses ahead of time, fetching them concurrently,
+        so that later proofs for these addresses don't hit storage.
+
+        :param addresses: addresses that are about to claim
+        :param provider: web3 provider instance used to look up currency decimals
+        :param storage: storage to fetch the shards with, defaults to the storage of
+            the tree
+        """
+
+        shard_ids = sorted(
+            {self._get_shard_id(address) for address in addresses} - set(self.shards)
+        )
+
+        raws = self._get_storage(storage).get_batch(
+            [self._get_shard_uri(shard_id) for shard_id in shard_ids],
+            allow_failure=True,
+        )
 
-        if shard is None:
-            uri = self.base_uri + "/" + shard_id + ".json"
+        for shard_id, raw in zip(shard_ids, raws):
+            if raw is not None:
+                with self._get_shard_lock(shard_id):
+                    if shard_id not in self.shards:
+                        self._add_shard(shard_id, raw, provider)
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _get_storage(self, storage: Optional[IpfsStorage]) -> IpfsStorage:
+        if storage is not None:
+            return storage
+        if self.storage is None:
+            raise ValueError("No storage to fetch the shards of the merkle tree with")
+        return self.storage
+
+    def _get_shard_id(self, address: str) -> str:
+        return address[2:self.shard_nybbles+2].lower()
+
+    def _get_shard_uri(self, shard_id: str) -> str:
+        return self.base_uri + "/" + shard_id + ".json"
+
+    def _get_shard_lock(self, shard_id: str) -> Lock:
+        with self._lock:
+            if shard_id not in self._shard_locks:
+                self._shard_locks[shard_id] = Lock()
+            return self._shard_locks[shard_id]
+
+    def _load_shard(self, shard_id: str, provider: Web3, storage: IpfsStorage) -> bool:
+        if shard_id in self.shards:
+            return True
+
+        # Concurrent claims in the same shard wait for a single fetch
+        with self._get_shard_lock(shard_id):
+            if shard_id in self.shards:
+                return True
 
-            raw = {}
             try:
-                raw = self.storage.get(uri)
+                raw = storage.get(self._get_shard_uri(shard_id))
             except:
-                return None
+                return False
 
-            shard_data: ShardData = ShardData.from_json(raw)
-            self.shards[shard_id] = shard_data
-            shard = self.shards[shard_id]
+            self._add_shard(shard_id, raw, provider)
+            return True
 
-            hashed_entries: List[str] = []
-            for e in shard.entries:
-                currency_decimals = self.fetch_and_cache_decimals(currency_decimal_map, provider, e.currency_address)
-                hash = self.hash_entry(e, self.token_decimals, currency_decimals)
-                hashed_entries.append(hash)
+    def _add_shard(self, shard_id: str, raw: Dict, provider: Web3):
+        shard = ShardData.from_json(raw)
 
-            tree = MerkleTree()
-            for leaf in hashed_entries:
-                tree.add_leaf(leaf)
+        entries: Dict[str, SnapshotEntry] = {}
+        leaves: Dict[str, str] = {}
+        tree = MerkleTree()
+        for e in shard.entries:
+            currency_decimals = self.fetch_and_cache_decimals(
+                self._currency_decimals, provider, e.currency_address
+            )
+            leaf = self.hash_entry(e, self.token_decimals, currency_decimals)
+            tree.add_leaf(leaf)
 
-            tree.make_tree()
-            self.trees[shard_id] = tree
+            address = e.address.lower()
+            if address not in entries:
+                entries[address] = e
+                leaves[address] = leaf
 
-        entry: Optional[SnapshotEntry] = None
-        for e in shard.entries:
-            if e.address.lower() == address.lower():
-                entry = e
-                break
+        tree.make_tree()
 
-        if entry is None:
-            return None
+        self.trees[shard_id] = tree
+        self._entries[shard_id] = entries
+        self._leaves[shard_id] = leaves
+        # Published last, it marks the shard as loaded
+        self.shards[shard_id] = shard
 
-        currency_decimals = self.fetch_and_cache_decimals(
-            currency_decimal_map,
-            provider,
-            entry.currency_address
-        )
 
-        leaf = self.hash_entry(entry, self.token_decimals, currency_decimals)
+MAX_CACHED_MERKLE_TREES = 32
 
-        proof: List[str] = []
-        current_tree = self.trees.get(shard_id)
-        if current_tree is not None:
-            merkle_proof = current_tree.get_proof(leaf)
+_sharded_merkle_trees: "OrderedDict[Tuple[int, str], ShardedMerkleTree]" = OrderedDict()
+_sharded_merkle_trees_lock = Lock()
 
-            if merkle_proof is not None:
-                proof = [p.get("left", p.get("right")) for p in merkle_proof]
 
-        proof += shard.proofs
+def get_sharded_merkle_tree(
+    chain_id: int, merkle_root: str, snapshot_uri: str, storage: IpfsStorage
+) -> Optional[ShardedMerkleTree]:
+    """
+    Get the process-wide sharded merkle tree of a claim condition snapshot, fetching
+    the snapshot info the first time the merkle root is seen on the chain.
 
-        return SnapshotEntryWithProof(
-            address=entry.address,
-            max_claimable=entry.max_claimable,
-            price=entry.price,
-            currency_address=entry.currency_address,
-            proof=proof
-        )
\ No newline at end of file
+    Trees are shared by every caller, so they are kept per chain, as the currency
+    decimals they cache are, and without a storage: shards are fetched with the
+    storage passed to get_proof and prefetch.
+
+    :param chain_id: chain ID of the claim condition
+    :param merkle_root: merkle root of the claim condition
+    :param snapshot_uri: URI of the sharded merkle tree info of the snapshot
+    :param storage: storage used to fetch the snapshot info
+    :returns: the sharded merkle tree, or None if the snapshot is for another root
+    """
+
+    key = (chain_id, merkle_root.lower())
+    with _sharded_merkle_trees_lock:
+        if key in _sharded_merkle_trees:
+            _sharded_merkle_trees.move_to_end(key)
+            return _sharded_merkle_trees[key]
+
+    metadata = ShardedMerkleTreeInfo.from_json(storage.get(snapshot_uri))
+    if metadata.merkle_root.lower() != key[1]:
+        return None
+
+    with _sharded_merkle_trees_lock:
+        if key not in _sharded_merkle_trees:
+            _sharded_merkle_trees[key] = ShardedMerkleTree.from_info(metadata)
+        _sharded_merkle_trees.move_to_end(key)
+
+        # The least recently used trees are dropped with the shards they fetched
+        while len(_sharded_merkle_trees) > MAX_CACHED_MERKLE_TREES:
+            _sharded_merkle_trees.popitem(last=False)
+
+        return _sharded_merkle_trees[key]
@@ -0,0 +1,185 @@
+import sqlite3
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+from thirdweb.types.storage import StorageCacheStats
+
+
+class StorageCache:
+    """
+    Two-tier cache for immutable IPFS content keyed by CID and path.
+
+    Content is held in an in-memory LRU bounded by a byte budget and, when a
+    path is given, in a sqlite database that survives process restarts and is
+    evicted least recently used first once it grows over its own byte budget.
+    """
+
+    _max_memory_bytes: int
+    _max_disk_bytes: int
+    _memory: "OrderedDict[str, bytes]"
+    _memory_size: int
+    _disk_size: int
+    _db: Optional[sqlite3.Connection]
+    _lock: Lock
+
+    _memory_hits: int
+    _disk_hits: int
+    _misses: int
+
+    def __init__(
+        self,
+        max_memory_bytes: int,
+        path: Optional[str] = None,
+        max_disk_bytes: int = 0,
+    ):
+        """
+        Initialize the storage cache.
+
+        :param max_memory_bytes: byte budget of the in-memory tier, 0 disables it
+        :param path: optional path of the sqlite database for the on-disk tier
+        :param max_disk_bytes: byte budget of the on-disk tier
+        """
+
+        self._max_memory_bytes = max_memory_bytes
+        self._max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._memory_size = 0
+        self._lock = Lock()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+        self._db = None
+        self._disk_size = 0
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS content "
+                "(key TEXT PRIMARY KEY, data BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS content_accessed ON content (accessed)"
+            )
+            self._db.commit()
+            (self._disk_size,) = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM content"
+            ).fetchone()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get cached content.
+
+        :param key: CID and path of the content
+        :returns: the cached content, or None if it is not cached
+        """
+
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT data FROM content WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._db.execute(
+                        "UPDATE content SET accessed = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+                    self._db.commit()
+                    self._disk_hits += 1
+                    self._set_memory(key, row[0])
+                    return row[0]
+
+            self._misses += 1
+            return None
+
+    def set(self, key: str, data: bytes):
+        """
+        Cache content.
+
+        :param key: CID and path of the content
+        :param data: the content to cache
+        """
+
+        with self._lock:
+            self._set_memory(key, data)
+
+            if self._db is not None and len(data) <= self._max_disk_bytes:
+                row = self._db.execute(
+                    "SELECT size FROM content WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._disk_size -= row[0]
+
+                self._db.execute(
+                    "INSERT OR REPLACE INTO content (key, data, size, accessed) VALUES (?, ?, ?, ?)",
+                    (key, data, len(data), time.time()),
+                )
+                self._disk_size += len(data)
+                self._evict_disk()
+                self._db.commit()
+
+    def clear(self):
+        """
+        Remove all content from both tiers and reset the counters.
+        """
+
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            self._memory_hits = 0
+            self._disk_hits = 0
+            self._misses = 0
+
+            if self._db is not None:
+                self._db.execute("DELETE FROM content")
+                self._db.commit()
+                self._disk_size = 0
+
+    def stats(self) -> StorageCacheStats:
+        """
+        Get the hit and miss counters of the cache.
+
+        :returns: hits per tier, misses and the size of the in-memory tier in bytes
+        """
+
+        with self._lock:
+            return StorageCacheStats(
+                self._memory_hits, self._disk_hits, self._misses, self._memory_size
+            )
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _set_memory(self, key: str, data: bytes):
+        if len(data) > self._max_memory_bytes:
+            return
+
+        if key in self._memory:
+            self._memory_size -= len(self._memory.pop(key))
+
+        self._memory[key] = data
+        self._memory_size += len(data)
+
+        while self._memory_size > self._max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+
+    def _evict_disk(self):
+        assert self._db is not None
+
+        while self._disk_size > self._max_disk_bytes:
+            row = self._db.execute(
+                "SELECT key, size FROM content ORDER BY accessed ASC LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+
+            self._db.execute("DELETE FROM content WHERE key = ?", (row[0],))
+            self._disk_size -= row[1]
@@ -0,0 +1,45 @@
+import random
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+
+class JitteredRetry(Retry):
+    """
+    Retry policy that applies full jitter to the exponential backoff, so that
+    concurrent requests rejected together don't retry in lockstep.
+    """
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return random.uniform(0, backoff) if backoff > 0 else 0
+
+
+def create_session(
+    pool_size: int, max_retries: int, backoff_factor: float
+) -> Session:
+    """
+    Creates a requests session that keeps connections alive in a pool and retries
+    idempotent GET requests on rate limiting and server errors.
+    """
+
+    retry = JitteredRetry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+
+    session = Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
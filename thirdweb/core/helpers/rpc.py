@@ -0,0 +1,92 @@
+import json
+from threading import Lock
+from typing import Any, Dict, List, Tuple
+
+from eth_typing import URI
+from requests.exceptions import HTTPError
+from web3 import Web3
+from web3._utils.request import make_post_request
+from web3.providers.base import BaseProvider
+from web3.providers.rpc import HTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from thirdweb.core.classes.batch_provider import BatchHTTPProvider
+from thirdweb.core.classes.read_write_provider import ReadWriteProvider
+
+
+def batch_request(provider: Web3, calls: List[Tuple[str, List[Any]]]) -> List[RPCResponse]:
+    """
+    Sends a list of JSON-RPC requests as a single batch over HTTP providers, or one
+    request at a time over any other provider or when the node rejects the batch,
+    and returns the raw responses in order.
+    """
+
+    if len(calls) == 0:
+        return []
+
+    http_provider = provider.provider
+    if isinstance(http_provider, (BatchHTTPProvider, ReadWriteProvider)):
+        return http_provider.request_batch(calls)
+    if not isinstance(http_provider, HTTPProvider) or http_provider.endpoint_uri is None:
+        return _request_each(http_provider, calls)
+
+    payload = [
+        {"jsonrpc": "2.0", "method": method, "params": params, "id": i}
+        for i, (method, params) in enumerate(calls)
+    ]
+    try:
+        raw = make_post_request(
+            URI(http_provider.endpoint_uri),
+            json.dumps(payload).encode(),
+            **dict(http_provider.get_request_kwargs()),
+        )
+        responses = json.loads(raw)
+    except (HTTPError, ValueError):
+        # Some nodes and proxies reject batches with an HTTP error
+        return _request_each(http_provider, calls)
+
+    # Nodes without batch support answer with a single error object
+    if not isinstance(responses, list):
+        return _request_each(http_provider, calls)
+
+    by_id: Dict[int, RPCResponse] = {response.get("id"): response for response in responses}
+    return [
+        by_id.get(i, {"error": {"code": -32603, "message": "Missing batch response"}})  # type: ignore
+        for i in range(len(calls))
+    ]
+
+
+def _request_each(
+    provider: BaseProvider, calls: List[Tuple[str, List[Any]]]
+) -> List[RPCResponse]:
+    return [provider.make_request(RPCEndpoint(method), params) for method, params in calls]
+
+
+def get_provider_key(provider: Web3) -> str:
+    """
+    Returns a key identifying the node a provider talks to, used to share state
+    between the many provider handlers created for the same connection.
+    """
+
+    return str(getattr(provider.provider, "endpoint_uri", id(provider.provider)))
+
+
+_chain_ids: Dict[str, int] = {}
+_chain_ids_lock = Lock()
+
+
+def get_chain_id(provider: Web3) -> int:
+    """
+    Returns the chain ID of the node a provider talks to, looked up once per node.
+    """
+
+    key = get_provider_key(provider)
+
+    with _chain_ids_lock:
+        if key in _chain_ids:
+            return _chain_ids[key]
+
+    chain_id = provider.eth.chain_id
+    with _chain_ids_lock:
+        _chain_ids[key] = chain_id
+    return chain_id
@@ -10,13 +10,15 @@ from thirdweb.contracts.edition_drop import EditionDrop
 from thirdweb.contracts.nft_drop import NFTDrop
 from thirdweb.contracts.multiwrap import Multiwrap
 from thirdweb.core.auth.wallet_authenticator import WalletAuthenticator
+from thirdweb.core.classes.batch_provider import RequestBatch
+from thirdweb.core.classes.call_cache import get_call_cache
 from thirdweb.core.classes.contract_deployer import ContractDeployer
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from thirdweb.core.classes.provider_handler import ProviderHandler
 from thirdweb.contracts import Token, Edition, NFTCollection
 
 from eth_account.account import LocalAccount
-from typing import Any, Dict, Optional, Type, Union, cast
+from typing import Any, ContextManager, Dict, Optional, Type, Union, cast
 from web3 import Web3
 
 from thirdweb.types.sdk import SDKOptions
@@ -25,6 +27,10 @@ from thirdweb.types.sdk import SDKOptions
 class ThirdwebSDK(ProviderHandler):
     """
     The main entry point for the Thirdweb SDK.
+
+    A provider given to update_provider is used as is, unless reads are routed to a
+    read-only RPC or cached, in which case requests go through a Web3 instance of the
+    SDK copying its transport and middlewares, returned by get_provider.
     """
 
     __contract_cache: Dict[
@@ -73,14 +79,23 @@ class ThirdwebSDK(ProviderHandler):
             options = SDKOptions()
 
         if storage is None:
-            storage = IpfsStorage(options.secret_key)
+            storage = IpfsStorage(options.secret_key, settings=options.storage_settings)
 
         client_id = derive_client_id_from_secret_key(options.secret_key) if options.secret_key is not None else None
-        provider = get_provider_for_network(network, client_id)
+        provider = get_provider_for_network(
+            network,
+            client_id,
+            options.rpc_batch_settings,
+            options.rpc_failover_settings,
+        )
+        # The provider is the SDK's own, so reads can be pinned through it directly
+        get_call_cache(provider, options.call_cache_settings).install(provider)
         super().__init__(provider, signer, options)
 
-        self.auth = WalletAuthenticator(provider, signer, options)
-        self.deployer = ContractDeployer(provider, signer, options, storage)
+        self.auth = WalletAuthenticator(self.get_provider(), signer, options)
+        self.deployer = ContractDeployer(
+            self.get_provider(), signer, options, storage
+        )
         self.storage = storage
 
     def get_nft_collection(self, address: str) -> NFTCollection:
@@ -195,6 +210,51 @@ class ThirdwebSDK(ProviderHandler):
         self.__contract_cache[address] = cast(Any, contract)
         return contract
 
+    def batch(self) -> RequestBatch:
+        """
+        Run reads concurrently so that their requests reach the node in shared
+        JSON-RPC batches.
+
+        ```python
+        token = sdk.get_token("{{contract_address}}")
+
+        with sdk.batch() as batch:
+            metadata = batch.submit(token.get)
+            balance = batch.submit(token.balance)
+
+        print(metadata.result().symbol, balance.result().display_value)
+        ```
+
+        :returns: a batch to submit functions to, waited for when the block exits
+        """
+
+        return RequestBatch(self.get_provider())
+
+    def pin_block(self, block_number: Optional[int] = None) -> ContextManager[int]:
+        """
+        Pin every contract read made from the current thread to a block while the
+        context is open, so that reads made over many requests see a consistent
+        snapshot of the chain. Reads made from other threads are not pinned.
+
+        Reads are pinned by the call cache middleware of the SDK, which is added to a
+        provider given to update_provider the first time reads are pinned.
+
+        ```python
+        nft_collection = sdk.get_nft_collection("{{contract_address}}")
+
+        with sdk.pin_block() as block_number:
+            nfts = nft_collection.get_all()
+        ```
+
+        :param block_number: block to read at, defaults to the latest block
+        :returns: a context manager yielding the number of the pinned block
+        """
+
+        provider = self.get_provider()
+        call_cache = get_call_cache(provider, self.get_options().call_cache_settings)
+        call_cache.install(provider)
+        return call_cache.pin(block_number)
+
     def update_provider(self, provider: Web3):
         """
         Update the provider instance used by the SDK.
@@ -203,6 +263,9 @@ class ThirdwebSDK(ProviderHandler):
         """
 
         super()._update_provider(provider)
+
+        # Every handler shares the Web3 instance the SDK sends requests through
+        provider = self.get_provider()
         self.auth._update_provider(provider)
         self.deployer._update_provider(provider)
 
@@ -21,4 +21,27 @@ class SignatureEvent:
 class EventQueryOptions:
     filters: Dict[str, Any] = dataclasses.field(default_factory=dict)
     from_block: Optional[BlockIdentifier] = "earliest"
-    to_block: Optional[BlockIdentifier] = "latest"
\ No newline at end of file
+    to_block: Optional[BlockIdentifier] = "latest"
+
+@dataclass
+class EventBackfillSettings:
+    """
+    Settings of a chunked event log backfill.
+
+    :param block_range: number of blocks queried in the first window, defaults to 2000
+    :param min_block_range: smallest window a window that returned too many results
+        is split down to before giving up, defaults to 1
+    :param max_block_range: largest window sparse windows grow up to, defaults to 100000
+    :param target_results: number of logs per window the window size adapts towards,
+        defaults to 1000
+    :param max_workers: number of windows fetched concurrently, defaults to 4
+    :param checkpoint_path: optional path of a sqlite database the progress of the
+        backfill is saved to, so that it resumes where it stopped when run again
+    """
+
+    block_range: int = 2000
+    min_block_range: int = 1
+    max_block_range: int = 100000
+    target_results: int = 1000
+    max_workers: int = 4
+    checkpoint_path: Optional[str] = None
@@ -113,3 +113,21 @@ class Offer:
     price_per_token: PriceWei
     currency_value: CurrencyValue
     currency_contract_address: str
+
+
+@dataclass
+class MarketplaceIndexSettings:
+    """
+    Settings of a local index of marketplace listings.
+
+    :param confirmations: number of blocks behind the chain head the index stays at,
+        so that reorgs shallower than this never reach it, defaults to 12
+    :param path: optional path of a sqlite database the index is persisted to, so
+        that it is only caught up on restart instead of seeded again
+    :param max_block_range: maximum number of blocks queried in a single eth_getLogs
+        call, defaults to 2000
+    """
+
+    confirmations: int = 12
+    path: Optional[str] = None
+    max_block_range: int = 2000
@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+from typing import Any, List
+
+from web3.contract import Contract
+
+
+@dataclass
+class ReadCall:
+    """
+    A single contract read to be batched through Multicall3.
+
+    :param contract: web3 contract interface to call
+    :param fn: name of the function to call on the contract
+    :param args: arguments to pass to the function
+    """
+
+    contract: Contract
+    fn: str
+    args: List[Any] = field(default_factory=list)
+
+
+@dataclass
+class ReadResult:
+    """
+    The result of a batched contract read.
+
+    :param success: whether the call succeeded
+    :param data: the decoded return value of the call, None if it failed
+    """
+
+    success: bool
+    data: Any = None
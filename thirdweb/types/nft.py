@@ -126,3 +126,43 @@ class EditionMetadataOwner(EditionMetadata):
 class QueryAllParams:
     start: int = 0
     count: int = 100
+
+
+@dataclass
+class LazyMintSettings:
+    """
+    Settings of a lazy mint batch.
+
+    :param chunk_size: largest number of NFTs lazy minted per transaction, halved
+        until a transaction fits in the allowed share of the block, defaults to 1000
+    :param max_concurrent_uploads: number of chunks uploaded concurrently, defaults to 4
+    :param max_pending_transactions: number of lazy mint transactions sent before
+        waiting for the first of them to be mined, defaults to 4
+    :param max_block_gas_fraction: share of the block gas limit a lazy mint
+        transaction can use, defaults to 0.5
+    :param checkpoint_path: optional path of a JSON file the progress of the batch is
+        saved to, so that it resumes after the last confirmed chunk when run again
+    """
+
+    chunk_size: int = 1000
+    max_concurrent_uploads: int = 4
+    max_pending_transactions: int = 4
+    max_block_gas_fraction: float = 0.5
+    checkpoint_path: Optional[str] = None
+
+
+@dataclass
+class LazyMintProgress:
+    """
+    The progress of a lazy mint batch, counted in NFTs.
+
+    :param uploaded: number of NFTs whose metadata was uploaded
+    :param submitted: number of NFTs whose lazy mint transaction was sent
+    :param minted: number of NFTs whose lazy mint transaction was mined
+    :param last_token_id: id of the last NFT lazy minted by this run, if any
+    """
+
+    uploaded: int
+    submitted: int
+    minted: int
+    last_token_id: Optional[int] = None
@@ -1,7 +1,8 @@
 from enum import Enum
-from typing import Optional
-from dataclasses import dataclass
+from typing import List, Optional
+from dataclasses import dataclass, field
 
+from thirdweb.constants.addresses import MULTICALL3_ADDRESS
 from thirdweb.constants.chains import ChainId
 
 
@@ -18,23 +19,227 @@ class GasSettings(object):
 
     :param max_price_in_gwei: maximum gas price in gwei, defaults to 300
     :param speed: gas speed to use, defaults to "fastest"
+    :param fee_history_blocks: number of recent blocks whose tips are used to price
+        transactions, defaults to 10
+    :param fee_cache_seconds: seconds fees are reused for before being read again,
+        unless a newer block is seen earlier, defaults to 2
     """
 
     max_price_in_gwei: int = 300
     speed: GasSpeed = GasSpeed.FASTEST
+    fee_history_blocks: int = 10
+    fee_cache_seconds: float = 2
 
 
 @dataclass
 class ReadOnlySettings(object):
     """
-    The read-only RPC settings for the SDK.
+    The read-only RPC settings for the SDK. When set, contract reads, log queries and
+    receipt polling go to the read-only RPC, and transactions to the RPC of the signer.
 
     :param rpc_url: URL of the RPC
     :param chain_id: optional chain ID to use for the RPC
+    :param rpc_urls: optional URLs of other read-only RPCs of the same chain
+    :param round_robin: whether to send reads to every read-only RPC in turn, instead
+        of to the fastest one, defaults to False
     """
 
     rpc_url: str = ""
     chain_id: Optional[ChainId] = None
+    rpc_urls: List[str] = field(default_factory=list)
+    round_robin: bool = False
+
+
+@dataclass
+class MulticallSettings(object):
+    """
+    The settings used to batch contract reads through Multicall3, and contract writes
+    through the multicall function of the contract.
+
+    :param address: address of the Multicall3 contract, defaults to the canonical deployment
+    :param chunk_size: maximum number of calls packed into a single aggregate3 call, defaults to 500
+    :param allow_failure: whether a reverting call should be returned as a failed result
+        instead of reverting the whole batch, defaults to True
+    :param max_gas_per_transaction: gas ceiling of a single multicall transaction, batched
+        writes estimated above it are split across several transactions, defaults to
+        half of the block gas limit
+    """
+
+    address: str = MULTICALL3_ADDRESS
+    chunk_size: int = 500
+    allow_failure: bool = True
+    max_gas_per_transaction: Optional[int] = None
+
+
+@dataclass
+class StorageSettings(object):
+    """
+    The IPFS storage settings for the SDK.
+
+    :param max_concurrent_requests: maximum number of gateway requests in flight
+        when fetching many files at once, defaults to 16
+    :param max_requests_per_host: maximum number of requests in flight to a single
+        gateway host, defaults to 8
+    :param pool_size: number of keep-alive connections kept open per host, defaults to 16
+    :param timeout: timeout in seconds for each gateway and upload request, defaults to 30
+    :param max_retries: number of times a failed GET or upload is retried on connection
+        errors, rate limiting or server errors, defaults to 3
+    :param retry_backoff_factor: base backoff in seconds between retries, doubled on every
+        attempt and jittered, defaults to 0.5
+    :param cache_max_bytes: byte budget of the in-memory cache of IPFS content,
+        0 disables it, defaults to 64MB
+    :param cache_path: optional path of a sqlite database used to persist cached
+        IPFS content across restarts
+    :param cache_max_disk_bytes: byte budget of the on-disk cache, defaults to 1GB
+    :param max_concurrent_uploads: maximum number of upload requests in flight when
+        uploading a large batch of files in parts, defaults to 4
+    :param upload_part_max_bytes: maximum size of the files uploaded in a single
+        request, defaults to 100MB
+    :param upload_part_max_files: maximum number of files uploaded in a single request,
+        defaults to 1000
+    :param deduplicate_uploads: whether to compute the CID of files locally before
+        uploading them in parts, to upload identical files once and skip files that
+        were already uploaded, defaults to True
+    :param pin_index_path: optional path of a sqlite database used to remember the CIDs
+        of uploaded files across restarts
+    """
+
+    max_concurrent_requests: int = 16
+    max_requests_per_host: int = 8
+    pool_size: int = 16
+    timeout: float = 30
+    max_retries: int = 3
+    retry_backoff_factor: float = 0.5
+    cache_max_bytes: int = 64 * 1024 * 1024
+    cache_path: Optional[str] = None
+    cache_max_disk_bytes: int = 1024 * 1024 * 1024
+    max_concurrent_uploads: int = 4
+    upload_part_max_bytes: int = 100 * 1024 * 1024
+    upload_part_max_files: int = 1000
+    deduplicate_uploads: bool = True
+    pin_index_path: Optional[str] = None
+
+
+@dataclass
+class TransactionSettings(object):
+    """
+    The settings used to track sent transactions until they are mined.
+
+    :param receipt_poll_interval: seconds between two batched receipt lookups, defaults to 0.1
+    :param receipt_timeout: seconds to wait for a transaction to be mined before
+        giving up on it, defaults to 120
+    """
+
+    receipt_poll_interval: float = 0.1
+    receipt_timeout: float = 120
+
+
+@dataclass
+class EventSettings(object):
+    """
+    The settings used to watch the chain for contract events.
+
+    :param poll_interval: seconds between two polls for new logs, defaults to 2
+    :param use_filters: whether to poll a node filter with eth_getFilterChanges instead
+        of querying block ranges with eth_getLogs, when there are no confirmations to
+        wait for and the node supports filters, defaults to True
+    :param confirmations: number of blocks a log must be buried under before it is
+        delivered, so that logs of blocks reorged out are never delivered, defaults to 0
+    :param max_block_range: maximum number of blocks queried in a single eth_getLogs
+        call when catching up, defaults to 2000
+    :param max_pending_events: maximum number of events waiting to be dispatched to
+        listeners, defaults to 10000
+    :param drop_when_full: whether to drop new events when too many are waiting instead
+        of pausing polling until listeners catch up, defaults to False
+    """
+
+    poll_interval: float = 2
+    use_filters: bool = True
+    confirmations: int = 0
+    max_block_range: int = 2000
+    max_pending_events: int = 10000
+    drop_when_full: bool = False
+
+
+@dataclass
+class RpcBatchSettings(object):
+    """
+    The settings used to send JSON-RPC requests to the node in batches.
+
+    :param window: seconds requests are held for before being sent, so that more of them
+        share a batch, defaults to 0 which only batches requests made while others are
+        in flight
+    :param scope_window: seconds requests are held for inside sdk.batch(), defaults to 0.01
+    :param max_batch_size: maximum number of requests sent in a single batch, defaults to 100
+    :param max_concurrent_batches: maximum number of batches in flight at the same time,
+        defaults to 4
+    :param max_retries: number of times a batch that was rate limited or failed on the
+        node is sent again, defaults to 2
+    :param retry_backoff: seconds waited before sending a batch again, doubled on every
+        retry, defaults to 0.25
+    """
+
+    window: float = 0
+    scope_window: float = 0.01
+    max_batch_size: int = 100
+    max_concurrent_batches: int = 4
+    max_retries: int = 2
+    retry_backoff: float = 0.25
+
+
+@dataclass
+class RpcFailoverSettings(object):
+    """
+    The settings used to spread JSON-RPC requests over several endpoints of a chain,
+    sending them to the healthiest endpoint and failing over when it stops answering.
+
+    :param fallback_urls: URLs of other endpoints of the chain to fail over to
+    :param latency_smoothing: weight of the latest request in the rolling latency of an
+        endpoint, defaults to 0.2
+    :param window_size: number of recent requests the error rate of an endpoint is
+        measured over, defaults to 20
+    :param max_error_rate: error rate over a full window past which an endpoint is
+        ejected, defaults to 0.5
+    :param max_consecutive_failures: number of failed requests in a row after which an
+        endpoint is ejected, defaults to 3
+    :param cooldown: seconds an ejected endpoint waits before it is probed again,
+        doubled every time the probe fails, defaults to 10
+    :param max_cooldown: maximum seconds an ejected endpoint waits between probes,
+        defaults to 300
+    :param probe_interval: seconds after which an endpoint that was not used is tried
+        again to refresh its latency, defaults to 60
+    :param timeout: seconds to wait for an endpoint to answer before failing over,
+        defaults to 10
+    :param round_robin: whether to send requests to every healthy endpoint in turn,
+        instead of to the one with the best score, defaults to False
+    """
+
+    fallback_urls: List[str] = field(default_factory=list)
+    latency_smoothing: float = 0.2
+    window_size: int = 20
+    max_error_rate: float = 0.5
+    max_consecutive_failures: int = 3
+    cooldown: float = 10
+    max_cooldown: float = 300
+    probe_interval: float = 60
+    timeout: float = 10
+    round_robin: bool = False
+
+
+@dataclass
+class CallCacheSettings(object):
+    """
+    The settings used to memoize contract reads for the block they were made at.
+
+    :param enabled: whether to cache the results of eth_call, defaults to False
+    :param max_entries: maximum number of results kept in the cache, defaults to 1000
+    :param block_poll_interval: seconds the latest block number is trusted for before
+        it is read from the node again, defaults to 1
+    """
+
+    enabled: bool = False
+    max_entries: int = 1000
+    block_poll_interval: float = 1
 
 
 @dataclass
@@ -44,8 +249,26 @@ class SDKOptions(object):
 
     :param read_only_settings: optional read-only RPC settings
     :param gas_settings: gas settings
+    :param multicall_settings: settings for batching contract reads
+    :param storage_settings: settings for the default IPFS storage
+    :param transaction_settings: settings for tracking sent transactions
+    :param event_settings: settings for watching the chain for contract events
+    :param rpc_batch_settings: settings for batching the JSON-RPC requests of the SDK provider
+    :param rpc_failover_settings: settings for failing over between the RPC endpoints of a chain
+    :param call_cache_settings: settings for caching contract reads within a block
     """
 
     secret_key: Optional[str] = None
     read_only_settings: Optional[ReadOnlySettings] = None
     gas_settings: GasSettings = GasSettings()
+    multicall_settings: MulticallSettings = field(default_factory=MulticallSettings)
+    storage_settings: StorageSettings = field(default_factory=StorageSettings)
+    transaction_settings: TransactionSettings = field(
+        default_factory=TransactionSettings
+    )
+    event_settings: EventSettings = field(default_factory=EventSettings)
+    rpc_batch_settings: RpcBatchSettings = field(default_factory=RpcBatchSettings)
+    rpc_failover_settings: RpcFailoverSettings = field(
+        default_factory=RpcFailoverSettings
+    )
+    call_cache_settings: CallCacheSettings = field(default_factory=CallCacheSettings)
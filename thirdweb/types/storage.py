@@ -12,3 +12,11 @@ class CidWithFileName:
 class UriWithMetadata:
     base_uri: str
     metadata_uris: List[str]
+
+
+@dataclass
+class StorageCacheStats:
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    memory_size: int
@@ -1,4 +1,4 @@
-from typing import Callable, Generic, TypeVar
+from typing import Callable, Generic, Optional, TypeVar, cast
 from web3.eth import TxReceipt
 from dataclasses import dataclass
 
@@ -18,3 +18,26 @@ class TxResultWithData(TxResult, Generic[T]):
 @dataclass
 class TxResultWithId(TxResultWithData[T]):
     id: int
+
+
+@dataclass
+class TxFees:
+    """
+    The fees to price a transaction with.
+
+    :param max_fee_per_gas: maximum price per unit of gas of an EIP-1559 transaction
+    :param max_priority_fee_per_gas: maximum tip per unit of gas of an EIP-1559 transaction
+    :param gas_price: price per unit of gas of a legacy transaction, on chains without EIP-1559
+    """
+
+    max_fee_per_gas: Optional[int] = None
+    max_priority_fee_per_gas: Optional[int] = None
+    gas_price: Optional[int] = None
+
+    @property
+    def max_price(self) -> int:
+        """
+        The most the transaction can pay per unit of gas.
+        """
+
+        return cast(int, self.gas_price if self.gas_price is not None else self.max_fee_per_gas)